@@ -11,7 +11,11 @@ from docling_parse.pdf_parser import DoclingPdfParser, PdfDocument
 from PIL import Image
 from pypdfium2 import PdfPage
 
-from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
+from docling.backend.pdf_backend import (
+    PdfDocumentBackend,
+    PdfPageBackend,
+    PdfPageContent,
+)
 from docling.datamodel.backend_options import PdfBackendOptions
 from docling.datamodel.base_models import Size
 from docling.utils.locks import pypdfium2_lock
@@ -74,6 +78,10 @@ class DoclingParseV4PageBackend(PdfPageBackend):
 
         self._dpage = seg_page
 
+    def set_segmented_page(self, segmented_page: SegmentedPdfPage) -> None:
+        """Use a page parsed elsewhere (e.g. in a parse worker) instead of parsing."""
+        self._dpage = segmented_page
+
     def is_valid(self) -> bool:
         return self.valid
 
@@ -225,9 +233,35 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
 
         return len_2
 
+    def page_parse_flags(
+        self,
+        create_words: Optional[bool] = None,
+        create_textlines: Optional[bool] = None,
+    ) -> dict[str, bool]:
+        """Page backend parse flags derived from `required_page_content`.
+
+        Explicit `create_words` / `create_textlines` take precedence. Characters are
+        only kept when explicitly required.
+        """
+        required = self.required_page_content
+        if create_words is None:
+            create_words = required is None or PdfPageContent.WORDS in required
+        if create_textlines is None:
+            create_textlines = required is None or PdfPageContent.TEXTLINES in required
+        return {
+            "create_words": create_words,
+            "create_textlines": create_textlines,
+            "keep_chars": required is not None and PdfPageContent.CHARS in required,
+            "keep_images": required is None or PdfPageContent.BITMAPS in required,
+        }
+
     def load_page(
-        self, page_no: int, create_words: bool = True, create_textlines: bool = True
+        self,
+        page_no: int,
+        create_words: Optional[bool] = None,
+        create_textlines: Optional[bool] = None,
     ) -> DoclingParseV4PageBackend:
+        """Load a page, parsing only the content in `required_page_content`."""
         with pypdfium2_lock:
             ppage = self._pdoc[page_no]
 
@@ -235,8 +269,7 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
             dp_doc=self.dp_doc,
             page_obj=ppage,
             page_no=page_no,
-            create_words=create_words,
-            create_textlines=create_textlines,
+            **self.page_parse_flags(create_words, create_textlines),
         )
 
     def is_valid(self) -> bool:
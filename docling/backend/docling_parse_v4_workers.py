@@ -0,0 +1,307 @@
+"""Process pool parsing and rendering PDF pages with docling-parse v4.
+
+Parsing and rendering a page holds the GIL (and `pypdfium2_lock`) for most of its
+duration, so a single preprocess thread caps the throughput of the PDF pipeline on
+many-core machines. `DoclingParseV4WorkerPool` parses pages ahead in worker
+processes, each holding its own pypdfium2 and docling-parse handles of the
+document. The parsed page and the rendered images are handed back through one
+shared memory block per page.
+"""
+
+import logging
+import multiprocessing
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import pypdfium2 as pdfium
+from docling_core.types.doc.page import SegmentedPdfPage
+from docling_parse.pdf_parser import DoclingPdfParser, PdfDocument
+from PIL import Image
+
+from docling.backend.docling_parse_v4_backend import (
+    DoclingParseV4DocumentBackend,
+    DoclingParseV4PageBackend,
+)
+from docling.datamodel.base_models import Page, Size
+from docling.utils.locks import pypdfium2_lock
+
+_log = logging.getLogger(__name__)
+
+# Documents each worker keeps open, least recently used are closed first
+_WORKER_MAX_OPEN_DOCS = 4
+
+
+@dataclass(frozen=True)
+class _DocumentSource:
+    key: str
+    path: Optional[Path] = None
+    # Name and size of the shared memory block holding the bytes of a stream
+    shm_name: Optional[str] = None
+    size: int = 0
+    password: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _ImageLayout:
+    scale: float
+    mode: str
+    size: tuple[int, int]
+    nbytes: int
+
+
+@dataclass(frozen=True)
+class _ParseResult:
+    shm_name: str
+    page_size: Size
+    page_nbytes: int
+    images: list[_ImageLayout]
+
+
+@dataclass
+class ParsedPage:
+    """A page parsed and rendered by a worker process."""
+
+    segmented_page: SegmentedPdfPage
+    size: Size
+    images: dict[float, Image.Image]
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    assert shm.buf is not None
+    return shm.buf
+
+
+# ---------------------------------------------------------------- worker side
+
+_worker_parser: Optional[DoclingPdfParser] = None
+_worker_docs: OrderedDict[str, tuple[pdfium.PdfDocument, PdfDocument]] = OrderedDict()
+
+
+def _open_document(source: _DocumentSource) -> tuple[pdfium.PdfDocument, PdfDocument]:
+    global _worker_parser
+
+    if source.key in _worker_docs:
+        _worker_docs.move_to_end(source.key)
+        return _worker_docs[source.key]
+
+    path_or_stream: Union[Path, BytesIO]
+    if source.path is not None:
+        path_or_stream = source.path
+    else:
+        assert source.shm_name is not None
+        shm = SharedMemory(name=source.shm_name)
+        try:
+            path_or_stream = BytesIO(bytes(_buffer(shm)[: source.size]))
+        finally:
+            shm.close()
+
+    if _worker_parser is None:
+        _worker_parser = DoclingPdfParser(loglevel="fatal")
+    with pypdfium2_lock:
+        pdoc = pdfium.PdfDocument(path_or_stream, password=source.password)
+    dp_doc = _worker_parser.load(
+        path_or_stream=path_or_stream, password=source.password
+    )
+    if dp_doc is None:
+        raise RuntimeError(f"docling-parse v4 could not load document {source.key}.")
+
+    _worker_docs[source.key] = (pdoc, dp_doc)
+    while len(_worker_docs) > _WORKER_MAX_OPEN_DOCS:
+        _, (old_pdoc, old_dp_doc) = _worker_docs.popitem(last=False)
+        old_dp_doc.unload()
+        with pypdfium2_lock:
+            old_pdoc.close()
+    return pdoc, dp_doc
+
+
+def _parse_page(
+    source: _DocumentSource,
+    page_no: int,
+    parse_flags: dict[str, bool],
+    scales: tuple[float, ...],
+) -> _ParseResult:
+    pdoc, dp_doc = _open_document(source)
+    with pypdfium2_lock:
+        ppage = pdoc[page_no]
+
+    page_backend = DoclingParseV4PageBackend(
+        dp_doc=dp_doc, page_obj=ppage, page_no=page_no, **parse_flags
+    )
+    try:
+        segmented_page = page_backend.get_segmented_page()
+        page_size = page_backend.get_size()
+        images = [(scale, page_backend.get_page_image(scale=scale)) for scale in scales]
+    finally:
+        page_backend.unload()
+
+    page_bytes = pickle.dumps(segmented_page, protocol=pickle.HIGHEST_PROTOCOL)
+    image_bytes = [image.tobytes() for _, image in images]
+    shm = SharedMemory(
+        create=True, size=max(1, len(page_bytes) + sum(map(len, image_bytes)))
+    )
+    try:
+        buf = _buffer(shm)
+        buf[: len(page_bytes)] = page_bytes
+        offset = len(page_bytes)
+        for data in image_bytes:
+            buf[offset : offset + len(data)] = data
+            offset += len(data)
+    finally:
+        shm.close()
+
+    return _ParseResult(
+        shm_name=shm.name,
+        page_size=page_size,
+        page_nbytes=len(page_bytes),
+        images=[
+            _ImageLayout(
+                scale=scale, mode=image.mode, size=image.size, nbytes=len(data)
+            )
+            for (scale, image), data in zip(images, image_bytes)
+        ],
+    )
+
+
+# ---------------------------------------------------------------- parent side
+
+
+def _read_result(result: _ParseResult) -> ParsedPage:
+    shm = SharedMemory(name=result.shm_name)
+    try:
+        buf = _buffer(shm)
+        segmented_page = pickle.loads(bytes(buf[: result.page_nbytes]))
+        images: dict[float, Image.Image] = {}
+        offset = result.page_nbytes
+        for layout in result.images:
+            images[layout.scale] = Image.frombytes(
+                layout.mode,
+                layout.size,
+                bytes(buf[offset : offset + layout.nbytes]),
+            )
+            offset += layout.nbytes
+    finally:
+        shm.close()
+        shm.unlink()
+    return ParsedPage(
+        segmented_page=segmented_page, size=result.page_size, images=images
+    )
+
+
+class DoclingParseV4WorkerPool:
+    """Pool of worker processes parsing and rendering pages of PDF documents.
+
+    Documents given as streams are copied once into shared memory, which is released
+    with `release_document`.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        # spawn: forking a process with running pipeline threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._doc_buffers: dict[str, tuple[SharedMemory, int]] = {}
+        self._lock = threading.Lock()
+
+    def parse_pages(
+        self,
+        backend: DoclingParseV4DocumentBackend,
+        page_nos: Sequence[int],
+        scales: Sequence[float],
+    ) -> list[Union[ParsedPage, BaseException]]:
+        """Parse and render the pages (0-based) in parallel.
+
+        Failures are returned in place of the page, so callers can fall back to
+        parsing these pages in-process.
+        """
+        source = self._document_source(backend)
+        parse_flags = backend.page_parse_flags()
+        futures: list[Future[_ParseResult]] = [
+            self._executor.submit(
+                _parse_page, source, page_no, parse_flags, tuple(scales)
+            )
+            for page_no in page_nos
+        ]
+        results: list[Union[ParsedPage, BaseException]] = []
+        for future in futures:
+            try:
+                results.append(_read_result(future.result()))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    def load_pages(
+        self,
+        backend: DoclingParseV4DocumentBackend,
+        pages: Sequence[Page],
+        scales: Sequence[float],
+    ) -> None:
+        """Attach page backends preloaded with the parsed page and images.
+
+        Pages the workers failed to parse are left without backend.
+        """
+        results = self.parse_pages(backend, [p.page_no - 1 for p in pages], scales)
+        for page, result in zip(pages, results):
+            if isinstance(result, BaseException):
+                _log.warning(
+                    f"Parse worker failed on page {page.page_no}, parsing in-process: "
+                    f"{result}"
+                )
+                continue
+            page_backend = backend.load_page(page.page_no - 1)
+            page_backend.set_segmented_page(result.segmented_page)
+            page._backend = page_backend
+            page.size = result.size
+            page._image_cache.update(result.images)
+
+    def release_document(self, backend: DoclingParseV4DocumentBackend) -> None:
+        """Free the shared copy of a document given as a stream."""
+        with self._lock:
+            buffer = self._doc_buffers.pop(self._document_key(backend), None)
+        if buffer is not None:
+            buffer[0].close()
+            buffer[0].unlink()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            buffers = [shm for shm, _ in self._doc_buffers.values()]
+            self._doc_buffers.clear()
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
+
+    @staticmethod
+    def _document_key(backend: DoclingParseV4DocumentBackend) -> str:
+        # Shards of a document share its hash, but not their backends
+        return f"{backend.document_hash}-{id(backend)}"
+
+    def _document_source(
+        self, backend: DoclingParseV4DocumentBackend
+    ) -> _DocumentSource:
+        key = self._document_key(backend)
+        password = (
+            backend.options.password.get_secret_value()
+            if backend.options.password
+            else None
+        )
+        if isinstance(backend.path_or_stream, Path):
+            return _DocumentSource(
+                key=key, path=backend.path_or_stream, password=password
+            )
+
+        with self._lock:
+            if key not in self._doc_buffers:
+                data = backend.path_or_stream.getvalue()
+                shm = SharedMemory(create=True, size=max(1, len(data)))
+                _buffer(shm)[: len(data)] = data
+                self._doc_buffers[key] = (shm, len(data))
+            shm, size = self._doc_buffers[key]
+        return _DocumentSource(key=key, shm_name=shm.name, size=size, password=password)
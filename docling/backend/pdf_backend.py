@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from enum import Enum
 from io import BytesIO
 from pathlib import Path
 from typing import Optional, Set, Union
@@ -14,6 +15,15 @@ from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
 
 
+class PdfPageContent(str, Enum):
+    """Granularities of parsed page content which pipeline stages may require."""
+
+    TEXTLINES = "textlines"
+    WORDS = "words"
+    CHARS = "chars"
+    BITMAPS = "bitmaps"
+
+
 class PdfPageBackend(ABC):
     @abstractmethod
     def get_text_in_rect(self, bbox: BoundingBox) -> str:
@@ -59,12 +69,24 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
     ):
         super().__init__(in_doc, path_or_stream, options)
         self.options: PdfBackendOptions
+        # None means everything is parsed; backends may ignore it
+        self.required_page_content: Optional[Set[PdfPageContent]] = None
 
         if self.input_format not in self.supported_formats():
             raise RuntimeError(
                 f"Incompatible file format {self.input_format} was passed to a PdfDocumentBackend. Valid format are {','.join(self.supported_formats())}."
             )
 
+    def set_required_page_content(
+        self, content: Optional[Iterable[PdfPageContent]]
+    ) -> None:
+        """Restrict parsing of pages loaded from now on to the given content.
+
+        Backends supporting it skip building the content no stage will consume.
+        Passing None restores full parsing.
+        """
+        self.required_page_content = set(content) if content is not None else None
+
     @abstractmethod
     def load_page(self, page_no: int) -> PdfPageBackend:
         pass
@@ -29,6 +29,7 @@ from pydantic import (
 
 if TYPE_CHECKING:
     from docling.backend.pdf_backend import PdfPageBackend
+    from docling.utils.page_image_store import PageImageStore
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.datamodel.pipeline_options import PipelineOptions
@@ -270,12 +271,36 @@ class EquationPrediction(BaseModel):
     equation_map: dict[int, TextElement] = {}
 
 
+class OcrDecisionReason(str, Enum):
+    """Why the OCR model did or did not OCR (parts of) a page."""
+
+    FORCED_FULL_PAGE = "forced_full_page"
+    LOW_PARSE_QUALITY = "low_parse_quality"
+    BITMAP_DOMINANT = "bitmap_dominant"
+    BITMAP_REGIONS = "bitmap_regions"
+    LOW_BITMAP_COVERAGE = "low_bitmap_coverage"
+    TEXT_LAYER_PRESENT = "text_layer_present"
+
+
+class OcrDecision(BaseModel):
+    """Per-page record of the OCR decision and the signals it was based on."""
+
+    do_ocr: bool
+    reason: OcrDecisionReason
+    bitmap_coverage: float
+    text_density: Optional[float] = None  # only computed by the adaptive policy
+    parse_score: Optional[float] = None
+    num_ocr_rects: int = 0
+    num_skipped_rects: int = 0
+
+
 class PagePredictions(BaseModel):
     layout: Optional[LayoutPrediction] = None
     tablestructure: Optional[TableStructurePrediction] = None
     figures_classification: Optional[FigureClassificationPrediction] = None
     equations_prediction: Optional[EquationPrediction] = None
     vlm_response: Optional[VlmPrediction] = None
+    ocr_decision: Optional[OcrDecision] = None
 
 
 PageElement = Union[TextElement, Table, FigureElement, ContainerElement]
@@ -311,6 +336,21 @@ class Page(BaseModel):
     _image_cache: dict[
         float, Image
     ] = {}  # Cache of images in different scales. By default it is cleared during assembling.
+    _image_store: Optional["PageImageStore"] = (
+        None  # On-disk store for the images of the page, see `spill_images`.
+    )
+
+    def spill_images(self) -> None:
+        """Move the cached images to the image store, they are loaded back on demand."""
+        assert self._image_store is not None
+        self._image_store.spill(self.page_no, self._image_cache)
+        self._image_cache = {}
+
+    def _get_cached_image(self, scale: float) -> Optional[Image]:
+        image = self._image_cache.get(scale, None)
+        if image is None and self._image_store is not None:
+            image = self._image_store.get(self.page_no, scale)
+        return image
 
     @property
     def cells(self) -> list[TextCell]:
@@ -327,22 +367,23 @@ class Page(BaseModel):
         cropbox: Optional[BoundingBox] = None,
     ) -> Optional[Image]:
         if self._backend is None:
-            return self._image_cache.get(scale, None)
+            return self._get_cached_image(scale)
 
         if max_size:
             assert self.size is not None
             scale = min(scale, max_size / max(self.size.as_tuple()))
 
-        if scale not in self._image_cache:
+        page_im = self._get_cached_image(scale)
+        if page_im is None:
             if cropbox is None:
-                self._image_cache[scale] = self._backend.get_page_image(scale=scale)
+                page_im = self._backend.get_page_image(scale=scale)
+                self._image_cache[scale] = page_im
             else:
                 return self._backend.get_page_image(scale=scale, cropbox=cropbox)
 
         if cropbox is None:
-            return self._image_cache[scale]
+            return page_im
         else:
-            page_im = self._image_cache[scale]
             assert self.size is not None
             return page_im.crop(
                 cropbox.to_top_left_origin(page_height=self.size.height)
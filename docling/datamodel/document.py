@@ -53,7 +53,7 @@ from docling_core.types.legacy_doc.document import (
 )
 from docling_core.utils.file import resolve_source_to_stream
 from docling_core.utils.legacy import docling_document_to_legacy
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import deprecated
 
 from docling.backend.abstract_backend import (
@@ -75,6 +75,7 @@ from docling.datamodel.base_models import (
     Page,
 )
 from docling.datamodel.settings import DocumentLimits
+from docling.utils.cancellation import CancellationToken
 from docling.utils.profiling import ProfilingItem
 from docling.utils.utils import create_file_hash
 
@@ -418,6 +419,13 @@ class ConversionResult(ConversionAssets):
     input: InputDocument
     assembled: AssembledUnit = AssembledUnit()
 
+    _cancellation: CancellationToken = PrivateAttr(default_factory=CancellationToken)
+
+    @property
+    def cancellation(self) -> CancellationToken:
+        """Token cancelling the conversion, armed with the `document_timeout`."""
+        return self._cancellation
+
 
 class _DummyBackend(AbstractDocumentBackend):
     def __init__(self, *args, **kwargs):
@@ -103,6 +103,18 @@ class TableStructureOptions(BaseTableStructureOptions):
     ] = TableFormerMode.ACCURATE
 
 
+class OcrDecisionPolicy(str, Enum):
+    """Policy deciding which pages and regions are sent to the OCR engine.
+
+    - `bitmap_coverage`: OCR the bitmap regions of a page, based on their coverage only.
+    - `adaptive`: additionally use the parse quality and the text density of the text
+      layer, to only OCR where it changes the output.
+    """
+
+    BITMAP_COVERAGE = "bitmap_coverage"
+    ADAPTIVE = "adaptive"
+
+
 class OcrOptions(BaseOptions):
     """OCR options."""
 
@@ -127,6 +139,38 @@ class OcrOptions(BaseOptions):
             examples=[0.05, 0.1],
         ),
     ] = 0.05
+    decision_policy: Annotated[
+        OcrDecisionPolicy,
+        Field(
+            description=(
+                "Policy deciding which pages and regions are OCRed. `bitmap_coverage` relies on the bitmap coverage "
+                "only. `adaptive` also performs a full-page OCR of pages with a garbled text layer and skips bitmap "
+                "regions which are already covered by the text layer."
+            )
+        ),
+    ] = OcrDecisionPolicy.BITMAP_COVERAGE
+    parse_score_threshold: Annotated[
+        float,
+        Field(
+            description=(
+                "Adaptive policy only. Pages whose parse score is below this value are fully OCRed and their "
+                "programmatic text cells are replaced by the OCR cells."
+            ),
+            ge=0.0,
+            le=1.0,
+        ),
+    ] = 0.5
+    text_density_threshold: Annotated[
+        float,
+        Field(
+            description=(
+                "Adaptive policy only. Bitmap regions whose area is covered by programmatic text cells above this "
+                "fraction are not OCRed, since overlapping OCR cells would be discarded anyway."
+            ),
+            ge=0.0,
+            le=1.0,
+        ),
+    ] = 0.25
 
 
 class OcrAutoOptions(OcrOptions):
@@ -242,6 +286,17 @@ class RapidOcrOptions(OcrOptions):
             description="Custom path to font file for text rendering in visualization."
         ),
     ] = None
+    batch_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Number of text lines classified and recognized together. When larger than 1, the value sets "
+                "RapidOCR's `Cls.cls_batch_num` and `Rec.rec_batch_num`. RapidOCR reads one crop per call, the "
+                "crops are rendered and read one at a time. The default of 1 keeps RapidOCR's defaults."
+            ),
+            ge=1,
+        ),
+    ] = 1
     rapidocr_params: Annotated[
         dict[str, Any],
         Field(
@@ -323,6 +378,17 @@ class EasyOcrOptions(OcrOptions):
             )
         ),
     ] = True
+    batch_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Number of OCR crops processed together. When larger than 1, the crops of all pages in an OCR "
+                "batch are rendered first, crops of identical size are run through EasyOCR's `readtext_batched` "
+                "and the value is also used as recognizer batch size. The default of 1 processes one crop at a time."
+            ),
+            ge=1,
+        ),
+    ] = 1
     model_config = ConfigDict(
         extra="forbid",
         protected_namespaces=(),
@@ -369,6 +435,17 @@ class TesseractCliOcrOptions(OcrOptions):
             )
         ),
     ] = None
+    osd_sample_pages: Annotated[
+        Optional[int],
+        Field(
+            description=(
+                "If set, the orientation and script detection (OSD) only runs on the first N OCRed pages of each "
+                "document. The most frequent orientation and script are cached and reused for the remaining pages. "
+                "If None, OSD runs for every OCR rectangle, which handles documents with mixed page orientations."
+            ),
+            ge=1,
+        ),
+    ] = None
     model_config = ConfigDict(
         extra="forbid",
     )
@@ -405,6 +482,17 @@ class TesseractOcrOptions(OcrOptions):
             )
         ),
     ] = None
+    osd_sample_pages: Annotated[
+        Optional[int],
+        Field(
+            description=(
+                "If set, the orientation and script detection (OSD) only runs on the first N OCRed pages of each "
+                "document. The most frequent orientation and script are cached and reused for the remaining pages. "
+                "If None, OSD runs for every OCR rectangle, which handles documents with mixed page orientations."
+            ),
+            ge=1,
+        ),
+    ] = None
     model_config = ConfigDict(
         extra="forbid",
     )
@@ -1124,6 +1212,34 @@ class VlmExtractionPipelineOptions(PipelineOptions):
             )
         ),
     ] = NU_EXTRACT_2B_TRANSFORMERS
+    page_batch_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Number of pages sent to the VLM in one inference call. Larger batches improve throughput on GPUs at "
+                "the cost of memory."
+            ),
+        ),
+    ] = 1
+    streaming: Annotated[
+        bool,
+        Field(
+            description=(
+                "Render pages lazily on a background thread, overlapping rendering with inference, instead of "
+                "rendering every page upfront. Keeps memory bounded for long documents."
+            )
+        ),
+    ] = False
+    page_prefetch_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Maximum number of rendered pages waiting for inference in streaming mode."
+            ),
+        ),
+    ] = 4
 
 
 class PdfPipelineOptions(PaginatedPipelineOptions):
@@ -1265,6 +1381,27 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
             )
         ),
     ] = False
+    images_output_dir: Annotated[
+        Optional[Path],
+        Field(
+            description=(
+                "Directory where generated page, picture and table images are written as PNG files, in a subdirectory "
+                "per document named after its hash. The document then "
+                "references these files instead of embedding the images as base64. Only used by "
+                "`StandardPdfPipeline`."
+            )
+        ),
+    ] = None
+    image_encoding_workers: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Number of threads cropping and encoding the generated page, picture and table images. Only used by "
+                "`StandardPdfPipeline`."
+            ),
+        ),
+    ] = 4
     generate_parsed_pages: Annotated[
         bool,
         Field(
@@ -1275,6 +1412,26 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
             )
         ),
     ] = False
+    parse_required_content_only: Annotated[
+        bool,
+        Field(
+            description=(
+                "Let the PDF backend parse only the page content the enabled stages consume, e.g. skip word cells "
+                "without table structure and bitmap resources without OCR. Reduces parsing time and memory. Ignored "
+                "when `generate_parsed_pages` is enabled and by backends not supporting it. Only used by `StandardPdfPipeline`."
+            )
+        ),
+    ] = True
+    spill_page_images: Annotated[
+        bool,
+        Field(
+            description=(
+                "Move the images of finished pages to a temporary directory and load them back on demand, during "
+                "assembly, image cropping and enrichment. Bounds the memory of long documents when page, picture or "
+                "table images are generated. Only used by `StandardPdfPipeline`."
+            )
+        ),
+    ] = False
 
     ### Arguments for threaded PDF pipeline with batching and backpressure control
 
@@ -1309,6 +1466,119 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
             )
         ),
     ] = 4
+    adaptive_batch_size: Annotated[
+        bool,
+        Field(
+            description=(
+                "Adapt the batch sizes of the OCR, layout and table stages at runtime. Starting from "
+                "`ocr_batch_size`, `layout_batch_size` and `table_batch_size`, a stage doubles its batch size while "
+                "pages are waiting and the latency per page does not get worse, and shrinks it when the latency gets "
+                "worse or the free accelerator or host memory drops below `adaptive_batch_min_free_memory`. The "
+                "chosen sizes are recorded in the `<stage>_batch` profiling timings. Only used by "
+                "`StandardPdfPipeline` (threaded mode)."
+            )
+        ),
+    ] = False
+    max_adaptive_batch_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Upper bound of the batch sizes chosen with `adaptive_batch_size`. Only used by `StandardPdfPipeline` "
+                "(threaded mode)."
+            ),
+        ),
+    ] = 32
+    adaptive_batch_min_free_memory: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=1.0,
+            description=(
+                "Fraction of free CUDA memory (or host memory without CUDA) below which the stages using "
+                "`adaptive_batch_size` halve their batch size. Only used by `StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = 0.1
+    layout_postprocess_stage: Annotated[
+        bool,
+        Field(
+            description=(
+                "Run layout post-processing (cluster cleanup, cell assignment and confidence scores) in a separate "
+                "stage after layout inference, so the layout model keeps processing the next pages meanwhile. Only "
+                "applies to the built-in layout model. Only used by `StandardPdfPipeline` (threaded mode)."
+            )
+        ),
+    ] = True
+    layout_postprocess_workers: Annotated[
+        int,
+        Field(
+            ge=0,
+            description=(
+                "Number of worker processes for the layout post-processing stage. With 0, post-processing runs in the "
+                "stage thread. Worker processes avoid contention on the GIL for dense documents, at the cost of copying "
+                "the page cells between processes. Only used by `StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = 0
+    num_page_shards: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Split the page range of a document into up to this many contiguous shards, converted concurrently "
+                "and merged before reading order and assembly. Each shard runs its own set of stage threads over the "
+                "shared models, which reduces the latency of a single long document. Only used by "
+                "`StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = 1
+    page_shard_min_pages: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Minimum number of pages per shard when `num_page_shards` is greater than 1. Shorter documents use "
+                "fewer shards. Only used by `StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = 16
+    shared_stage_graph: Annotated[
+        bool,
+        Field(
+            description=(
+                "Run the stages in long-lived threads shared by all the documents converted by the pipeline, instead "
+                "of starting and stopping a set of stage threads per document. Pages of concurrent documents (e.g. "
+                "with `doc_batch_concurrency` > 1) are fed with a fair share of the queue capacity each, and the "
+                "layout inference batches are filled with pages of several documents. Only used by "
+                "`StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = False
+    incremental_reading_order: Annotated[
+        bool,
+        Field(
+            description=(
+                "Apply the reading order to the pages as they leave the last stage and append their items to "
+                "`ConversionResult.document` during the conversion, instead of once after the last page. Overlaps the "
+                "reading order with the conversion of the next pages and lets consumers holding the conversion result "
+                "start on the document early. Not applied when `num_page_shards` splits the document. Only used by "
+                "`StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = False
+    parse_workers: Annotated[
+        int,
+        Field(
+            ge=0,
+            description=(
+                "Number of worker processes parsing and rendering PDF pages ahead of the other stages. With 0, pages "
+                "are parsed in the preprocess stage thread. Worker processes lift the parsing throughput limit on "
+                "many-core machines, at the cost of one document handle per worker. Only applies to the docling-parse "
+                "v4 backend. Only used by `StandardPdfPipeline` (threaded mode)."
+            ),
+        ),
+    ] = 0
 
     # Timing control
     batch_polling_interval_seconds: Annotated[
@@ -1334,6 +1604,33 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
     ] = 100
 
 
+class VlmFallbackThresholds(BaseModel):
+    """Page confidence scores below which `HybridPdfPipeline` converts a page with the VLM.
+
+    A page is re-converted if any of its scores is below the threshold of that score.
+    Scores that do not apply to a page (e.g. no table on the page) never trigger it.
+    """
+
+    parse_score: Annotated[
+        Optional[float],
+        Field(
+            description="Threshold of the PDF parsing quality score. None disables it."
+        ),
+    ] = 0.5
+    layout_score: Annotated[
+        Optional[float],
+        Field(description="Threshold of the layout detection score. None disables it."),
+    ] = 0.5
+    table_score: Annotated[
+        Optional[float],
+        Field(description="Threshold of the table structure score. None disables it."),
+    ] = 0.5
+    ocr_score: Annotated[
+        Optional[float],
+        Field(description="Threshold of the OCR score. None disables it."),
+    ] = 0.5
+
+
 class ProcessingPipeline(str, Enum):
     """Available document processing pipeline types for different use cases.
 
@@ -1355,3 +1652,74 @@ class ProcessingPipeline(str, Enum):
 
 class ThreadedPdfPipelineOptions(PdfPipelineOptions):
     """Pipeline options for the threaded PDF pipeline with batching and backpressure control"""
+
+
+class ThreadedVlmPipelineOptions(VlmPipelineOptions):
+    """Pipeline options for the threaded VLM pipeline with batching and backpressure control"""
+
+    vlm_batch_size: Annotated[
+        Optional[int],
+        Field(
+            ge=1,
+            description=(
+                "Number of pages sent to the VLM in one batch. If None, the preferred batch size of the inference "
+                "engine is used, e.g. the number of concurrent requests of API engines. Only used by "
+                "`ThreadedVlmPipeline`."
+            ),
+        ),
+    ] = None
+    vlm_reorder_window: Annotated[
+        Optional[int],
+        Field(
+            ge=1,
+            description=(
+                "Maximum number of queued pages the VLM stage takes at once and splits into batches of pages with "
+                "similar ink density, a cheap estimate of the response length, so that short pages are not decoded "
+                "as long as the longest page of their batch. Results keep the page order. If None or not larger "
+                "than the VLM batch size, pages are batched in arrival order. Only used by `ThreadedVlmPipeline`."
+            ),
+        ),
+    ] = None
+    batch_polling_interval_seconds: Annotated[
+        float,
+        Field(
+            description=(
+                "Polling interval in seconds for batch collection in threaded pipeline stages. Each stage waits up to "
+                "this duration to accumulate items before processing. Only used by `ThreadedVlmPipeline`."
+            )
+        ),
+    ] = 0.5
+    queue_max_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Maximum queue size between the render, VLM and page assembly stages. Bounds the number of rendered "
+                "page images held ahead of the VLM. Only used by `ThreadedVlmPipeline`."
+            ),
+        ),
+    ] = 16
+
+
+class HybridPdfPipelineOptions(ThreadedPdfPipelineOptions):
+    """Pipeline options for the hybrid pipeline converting low-confidence pages with a VLM"""
+
+    vlm_options: Annotated[
+        Union[VlmConvertOptions, InlineVlmOptions, ApiVlmOptions],
+        Field(
+            description=(
+                "Vision-Language Model converting the pages whose confidence scores fall below "
+                "`vlm_fallback_thresholds`. Default: 'granite_docling' preset. Only used by `HybridPdfPipeline`."
+            ),
+        ),
+    ] = _default_vlm_convert_options
+    vlm_fallback_thresholds: Annotated[
+        VlmFallbackThresholds,
+        Field(
+            description=(
+                "Page confidence scores below which a page converted by the standard layout, table and OCR models is "
+                "converted again with the VLM, its VLM content replacing the standard one in the document. Only used "
+                "by `HybridPdfPipeline`."
+            ),
+        ),
+    ] = VlmFallbackThresholds()
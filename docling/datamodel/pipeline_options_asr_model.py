@@ -171,6 +171,49 @@ class InlineAsrNativeWhisperOptions(InlineAsrOptions):
             )
         ),
     ] = True
+    chunk_duration: Annotated[
+        Optional[float],
+        Field(
+            gt=0,
+            description=(
+                "Target duration in seconds of the audio chunks transcribed "
+                "independently. Chunks are cut at the quietest point close to "
+                "the target duration, so long recordings are transcribed "
+                "piecewise, with progress and partial results on timeout. If "
+                "None, the whole file is transcribed in a single call."
+            ),
+            examples=[300.0, 600.0],
+        ),
+    ] = None
+    chunk_search_window: Annotated[
+        float,
+        Field(
+            gt=0,
+            description=(
+                "Length in seconds of the window before each chunk boundary "
+                "which is searched for silence to place the cut."
+            ),
+        ),
+    ] = 10.0
+    silence_threshold_db: Annotated[
+        float,
+        Field(
+            description=(
+                "Loudness in dBFS below which a chunk is considered silent and "
+                "skipped without running the model."
+            ),
+        ),
+    ] = -60.0
+    num_workers: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=(
+                "Number of chunks transcribed in parallel when chunking is "
+                "enabled. Each worker uses its own copy of the model."
+            ),
+        ),
+    ] = 1
 
 
 class InlineAsrMlxWhisperOptions(InlineAsrOptions):
@@ -33,6 +33,22 @@ class BatchConcurrencySettings(BaseModel):
     elements_batch_size: int = (
         16  # Number of elements processed in one batch, in enrichment models.
     )
+    share_models: bool = False  # Share loaded layout, table and OCR models between pipelines with different options.
+    model_registry_max_idle_bytes: int = (
+        2 * 1024**3  # Memory budget for shared models not used by any pipeline.
+    )
+    model_registry_max_idle_models: int = (
+        16  # Max. number of shared models not used by any pipeline, of any size.
+    )
+    pipeline_cache_max_size: Optional[int] = (
+        None  # Max. number of initialized pipelines kept by a converter.
+    )
+    pipeline_cache_ttl: Optional[float] = (
+        None  # Seconds after which an unused cached pipeline is dropped.
+    )
+    pipeline_cache_max_bytes: Optional[int] = (
+        None  # Memory budget for the models of cached pipelines.
+    )
 
     # To force models into single core: export OMP_NUM_THREADS=1
 
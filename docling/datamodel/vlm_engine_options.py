@@ -78,6 +78,34 @@ class TransformersVlmEngineOptions(BaseVlmEngineOptions):
         default=True, description="Enable key-value caching for attention"
     )
 
+    continuous_batching: bool = Field(
+        default=False,
+        description=(
+            "Decode with continuous batching: finished sequences leave the batch and "
+            "queued inputs take their place at every decoding step, each with its own "
+            "stopping criteria and max_new_tokens. Falls back to `generate` for models "
+            "with sliding-window caches or multimodal rotary positions, and for inputs "
+            "with extra generation arguments"
+        ),
+    )
+
+    max_concurrent_sequences: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of sequences decoded together with continuous batching",
+    )
+
+    prompt_prefix_caching: bool = Field(
+        default=False,
+        description=(
+            "With continuous batching, prefill the prompt tokens before the image (chat "
+            "template, system prompt) once and reuse their KV cache for the following "
+            "pages. It is recomputed when the prompt prefix changes. Prefixes shorter "
+            "than 64 tokens are not cached, their prefill is cheaper than attending to "
+            "a cache. Needs a model config with an `image_token_id`"
+        ),
+    )
+
 
 # =============================================================================
 # MLX ENGINE OPTIONS
@@ -64,6 +64,7 @@ from docling.pipeline.asr_pipeline import AsrPipeline
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.pipeline_cache import PipelineCache, PipelineCacheStats
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -190,7 +191,8 @@ class DocumentConverter:
         allowed_formats: Allowed input formats.
         format_to_options: Mapping of formats to their options.
         initialized_pipelines: Cache of initialized pipelines keyed by
-            (pipeline class, options hash).
+            (pipeline class, options hash), bounded by the
+            `pipeline_cache_*` limits of `docling.datamodel.settings.settings.perf`.
     """
 
     _default_download_filename = "file"
@@ -244,15 +246,19 @@ class DocumentConverter:
             )
             for format in self.allowed_formats
         }
-        self.initialized_pipelines: dict[
+        self.initialized_pipelines: PipelineCache[
             tuple[Type[BasePipeline], str], BasePipeline
-        ] = {}
+        ] = PipelineCache()
 
     def _get_initialized_pipelines(
         self,
-    ) -> dict[tuple[Type[BasePipeline], str], BasePipeline]:
+    ) -> PipelineCache[tuple[Type[BasePipeline], str], BasePipeline]:
         return self.initialized_pipelines
 
+    def pipeline_cache_stats(self) -> PipelineCacheStats:
+        """Return the hits, misses and evictions of the pipeline cache."""
+        return self.initialized_pipelines.stats()
+
     def _get_pipeline_options_hash(self, pipeline_options: PipelineOptions) -> str:
         """Generate a hash of pipeline options to use as part of the cache key."""
         options_str = str(pipeline_options.model_dump())
@@ -489,20 +495,14 @@ class DocumentConverter:
         # Use a composite key to cache pipelines
         cache_key = (pipeline_class, options_hash)
 
-        with _PIPELINE_CACHE_LOCK:
-            if cache_key not in self.initialized_pipelines:
-                _log.info(
-                    f"Initializing pipeline for {pipeline_class.__name__} with options hash {options_hash}"
-                )
-                self.initialized_pipelines[cache_key] = pipeline_class(
-                    pipeline_options=pipeline_options
-                )
-            else:
-                _log.debug(
-                    f"Reusing cached pipeline for {pipeline_class.__name__} with options hash {options_hash}"
-                )
+        def _create_pipeline() -> BasePipeline:
+            _log.info(
+                f"Initializing pipeline for {pipeline_class.__name__} with options hash {options_hash}"
+            )
+            return pipeline_class(pipeline_options=pipeline_options)
 
-            return self.initialized_pipelines[cache_key]
+        with _PIPELINE_CACHE_LOCK:
+            return self.initialized_pipelines.get_or_create(cache_key, _create_pipeline)
 
     def _process_document(
         self, in_doc: InputDocument, raises_on_error: bool
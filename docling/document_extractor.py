@@ -39,6 +39,7 @@ from docling.datamodel.settings import (
 from docling.exceptions import ConversionError
 from docling.pipeline.base_extraction_pipeline import BaseExtractionPipeline
 from docling.pipeline.extraction_vlm_pipeline import ExtractionVlmPipeline
+from docling.utils.pipeline_cache import PipelineCache
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -116,9 +117,9 @@ class DocumentExtractor:
         }
 
         # Cache pipelines by (class, options-hash)
-        self._initialized_pipelines: dict[
+        self._initialized_pipelines: PipelineCache[
             tuple[Type[BaseExtractionPipeline], str], BaseExtractionPipeline
-        ] = {}
+        ] = PipelineCache()
 
     # ---------------------------- Public API ---------------------------------
 
@@ -303,20 +304,19 @@ class DocumentExtractor:
         options_hash = self._get_pipeline_options_hash(pipeline_options)
 
         cache_key = (pipeline_class, options_hash)
-        with _PIPELINE_CACHE_LOCK:
-            if cache_key not in self._initialized_pipelines:
-                _log.info(
-                    f"Initializing extraction pipeline for {pipeline_class.__name__} with options hash {options_hash}"
-                )
-                self._initialized_pipelines[cache_key] = pipeline_class(
-                    pipeline_options=pipeline_options  # type: ignore[arg-type]
-                )
-            else:
-                _log.debug(
-                    f"Reusing cached extraction pipeline for {pipeline_class.__name__} with options hash {options_hash}"
-                )
 
-            return self._initialized_pipelines[cache_key]
+        def _create_pipeline() -> BaseExtractionPipeline:
+            _log.info(
+                f"Initializing extraction pipeline for {pipeline_class.__name__} with options hash {options_hash}"
+            )
+            return pipeline_class(
+                pipeline_options=pipeline_options  # type: ignore[arg-type]
+            )
+
+        with _PIPELINE_CACHE_LOCK:
+            return self._initialized_pipelines.get_or_create(
+                cache_key, _create_pipeline
+            )
 
     @staticmethod
     def _get_pipeline_options_hash(pipeline_options: PipelineOptions) -> str:
@@ -8,3 +8,7 @@ class ConversionError(BaseError):
 
 class OperationNotAllowed(BaseError):
     pass
+
+
+class ConversionCancelledError(BaseError):
+    """Raised by the models when the conversion of a document was cancelled."""
@@ -2,7 +2,8 @@
 
 from typing import Union
 
-from pydantic import model_validator
+from docling_core.types.doc import DocItemLabel
+from pydantic import Field, model_validator
 
 from docling.datamodel.layout_model_specs import DOCLING_LAYOUT_HERON
 from docling.datamodel.pipeline_options import LayoutOptions, PaginatedPipelineOptions
@@ -27,6 +28,28 @@ class ThreadedLayoutVlmPipelineOptions(PaginatedPipelineOptions):
         model_spec=DOCLING_LAYOUT_HERON, skip_cell_assignment=True
     )
 
+    # Region mode: only the crops of these layout labels, and of text regions without
+    # clean native text, are sent to the VLM. The other regions take the text of the
+    # PDF backend, which saves most image tokens on text-heavy documents.
+    vlm_region_crops: bool = False
+    vlm_region_labels: set[DocItemLabel] = {
+        DocItemLabel.TABLE,
+        DocItemLabel.DOCUMENT_INDEX,
+        DocItemLabel.FORMULA,
+        DocItemLabel.CODE,
+        DocItemLabel.PICTURE,
+        DocItemLabel.CHART,
+    }
+    # Prompts of the region crops per label, vlm_options.prompt for the other labels
+    vlm_region_prompts: dict[DocItemLabel, str] = Field(
+        default_factory=lambda: {
+            DocItemLabel.TABLE: "Convert table to OTSL.",
+            DocItemLabel.DOCUMENT_INDEX: "Convert table to OTSL.",
+            DocItemLabel.FORMULA: "Convert formula to LaTeX.",
+            DocItemLabel.CODE: "Convert code to text.",
+        }
+    )
+
     # Threading and batching controls
     layout_batch_size: int = 4
     vlm_batch_size: int = 4
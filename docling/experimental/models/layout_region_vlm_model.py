@@ -0,0 +1,235 @@
+"""Internal page model sending only the layout regions that need a VLM to the VLM."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable, Mapping, Sequence
+
+from docling_core.types.doc import DocItemLabel, RefItem
+from docling_core.types.doc.tokens import DocumentToken
+from docling_ibm_models.reading_order.reading_order_rb import (
+    PageElement as ReadingOrderPageElement,
+    ReadingOrderPredictor,
+)
+from PIL.Image import Image
+
+from docling.datamodel.base_models import Cluster, Page, VlmPrediction
+from docling.datamodel.document import ConversionResult
+from docling.models.base_model import BasePageModel, BaseVlmPageModel
+from docling.utils.profiling import TimeRecorder
+
+__all__ = ["LayoutRegionVlmModel"]
+
+_log = logging.getLogger(__name__)
+
+# DocTags elements of the clusters taking the native text of the backend
+_TEXT_TAGS: dict[DocItemLabel, str] = {
+    DocItemLabel.TITLE: "title",
+    DocItemLabel.SECTION_HEADER: "section_header_level_1",
+    DocItemLabel.CAPTION: "caption",
+    DocItemLabel.FOOTNOTE: "footnote",
+    DocItemLabel.PAGE_HEADER: "page_header",
+    DocItemLabel.PAGE_FOOTER: "page_footer",
+    DocItemLabel.LIST_ITEM: "list_item",
+    DocItemLabel.CHECKBOX_SELECTED: "checkbox_selected",
+    DocItemLabel.CHECKBOX_UNSELECTED: "checkbox_unselected",
+}
+
+# DocTags elements of the clusters converted by the VLM
+_REGION_TAGS: dict[DocItemLabel, str] = {
+    DocItemLabel.TABLE: "otsl",
+    DocItemLabel.DOCUMENT_INDEX: "otsl",
+    DocItemLabel.FORMULA: "formula",
+    DocItemLabel.CODE: "code",
+    DocItemLabel.PICTURE: "picture",
+    DocItemLabel.CHART: "chart",
+}
+
+# Tags of the region responses whose structure is kept, all others become plain text
+_STRUCTURED_TAGS = {"otsl", "picture", "chart", "code"}
+
+_LOC_PATTERN = re.compile(r"<loc_\d+>")
+_TOKEN_PATTERN = re.compile(r"<[^>]*>")
+_ELEMENT_PATTERN = re.compile(
+    r"<(?P<tag>[a-z_0-9]+)>(?P<body>.*?)</(?P=tag)>", re.DOTALL
+)
+_WRAPPER_PATTERN = re.compile(r"</?doctag>|<end_of_utterance>")
+
+
+def is_clean_text(text: str) -> bool:
+    """Whether the native text of a region can be used without the VLM.
+
+    Empty text (scanned or vectorized regions) and text with unmapped glyphs or
+    replacement characters (broken font encodings) are not.
+    """
+    if not text.strip() or "GLYPH<" in text:
+        return False
+    broken = sum(1 for c in text if c == "\ufffd" or (c < " " and c not in "\t\n"))
+    return broken / len(text) < 0.02
+
+
+def region_body(response: str, tag: str) -> str:
+    """Content of the first element of a region response, without locations.
+
+    The locations the VLM predicts are relative to the crop, the pipeline puts the
+    location of the layout cluster in their place.
+    """
+    text = _WRAPPER_PATTERN.sub("", response).strip()
+    match = _ELEMENT_PATTERN.search(text)
+    if tag in _STRUCTURED_TAGS and match is not None:
+        return _LOC_PATTERN.sub("", match.group("body")).strip()
+    # Text of all the elements the VLM found in the region
+    return " ".join(_TOKEN_PATTERN.sub(" ", text).split())
+
+
+class LayoutRegionVlmModel(BasePageModel):
+    """Convert the layout clusters of a page, sending only selected crops to the VLM.
+
+    Clusters whose label is in ``region_labels`` and text clusters without clean
+    native text are cropped from the page image and converted by the VLM, in batches
+    of ``batch_size`` crops across the pages. The other clusters take the text of the backend. The
+    elements are stitched in reading order into the DocTags of the page, stored as
+    its ``vlm_response``.
+
+    This model is internal and not part of the stable public interface.
+    """
+
+    def __init__(
+        self,
+        vlm_model: BaseVlmPageModel,
+        region_labels: Iterable[DocItemLabel],
+        region_prompts: Mapping[DocItemLabel, str],
+        scale: float,
+        batch_size: int,
+    ):
+        self.vlm_model = vlm_model
+        self.region_labels = set(region_labels)
+        self.region_prompts = dict(region_prompts)
+        self.scale = scale
+        self.batch_size = batch_size
+        self.ro_model = ReadingOrderPredictor()
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        pages = list(page_batch)
+        with TimeRecorder(conv_res, "vlm_regions"):
+            # Per page, the DocTags elements, with None where a VLM region goes
+            page_elements: list[list[tuple[Cluster, str, str | None]]] = []
+            crops: list[Image] = []
+            prompts: list[str] = []
+            for page in pages:
+                conv_res.cancellation.raise_if_cancelled()
+                elements: list[tuple[Cluster, str, str | None]] = []
+                for cluster in self._ordered_clusters(page):
+                    tag, body = self._native_element(page, cluster)
+                    if body is None:
+                        crop = page.get_image(scale=self.scale, cropbox=cluster.bbox)
+                        if crop is None or min(crop.size) < 1:
+                            # Keep the element, with whatever native text it has
+                            body = self._fallback_body(page, cluster, tag)
+                            elements.append((cluster, tag, body))
+                            continue
+                        crops.append(crop)
+                        prompts.append(
+                            self.region_prompts.get(
+                                cluster.label, self.vlm_model.vlm_options.prompt
+                            )
+                        )
+                    elements.append((cluster, tag, body))
+                page_elements.append(elements)
+
+            responses: list[VlmPrediction] = []
+            for start in range(0, len(crops), self.batch_size):
+                responses.extend(
+                    self.vlm_model.process_images(
+                        crops[start : start + self.batch_size],
+                        prompts[start : start + self.batch_size],
+                    )
+                )
+            predictions = iter(responses)
+            _log.debug("Sent %d regions of %d pages to the VLM", len(crops), len(pages))
+
+            for page, elements in zip(pages, page_elements):
+                parts = []
+                for cluster, tag, body in elements:
+                    if body is None:
+                        body = region_body(next(predictions).text, tag)
+                    parts.append(self._doctags_element(page, cluster, tag, body))
+                page.predictions.vlm_response = VlmPrediction(
+                    text=self._join_elements(parts)
+                )
+
+        yield from pages
+
+    def _ordered_clusters(self, page: Page) -> list[Cluster]:
+        if page.predictions.layout is None or page.size is None:
+            return []
+        clusters = page.predictions.layout.clusters
+        elements = []
+        for cid, cluster in enumerate(clusters):
+            bbox = cluster.bbox.to_bottom_left_origin(page.size.height)
+            elements.append(
+                ReadingOrderPageElement(
+                    cid=cid,
+                    ref=RefItem(cref=f"#/{page.page_no}/{cluster.id}"),
+                    text="",
+                    page_no=page.page_no,
+                    page_size=page.size,
+                    label=cluster.label,
+                    l=bbox.l,
+                    r=bbox.r,
+                    b=bbox.b,
+                    t=bbox.t,
+                    coord_origin=bbox.coord_origin,
+                )
+            )
+        ordered = self.ro_model.predict_reading_order(page_elements=elements)
+        return [clusters[element.cid] for element in ordered]
+
+    def _native_element(self, page: Page, cluster: Cluster) -> tuple[str, str | None]:
+        """Tag and native text of a cluster, the text is None for VLM regions."""
+        if cluster.label in self.region_labels:
+            return _REGION_TAGS.get(cluster.label, "text"), None
+        tag = _TEXT_TAGS.get(cluster.label, "text")
+        assert page._backend is not None
+        text = page._backend.get_text_in_rect(cluster.bbox)
+        if not is_clean_text(text):
+            return tag, None
+        return tag, " ".join(text.split())
+
+    @staticmethod
+    def _fallback_body(page: Page, cluster: Cluster, tag: str) -> str:
+        """Body of a region without crop: its native text, empty for structures."""
+        if tag in _STRUCTURED_TAGS or page._backend is None:
+            return ""
+        return " ".join(page._backend.get_text_in_rect(cluster.bbox).split())
+
+    @staticmethod
+    def _doctags_element(page: Page, cluster: Cluster, tag: str, body: str) -> str:
+        assert page.size is not None
+        location = DocumentToken.get_location(
+            bbox=cluster.bbox.as_tuple(),
+            page_w=page.size.width,
+            page_h=page.size.height,
+        )
+        return f"<{tag}>{location}{body}</{tag}>"
+
+    @staticmethod
+    def _join_elements(parts: Sequence[str]) -> str:
+        """Wrap the page elements into DocTags, grouping consecutive list items."""
+        doctags = ["<doctag>"]
+        in_list = False
+        for part in parts:
+            is_item = part.startswith("<list_item>")
+            if is_item and not in_list:
+                doctags.append("<unordered_list>")
+            elif not is_item and in_list:
+                doctags.append("</unordered_list>")
+            in_list = is_item
+            doctags.append(part)
+        if in_list:
+            doctags.append("</unordered_list>")
+        doctags.append("</doctag>")
+        return "".join(doctags)
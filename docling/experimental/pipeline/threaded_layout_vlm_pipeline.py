@@ -3,6 +3,10 @@
 A specialized two-stage threaded pipeline that combines layout model preprocessing
 with VLM processing. The layout model detects document elements and coordinates,
 which are then injected into the VLM prompt for enhanced structured output.
+
+With `vlm_region_crops`, the VLM instead receives only the crops of the regions that
+need it (tables, formulas, code, pictures and text without clean native text), the
+other regions take the text of the PDF backend.
 """
 
 from __future__ import annotations
@@ -32,7 +36,8 @@ from docling.datamodel.settings import settings
 from docling.experimental.datamodel.threaded_layout_vlm_pipeline_options import (
     ThreadedLayoutVlmPipelineOptions,
 )
-from docling.models.base_model import BaseVlmPageModel
+from docling.experimental.models.layout_region_vlm_model import LayoutRegionVlmModel
+from docling.models.base_model import BasePageModel, BaseVlmPageModel
 from docling.models.stages.layout.layout_model import LayoutModel
 from docling.models.vlm_pipeline_models.api_vlm_model import ApiVlmModel
 from docling.models.vlm_pipeline_models.hf_transformers_model import (
@@ -177,6 +182,17 @@ class ThreadedLayoutVlmPipeline(BasePipeline):
         else:
             raise ValueError(f"Unsupported VLM options type: {type(base_vlm_options)}")
 
+        # Model of the VLM stage
+        self.vlm_stage_model: BasePageModel = self.vlm_model
+        if self.pipeline_options.vlm_region_crops:
+            self.vlm_stage_model = LayoutRegionVlmModel(
+                vlm_model=self.vlm_model,
+                region_labels=self.pipeline_options.vlm_region_labels,
+                region_prompts=self.pipeline_options.vlm_region_prompts,
+                scale=base_vlm_options.scale,
+                batch_size=self.pipeline_options.vlm_batch_size,
+            )
+
     def _resolve_artifacts_path(self) -> Optional[Path]:
         """Resolve artifacts path from options or settings."""
         if self.pipeline_options.artifacts_path:
@@ -204,10 +220,10 @@ class ThreadedLayoutVlmPipeline(BasePipeline):
             queue_max_size=opts.queue_max_size,
         )
 
-        # VLM stage - now layout-aware through enhanced build_prompt
+        # VLM stage - layout-aware through enhanced build_prompt, or region crops
         vlm_stage = ThreadedPipelineStage(
             name="vlm",
-            model=self.vlm_model,
+            model=self.vlm_stage_model,
             batch_size=opts.vlm_batch_size,
             batch_timeout=opts.batch_timeout_seconds,
             queue_max_size=opts.queue_max_size,
@@ -1,9 +1,10 @@
 import copy
 import logging
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
 import numpy as np
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -12,15 +13,25 @@ from PIL import Image, ImageDraw
 from rtree import index
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
-from docling.datamodel.base_models import Page
+from docling.datamodel.base_models import OcrDecision, OcrDecisionReason, Page
 from docling.datamodel.document import ConversionResult
-from docling.datamodel.pipeline_options import OcrOptions
+from docling.datamodel.pipeline_options import OcrDecisionPolicy, OcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BaseModelWithOptions, BasePageModel
+from docling.utils.layout_postprocessor import _cell_boxes
 
 _log = logging.getLogger(__name__)
 
 
+@dataclass
+class OcrCrop:
+    """A rendered OCR region, tagged with the index of its page in the batch."""
+
+    page_idx: int
+    rect: BoundingBox
+    image: np.ndarray
+
+
 class BaseOcrModel(BasePageModel, BaseModelWithOptions):
     def __init__(
         self,
@@ -37,7 +48,14 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
         self.options = options
 
     # Computes the optimum amount and coordinates of rectangles to OCR on a given page
-    def get_ocr_rects(self, page: Page) -> List[BoundingBox]:
+    def get_ocr_rects(
+        self, page: Page, conv_res: Optional[ConversionResult] = None
+    ) -> List[BoundingBox]:
+        """Return the rectangles to OCR and record the decision on the page.
+
+        The parse score of the page is read from ``conv_res`` when it is given,
+        which is needed by the adaptive decision policy.
+        """
         from scipy.ndimage import binary_dilation, find_objects, label
 
         BITMAP_COVERAGE_TRESHOLD = 0.75
@@ -92,24 +110,151 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
             bitmap_rects = []
         coverage, ocr_rects = find_ocr_rects(page.size, bitmap_rects)
 
-        # return full-page rectangle if page is dominantly covered with bitmaps
-        if self.options.force_full_page_ocr or coverage > max(
+        full_page_rect = BoundingBox(
+            l=0,
+            t=0,
+            r=page.size.width,
+            b=page.size.height,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        bitmap_dominant = coverage > max(
             BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold
+        )
+
+        parse_score: Optional[float] = None
+        if conv_res is not None and page.page_no in conv_res.confidence.pages:
+            page_parse_score = conv_res.confidence.pages[page.page_no].parse_score
+            if not np.isnan(page_parse_score):
+                parse_score = page_parse_score
+
+        adaptive = self.options.decision_policy == OcrDecisionPolicy.ADAPTIVE
+        num_skipped_rects = 0
+        text_density: Optional[float] = None
+        if adaptive:
+            text_boxes = self._text_cell_boxes(page)
+            text_density = self._text_density(text_boxes, full_page_rect)
+
+        if self.options.force_full_page_ocr:
+            reason = OcrDecisionReason.FORCED_FULL_PAGE
+            selected_rects = [full_page_rect]
+        elif (
+            adaptive
+            and parse_score is not None
+            and parse_score < self.options.parse_score_threshold
         ):
-            return [
-                BoundingBox(
-                    l=0,
-                    t=0,
-                    r=page.size.width,
-                    b=page.size.height,
-                    coord_origin=CoordOrigin.TOPLEFT,
-                )
-            ]
+            # the text layer is garbled, OCR output replaces it (see post_process_cells)
+            reason = OcrDecisionReason.LOW_PARSE_QUALITY
+            selected_rects = [full_page_rect]
+        # return full-page rectangle if page is dominantly covered with bitmaps
+        elif bitmap_dominant:
+            reason = OcrDecisionReason.BITMAP_DOMINANT
+            selected_rects = [full_page_rect]
         # return individual rectangles if the bitmap coverage is above the threshold
         elif coverage > self.options.bitmap_area_threshold:
-            return ocr_rects
+            reason = OcrDecisionReason.BITMAP_REGIONS
+            selected_rects = ocr_rects
         else:  # overall coverage of bitmaps is too low, drop all bitmap rectangles.
-            return []
+            reason = OcrDecisionReason.LOW_BITMAP_COVERAGE
+            selected_rects = []
+
+        if adaptive and reason in (
+            OcrDecisionReason.BITMAP_DOMINANT,
+            OcrDecisionReason.BITMAP_REGIONS,
+        ):
+            # OCR cells overlapping programmatic cells are dropped when combining,
+            # hence regions already covered by a good text layer are not worth OCRing.
+            kept_rects = [
+                rect
+                for rect in selected_rects
+                if self._text_density(text_boxes, rect)
+                < self.options.text_density_threshold
+            ]
+            num_skipped_rects = len(selected_rects) - len(kept_rects)
+            selected_rects = kept_rects
+            if not selected_rects:
+                reason = OcrDecisionReason.TEXT_LAYER_PRESENT
+
+        page.predictions.ocr_decision = OcrDecision(
+            do_ocr=len(selected_rects) > 0,
+            reason=reason,
+            bitmap_coverage=float(coverage),
+            text_density=text_density,
+            parse_score=parse_score,
+            num_ocr_rects=len(selected_rects),
+            num_skipped_rects=num_skipped_rects,
+        )
+
+        return selected_rects
+
+    @staticmethod
+    def _text_cell_boxes(page: Page) -> np.ndarray:
+        """Top-left origin boxes of the programmatic (non-OCR) text cells of *page*."""
+        assert page.size is not None
+        cells = [cell for cell in page.cells if not cell.from_ocr]
+        boxes = _cell_boxes(cells)
+        bottom_left = np.array(
+            [cell.rect.coord_origin == CoordOrigin.BOTTOMLEFT for cell in cells],
+            dtype=bool,
+        )
+        boxes[bottom_left, 1] = page.size.height - boxes[bottom_left, 1]
+        boxes[bottom_left, 3] = page.size.height - boxes[bottom_left, 3]
+        return boxes
+
+    @staticmethod
+    def _text_density(text_boxes: np.ndarray, rect: BoundingBox) -> float:
+        """Fraction of the top-left origin *rect* covered by the *text_boxes*."""
+        rect_area = rect.area()
+        if rect_area <= 0:
+            return 0.0
+
+        widths = np.minimum(text_boxes[:, 2], rect.r) - np.maximum(
+            text_boxes[:, 0], rect.l
+        )
+        heights = np.minimum(text_boxes[:, 3], rect.b) - np.maximum(
+            text_boxes[:, 1], rect.t
+        )
+        covered = float(np.sum(np.clip(widths, 0, None) * np.clip(heights, 0, None)))
+        return min(covered / rect_area, 1.0)
+
+    def prepare_ocr_crops(
+        self,
+        conv_res: ConversionResult,
+        pages: Sequence[Page],
+        scale: float,
+    ) -> Tuple[Dict[int, List[BoundingBox]], List[OcrCrop]]:
+        """Compute the OCR rects of a page batch and render all their crops.
+
+        Returns the OCR rects of every valid page, keyed by the page index in
+        ``pages``, and the flat list of non-empty crops across the whole batch.
+        Engines with batched inference use this to decouple rendering from
+        recognition and to map results back to their pages.
+        """
+        page_rects: Dict[int, List[BoundingBox]] = {}
+        crops: List[OcrCrop] = []
+        for page_idx, page in enumerate(pages):
+            assert page._backend is not None
+            if not page._backend.is_valid():
+                continue
+
+            ocr_rects = self.get_ocr_rects(page, conv_res)
+            page_rects[page_idx] = ocr_rects
+            for ocr_rect in ocr_rects:
+                # Skip zero area boxes
+                if ocr_rect.area() == 0:
+                    continue
+                high_res_image = page._backend.get_page_image(
+                    scale=scale, cropbox=ocr_rect
+                )
+                crops.append(
+                    OcrCrop(
+                        page_idx=page_idx,
+                        rect=ocr_rect,
+                        image=np.array(high_res_image),
+                    )
+                )
+                del high_res_image
+
+        return page_rects, crops
 
     # Filters OCR cells by dropping any OCR cell that intersects with an existing programmatic cell.
     def _filter_ocr_cells(
@@ -146,7 +291,10 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
         existing_cells = page.cells
 
         # Combine existing and OCR cells with overlap filtering
-        final_cells = self._combine_cells(existing_cells, ocr_cells)
+        replace_existing = self._replaces_text_layer(page)
+        final_cells = self._combine_cells(
+            existing_cells, ocr_cells, replace_existing=replace_existing
+        )
 
         assert page.parsed_page is not None
 
@@ -154,11 +302,12 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
         page.parsed_page.textline_cells = final_cells
         page.parsed_page.has_lines = len(final_cells) > 0
 
-        # When force_full_page_ocr is used, PDF-extracted word/char cells are
-        # unreliable. Filter out cells where from_ocr=False, keeping any OCR-
-        # generated cells. This ensures downstream components (e.g., table
-        # structure model) fall back to OCR-extracted textline cells.
-        if self.options.force_full_page_ocr:
+        # When force_full_page_ocr is used, or the text layer was found to be
+        # garbled, PDF-extracted word/char cells are unreliable. Filter out
+        # cells where from_ocr=False, keeping any OCR-generated cells. This
+        # ensures downstream components (e.g., table structure model) fall
+        # back to OCR-extracted textline cells.
+        if replace_existing:
             page.parsed_page.word_cells = [
                 c for c in page.parsed_page.word_cells if c.from_ocr
             ]
@@ -168,11 +317,24 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
             page.parsed_page.has_words = len(page.parsed_page.word_cells) > 0
             page.parsed_page.has_chars = len(page.parsed_page.char_cells) > 0
 
+    def _replaces_text_layer(self, page: Page) -> bool:
+        """Whether the OCR cells replace the programmatic cells of *page*."""
+        decision = page.predictions.ocr_decision
+        return self.options.force_full_page_ocr or (
+            decision is not None
+            and decision.reason == OcrDecisionReason.LOW_PARSE_QUALITY
+        )
+
     def _combine_cells(
-        self, existing_cells: List[TextCell], ocr_cells: List[TextCell]
+        self,
+        existing_cells: List[TextCell],
+        ocr_cells: List[TextCell],
+        replace_existing: Optional[bool] = None,
     ) -> List[TextCell]:
         """Combine existing and OCR cells with filtering and re-indexing."""
-        if self.options.force_full_page_ocr:
+        if replace_existing is None:
+            replace_existing = self.options.force_full_page_ocr
+        if replace_existing:
             combined = ocr_cells
         else:
             filtered_ocr_cells = self._filter_ocr_cells(ocr_cells, existing_cells)
@@ -0,0 +1,410 @@
+"""Continuous batching of generation requests for Transformers models.
+
+`model.generate` decodes a padded batch until its longest sequence is done, with
+one set of stopping criteria for all of them: short pages wait for the longest
+one, and queued pages wait for the whole batch. `ContinuousBatchScheduler`
+schedules at the level of decoding steps instead. Each request is prefilled on its
+own, joins the decoding batch with its KV cache, and leaves it as soon as it meets
+its own stopping criteria or token budget, so queued requests take the freed slots
+right away.
+
+With an `image_token_id`, the prompt tokens before the first image, i.e. the chat
+template and system prompt shared by all pages, are prefilled once: their KV cache
+is reused by the following requests with the same prefix and recomputed when the
+prefix changes. Short prefixes are not cached, e.g. the DocTags prompts of
+SmolDocling place the image right after the chat role.
+
+Supported are decoders with a dynamic full-attention KV cache and one position per
+token, e.g. the Llama-based SmolDocling and Granite-Docling models. Models with
+sliding-window caches or multimodal rotary positions (Qwen2-VL) raise
+`UnsupportedModelError`.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+import torch
+import torch.nn.functional as F
+from transformers import DynamicCache, LogitsProcessorList, StoppingCriteriaList
+
+from docling.datamodel.base_models import VlmStopReason
+
+_log = logging.getLogger(__name__)
+
+_KVCache = list[tuple[torch.Tensor, torch.Tensor]]
+
+# Shorter prompt prefixes are prefilled with the prompt: attending to a cache is
+# slower than a causal prefill, which outweighs the reused tokens
+MIN_PREFIX_TOKENS = 64
+
+
+class UnsupportedModelError(RuntimeError):
+    """The model cannot be decoded with continuous batching."""
+
+
+@dataclass
+class GenerationRequest:
+    """Prompt of one sequence, as returned by the processor for a batch of one."""
+
+    inputs: dict[str, torch.Tensor]
+    max_new_tokens: int
+    stopping_criteria: Optional[StoppingCriteriaList] = None
+    logits_processor: Optional[LogitsProcessorList] = None
+    do_sample: bool = False
+
+
+@dataclass
+class GenerationResult:
+    token_ids: list[int]
+    stop_reason: VlmStopReason
+    # Seconds from the start of the prefill to the last token
+    generation_time: float
+
+
+@dataclass
+class PrefixCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Prompt tokens whose prefill was skipped
+    reused_tokens: int = 0
+
+
+@dataclass
+class _Sequence:
+    request: GenerationRequest
+    future: "Future[GenerationResult]"
+    prompt_ids: torch.Tensor
+    # Position of the next token fed to the model
+    position: int
+    start_time: float
+    token_ids: list[int] = field(default_factory=list)
+
+
+def _check_cache(past_key_values: Any) -> DynamicCache:
+    if type(past_key_values) is not DynamicCache or any(
+        getattr(layer, "is_sliding", False)
+        for layer in getattr(past_key_values, "layers", [])
+    ):
+        raise UnsupportedModelError(
+            f"Continuous batching needs a dynamic full-attention KV cache, the model "
+            f"returned {type(past_key_values).__name__}."
+        )
+    return past_key_values
+
+
+def _get_layers(cache: DynamicCache) -> _KVCache:
+    return [(cache[ix][0], cache[ix][1]) for ix in range(len(cache))]
+
+
+def _set_layers(cache: DynamicCache, layers: _KVCache) -> None:
+    # Replace the tensors in place, rebuilding the cache would copy them
+    if hasattr(cache, "layers"):
+        for layer, (keys, values) in zip(cache.layers, layers):
+            layer.keys, layer.values = keys, values
+    else:  # transformers < 4.54
+        cache.key_cache = [keys for keys, _ in layers]  # type: ignore[attr-defined]
+        cache.value_cache = [values for _, values in layers]  # type: ignore[attr-defined]
+
+
+def _pad_left(cache: _KVCache, mask: torch.Tensor, num: int):
+    cache = [
+        (F.pad(keys, (0, 0, num, 0)), F.pad(values, (0, 0, num, 0)))
+        for keys, values in cache
+    ]
+    return cache, F.pad(mask, (num, 0))
+
+
+class ContinuousBatchScheduler:
+    """Decodes the submitted requests in one batch, refilled at every step.
+
+    The decoding runs in a background thread owning the model; `submit` can be
+    called from any thread. With *image_token_id*, the KV cache of the prompt
+    prefix before the first image token is shared by the requests, if it has at
+    least *min_prefix_tokens* tokens.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        eos_token_ids: Union[int, list[int], set[int], None],
+        max_batch_size: int = 8,
+        image_token_id: Optional[int] = None,
+        min_prefix_tokens: int = MIN_PREFIX_TOKENS,
+    ) -> None:
+        if any(hasattr(module, "get_rope_index") for module in model.modules()):
+            raise UnsupportedModelError(
+                "Continuous batching does not support multimodal rotary positions."
+            )
+        self.model = model
+        if isinstance(eos_token_ids, int):
+            eos_token_ids = [eos_token_ids]
+        self.eos_token_ids = set(eos_token_ids or [])
+        self.max_batch_size = max_batch_size
+        self.image_token_id = image_token_id
+        self.min_prefix_tokens = min_prefix_tokens
+
+        # Prompt prefix shared by the requests, with its KV cache
+        self._prefix_ids: Optional[torch.Tensor] = None
+        self._prefix_layers: _KVCache = []
+        self._prefix_stats = PrefixCacheStats()
+
+        self._pending: deque[_Sequence] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # Decoding batch: sequences, their left-padded KV cache and attention mask
+        self._active: list[_Sequence] = []
+        self._cache: Optional[DynamicCache] = None
+        self._mask: Optional[torch.Tensor] = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="vlm-continuous-batching", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, request: GenerationRequest) -> "Future[GenerationResult]":
+        future: Future[GenerationResult] = Future()
+        input_ids = request.inputs["input_ids"]
+        sequence = _Sequence(
+            request=request,
+            future=future,
+            prompt_ids=input_ids,
+            position=0,
+            start_time=0.0,
+        )
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The scheduler is shut down.")
+            self._pending.append(sequence)
+            self._cond.notify()
+        return future
+
+    def shutdown(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not (self._pending or self._active or self._closed):
+                    self._cond.wait()
+                if self._closed:
+                    break
+                admitted: list[_Sequence] = []
+                while self._pending and (
+                    len(self._active) + len(admitted) < self.max_batch_size
+                ):
+                    admitted.append(self._pending.popleft())
+
+            with torch.inference_mode():
+                for sequence in admitted:
+                    try:
+                        self._prefill(sequence)
+                    except Exception as exc:
+                        sequence.future.set_exception(exc)
+                if self._active:
+                    try:
+                        self._decode_step()
+                    except Exception as exc:
+                        for sequence in self._active:
+                            sequence.future.set_exception(exc)
+                        self._select([])
+
+        error = RuntimeError("The scheduler was shut down.")
+        for sequence in [*self._active, *self._pending]:
+            if not sequence.future.done():
+                sequence.future.set_exception(error)
+
+    def _prefill(self, sequence: _Sequence) -> None:
+        sequence.start_time = time.monotonic()
+        inputs = sequence.request.inputs
+        mask = inputs.get("attention_mask")
+        if mask is None:
+            mask = torch.ones_like(inputs["input_ids"])
+
+        input_ids = inputs["input_ids"]
+        prefix_len = self._prefix_length(input_ids, mask)
+        if prefix_len > 0:
+            # Prefill only the tokens following the cached prefix
+            outputs = self.model(
+                **{**inputs, "input_ids": input_ids[:, prefix_len:]},
+                past_key_values=self._prefix_cache(input_ids[:, :prefix_len]),
+                cache_position=torch.arange(
+                    prefix_len, input_ids.shape[1], device=input_ids.device
+                ),
+                use_cache=True,
+                return_dict=True,
+            )
+        else:
+            outputs = self.model(**inputs, use_cache=True, return_dict=True)
+        cache = _check_cache(outputs.past_key_values)
+        sequence.position = int(mask.sum())
+        (token,) = self._next_tokens([sequence], outputs.logits[:, -1, :])
+        if self._append(sequence, token):
+            return
+
+        if self._cache is None or self._mask is None:
+            self._cache, self._mask = cache, mask
+        else:
+            layers, batch_layers = _get_layers(cache), _get_layers(self._cache)
+            batch_mask = self._mask
+            if mask.shape[1] < batch_mask.shape[1]:
+                layers, mask = _pad_left(
+                    layers, mask, batch_mask.shape[1] - mask.shape[1]
+                )
+            elif mask.shape[1] > batch_mask.shape[1]:
+                batch_layers, batch_mask = _pad_left(
+                    batch_layers, batch_mask, mask.shape[1] - batch_mask.shape[1]
+                )
+            _set_layers(
+                self._cache,
+                [
+                    (torch.cat([keys, new_keys]), torch.cat([values, new_values]))
+                    for (keys, values), (new_keys, new_values) in zip(
+                        batch_layers, layers
+                    )
+                ],
+            )
+            self._mask = torch.cat([batch_mask, mask])
+        self._active.append(sequence)
+
+    def prefix_stats(self) -> PrefixCacheStats:
+        """Return a snapshot of the prompt prefix cache counters."""
+        return PrefixCacheStats(**vars(self._prefix_stats))
+
+    def _prefix_length(self, input_ids: torch.Tensor, mask: torch.Tensor) -> int:
+        """Number of prompt tokens before the first image token, 0 if not cached."""
+        if self.image_token_id is None or not bool(mask.all()):
+            return 0
+        positions = (input_ids[0] == self.image_token_id).nonzero()
+        prefix_len = int(positions[0]) if len(positions) else 0
+        return prefix_len if prefix_len >= self.min_prefix_tokens else 0
+
+    def _prefix_cache(self, prefix_ids: torch.Tensor) -> DynamicCache:
+        """Return a KV cache holding *prefix_ids*, prefilled once per prefix."""
+        if self._prefix_ids is not None and torch.equal(self._prefix_ids, prefix_ids):
+            self._prefix_stats.hits += 1
+            self._prefix_stats.reused_tokens += prefix_ids.shape[1]
+        else:
+            outputs = self.model(
+                input_ids=prefix_ids,
+                attention_mask=torch.ones_like(prefix_ids),
+                use_cache=True,
+                return_dict=True,
+            )
+            self._prefix_ids = prefix_ids
+            self._prefix_layers = _get_layers(_check_cache(outputs.past_key_values))
+            self._prefix_stats.misses += 1
+
+        # The cached tensors are shared: the cache only ever replaces them
+        cache = DynamicCache()
+        for layer_idx, (keys, values) in enumerate(self._prefix_layers):
+            cache.update(keys, values, layer_idx)
+        return cache
+
+    def _decode_step(self) -> None:
+        assert self._mask is not None
+        device = self._mask.device
+        num_cached = self._mask.shape[1]
+        input_ids = torch.tensor(
+            [[s.token_ids[-1]] for s in self._active], device=device
+        )
+        position_ids = torch.tensor([[s.position] for s in self._active], device=device)
+        mask = F.pad(self._mask, (0, 1), value=1)
+
+        outputs = self.model(
+            input_ids=input_ids,
+            attention_mask=mask,
+            position_ids=position_ids,
+            past_key_values=self._cache,
+            cache_position=torch.tensor([num_cached], device=device),
+            use_cache=True,
+            return_dict=True,
+        )
+        self._mask = mask
+
+        tokens = self._next_tokens(self._active, outputs.logits[:, -1, :])
+        keep = []
+        for ix, (sequence, token) in enumerate(zip(self._active, tokens)):
+            sequence.position += 1
+            if not self._append(sequence, token):
+                keep.append(ix)
+        if len(keep) < len(self._active):
+            self._select(keep)
+
+    def _select(self, keep: list[int]) -> None:
+        """Keep the sequences at *keep* in the batch, drop the padding they share."""
+        if not keep:
+            self._active, self._cache, self._mask = [], None, None
+            return
+        assert self._cache is not None and self._mask is not None
+        index = torch.tensor(keep, device=self._mask.device)
+        mask = self._mask[index]
+        first = int(mask.any(dim=0).nonzero()[0])
+        self._mask = mask[:, first:]
+        _set_layers(
+            self._cache,
+            [
+                (keys[index, :, first:], values[index, :, first:])
+                for keys, values in _get_layers(self._cache)
+            ],
+        )
+        self._active = [self._active[ix] for ix in keep]
+
+    def _next_tokens(self, sequences: list[_Sequence], logits: torch.Tensor):
+        tokens: list[int] = logits.argmax(dim=-1).tolist()
+        for ix, sequence in enumerate(sequences):
+            request = sequence.request
+            if not (request.logits_processor or request.do_sample):
+                continue
+            scores = logits[ix : ix + 1].float()
+            if request.logits_processor:
+                generated = torch.tensor([sequence.token_ids], device=logits.device)
+                input_ids = torch.cat(
+                    [sequence.prompt_ids, generated.to(sequence.prompt_ids.dtype)],
+                    dim=1,
+                )
+                scores = request.logits_processor(input_ids, scores)  # type: ignore[arg-type]
+            if request.do_sample:
+                probs = torch.softmax(scores, dim=-1)
+                tokens[ix] = int(torch.multinomial(probs, num_samples=1))
+            else:
+                tokens[ix] = int(scores.argmax(dim=-1))
+        return tokens
+
+    def _append(self, sequence: _Sequence, token: int) -> bool:
+        """Add a generated token, complete the sequence if it is done."""
+        sequence.token_ids.append(token)
+        request = sequence.request
+
+        stop_reason: Optional[VlmStopReason] = None
+        if token in self.eos_token_ids:
+            stop_reason = VlmStopReason.END_OF_SEQUENCE
+        elif request.stopping_criteria and bool(
+            torch.as_tensor(
+                request.stopping_criteria(
+                    torch.tensor([sequence.token_ids]), scores=None
+                )
+            ).any()
+        ):
+            stop_reason = VlmStopReason.STOP_SEQUENCE
+        elif len(sequence.token_ids) >= request.max_new_tokens:
+            stop_reason = VlmStopReason.LENGTH
+        if stop_reason is None:
+            return False
+
+        sequence.future.set_result(
+            GenerationResult(
+                token_ids=sequence.token_ids,
+                stop_reason=stop_reason,
+                generation_time=time.monotonic() - sequence.start_time,
+            )
+        )
+        return True
@@ -6,7 +6,7 @@ implementations to avoid code duplication and ensure consistency.
 
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 from PIL import Image
@@ -14,6 +14,9 @@ from PIL import Image
 from docling.datamodel.pipeline_options_vlm_model import TransformersPromptStyle
 from docling.models.utils.generation_utils import GenerationStopper
 
+if TYPE_CHECKING:
+    from docling.models.inference_engines.vlm.base import VlmEngineInput
+
 _log = logging.getLogger(__name__)
 
 
@@ -90,6 +93,13 @@ def extract_generation_stoppers(
     return stoppers
 
 
+def raise_if_cancelled(input_batch: List["VlmEngineInput"]) -> None:
+    """Raise `ConversionCancelledError` if the conversion of any input is cancelled."""
+    for input_data in input_batch:
+        if input_data.cancellation is not None:
+            input_data.cancellation.raise_if_cancelled()
+
+
 def resolve_model_artifacts_path(
     repo_id: str,
     revision: str,
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from PIL.Image import Image
 
@@ -12,13 +12,17 @@ from docling.datamodel.vlm_engine_options import ApiVlmEngineOptions
 from docling.models.inference_engines.vlm._utils import (
     extract_generation_stoppers,
     preprocess_image_batch,
+    raise_if_cancelled,
 )
 from docling.models.inference_engines.vlm.base import (
     BaseVlmEngine,
     VlmEngineInput,
     VlmEngineOutput,
 )
-from docling.models.utils.generation_utils import GenerationStopper
+from docling.models.utils.generation_utils import (
+    CancellationStopper,
+    GenerationStopper,
+)
 from docling.utils.api_image_request import (
     api_image_request,
     api_image_request_streaming,
@@ -109,6 +113,12 @@ class ApiVlmEngine(BaseVlmEngine):
 
         def _process_single_input(input_data: VlmEngineInput) -> VlmEngineOutput:
             """Process a single input via API."""
+            # Requests must not outlive the deadline of the conversion
+            timeout = self.options.timeout
+            if input_data.cancellation is not None:
+                timeout = input_data.cancellation.timeout(timeout)
+                input_data.cancellation.raise_if_cancelled()
+
             # Prepare image using shared utility
             images = preprocess_image_batch([input_data.image])
             image = images[0]
@@ -131,38 +141,47 @@ class ApiVlmEngine(BaseVlmEngine):
             custom_stoppers = extract_generation_stoppers(
                 input_data.extra_generation_config
             )
+            if custom_stoppers and input_data.cancellation is not None:
+                # The streaming path also aborts at cancellation
+                custom_stoppers.append(CancellationStopper(input_data.cancellation))
 
             request_start_time = time.time()
             stop_reason = "unspecified"
 
-            if custom_stoppers:
-                # Streaming path with early abort support
-                generated_text, num_tokens = api_image_request_streaming(
-                    url=self.options.url,  # type: ignore[arg-type]
-                    image=image,
-                    prompt=input_data.prompt,
-                    headers=self.options.headers,
-                    generation_stoppers=custom_stoppers,
-                    timeout=self.options.timeout,
-                    **api_params,
-                )
-
-                # Check if stopped by custom criteria
-                for stopper in custom_stoppers:
-                    if stopper.should_stop(generated_text):
-                        stop_reason = "custom_criteria"
-                        break
-            else:
-                # Non-streaming path
-                generated_text, num_tokens, api_stop_reason = api_image_request(
-                    url=self.options.url,  # type: ignore[arg-type]
-                    image=image,
-                    prompt=input_data.prompt,
-                    headers=self.options.headers,
-                    timeout=self.options.timeout,
-                    **api_params,
-                )
-                stop_reason = api_stop_reason
+            try:
+                if custom_stoppers:
+                    # Streaming path with early abort support
+                    generated_text, num_tokens = api_image_request_streaming(
+                        url=self.options.url,  # type: ignore[arg-type]
+                        image=image,
+                        prompt=input_data.prompt,
+                        headers=self.options.headers,
+                        generation_stoppers=custom_stoppers,
+                        timeout=timeout,
+                        **api_params,
+                    )
+
+                    # Check if stopped by custom criteria
+                    for stopper in custom_stoppers:
+                        if stopper.should_stop(generated_text):
+                            stop_reason = "custom_criteria"
+                            break
+                else:
+                    # Non-streaming path
+                    generated_text, num_tokens, api_stop_reason = api_image_request(
+                        url=self.options.url,  # type: ignore[arg-type]
+                        image=image,
+                        prompt=input_data.prompt,
+                        headers=self.options.headers,
+                        timeout=timeout,
+                        **api_params,
+                    )
+                    stop_reason = api_stop_reason
+            except Exception:
+                # A request cut by the deadline fails as a cancellation
+                raise_if_cancelled([input_data])
+                raise
+            raise_if_cancelled([input_data])
 
             generation_time = time.time() - request_start_time
 
@@ -205,6 +224,16 @@ class ApiVlmEngine(BaseVlmEngine):
 
         return outputs
 
+    def get_cache_identity(self) -> Dict[str, Any]:
+        identity = super().get_cache_identity()
+        identity.update(url=str(self.options.url), params=self.merged_params)
+        return identity
+
+    @property
+    def preferred_batch_size(self) -> int:
+        # One batch keeps all concurrent requests busy
+        return self.options.concurrency
+
     def cleanup(self) -> None:
         """Clean up API runtime resources.
 
@@ -2,7 +2,7 @@
 
 import logging
 import platform
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
 from docling.datamodel.vlm_engine_options import (
@@ -230,6 +230,18 @@ class AutoInlineVlmEngine(BaseVlmEngine):
         # Delegate to the actual engine's batch implementation
         return self.actual_engine.predict_batch(input_batch)
 
+    def get_cache_identity(self) -> Dict[str, Any]:
+        if not self._initialized:
+            self.initialize()
+        assert self.actual_engine is not None, "Engine not initialized"
+        return self.actual_engine.get_cache_identity()
+
+    @property
+    def preferred_batch_size(self) -> int:
+        if self.actual_engine is not None:
+            return self.actual_engine.preferred_batch_size
+        return super().preferred_batch_size
+
     def cleanup(self) -> None:
         """Clean up the actual engine resources."""
         if self.actual_engine is not None:
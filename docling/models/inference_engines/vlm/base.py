@@ -3,11 +3,15 @@
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from PIL.Image import Image
 from pydantic import BaseModel, ConfigDict, Field
 
+from docling.datamodel.settings import settings
+from docling.utils.cancellation import CancellationToken
+
 if TYPE_CHECKING:
     from docling.datamodel.stage_model_specs import EngineModelConfig
 
@@ -51,6 +55,31 @@ class VlmEngineType(str, Enum):
         }
 
 
+class VlmResponseCacheOptions(BaseModel):
+    """Options of the persistent cache of VLM responses."""
+
+    path: Optional[Path] = Field(
+        default=None,
+        description=(
+            "SQLite database file of the cache, shared by all engines using it. "
+            "Defaults to `vlm_responses.sqlite` in `settings.cache_dir`"
+        ),
+    )
+    max_entries: Optional[int] = Field(
+        default=100_000,
+        ge=1,
+        description=(
+            "Maximum number of cached responses, the least recently used ones are "
+            "evicted first. None means unbounded"
+        ),
+    )
+    ttl: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds after which a cached response expires. None means never",
+    )
+
+
 class BaseVlmEngineOptions(BaseModel):
     """Base configuration for VLM inference engines.
 
@@ -62,6 +91,15 @@ class BaseVlmEngineOptions(BaseModel):
 
     engine_type: VlmEngineType = Field(description="Type of inference engine to use")
 
+    response_cache: Optional[VlmResponseCacheOptions] = Field(
+        default=None,
+        description=(
+            "Cache the generated responses on disk, keyed by the input image, prompt, "
+            "model and generation parameters, and answer repeated inputs without "
+            "running the model. Sampled generations (temperature > 0) are not cached"
+        ),
+    )
+
 
 class VlmEngineInput(BaseModel):
     """Input to a VLM inference engine.
@@ -85,6 +123,14 @@ class VlmEngineInput(BaseModel):
     extra_generation_config: Dict[str, Any] = Field(
         default_factory=dict, description="Additional generation configuration"
     )
+    cancellation: Optional[CancellationToken] = Field(
+        default=None,
+        exclude=True,
+        description=(
+            "Token of the document conversion. Engines abort the generation and "
+            "raise `ConversionCancelledError` once it is cancelled"
+        ),
+    )
 
 
 class VlmEngineOutput(BaseModel):
@@ -147,7 +193,9 @@ class BaseVlmEngine(ABC):
         """Run inference on a batch of inputs.
 
         This is the primary method that all engines must implement.
-        Single predictions are routed through this method.
+        Single predictions are routed through this method. Engines should stop
+        generating and raise `ConversionCancelledError` once the `cancellation`
+        token of the inputs is cancelled.
 
         Args:
             input_batch: List of inputs to process
@@ -194,6 +242,29 @@ class BaseVlmEngine(ABC):
         else:
             return self.predict(input_data)
 
+    def get_cache_identity(self) -> Dict[str, Any]:
+        """Describe the model answering the inputs, for keying cached responses.
+
+        Responses are only reused between engines with equal identities.
+        """
+        identity: Dict[str, Any] = {"engine_type": self.options.engine_type.value}
+        if self.model_config is not None:
+            identity.update(
+                self.model_config.model_dump(
+                    mode="json", include={"repo_id", "revision", "extra_config"}
+                )
+            )
+        return identity
+
+    @property
+    def preferred_batch_size(self) -> int:
+        """Number of inputs the engine processes efficiently in one `predict_batch` call.
+
+        Pipelines forming their own batches, like `ThreadedVlmPipeline`, size them
+        with this value.
+        """
+        return settings.perf.page_batch_size
+
     def cleanup(self) -> None:
         """Clean up resources (optional).
 
@@ -28,6 +28,8 @@ def create_vlm_engine(
 ) -> BaseVlmEngine:
     """Create a VLM inference engine from options.
 
+    With `options.response_cache`, the engine is wrapped in a `CachedVlmEngine`.
+
     Args:
         options: Engine configuration options
         model_spec: Model specification (for generating engine-specific configs)
@@ -39,6 +41,23 @@ def create_vlm_engine(
         ValueError: If engine type is not supported
         ImportError: If required dependencies are not installed
     """
+    engine = _create_engine(options, model_spec)
+    if options.response_cache is not None:
+        from docling.models.inference_engines.vlm.response_cache import (
+            CachedVlmEngine,
+            VlmResponseCache,
+        )
+
+        engine = CachedVlmEngine(
+            engine, VlmResponseCache.from_options(options.response_cache)
+        )
+    return engine
+
+
+def _create_engine(
+    options: BaseVlmEngineOptions,
+    model_spec: Optional["VlmModelSpec"],
+) -> BaseVlmEngine:
     engine_type = options.engine_type
 
     # Generate model_config from model_spec if provided
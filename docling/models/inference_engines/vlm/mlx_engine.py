@@ -12,6 +12,7 @@ from docling.datamodel.vlm_engine_options import MlxVlmEngineOptions
 from docling.models.inference_engines.vlm._utils import (
     extract_generation_stoppers,
     preprocess_image_batch,
+    raise_if_cancelled,
 )
 from docling.models.inference_engines.vlm.base import (
     BaseVlmEngine,
@@ -163,6 +164,8 @@ class MlxVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
             _log.debug("MLX model: Acquired global lock for thread safety")
 
             for input_data in input_batch:
+                raise_if_cancelled([input_data])
+
                 # Preprocess image
                 images = preprocess_image_batch([input_data.image])
                 image = images[0]
@@ -196,6 +199,13 @@ class MlxVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
                 ):
                     output_text += token.text
 
+                    # Abort the generation of cancelled conversions
+                    if (
+                        input_data.cancellation is not None
+                        and input_data.cancellation.cancelled
+                    ):
+                        break
+
                     # Check for configured stop strings
                     if input_data.stop_strings:
                         if any(
@@ -236,6 +246,7 @@ class MlxVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
                         break
 
                 generation_time = time.time() - start_time
+                raise_if_cancelled([input_data])
 
                 _log.debug(
                     f"MLX generation completed in {generation_time:.2f}s, "
@@ -260,6 +271,11 @@ class MlxVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
 
         return outputs
 
+    @property
+    def preferred_batch_size(self) -> int:
+        # Inputs are generated one after the other, batching gains nothing
+        return 1
+
     def cleanup(self) -> None:
         """Clean up model resources."""
         if self.vlm_model is not None:
@@ -0,0 +1,253 @@
+"""Persistent cache of VLM responses.
+
+Documents repeat their inputs to the VLM: letterhead pages, logos described on every
+page, or whole corpora converted again. `CachedVlmEngine` answers such inputs from a
+`VlmResponseCache` and only runs the wrapped engine on the misses. Responses are
+keyed by a hash of the input image pixels, the prompt, the generation parameters and
+the identity of the model (`BaseVlmEngine.get_cache_identity`).
+
+The cache is a SQLite database, so it persists across runs and can be shared by the
+engines of several pipelines and processes. It is bounded by a number of entries,
+evicting the least recently used ones first, and optionally by the age of entries.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, cast
+
+from docling.datamodel.settings import settings
+from docling.models.inference_engines.vlm.base import (
+    BaseVlmEngine,
+    VlmEngineInput,
+    VlmEngineOutput,
+    VlmResponseCacheOptions,
+)
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class VlmResponseCacheStats:
+    """Counters of a `VlmResponseCache`, since it was opened."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class VlmResponseCache:
+    """LRU cache of VLM responses stored in a SQLite database."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.path = path or settings.cache_dir / "vlm_responses.sqlite"
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, output TEXT NOT NULL, "
+            "created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._stats = VlmResponseCacheStats()
+        with self._lock:
+            self._evict_expired_locked()
+            self._size = self._count_locked()
+
+    @classmethod
+    def from_options(cls, options: VlmResponseCacheOptions) -> "VlmResponseCache":
+        return cls(path=options.path, max_entries=options.max_entries, ttl=options.ttl)
+
+    @staticmethod
+    def make_key(input_data: VlmEngineInput, identity: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key of *input_data*, or None if it must not be cached.
+
+        Sampled generations are not cached, nor inputs whose extra generation
+        config cannot be serialized (e.g. custom stopping criteria objects).
+        """
+        if input_data.temperature > 0:
+            return None
+        try:
+            params = json.dumps(
+                {
+                    "identity": identity,
+                    "prompt": input_data.prompt,
+                    "max_new_tokens": input_data.max_new_tokens,
+                    "stop_strings": input_data.stop_strings,
+                    "extra_generation_config": input_data.extra_generation_config,
+                },
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            return None
+
+        image = input_data.image
+        digest = hashlib.sha256(params.encode("utf-8"))
+        digest.update(f"{image.mode}:{image.width}x{image.height}:".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[VlmEngineOutput]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._stats.evictions += 1
+                self._size -= 1
+                row = None
+            if row is None:
+                self._stats.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+            )
+            self._stats.hits += 1
+        return VlmEngineOutput.model_validate_json(row[0])
+
+    def put(self, key: str, output: VlmEngineOutput) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, output, created, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, output.model_dump_json(), now, now),
+            )
+            # Upper estimate, replaced keys and writes of other processes are
+            # only accounted for by counting before evicting
+            self._size += 1
+            if self.max_entries is not None and self._size > self.max_entries:
+                self._size = self._count_locked()
+                num_evicted = max(self._size - self.max_entries, 0)
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                    (num_evicted,),
+                )
+                self._stats.evictions += num_evicted
+                self._size -= num_evicted
+
+    def stats(self) -> VlmResponseCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return VlmResponseCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=self._count_locked(),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _count_locked(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _evict_expired_locked(self) -> None:
+        if self.ttl is None:
+            return
+        cursor = self._conn.execute(
+            "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)
+        )
+        self._stats.evictions += max(cursor.rowcount, 0)
+
+
+class CachedVlmEngine(BaseVlmEngine):
+    """Engine answering repeated inputs from a `VlmResponseCache`.
+
+    The inputs missing in the cache are predicted by the wrapped engine in one batch,
+    and their responses are added to the cache.
+    """
+
+    def __init__(self, engine: BaseVlmEngine, cache: VlmResponseCache) -> None:
+        super().__init__(engine.options, model_config=engine.model_config)
+        self.engine = engine
+        self.cache = cache
+        self._identity: Optional[Dict[str, Any]] = None
+
+    def initialize(self) -> None:
+        self.engine.initialize()
+        self._initialized = True
+
+    def get_cache_identity(self) -> Dict[str, Any]:
+        if self._identity is None:
+            self._identity = self.engine.get_cache_identity()
+        return self._identity
+
+    @property
+    def preferred_batch_size(self) -> int:
+        return self.engine.preferred_batch_size
+
+    def predict_batch(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        identity = self.get_cache_identity()
+        outputs: List[Optional[VlmEngineOutput]] = [None] * len(input_batch)
+        # Inputs to predict, identical inputs of the batch are predicted once
+        missing: Dict[Any, List[int]] = {}
+        for ix, input_data in enumerate(input_batch):
+            key = self.cache.make_key(input_data, identity)
+            if key is None:
+                missing[ix] = [ix]
+            elif key in missing:
+                missing[key].append(ix)
+            elif (output := self.cache.get(key)) is not None:
+                outputs[ix] = output
+            else:
+                missing[key] = [ix]
+
+        if missing:
+            results = self.engine.predict_batch(
+                [input_batch[ixs[0]] for ixs in missing.values()]
+            )
+            for (key, ixs), output in zip(missing.items(), results):
+                for ix in ixs:
+                    outputs[ix] = output
+                if isinstance(key, str):
+                    self.cache.put(key, output)
+
+        _log.debug(
+            f"VLM response cache: predicted {len(missing)} of {len(input_batch)} inputs"
+        )
+        return cast(List[VlmEngineOutput], outputs)
+
+    def cleanup(self) -> None:
+        stats = self.cache.stats()
+        _log.info(
+            f"VLM response cache: {stats.hits} hits, {stats.misses} misses "
+            f"(hit rate {stats.hit_rate:.1%}), {stats.evictions} evictions, "
+            f"{stats.size} entries"
+        )
+        self.engine.cleanup()
+        self.cache.close()
@@ -3,9 +3,10 @@
 import importlib.metadata
 import logging
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 import torch
 from PIL.Image import Image
@@ -17,10 +18,15 @@ from transformers import (
     AutoProcessor,
     BitsAndBytesConfig,
     GenerationConfig,
+    LogitsProcessorList,
     PreTrainedModel,
     ProcessorMixin,
+    RepetitionPenaltyLogitsProcessor,
     StoppingCriteriaList,
     StopStringCriteria,
+    TemperatureLogitsWarper,
+    TopKLogitsWarper,
+    TopPLogitsWarper,
 )
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
@@ -29,9 +35,15 @@ from docling.datamodel.pipeline_options_vlm_model import (
     TransformersPromptStyle,
 )
 from docling.datamodel.vlm_engine_options import TransformersVlmEngineOptions
+from docling.models.inference_engines.vlm._continuous_batching import (
+    ContinuousBatchScheduler,
+    GenerationRequest,
+    UnsupportedModelError,
+)
 from docling.models.inference_engines.vlm._utils import (
     extract_generation_stoppers,
     preprocess_image_batch,
+    raise_if_cancelled,
     resolve_model_artifacts_path,
 )
 from docling.models.inference_engines.vlm.base import (
@@ -40,6 +52,7 @@ from docling.models.inference_engines.vlm.base import (
     VlmEngineOutput,
 )
 from docling.models.utils.generation_utils import (
+    CancellationCriteria,
     GenerationStopper,
     HFStoppingCriteriaWrapper,
 )
@@ -84,6 +97,9 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
         self.processor: Optional[ProcessorMixin] = None
         self.vlm_model: Optional[PreTrainedModel] = None
         self.generation_config: Optional[GenerationConfig] = None
+        self._scheduler: Optional[ContinuousBatchScheduler] = None
+        self._scheduler_lock = threading.Lock()
+        self._continuous_batching_unsupported = False
 
         # Initialize immediately if model_config is provided
         if self.model_config is not None:
@@ -228,6 +244,8 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
 
         This method processes multiple images in a single forward pass,
         which is much more efficient than processing them sequentially.
+        With `continuous_batching`, the inputs are decoded by the continuous
+        batching scheduler, each with its own stopping criteria and token budget.
 
         Args:
             input_batch: List of inputs to process
@@ -240,6 +258,7 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
 
         if not input_batch:
             return []
+        raise_if_cancelled(input_batch)
 
         # Model should already be loaded via initialize()
         if self.vlm_model is None or self.processor is None:
@@ -247,6 +266,11 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
                 "Model not loaded. Ensure EngineModelConfig was provided during initialization."
             )
 
+        if self.options.continuous_batching:
+            continuous_outputs = self._predict_continuous(input_batch)
+            if continuous_outputs is not None:
+                return continuous_outputs
+
         # Get prompt style from first input's extra config
         first_input = input_batch[0]
         prompt_style = first_input.extra_generation_config.get(
@@ -258,67 +282,255 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
         images = preprocess_image_batch([inp.image for inp in input_batch])
 
         # Prepare prompts
-        prompts = []
-        for input_data in input_batch:
-            # Format prompt
-            if prompt_style == TransformersPromptStyle.CHAT:
-                # Use structured message format with image placeholder (like legacy implementation)
-                # This is required for vision models like Granite Vision to properly tokenize
-                # both image features and text tokens
-                messages = [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "image"},
-                            {"type": "text", "text": input_data.prompt},
-                        ],
-                    }
-                ]
-                formatted_prompt = self.processor.apply_chat_template(  # type: ignore[union-attr]
-                    messages,
-                    tokenize=False,
-                    add_generation_prompt=True,
+        prompts = [
+            self._format_prompt(input_data, prompt_style) for input_data in input_batch
+        ]
+
+        # Process batch
+        inputs = self._process_inputs(images, prompts, first_input, prompt_style)
+
+        # Setup stopping criteria (use first input's config)
+        stopping_criteria_list = self._stopping_criteria(first_input)
+
+        generation_config, decoder_config = self._split_generation_config(first_input)
+
+        # Generate
+        gen_kwargs = {
+            **inputs,
+            "max_new_tokens": first_input.max_new_tokens,
+            "use_cache": self.options.use_kv_cache,
+            "generation_config": self.generation_config,
+            **generation_config,
+        }
+
+        if first_input.temperature > 0:
+            gen_kwargs["do_sample"] = True
+            gen_kwargs["temperature"] = first_input.temperature
+        else:
+            gen_kwargs["do_sample"] = False
+
+        if stopping_criteria_list:
+            gen_kwargs["stopping_criteria"] = stopping_criteria_list
+
+        start_time = time.time()
+        with torch.inference_mode():
+            generated_ids = self.vlm_model.generate(**gen_kwargs)  # type: ignore[union-attr,operator]
+        generation_time = time.time() - start_time
+        raise_if_cancelled(input_batch)
+
+        # Decode
+        input_len = inputs["input_ids"].shape[1]
+        trimmed_sequences = generated_ids[:, input_len:]
+        decoded_texts = self._decode(trimmed_sequences, decoder_config)
+
+        # Create outputs
+        outputs = []
+        for i, text in enumerate(decoded_texts):
+            outputs.append(
+                VlmEngineOutput(
+                    text=text,
+                    stop_reason="unspecified",
+                    metadata={
+                        "generation_time": generation_time / len(input_batch),
+                        "num_tokens": int(generated_ids[i].shape[0])
+                        if i < generated_ids.shape[0]
+                        else None,
+                        "batch_size": len(input_batch),
+                    },
                 )
-            elif prompt_style == TransformersPromptStyle.RAW:
-                formatted_prompt = input_data.prompt
-            else:  # NONE
-                formatted_prompt = None
+            )
 
-            prompts.append(formatted_prompt)
+        _log.info(
+            f"Batch processed {len(input_batch)} images in {generation_time:.2f}s "
+            f"({generation_time / len(input_batch):.2f}s per image)"
+        )
 
-        # Process batch
+        return outputs
+
+    def _predict_continuous(
+        self, input_batch: List[VlmEngineInput]
+    ) -> Optional[List[VlmEngineOutput]]:
+        """Decode the inputs with the continuous batching scheduler.
+
+        Returns None when the inputs or the model need `generate`, i.e. extra
+        generation arguments or an unsupported KV cache.
+        """
+        if self._continuous_batching_unsupported or any(
+            self._split_generation_config(inp)[0] for inp in input_batch
+        ):
+            return None
+
+        try:
+            scheduler = self._get_scheduler()
+        except UnsupportedModelError as exc:
+            _log.warning(f"Falling back to static batching: {exc}")
+            self._continuous_batching_unsupported = True
+            return None
+
+        start_time = time.time()
+        futures = []
+        try:
+            for input_data in input_batch:
+                prompt_style = input_data.extra_generation_config.get(
+                    "transformers_prompt_style",
+                    TransformersPromptStyle.CHAT,
+                )
+                inputs = self._process_inputs(
+                    preprocess_image_batch([input_data.image]),
+                    [self._format_prompt(input_data, prompt_style)],
+                    input_data,
+                    prompt_style,
+                )
+                futures.append(
+                    scheduler.submit(
+                        GenerationRequest(
+                            inputs=inputs,
+                            max_new_tokens=input_data.max_new_tokens,
+                            stopping_criteria=self._stopping_criteria(input_data),
+                            logits_processor=self._logits_processor(input_data),
+                            do_sample=input_data.temperature > 0,
+                        )
+                    )
+                )
+            results = [future.result() for future in futures]
+        except UnsupportedModelError as exc:
+            _log.warning(f"Falling back to static batching: {exc}")
+            self._disable_continuous_batching(scheduler)
+            return None
+        except RuntimeError:
+            # Another batch fell back and shut the scheduler down under us
+            if self._continuous_batching_unsupported:
+                return None
+            raise
+        raise_if_cancelled(input_batch)
+
+        outputs = []
+        for input_data, result in zip(input_batch, results):
+            _, decoder_config = self._split_generation_config(input_data)
+            (text,) = self._decode(torch.tensor([result.token_ids]), decoder_config)
+            outputs.append(
+                VlmEngineOutput(
+                    text=text,
+                    stop_reason=result.stop_reason.value,
+                    metadata={
+                        "generation_time": result.generation_time,
+                        "num_tokens": len(result.token_ids),
+                        "batch_size": len(input_batch),
+                    },
+                )
+            )
+
+        _log.info(
+            f"Continuous batching processed {len(input_batch)} images in "
+            f"{time.time() - start_time:.2f}s"
+        )
+
+        return outputs
+
+    def _disable_continuous_batching(self, scheduler: ContinuousBatchScheduler) -> None:
+        """Fall back to `generate` and stop the scheduler's decoding thread."""
+        with self._scheduler_lock:
+            self._continuous_batching_unsupported = True
+            if self._scheduler is scheduler:
+                self._scheduler = None
+        scheduler.shutdown()
+
+    def _get_scheduler(self) -> ContinuousBatchScheduler:
+        with self._scheduler_lock:
+            if self._scheduler is None:
+                eos_token_ids = set()
+                for eos in (
+                    getattr(self.generation_config, "eos_token_id", None),
+                    self.processor.tokenizer.eos_token_id,  # type: ignore[union-attr]
+                ):
+                    if isinstance(eos, int):
+                        eos_token_ids.add(eos)
+                    elif eos is not None:
+                        eos_token_ids.update(eos)
+                image_token_id = None
+                if self.options.prompt_prefix_caching:
+                    config = self.vlm_model.config  # type: ignore[union-attr]
+                    image_token_id = getattr(config, "image_token_id", None)
+                    if image_token_id is None:
+                        image_token_id = getattr(config, "image_token_index", None)
+                    if image_token_id is None:
+                        _log.warning(
+                            "Prompt prefix caching disabled: the model config has "
+                            "no image token id"
+                        )
+                self._scheduler = ContinuousBatchScheduler(
+                    self.vlm_model,
+                    eos_token_ids=eos_token_ids,
+                    max_batch_size=self.options.max_concurrent_sequences,
+                    image_token_id=image_token_id,
+                )
+            return self._scheduler
+
+    def _format_prompt(
+        self, input_data: VlmEngineInput, prompt_style: TransformersPromptStyle
+    ) -> Optional[str]:
+        if prompt_style == TransformersPromptStyle.CHAT:
+            # Use structured message format with image placeholder (like legacy implementation)
+            # This is required for vision models like Granite Vision to properly tokenize
+            # both image features and text tokens
+            messages = [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "image"},
+                        {"type": "text", "text": input_data.prompt},
+                    ],
+                }
+            ]
+            return self.processor.apply_chat_template(  # type: ignore[union-attr]
+                messages,
+                tokenize=False,
+                add_generation_prompt=True,
+            )
+        elif prompt_style == TransformersPromptStyle.RAW:
+            return input_data.prompt
+        else:  # NONE
+            return None
+
+    def _process_inputs(
+        self,
+        images: List[Image],
+        prompts: List[Optional[str]],
+        input_data: VlmEngineInput,
+        prompt_style: TransformersPromptStyle,
+    ) -> dict[str, torch.Tensor]:
         if prompt_style == TransformersPromptStyle.NONE:
             inputs = self.processor(  # type: ignore[misc]
                 images,
                 return_tensors="pt",
                 padding=True,
-                **first_input.extra_generation_config.get("extra_processor_kwargs", {}),
+                **input_data.extra_generation_config.get("extra_processor_kwargs", {}),
             )
         else:
             inputs = self.processor(  # type: ignore[misc]
-                text=prompts,
+                text=prompts,  # type: ignore[arg-type]
                 images=images,
                 return_tensors="pt",
                 padding=True,
-                **first_input.extra_generation_config.get("extra_processor_kwargs", {}),
+                **input_data.extra_generation_config.get("extra_processor_kwargs", {}),
             )
 
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        return {k: v.to(self.device) for k, v in inputs.items()}
 
-        # Setup stopping criteria (use first input's config)
+    def _stopping_criteria(self, input_data: VlmEngineInput) -> StoppingCriteriaList:
         stopping_criteria_list = StoppingCriteriaList()
 
-        if first_input.stop_strings:
+        if input_data.stop_strings:
             stopping_criteria_list.append(
                 StopStringCriteria(
-                    stop_strings=first_input.stop_strings,
+                    stop_strings=input_data.stop_strings,
                     tokenizer=self.processor.tokenizer,  # type: ignore[union-attr,attr-defined]
                 )
             )
 
         # Add custom stopping criteria using shared utility
         custom_stoppers = extract_generation_stoppers(
-            first_input.extra_generation_config
+            input_data.extra_generation_config
         )
         for stopper in custom_stoppers:
             wrapped_criteria = HFStoppingCriteriaWrapper(
@@ -327,8 +539,12 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
             )
             stopping_criteria_list.append(wrapped_criteria)
 
+        # Abort the generation of cancelled conversions
+        if input_data.cancellation is not None:
+            stopping_criteria_list.append(CancellationCriteria(input_data.cancellation))
+
         # Also handle any HF StoppingCriteria directly passed
-        custom_criteria = first_input.extra_generation_config.get(
+        custom_criteria = input_data.extra_generation_config.get(
             "custom_stopping_criteria", []
         )
         for criteria in custom_criteria:
@@ -338,6 +554,29 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
             ):
                 stopping_criteria_list.append(criteria)
 
+        return stopping_criteria_list
+
+    def _logits_processor(self, input_data: VlmEngineInput) -> LogitsProcessorList:
+        """Logits processing `generate` applies with the model generation config."""
+        processors = LogitsProcessorList()
+        config = self.generation_config
+        repetition_penalty = getattr(config, "repetition_penalty", None)
+        if repetition_penalty is not None and repetition_penalty != 1.0:
+            processors.append(RepetitionPenaltyLogitsProcessor(repetition_penalty))
+        if input_data.temperature > 0:
+            processors.append(TemperatureLogitsWarper(input_data.temperature))
+            top_k = getattr(config, "top_k", None)
+            if top_k:
+                processors.append(TopKLogitsWarper(top_k))
+            top_p = getattr(config, "top_p", None)
+            if top_p is not None and top_p < 1.0:
+                processors.append(TopPLogitsWarper(top_p))
+        return processors
+
+    def _split_generation_config(
+        self, input_data: VlmEngineInput
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Split the extra generation config in `generate` and decoder arguments."""
         # Filter decoder-specific keys
         decoder_keys = {
             "skip_special_tokens",
@@ -346,7 +585,7 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
         }
         generation_config = {
             k: v
-            for k, v in first_input.extra_generation_config.items()
+            for k, v in input_data.extra_generation_config.items()
             if k not in decoder_keys
             and k
             not in {
@@ -359,37 +598,14 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
         }
         decoder_config = {
             k: v
-            for k, v in first_input.extra_generation_config.items()
+            for k, v in input_data.extra_generation_config.items()
             if k in decoder_keys
         }
+        return generation_config, decoder_config
 
-        # Generate
-        gen_kwargs = {
-            **inputs,
-            "max_new_tokens": first_input.max_new_tokens,
-            "use_cache": self.options.use_kv_cache,
-            "generation_config": self.generation_config,
-            **generation_config,
-        }
-
-        if first_input.temperature > 0:
-            gen_kwargs["do_sample"] = True
-            gen_kwargs["temperature"] = first_input.temperature
-        else:
-            gen_kwargs["do_sample"] = False
-
-        if stopping_criteria_list:
-            gen_kwargs["stopping_criteria"] = stopping_criteria_list
-
-        start_time = time.time()
-        with torch.inference_mode():
-            generated_ids = self.vlm_model.generate(**gen_kwargs)  # type: ignore[union-attr,operator]
-        generation_time = time.time() - start_time
-
-        # Decode
-        input_len = inputs["input_ids"].shape[1]
-        trimmed_sequences = generated_ids[:, input_len:]
-
+    def _decode(
+        self, sequences: torch.Tensor, decoder_config: dict[str, Any]
+    ) -> List[str]:
         decode_fn = getattr(self.processor, "batch_decode", None)
         if decode_fn is None and hasattr(self.processor, "tokenizer"):
             decode_fn = self.processor.tokenizer.batch_decode  # type: ignore[union-attr]
@@ -398,39 +614,45 @@ class TransformersVlmEngine(BaseVlmEngine, HuggingFaceModelDownloadMixin):
                 "Neither processor.batch_decode nor tokenizer.batch_decode is available."
             )
 
-        decoded_texts = decode_fn(trimmed_sequences, **decoder_config)
+        decoded_texts = decode_fn(sequences, **decoder_config)
 
         # Remove padding
         pad_token = self.processor.tokenizer.pad_token  # type: ignore[union-attr,attr-defined]
         if pad_token:
             decoded_texts = [text.rstrip(pad_token) for text in decoded_texts]
+        return decoded_texts
 
-        # Create outputs
-        outputs = []
-        for i, text in enumerate(decoded_texts):
-            outputs.append(
-                VlmEngineOutput(
-                    text=text,
-                    stop_reason="unspecified",
-                    metadata={
-                        "generation_time": generation_time / len(input_batch),
-                        "num_tokens": int(generated_ids[i].shape[0])
-                        if i < generated_ids.shape[0]
-                        else None,
-                        "batch_size": len(input_batch),
-                    },
-                )
-            )
-
-        _log.info(
-            f"Batch processed {len(input_batch)} images in {generation_time:.2f}s "
-            f"({generation_time / len(input_batch):.2f}s per image)"
+    def get_cache_identity(self) -> Dict[str, Any]:
+        identity = super().get_cache_identity()
+        # The precision of the weights changes the responses
+        identity.update(
+            torch_dtype=self.options.torch_dtype, quantized=self.options.quantized
         )
+        if self.options.quantized:
+            identity.update(
+                load_in_8bit=self.options.load_in_8bit,
+                llm_int8_threshold=self.options.llm_int8_threshold,
+            )
+        return identity
 
-        return outputs
+    @property
+    def preferred_batch_size(self) -> int:
+        if self.options.continuous_batching:
+            return self.options.max_concurrent_sequences
+        return super().preferred_batch_size
 
     def cleanup(self) -> None:
         """Clean up model resources."""
+        with self._scheduler_lock:
+            if self._scheduler is not None:
+                if self._scheduler.image_token_id is not None:
+                    stats = self._scheduler.prefix_stats()
+                    _log.info(
+                        f"Prompt prefix cache: {stats.hits} hits, {stats.misses} "
+                        f"misses, {stats.reused_tokens} prompt tokens reused"
+                    )
+                self._scheduler.shutdown()
+                self._scheduler = None
         if self.vlm_model is not None:
             del self.vlm_model
             self.vlm_model = None
@@ -12,6 +12,7 @@ from docling.datamodel.vlm_engine_options import VllmVlmEngineOptions
 from docling.models.inference_engines.vlm._utils import (
     format_prompt_for_vlm,
     preprocess_image_batch,
+    raise_if_cancelled,
     resolve_model_artifacts_path,
 )
 from docling.models.inference_engines.vlm.base import (
@@ -256,6 +257,8 @@ class VllmVlmEngine(BaseVlmEngine):
 
         if not input_batch:
             return []
+        # vLLM cannot abort a generate call, only check before and after it
+        raise_if_cancelled(input_batch)
 
         # Model should already be loaded via initialize()
         if self.llm is None or self.processor is None or self.sampling_params is None:
@@ -309,6 +312,7 @@ class VllmVlmEngine(BaseVlmEngine):
         start_time = time.time()
         outputs = self.llm.generate(llm_inputs, sampling_params=sampling_params)
         generation_time = time.time() - start_time
+        raise_if_cancelled(input_batch)
 
         _log.debug(
             f"vLLM generated {len(outputs)} outputs in {generation_time:.2f}s "
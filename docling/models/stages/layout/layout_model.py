@@ -1,12 +1,16 @@
 import copy
+import itertools
 import logging
 import warnings
 from collections.abc import Sequence
+from concurrent.futures import Executor
+from functools import partial
 from pathlib import Path
 from typing import List, Optional, Union
 
 import numpy as np
-from docling_core.types.doc import DocItemLabel
+from docling_core.types.doc import CoordOrigin, DocItemLabel
+from docling_core.types.doc.page import SegmentedPdfPage, TextCell
 from PIL import Image
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
@@ -17,6 +21,7 @@ from docling.datamodel.pipeline_options import LayoutOptions
 from docling.datamodel.settings import settings
 from docling.models.base_layout_model import BaseLayoutModel
 from docling.models.utils.hf_model_download import download_hf_model
+from docling.models.utils.model_registry import load_shared_model
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.layout_postprocessor import LayoutPostprocessor
 from docling.utils.profiling import TimeRecorder
@@ -80,10 +85,20 @@ class LayoutModel(BaseLayoutModel):
                 )
                 artifacts_path = artifacts_path / model_path
 
-        self.layout_predictor = LayoutPredictor(
-            artifact_path=str(artifacts_path),
-            device=device,
-            num_threads=accelerator_options.num_threads,
+        self.layout_predictor = load_shared_model(
+            self,
+            key=(
+                "docling_layout",
+                str(artifacts_path),
+                device,
+                accelerator_options.num_threads,
+            ),
+            loader=partial(
+                LayoutPredictor,
+                artifact_path=str(artifacts_path),
+                device=device,
+                num_threads=accelerator_options.num_threads,
+            ),
         )
 
     @classmethod
@@ -157,8 +172,23 @@ class LayoutModel(BaseLayoutModel):
         # Convert to list to ensure predictable iteration
         pages = list(pages)
 
+        raw_predictions = self.predict_raw_layout(conv_res, pages)
+        for page, raw_prediction in zip(pages, raw_predictions):
+            page.predictions.layout = raw_prediction
+
+        return self.postprocess_layout(conv_res, pages)
+
+    def predict_raw_layout(
+        self,
+        conv_res: ConversionResult,
+        pages: Sequence[Page],
+    ) -> list[LayoutPrediction]:
+        """Run the layout predictor on *pages* and return their raw clusters.
+
+        This is the accelerator-bound part of `predict_layout`, the returned
+        predictions still need to go through `postprocess_layout`.
+        """
         # Separate valid and invalid pages
-        valid_pages = []
         valid_page_images: List[Union[Image.Image, np.ndarray]] = []
 
         for page in pages:
@@ -170,7 +200,6 @@ class LayoutModel(BaseLayoutModel):
             page_image = page.get_image(scale=1.0)
             assert page_image is not None
 
-            valid_pages.append(page)
             valid_page_images.append(page_image)
 
         # Process all valid pages with batch prediction
@@ -181,15 +210,12 @@ class LayoutModel(BaseLayoutModel):
                     valid_page_images
                 )
 
-        # Process each page with its predictions
-        layout_predictions: list[LayoutPrediction] = []
+        raw_predictions: list[LayoutPrediction] = []
         valid_page_idx = 0
         for page in pages:
             assert page._backend is not None
             if not page._backend.is_valid():
-                existing_prediction = page.predictions.layout or LayoutPrediction()
-                page.predictions.layout = existing_prediction
-                layout_predictions.append(existing_prediction)
+                raw_predictions.append(page.predictions.layout or LayoutPrediction())
                 continue
 
             page_predictions = batch_predictions[valid_page_idx]
@@ -200,26 +226,79 @@ class LayoutModel(BaseLayoutModel):
                 label = DocItemLabel(
                     pred_item["label"].lower().replace(" ", "_").replace("-", "_")
                 )  # Temporary, until docling-ibm-model uses docling-core types
-                cluster = Cluster(
+                # The predictor output is trusted, skip pydantic validation
+                cluster = Cluster.model_construct(
                     id=ix,
                     label=label,
-                    confidence=pred_item["confidence"],
-                    bbox=BoundingBox.model_validate(pred_item),
+                    confidence=float(pred_item["confidence"]),
+                    bbox=BoundingBox.model_construct(
+                        l=float(pred_item["l"]),
+                        t=float(pred_item["t"]),
+                        r=float(pred_item["r"]),
+                        b=float(pred_item["b"]),
+                        coord_origin=CoordOrigin.TOPLEFT,
+                    ),
                     cells=[],
+                    children=[],
                 )
                 clusters.append(cluster)
 
+            raw_predictions.append(LayoutPrediction(clusters=clusters))
+
+        return raw_predictions
+
+    def postprocess_layout(
+        self,
+        conv_res: ConversionResult,
+        pages: Sequence[Page],
+        executor: Optional[Executor] = None,
+    ) -> list[LayoutPrediction]:
+        """Post-process the raw layout stored in ``page.predictions.layout``.
+
+        Clusters are cleaned up and assigned their text cells, and the layout and
+        OCR confidence scores are recorded. With an *executor*, the CPU-bound
+        `LayoutPostprocessor` runs in its workers, e.g. a process pool.
+        """
+        pages = list(pages)
+        valid_pages = []
+        for page in pages:
+            assert page._backend is not None
+            if not page._backend.is_valid():
+                continue
+            valid_pages.append(page)
+
             if settings.debug.visualize_raw_layout:
+                assert page.predictions.layout is not None
                 self.draw_clusters_and_cells_side_by_side(
-                    conv_res, page, clusters, mode_prefix="raw"
+                    conv_res,
+                    page,
+                    page.predictions.layout.clusters,
+                    mode_prefix="raw",
                 )
 
-            # Apply postprocessing
-            processed_clusters, processed_cells = LayoutPostprocessor(
-                page, clusters, self.options
-            ).postprocess()
-            # Note: LayoutPostprocessor updates page.cells and page.parsed_page internally
-
+        # Apply postprocessing
+        if executor is None:
+            results = [
+                _postprocess_page_layout(page, _raw_clusters(page), self.options)
+                for page in valid_pages
+            ]
+        else:
+            results = list(
+                executor.map(
+                    _postprocess_page_layout,
+                    [_detached_page(page) for page in valid_pages],
+                    [_raw_clusters(page) for page in valid_pages],
+                    itertools.repeat(self.options),
+                )
+            )
+            for page, (_, processed_cells) in zip(valid_pages, results):
+                # The postprocessor updated a copy of the page, apply its cells
+                if not self.options.skip_cell_assignment:
+                    assert page.parsed_page is not None
+                    page.parsed_page.textline_cells = processed_cells
+                    page.parsed_page.has_lines = len(processed_cells) > 0
+
+        for page, (processed_clusters, processed_cells) in zip(valid_pages, results):
             with warnings.catch_warnings():
                 warnings.filterwarnings(
                     "ignore",
@@ -236,14 +315,42 @@ class LayoutModel(BaseLayoutModel):
                     np.mean([c.confidence for c in processed_cells if c.from_ocr])
                 )
 
-            prediction = LayoutPrediction(clusters=processed_clusters)
-            page.predictions.layout = prediction
+            page.predictions.layout = LayoutPrediction(clusters=processed_clusters)
 
             if settings.debug.visualize_layout:
                 self.draw_clusters_and_cells_side_by_side(
                     conv_res, page, processed_clusters, mode_prefix="postprocessed"
                 )
 
+        layout_predictions: list[LayoutPrediction] = []
+        for page in pages:
+            prediction = page.predictions.layout or LayoutPrediction()
+            page.predictions.layout = prediction
             layout_predictions.append(prediction)
 
         return layout_predictions
+
+
+def _raw_clusters(page: Page) -> list[Cluster]:
+    assert page.predictions.layout is not None
+    return page.predictions.layout.clusters
+
+
+def _detached_page(page: Page) -> Page:
+    """Copy of *page* with only what `LayoutPostprocessor` needs, for pickling."""
+    parsed_page: Optional[SegmentedPdfPage] = None
+    if page.parsed_page is not None:
+        parsed_page = SegmentedPdfPage(
+            dimension=page.parsed_page.dimension,
+            textline_cells=page.parsed_page.textline_cells,
+            char_cells=[],
+            word_cells=[],
+        )
+    return Page(page_no=page.page_no, size=page.size, parsed_page=parsed_page)
+
+
+def _postprocess_page_layout(
+    page: Page, clusters: list[Cluster], options: LayoutOptions
+) -> tuple[list[Cluster], list[TextCell]]:
+    # Note: LayoutPostprocessor updates page.cells and page.parsed_page internally
+    return LayoutPostprocessor(page, clusters, options).postprocess()
@@ -50,6 +50,9 @@ class OcrAutoModel(BaseOcrModel):
                         options=OcrMacOptions(
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            decision_policy=self.options.decision_policy,
+                            parse_score_threshold=self.options.parse_score_threshold,
+                            text_density_threshold=self.options.text_density_threshold,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -69,6 +72,9 @@ class OcrAutoModel(BaseOcrModel):
                             backend="onnxruntime",
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            decision_policy=self.options.decision_policy,
+                            parse_score_threshold=self.options.parse_score_threshold,
+                            text_density_threshold=self.options.text_density_threshold,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -88,6 +94,9 @@ class OcrAutoModel(BaseOcrModel):
                         options=EasyOcrOptions(
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            decision_policy=self.options.decision_policy,
+                            parse_score_threshold=self.options.parse_score_threshold,
+                            text_density_threshold=self.options.text_density_threshold,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -107,6 +116,9 @@ class OcrAutoModel(BaseOcrModel):
                             backend="torch",
                             bitmap_area_threshold=self.options.bitmap_area_threshold,
                             force_full_page_ocr=self.options.force_full_page_ocr,
+                            decision_policy=self.options.decision_policy,
+                            parse_score_threshold=self.options.parse_score_threshold,
+                            text_density_threshold=self.options.text_density_threshold,
                         ),
                         accelerator_options=accelerator_options,
                     )
@@ -1,9 +1,11 @@
 import logging
 import warnings
 import zipfile
+from collections import defaultdict
 from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Type
 
 import numpy
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -17,10 +19,11 @@ from docling.datamodel.pipeline_options import (
     OcrOptions,
 )
 from docling.datamodel.settings import settings
-from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.base_ocr_model import BaseOcrModel, OcrCrop
+from docling.models.utils.model_registry import load_shared_model
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.profiling import TimeRecorder
-from docling.utils.utils import download_url_with_progress
+from docling.utils.utils import chunkify, download_url_with_progress
 
 _log = logging.getLogger(__name__)
 
@@ -81,13 +84,25 @@ class EasyOcrModel(BaseOcrModel):
             with warnings.catch_warnings():
                 if self.options.suppress_mps_warnings:
                     warnings.filterwarnings("ignore", message=".*pin_memory.*MPS.*")
-                self.reader = easyocr.Reader(
-                    lang_list=self.options.lang,
-                    gpu=use_gpu,
-                    model_storage_directory=model_storage_directory,
-                    recog_network=self.options.recog_network,
-                    download_enabled=download_enabled,
-                    verbose=False,
+                self.reader = load_shared_model(
+                    self,
+                    key=(
+                        "easyocr",
+                        tuple(self.options.lang),
+                        use_gpu,
+                        model_storage_directory,
+                        self.options.recog_network,
+                        download_enabled,
+                    ),
+                    loader=partial(
+                        easyocr.Reader,
+                        lang_list=self.options.lang,
+                        gpu=use_gpu,
+                        model_storage_directory=model_storage_directory,
+                        recog_network=self.options.recog_network,
+                        download_enabled=download_enabled,
+                        verbose=False,
+                    ),
                 )
 
     @staticmethod
@@ -126,6 +141,75 @@ class EasyOcrModel(BaseOcrModel):
 
         return local_dir
 
+    def _result_to_cells(self, result: list, ocr_rect: BoundingBox) -> List[TextCell]:
+        return [
+            TextCell(
+                index=ix,
+                text=line[1],
+                orig=line[1],
+                from_ocr=True,
+                confidence=line[2],
+                rect=BoundingRectangle.from_bounding_box(
+                    BoundingBox.from_tuple(
+                        coord=(
+                            (line[0][0][0] / self.scale) + ocr_rect.l,
+                            (line[0][0][1] / self.scale) + ocr_rect.t,
+                            (line[0][2][0] / self.scale) + ocr_rect.l,
+                            (line[0][2][1] / self.scale) + ocr_rect.t,
+                        ),
+                        origin=CoordOrigin.TOPLEFT,
+                    )
+                ),
+            )
+            for ix, line in enumerate(result)
+            if line[2] >= self.options.confidence_threshold
+        ]
+
+    def _call_batched(
+        self, conv_res: ConversionResult, pages: List[Page]
+    ) -> Iterable[Page]:
+        with TimeRecorder(conv_res, "ocr"):
+            page_rects, crops = self.prepare_ocr_crops(
+                conv_res, pages, scale=self.scale
+            )
+
+            # readtext_batched requires all images of a call to share one shape
+            crops_by_shape: Dict[tuple, List[OcrCrop]] = defaultdict(list)
+            for crop in crops:
+                crops_by_shape[crop.image.shape].append(crop)
+
+            page_cells: Dict[int, List[TextCell]] = {ix: [] for ix in page_rects}
+            for same_shape_crops in crops_by_shape.values():
+                for chunk in chunkify(same_shape_crops, self.options.batch_size):
+                    conv_res.cancellation.raise_if_cancelled()
+                    with warnings.catch_warnings():
+                        if self.options.suppress_mps_warnings:
+                            warnings.filterwarnings(
+                                "ignore", message=".*pin_memory.*MPS.*"
+                            )
+
+                        results = self.reader.readtext_batched(
+                            [crop.image for crop in chunk],
+                            batch_size=self.options.batch_size,
+                        )
+
+                    for crop, result in zip(chunk, results):
+                        page_cells[crop.page_idx].extend(
+                            self._result_to_cells(result, crop.rect)
+                        )
+            del crops
+
+            # Post-process the cells
+            for page_idx, cells in page_cells.items():
+                self.post_process_cells(cells, pages[page_idx])
+
+        for page_idx, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and page_idx in page_rects:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_rects[page_idx])
+
+            yield page
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -133,16 +217,21 @@ class EasyOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
+        if self.options.batch_size > 1:
+            yield from self._call_batched(conv_res, list(page_batch))
+            return
+
         for page in page_batch:
             assert page._backend is not None
             if not page._backend.is_valid():
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
+                    ocr_rects = self.get_ocr_rects(page, conv_res)
 
                     all_ocr_cells = []
                     for ocr_rect in ocr_rects:
+                        conv_res.cancellation.raise_if_cancelled()
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
@@ -162,29 +251,7 @@ class EasyOcrModel(BaseOcrModel):
                         del high_res_image
                         del im
 
-                        cells = [
-                            TextCell(
-                                index=ix,
-                                text=line[1],
-                                orig=line[1],
-                                from_ocr=True,
-                                confidence=line[2],
-                                rect=BoundingRectangle.from_bounding_box(
-                                    BoundingBox.from_tuple(
-                                        coord=(
-                                            (line[0][0][0] / self.scale) + ocr_rect.l,
-                                            (line[0][0][1] / self.scale) + ocr_rect.t,
-                                            (line[0][2][0] / self.scale) + ocr_rect.l,
-                                            (line[0][2][1] / self.scale) + ocr_rect.t,
-                                        ),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    )
-                                ),
-                            )
-                            for ix, line in enumerate(result)
-                            if line[2] >= self.options.confidence_threshold
-                        ]
-                        all_ocr_cells.extend(cells)
+                        all_ocr_cells.extend(self._result_to_cells(result, ocr_rect))
 
                     # Post-process the cells
                     self.post_process_cells(all_ocr_cells, page)
@@ -69,10 +69,11 @@ class OcrMacModel(BaseOcrModel):
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
+                    ocr_rects = self.get_ocr_rects(page, conv_res)
 
                     all_ocr_cells = []
                     for ocr_rect in ocr_rects:
+                        conv_res.cancellation.raise_if_cancelled()
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
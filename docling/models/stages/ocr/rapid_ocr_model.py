@@ -1,7 +1,8 @@
 import logging
 from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
-from typing import Literal, Optional, Type, TypedDict
+from typing import Dict, List, Literal, Optional, Type, TypedDict
 
 import numpy
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -16,6 +17,7 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.utils.model_registry import load_shared_model
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.profiling import TimeRecorder
 from docling.utils.utils import download_url_with_progress
@@ -213,13 +215,22 @@ class RapidOcrModel(BaseOcrModel):
                 _log.warning(
                     "The 'rec_font_path' option for RapidOCR is deprecated. Please use 'font_path' instead."
                 )
+            if self.options.batch_size > 1:
+                params["Cls.cls_batch_num"] = self.options.batch_size
+                params["Rec.rec_batch_num"] = self.options.batch_size
+
             user_params = self.options.rapidocr_params
             if user_params:
                 _log.debug("Overwriting RapidOCR params with user-provided values.")
                 params.update(user_params)
 
-            self.reader = RapidOCR(
-                params=params,
+            self.reader = load_shared_model(
+                self,
+                key=(
+                    "rapidocr",
+                    *sorted((name, str(value)) for name, value in params.items()),
+                ),
+                loader=partial(RapidOCR, params=params),
             )
 
     @staticmethod
@@ -246,6 +257,43 @@ class RapidOcrModel(BaseOcrModel):
 
         return local_dir
 
+    def _read_crop(
+        self, image: numpy.ndarray, ocr_rect: BoundingBox
+    ) -> Optional[List[TextCell]]:
+        result = self.reader(
+            image,
+            use_det=self.options.use_det,
+            use_cls=self.options.use_cls,
+            use_rec=self.options.use_rec,
+        )
+        if result is None or result.boxes is None:
+            _log.warning("RapidOCR returned empty result!")
+            return None
+
+        return [
+            TextCell(
+                index=ix,
+                text=line[1],
+                orig=line[1],
+                confidence=line[2],
+                from_ocr=True,
+                rect=BoundingRectangle.from_bounding_box(
+                    BoundingBox.from_tuple(
+                        coord=(
+                            (line[0][0][0] / self.scale) + ocr_rect.l,
+                            (line[0][0][1] / self.scale) + ocr_rect.t,
+                            (line[0][2][0] / self.scale) + ocr_rect.l,
+                            (line[0][2][1] / self.scale) + ocr_rect.t,
+                        ),
+                        origin=CoordOrigin.TOPLEFT,
+                    )
+                ),
+            )
+            for ix, line in enumerate(
+                zip(result.boxes.tolist(), result.txts, result.scores)
+            )
+        ]
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -253,16 +301,19 @@ class RapidOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
+        # RapidOCR reads one image per call: each crop is rendered and read in turn,
+        # the classifier and the recognizer batch its text lines (see batch_size)
         for page in page_batch:
             assert page._backend is not None
             if not page._backend.is_valid():
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
+                    ocr_rects = self.get_ocr_rects(page, conv_res)
 
                     all_ocr_cells = []
                     for ocr_rect in ocr_rects:
+                        conv_res.cancellation.raise_if_cancelled()
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
@@ -270,48 +321,12 @@ class RapidOcrModel(BaseOcrModel):
                             scale=self.scale, cropbox=ocr_rect
                         )
                         im = numpy.array(high_res_image)
-                        result = self.reader(
-                            im,
-                            use_det=self.options.use_det,
-                            use_cls=self.options.use_cls,
-                            use_rec=self.options.use_rec,
-                        )
-                        if result is None or result.boxes is None:
-                            _log.warning("RapidOCR returned empty result!")
-                            continue
-                        result = list(
-                            zip(result.boxes.tolist(), result.txts, result.scores)
-                        )
+                        cells = self._read_crop(im, ocr_rect)
 
                         del high_res_image
                         del im
 
-                        if result is not None:
-                            cells = [
-                                TextCell(
-                                    index=ix,
-                                    text=line[1],
-                                    orig=line[1],
-                                    confidence=line[2],
-                                    from_ocr=True,
-                                    rect=BoundingRectangle.from_bounding_box(
-                                        BoundingBox.from_tuple(
-                                            coord=(
-                                                (line[0][0][0] / self.scale)
-                                                + ocr_rect.l,
-                                                (line[0][0][1] / self.scale)
-                                                + ocr_rect.t,
-                                                (line[0][2][0] / self.scale)
-                                                + ocr_rect.l,
-                                                (line[0][2][1] / self.scale)
-                                                + ocr_rect.t,
-                                            ),
-                                            origin=CoordOrigin.TOPLEFT,
-                                        )
-                                    ),
-                                )
-                                for ix, line in enumerate(result)
-                            ]
+                        if cells is not None:
                             all_ocr_cells.extend(cells)
 
                     # Post-process the cells
@@ -21,8 +21,11 @@ from docling.datamodel.pipeline_options import (
     TesseractCliOcrOptions,
 )
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelledError
 from docling.models.base_ocr_model import BaseOcrModel
+from docling.utils.cancellation import CancellationToken
 from docling.utils.ocr_utils import (
+    DocumentOsdCache,
     map_tesseract_script,
     parse_tesseract_orientation,
     tesseract_box_to_bounding_rectangle,
@@ -55,6 +58,11 @@ class TesseractOcrCliModel(BaseOcrModel):
         self._tesseract_languages: Optional[List[str]] = None
         self._script_prefix: Optional[str] = None
         self._is_auto: bool = "auto" in self.options.lang
+        self._osd_cache: Optional[DocumentOsdCache] = (
+            DocumentOsdCache(sample_pages=self.options.osd_sample_pages)
+            if self.options.osd_sample_pages is not None
+            else None
+        )
 
         if self.enabled:
             try:
@@ -99,13 +107,19 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return name, version
 
-    def _run_tesseract(self, ifilename: str, osd: Optional[pd.DataFrame]):
+    def _run_tesseract(
+        self,
+        ifilename: str,
+        osd: Optional[pd.DataFrame],
+        detected_lang: Optional[str] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ):
         r"""
         Run tesseract CLI
         """
         cmd = [self.options.tesseract_cmd]
-        if self._is_auto and osd is not None:
-            lang = self._parse_language(osd)
+        if self._is_auto:
+            lang = detected_lang if osd is None else self._parse_language(osd)
             if lang is not None:
                 cmd.append("-l")
                 cmd.append(lang)
@@ -124,7 +138,9 @@ class TesseractOcrCliModel(BaseOcrModel):
         cmd += [ifilename, "stdout", "tsv"]
         _log.info("command: {}".format(" ".join(cmd)))
 
-        output = subprocess.run(cmd, stdout=PIPE, stderr=DEVNULL, check=True)
+        output = _run_cancellable(
+            cmd, cancellation, stdout=PIPE, stderr=DEVNULL, check=True
+        )
 
         # _log.info(output)
 
@@ -147,7 +163,9 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return df_filtered
 
-    def _perform_osd(self, ifilename: str) -> pd.DataFrame:
+    def _perform_osd(
+        self, ifilename: str, cancellation: Optional[CancellationToken] = None
+    ) -> pd.DataFrame:
         r"""
         Run tesseract in PSM 0 mode to detect the language
         """
@@ -155,7 +173,7 @@ class TesseractOcrCliModel(BaseOcrModel):
         cmd = [self.options.tesseract_cmd]
         cmd.extend(["--psm", "0", "-l", "osd", ifilename, "stdout"])
         _log.info("command: {}".format(" ".join(cmd)))
-        output = subprocess.run(cmd, capture_output=True, check=True)
+        output = _run_cancellable(cmd, cancellation, capture_output=True, check=True)
         decoded_data = output.stdout.decode("utf-8")
         df_detected = pd.read_csv(
             io.StringIO(decoded_data), sep=":", header=None, names=["key", "value"]
@@ -218,10 +236,11 @@ class TesseractOcrCliModel(BaseOcrModel):
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
+                    ocr_rects = self.get_ocr_rects(page, conv_res)
 
                     all_ocr_cells = []
                     for ocr_rect_i, ocr_rect in enumerate(ocr_rects):
+                        conv_res.cancellation.raise_if_cancelled()
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
@@ -236,30 +255,56 @@ class TesseractOcrCliModel(BaseOcrModel):
                                 high_res_image.save(image_file)
                             doc_orientation = 0
                             df_osd: Optional[pd.DataFrame] = None
-                            try:
-                                df_osd = self._perform_osd(fname)
-                                doc_orientation = _parse_orientation(df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "OSD failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                # Skipping if OSD fail when in auto mode, otherwise proceed
-                                # to OCR in the hope OCR will succeed while OSD failed
-                                if self._is_auto:
-                                    continue
+                            detected_lang: Optional[str] = None
+                            cached_osd = (
+                                self._osd_cache.get(conv_res.input.document_hash)
+                                if self._osd_cache is not None
+                                else None
+                            )
+                            if cached_osd is not None:
+                                # Reuse the document decision, no `--psm 0` process
+                                doc_orientation, detected_lang = cached_osd
+                            else:
+                                try:
+                                    df_osd = self._perform_osd(
+                                        fname, conv_res.cancellation
+                                    )
+                                    doc_orientation = _parse_orientation(df_osd)
+                                except subprocess.CalledProcessError as exc:
+                                    _log.error(
+                                        "OSD failed (doc %s, page: %s, "
+                                        "OCR rectangle: %s, processed image file %s):\n %s",
+                                        conv_res.input.file,
+                                        page_i,
+                                        ocr_rect_i,
+                                        image_file,
+                                        exc.stderr,
+                                    )
+                                    # Skipping if OSD fail when in auto mode, otherwise proceed
+                                    # to OCR in the hope OCR will succeed while OSD failed
+                                    if self._is_auto:
+                                        continue
+                                if df_osd is not None and self._osd_cache is not None:
+                                    self._osd_cache.add_sample(
+                                        conv_res.input.document_hash,
+                                        page.page_no,
+                                        doc_orientation,
+                                        self._parse_language(df_osd)
+                                        if self._is_auto
+                                        else None,
+                                    )
                             if doc_orientation != 0:
                                 high_res_image = high_res_image.rotate(
                                     -doc_orientation, expand=True
                                 )
                                 high_res_image.save(fname)
                             try:
-                                df_result = self._run_tesseract(fname, df_osd)
+                                df_result = self._run_tesseract(
+                                    fname,
+                                    df_osd,
+                                    detected_lang=detected_lang,
+                                    cancellation=conv_res.cancellation,
+                                )
                             except subprocess.CalledProcessError as exc:
                                 _log.error(
                                     "tesseract OCR failed (doc %s, page: %s, "
@@ -329,3 +374,18 @@ def _parse_orientation(df_osd: pd.DataFrame) -> int:
     orientation_val = df_osd["value"].to_numpy()[mask][0]
     orientation = parse_tesseract_orientation(orientation_val.strip())
     return orientation
+
+
+def _run_cancellable(
+    cmd: List[str], cancellation: Optional[CancellationToken], **kwargs
+) -> subprocess.CompletedProcess:
+    """Run *cmd*, killing the process when the conversion is cancelled."""
+    if cancellation is None:
+        return subprocess.run(cmd, **kwargs)
+    cancellation.raise_if_cancelled()
+    try:
+        return subprocess.run(cmd, timeout=cancellation.timeout(), **kwargs)
+    except subprocess.TimeoutExpired as exc:
+        raise ConversionCancelledError(
+            cancellation.reason or "document timeout exceeded"
+        ) from exc
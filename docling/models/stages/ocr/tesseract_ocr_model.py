@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Iterable, Optional, Type
+from typing import TYPE_CHECKING, Iterable, Optional, Type
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
@@ -17,12 +17,16 @@ from docling.datamodel.pipeline_options import (
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
 from docling.utils.ocr_utils import (
+    DocumentOsdCache,
     map_tesseract_script,
     parse_tesseract_orientation,
     tesseract_box_to_bounding_rectangle,
 )
 from docling.utils.profiling import TimeRecorder
 
+if TYPE_CHECKING:
+    import tesserocr
+
 _log = logging.getLogger(__name__)
 
 
@@ -45,6 +49,11 @@ class TesseractOcrModel(BaseOcrModel):
         self.scale = 3  # multiplier for 72 dpi == 216 dpi.
         self.reader = None
         self.script_readers: dict[str, tesserocr.PyTessBaseAPI] = {}
+        self._osd_cache: Optional[DocumentOsdCache] = (
+            DocumentOsdCache(sample_pages=self.options.osd_sample_pages)
+            if self.options.osd_sample_pages is not None
+            else None
+        )
 
         if self.enabled:
             install_errmsg = (
@@ -113,6 +122,37 @@ class TesseractOcrModel(BaseOcrModel):
             )
             self.reader_RIL = tesserocr.RIL
 
+    def _get_script_reader(self, script: str) -> Optional[tesserocr.PyTessBaseAPI]:
+        """Return the reader of a detected script, creating it on first use.
+
+        Readers are kept for the lifetime of the model, hence they stay warm
+        across pages and documents.
+        """
+        assert self.reader is not None
+        assert self._tesserocr_languages is not None
+        lang = f"{self.script_prefix}{script}"
+
+        # Check if the detected language is present in the system
+        if lang not in self._tesserocr_languages:
+            msg = f"Tesseract detected the script '{script}' and language '{lang}'."
+            msg += " However this language is not installed in your system and will be ignored."
+            _log.warning(msg)
+            return None
+
+        if script not in self.script_readers:
+            import tesserocr
+
+            self.script_readers[script] = tesserocr.PyTessBaseAPI(
+                path=self.reader.GetDatapath(),
+                lang=lang,
+                psm=self.options.psm
+                if self.options.psm is not None
+                else tesserocr.PSM.AUTO,
+                init=True,
+                oem=tesserocr.OEM.DEFAULT,
+            )
+        return self.script_readers[script]
+
     def __del__(self):
         if self.reader is not None:
             # Finalize the tesseractAPI
@@ -137,10 +177,11 @@ class TesseractOcrModel(BaseOcrModel):
                     assert self.osd_reader is not None
                     assert self._tesserocr_languages is not None
 
-                    ocr_rects = self.get_ocr_rects(page)
+                    ocr_rects = self.get_ocr_rects(page, conv_res)
 
                     all_ocr_cells = []
                     for ocr_rect_i, ocr_rect in enumerate(ocr_rects):
+                        conv_res.cancellation.raise_if_cancelled()
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
@@ -149,58 +190,54 @@ class TesseractOcrModel(BaseOcrModel):
                         )
 
                         local_reader = self.reader
-                        self.osd_reader.SetImage(high_res_image)
-
                         doc_orientation = 0
-                        osd = self.osd_reader.DetectOrientationScript()
-
-                        # No text, or Orientation and Script detection failure
-                        if osd is None:
-                            _log.error(
-                                "OSD failed for doc (doc %s, page: %s, "
-                                "OCR rectangle: %s)",
-                                conv_res.input.file,
-                                page_i,
-                                ocr_rect_i,
-                            )
-                            # Skipping if OSD fail when in auto mode, otherwise proceed
-                            # to OCR in the hope OCR will succeed while OSD failed
-                            if self._is_auto:
-                                continue
+                        script: Optional[str] = None
+
+                        cached_osd = (
+                            self._osd_cache.get(conv_res.input.document_hash)
+                            if self._osd_cache is not None
+                            else None
+                        )
+                        if cached_osd is not None:
+                            doc_orientation, script = cached_osd
                         else:
-                            doc_orientation = parse_tesseract_orientation(
-                                osd["orient_deg"]
-                            )
-                            if doc_orientation != 0:
-                                high_res_image = high_res_image.rotate(
-                                    -doc_orientation, expand=True
+                            self.osd_reader.SetImage(high_res_image)
+                            osd = self.osd_reader.DetectOrientationScript()
+
+                            # No text, or Orientation and Script detection failure
+                            if osd is None:
+                                _log.error(
+                                    "OSD failed for doc (doc %s, page: %s, "
+                                    "OCR rectangle: %s)",
+                                    conv_res.input.file,
+                                    page_i,
+                                    ocr_rect_i,
                                 )
-                        if self._is_auto:
-                            script = osd["script_name"]
-                            script = map_tesseract_script(script)
-                            lang = f"{self.script_prefix}{script}"
-
-                            # Check if the detected language is present in the system
-                            if lang not in self._tesserocr_languages:
-                                msg = f"Tesseract detected the script '{script}' and language '{lang}'."
-                                msg += " However this language is not installed in your system and will be ignored."
-                                _log.warning(msg)
+                                # Skipping if OSD fail when in auto mode, otherwise proceed
+                                # to OCR in the hope OCR will succeed while OSD failed
+                                if self._is_auto:
+                                    continue
                             else:
-                                if script not in self.script_readers:
-                                    import tesserocr
-
-                                    self.script_readers[script] = (
-                                        tesserocr.PyTessBaseAPI(
-                                            path=self.reader.GetDatapath(),
-                                            lang=lang,
-                                            psm=self.options.psm
-                                            if self.options.psm is not None
-                                            else tesserocr.PSM.AUTO,
-                                            init=True,
-                                            oem=tesserocr.OEM.DEFAULT,
-                                        )
+                                doc_orientation = parse_tesseract_orientation(
+                                    osd["orient_deg"]
+                                )
+                                script = map_tesseract_script(osd["script_name"])
+                                if self._osd_cache is not None:
+                                    self._osd_cache.add_sample(
+                                        conv_res.input.document_hash,
+                                        page.page_no,
+                                        doc_orientation,
+                                        script,
                                     )
-                                local_reader = self.script_readers[script]
+
+                        if doc_orientation != 0:
+                            high_res_image = high_res_image.rotate(
+                                -doc_orientation, expand=True
+                            )
+                        if self._is_auto and script is not None:
+                            script_reader = self._get_script_reader(script)
+                            if script_reader is not None:
+                                local_reader = script_reader
 
                         local_reader.SetImage(high_res_image)
                         boxes = local_reader.GetComponentImages(
@@ -1,14 +1,19 @@
+from collections import deque
 from pathlib import Path
+from typing import Iterable, Mapping, Optional
 
 from docling_core.types.doc import (
+    CoordOrigin,
     DocItemLabel,
     DoclingDocument,
     DocumentOrigin,
+    GroupItem,
     GroupLabel,
     NodeItem,
     ProvenanceItem,
     RefItem,
     RichTableCell,
+    Size,
     TableData,
 )
 from docling_core.types.doc.document import ContentLayer
@@ -26,6 +31,7 @@ from docling.datamodel.base_models import (
     Cluster,
     ContainerElement,
     FigureElement,
+    Page,
     Table,
     TextElement,
 )
@@ -47,22 +53,30 @@ class ReadingOrderModel:
 
     def _assembled_to_readingorder_elements(
         self, conv_res: ConversionResult
+    ) -> list[ReadingOrderPageElement]:
+        page_sizes = {p.page_no: p.size for p in conv_res.pages}
+        return self._to_readingorder_elements(conv_res.assembled.elements, page_sizes)
+
+    def _to_readingorder_elements(
+        self,
+        page_elements: Iterable[BasePageElement],
+        page_sizes: dict[int, Optional[Size]],
+        start_cid: int = 0,
     ) -> list[ReadingOrderPageElement]:
         elements: list[ReadingOrderPageElement] = []
-        page_no_to_pages = {p.page_no: p for p in conv_res.pages}
 
-        for element in conv_res.assembled.elements:
-            page_height = page_no_to_pages[element.page_no].size.height  # type: ignore
+        for element in page_elements:
+            page_height = page_sizes[element.page_no].height  # type: ignore
             bbox = element.cluster.bbox.to_bottom_left_origin(page_height)
             text = element.text or ""
 
             elements.append(
                 ReadingOrderPageElement(
-                    cid=len(elements),
+                    cid=start_cid + len(elements),
                     ref=RefItem(cref=f"#/{element.page_no}/{element.cluster.id}"),
                     text=text,
                     page_no=element.page_no,
-                    page_size=page_no_to_pages[element.page_no].size,
+                    page_size=page_sizes[element.page_no],
                     label=element.label,
                     l=bbox.l,
                     r=bbox.r,
@@ -133,14 +147,7 @@ class ReadingOrderModel:
         }
         cid_to_rels = {rel.cid: rel for rel in ro_elements}
 
-        origin = DocumentOrigin(
-            mimetype="application/pdf",
-            filename=conv_res.input.file.name,
-            binary_hash=conv_res.input.document_hash,
-        )
-        doc_name = Path(origin.filename).stem
-        out_doc: DoclingDocument = DoclingDocument(name=doc_name, origin=origin)
-
+        out_doc = self._create_docling_doc(conv_res)
         for page in conv_res.pages:
             page_no = page.page_no
             size = page.size
@@ -161,170 +168,200 @@ class ReadingOrderModel:
             for cid in lst
         }
 
-        page_no_to_pages = {p.page_no: p for p in conv_res.pages}
-
         for rel in ro_elements:
             if rel.cid in skippable_cids:
                 continue
-            element = id_to_elem[rel.ref.cref]
+            current_list = self._add_readingorder_element(
+                out_doc,
+                rel,
+                id_to_elem,
+                cid_to_rels,
+                el_to_captions_mapping,
+                el_to_footnotes_mapping,
+                el_merges_mapping,
+                current_list,
+            )
 
-            page_height = page_no_to_pages[element.page_no].size.height  # type: ignore
+        return out_doc
 
-            if isinstance(element, TextElement):
-                if element.label == DocItemLabel.CODE:
-                    cap_text = element.text
-                    prov = ProvenanceItem(
-                        page_no=element.page_no,
-                        charspan=(0, len(cap_text)),
-                        bbox=element.cluster.bbox.to_bottom_left_origin(page_height),
-                    )
-                    code_item = out_doc.add_code(text=cap_text, prov=prov)
-
-                    if rel.cid in el_to_captions_mapping.keys():
-                        for caption_cid in el_to_captions_mapping[rel.cid]:
-                            caption_elem = id_to_elem[cid_to_rels[caption_cid].ref.cref]
-                            new_cap_item = self._add_caption_or_footnote(
-                                caption_elem, out_doc, code_item, page_height
-                            )
-
-                            code_item.captions.append(new_cap_item.get_ref())
-
-                    if rel.cid in el_to_footnotes_mapping.keys():
-                        for footnote_cid in el_to_footnotes_mapping[rel.cid]:
-                            footnote_elem = id_to_elem[
-                                cid_to_rels[footnote_cid].ref.cref
-                            ]
-                            new_footnote_item = self._add_caption_or_footnote(
-                                footnote_elem, out_doc, code_item, page_height
-                            )
-
-                            code_item.footnotes.append(new_footnote_item.get_ref())
-                else:
-                    new_item, current_list = self._handle_text_element(
-                        element, out_doc, current_list, page_height
-                    )
+    def _create_docling_doc(self, conv_res: ConversionResult) -> DoclingDocument:
+        origin = DocumentOrigin(
+            mimetype="application/pdf",
+            filename=conv_res.input.file.name,
+            binary_hash=conv_res.input.document_hash,
+        )
+        doc_name = Path(origin.filename).stem
+        return DoclingDocument(name=doc_name, origin=origin)
 
-                    if rel.cid in el_merges_mapping.keys():
-                        for merged_cid in el_merges_mapping[rel.cid]:
-                            merged_elem = id_to_elem[cid_to_rels[merged_cid].ref.cref]
-
-                            self._merge_elements(
-                                element, merged_elem, new_item, page_height
-                            )
-
-            elif isinstance(element, Table):
-                # Check if table has no structure prediction
-                if element.num_rows == 0 and element.num_cols == 0:
-                    # Only create 1x1 table if there are children to put in it
-                    if element.cluster.children:
-                        # Create minimal 1x1 table with rich cell containing all children
-                        tbl_data = TableData(num_rows=1, num_cols=1, table_cells=[])
-                    else:
-                        # Create empty table with no structure
-                        tbl_data = TableData(num_rows=0, num_cols=0, table_cells=[])
-                else:
-                    tbl_data = TableData(
-                        num_rows=element.num_rows,
-                        num_cols=element.num_cols,
-                        table_cells=element.table_cells,
-                    )
+    def _add_readingorder_element(
+        self,
+        out_doc: DoclingDocument,
+        rel: ReadingOrderPageElement,
+        id_to_elem: Mapping[str, BasePageElement],
+        cid_to_rels: dict[int, ReadingOrderPageElement],
+        el_to_captions_mapping: dict[int, list[int]],
+        el_to_footnotes_mapping: dict[int, list[int]],
+        el_merges_mapping: dict[int, list[int]],
+        current_list: Optional[GroupItem],
+    ) -> Optional[GroupItem]:
+        """Add the item of *rel* to *out_doc*, return the list group still open."""
+        element = id_to_elem[rel.ref.cref]
+
+        page_height = out_doc.pages[element.page_no].size.height
 
+        if isinstance(element, TextElement):
+            if element.label == DocItemLabel.CODE:
+                cap_text = element.text
                 prov = ProvenanceItem(
                     page_no=element.page_no,
-                    charspan=(0, 0),
+                    charspan=(0, len(cap_text)),
                     bbox=element.cluster.bbox.to_bottom_left_origin(page_height),
                 )
-
-                tbl = out_doc.add_table(
-                    data=tbl_data, prov=prov, label=element.cluster.label
-                )
+                code_item = out_doc.add_code(text=cap_text, prov=prov)
 
                 if rel.cid in el_to_captions_mapping.keys():
                     for caption_cid in el_to_captions_mapping[rel.cid]:
                         caption_elem = id_to_elem[cid_to_rels[caption_cid].ref.cref]
                         new_cap_item = self._add_caption_or_footnote(
-                            caption_elem, out_doc, tbl, page_height
+                            caption_elem, out_doc, code_item, page_height
                         )
 
-                        tbl.captions.append(new_cap_item.get_ref())
+                        code_item.captions.append(new_cap_item.get_ref())
 
                 if rel.cid in el_to_footnotes_mapping.keys():
                     for footnote_cid in el_to_footnotes_mapping[rel.cid]:
                         footnote_elem = id_to_elem[cid_to_rels[footnote_cid].ref.cref]
                         new_footnote_item = self._add_caption_or_footnote(
-                            footnote_elem, out_doc, tbl, page_height
+                            footnote_elem, out_doc, code_item, page_height
                         )
 
-                        tbl.footnotes.append(new_footnote_item.get_ref())
-
-                # Handle case where table has no structure prediction but has children
-                if (
-                    element.num_rows == 0
-                    and element.num_cols == 0
-                    and element.cluster.children
-                ):
-                    # Create rich cell containing all child elements
-                    rich_cell_ref = self._create_rich_cell_group(element, out_doc, tbl)
-
-                    # Create rich table cell spanning the entire 1x1 table
-                    rich_cell = RichTableCell(
-                        text="",  # Empty text since content is in the group
-                        row_span=1,
-                        col_span=1,
-                        start_row_offset_idx=0,
-                        end_row_offset_idx=1,
-                        start_col_offset_idx=0,
-                        end_col_offset_idx=1,
-                        column_header=False,
-                        row_header=False,
-                        ref=rich_cell_ref,
+                        code_item.footnotes.append(new_footnote_item.get_ref())
+            else:
+                new_item, current_list = self._handle_text_element(
+                    element, out_doc, current_list, page_height
+                )
+
+                if rel.cid in el_merges_mapping.keys():
+                    for merged_cid in el_merges_mapping[rel.cid]:
+                        merged_elem = id_to_elem[cid_to_rels[merged_cid].ref.cref]
+
+                        self._merge_elements(
+                            element, merged_elem, new_item, page_height
+                        )
+
+        elif isinstance(element, Table):
+            # Check if table has no structure prediction
+            if element.num_rows == 0 and element.num_cols == 0:
+                # Only create 1x1 table if there are children to put in it
+                if element.cluster.children:
+                    # Create minimal 1x1 table with rich cell containing all children
+                    tbl_data = TableData(num_rows=1, num_cols=1, table_cells=[])
+                else:
+                    # Create empty table with no structure
+                    tbl_data = TableData(num_rows=0, num_cols=0, table_cells=[])
+            else:
+                tbl_data = TableData(
+                    num_rows=element.num_rows,
+                    num_cols=element.num_cols,
+                    table_cells=element.table_cells,
+                )
+
+            prov = ProvenanceItem(
+                page_no=element.page_no,
+                charspan=(0, 0),
+                bbox=element.cluster.bbox.to_bottom_left_origin(page_height),
+            )
+
+            tbl = out_doc.add_table(
+                data=tbl_data, prov=prov, label=element.cluster.label
+            )
+
+            if rel.cid in el_to_captions_mapping.keys():
+                for caption_cid in el_to_captions_mapping[rel.cid]:
+                    caption_elem = id_to_elem[cid_to_rels[caption_cid].ref.cref]
+                    new_cap_item = self._add_caption_or_footnote(
+                        caption_elem, out_doc, tbl, page_height
                     )
-                    out_doc.add_table_cell(table_item=tbl, cell=rich_cell)
 
-                # TODO: Consider adding children of Table.
+                    tbl.captions.append(new_cap_item.get_ref())
 
-            elif isinstance(element, FigureElement):
-                cap_text = ""
-                prov = ProvenanceItem(
-                    page_no=element.page_no,
-                    charspan=(0, len(cap_text)),
-                    bbox=element.cluster.bbox.to_bottom_left_origin(page_height),
+            if rel.cid in el_to_footnotes_mapping.keys():
+                for footnote_cid in el_to_footnotes_mapping[rel.cid]:
+                    footnote_elem = id_to_elem[cid_to_rels[footnote_cid].ref.cref]
+                    new_footnote_item = self._add_caption_or_footnote(
+                        footnote_elem, out_doc, tbl, page_height
+                    )
+
+                    tbl.footnotes.append(new_footnote_item.get_ref())
+
+            # Handle case where table has no structure prediction but has children
+            if (
+                element.num_rows == 0
+                and element.num_cols == 0
+                and element.cluster.children
+            ):
+                # Create rich cell containing all child elements
+                rich_cell_ref = self._create_rich_cell_group(element, out_doc, tbl)
+
+                # Create rich table cell spanning the entire 1x1 table
+                rich_cell = RichTableCell(
+                    text="",  # Empty text since content is in the group
+                    row_span=1,
+                    col_span=1,
+                    start_row_offset_idx=0,
+                    end_row_offset_idx=1,
+                    start_col_offset_idx=0,
+                    end_col_offset_idx=1,
+                    column_header=False,
+                    row_header=False,
+                    ref=rich_cell_ref,
                 )
-                pic = out_doc.add_picture(prov=prov)
+                out_doc.add_table_cell(table_item=tbl, cell=rich_cell)
 
-                if rel.cid in el_to_captions_mapping.keys():
-                    for caption_cid in el_to_captions_mapping[rel.cid]:
-                        caption_elem = id_to_elem[cid_to_rels[caption_cid].ref.cref]
-                        new_cap_item = self._add_caption_or_footnote(
-                            caption_elem, out_doc, pic, page_height
-                        )
+            # TODO: Consider adding children of Table.
 
-                        pic.captions.append(new_cap_item.get_ref())
+        elif isinstance(element, FigureElement):
+            cap_text = ""
+            prov = ProvenanceItem(
+                page_no=element.page_no,
+                charspan=(0, len(cap_text)),
+                bbox=element.cluster.bbox.to_bottom_left_origin(page_height),
+            )
+            pic = out_doc.add_picture(prov=prov)
 
-                if rel.cid in el_to_footnotes_mapping.keys():
-                    for footnote_cid in el_to_footnotes_mapping[rel.cid]:
-                        footnote_elem = id_to_elem[cid_to_rels[footnote_cid].ref.cref]
-                        new_footnote_item = self._add_caption_or_footnote(
-                            footnote_elem, out_doc, pic, page_height
-                        )
+            if rel.cid in el_to_captions_mapping.keys():
+                for caption_cid in el_to_captions_mapping[rel.cid]:
+                    caption_elem = id_to_elem[cid_to_rels[caption_cid].ref.cref]
+                    new_cap_item = self._add_caption_or_footnote(
+                        caption_elem, out_doc, pic, page_height
+                    )
 
-                        pic.footnotes.append(new_footnote_item.get_ref())
+                    pic.captions.append(new_cap_item.get_ref())
 
-                self._add_child_elements(element, pic, out_doc)
+            if rel.cid in el_to_footnotes_mapping.keys():
+                for footnote_cid in el_to_footnotes_mapping[rel.cid]:
+                    footnote_elem = id_to_elem[cid_to_rels[footnote_cid].ref.cref]
+                    new_footnote_item = self._add_caption_or_footnote(
+                        footnote_elem, out_doc, pic, page_height
+                    )
 
-            elif isinstance(element, ContainerElement):  # Form, KV region
-                label = element.label
-                group_label = GroupLabel.UNSPECIFIED
-                if label == DocItemLabel.FORM:
-                    group_label = GroupLabel.FORM_AREA
-                elif label == DocItemLabel.KEY_VALUE_REGION:
-                    group_label = GroupLabel.KEY_VALUE_AREA
+                    pic.footnotes.append(new_footnote_item.get_ref())
 
-                container_el = out_doc.add_group(label=group_label)
+            self._add_child_elements(element, pic, out_doc)
 
-                self._add_child_elements(element, container_el, out_doc)
+        elif isinstance(element, ContainerElement):  # Form, KV region
+            label = element.label
+            group_label = GroupLabel.UNSPECIFIED
+            if label == DocItemLabel.FORM:
+                group_label = GroupLabel.FORM_AREA
+            elif label == DocItemLabel.KEY_VALUE_REGION:
+                group_label = GroupLabel.KEY_VALUE_AREA
 
-        return out_doc
+            container_el = out_doc.add_group(label=group_label)
+
+            self._add_child_elements(element, container_el, out_doc)
+
+        return current_list
 
     def _add_caption_or_footnote(self, elem, out_doc, parent, page_height):
         assert isinstance(elem, TextElement)
@@ -429,3 +466,158 @@ class ReadingOrderModel:
             )
 
         return docling_doc
+
+
+class IncrementalReadingOrder:
+    """Reading order of a conversion, applied to its pages as they complete.
+
+    Pages can be added in any order: a page is processed once all pages before it
+    were added or skipped, and its items are appended to `document` right away, so
+    consumers can start on the document before the last page is converted. Only a
+    trailing paragraph which may continue on the next pages is held back, together
+    with the items following it, until the next paragraph decides whether they are
+    merged. The final document is the one `ReadingOrderModel` builds from all pages.
+    """
+
+    def __init__(
+        self,
+        model: ReadingOrderModel,
+        conv_res: ConversionResult,
+        page_nos: Iterable[int],
+    ):
+        self.model = model
+        self.conv_res = conv_res
+        self.document = model._create_docling_doc(conv_res)
+
+        self._expected_page_nos = deque(sorted(page_nos))
+        self._arrived: dict[int, Optional[Page]] = {}
+        self._next_cid = 0
+
+        # Sorted elements not added to the document yet
+        self._pending: list[ReadingOrderPageElement] = []
+        # Position in `_pending` from which merges are predicted again
+        self._merge_pos = 0
+        self._id_to_elem: dict[str, BasePageElement] = {}
+        self._cid_to_rels: dict[int, ReadingOrderPageElement] = {}
+        self._captions: dict[int, list[int]] = {}
+        self._footnotes: dict[int, list[int]] = {}
+        self._merges: dict[int, list[int]] = {}
+        self._skippable_cids: set[int] = set()
+        self._current_list: Optional[GroupItem] = None
+
+    def add_page(self, page: Page) -> None:
+        self._arrived[page.page_no] = page
+        self._advance()
+
+    def skip_page(self, page_no: int) -> None:
+        """Mark a page which will not be added, e.g. because its conversion failed."""
+        self._arrived[page_no] = None
+        self._advance()
+
+    def finish(self) -> DoclingDocument:
+        """Add all held back items, pages not added by now are skipped."""
+        for page_no in self._expected_page_nos:
+            self._arrived.setdefault(page_no, None)
+        self._advance(final=True)
+        return self.document
+
+    def _advance(self, final: bool = False) -> None:
+        with TimeRecorder(
+            self.conv_res, "reading_order", scope=ProfilingScope.DOCUMENT
+        ):
+            while (
+                self._expected_page_nos and self._expected_page_nos[0] in self._arrived
+            ):
+                page = self._arrived.pop(self._expected_page_nos.popleft())
+                if page is not None:
+                    self._add_page_elements(page)
+            open_pos = self._predict_merges(final)
+
+            for rel in self._pending[:open_pos]:
+                if rel.cid in self._skippable_cids:
+                    continue
+                self._current_list = self.model._add_readingorder_element(
+                    self.document,
+                    rel,
+                    self._id_to_elem,
+                    self._cid_to_rels,
+                    self._captions,
+                    self._footnotes,
+                    self._merges,
+                    self._current_list,
+                )
+            del self._pending[:open_pos]
+            self._merge_pos -= open_pos
+
+    def _add_page_elements(self, page: Page) -> None:
+        assert page.size is not None, "Page size is not initialized."
+        self.document.add_page(page_no=page.page_no, size=page.size)
+
+        elements = page.assembled.elements if page.assembled else []
+        ro_elements = self.model._to_readingorder_elements(
+            elements, {page.page_no: page.size}, start_cid=self._next_cid
+        )
+        self._next_cid += len(ro_elements)
+
+        # Ordering, captions and footnotes only depend on the page itself
+        ro_model = self.model.ro_model
+        sorted_elements = ro_model.predict_reading_order(page_elements=ro_elements)
+        for mapping, page_mapping in (
+            (self._captions, ro_model.predict_to_captions(sorted_elements)),
+            (self._footnotes, ro_model.predict_to_footnotes(sorted_elements)),
+        ):
+            mapping.update(page_mapping)
+            for cids in page_mapping.values():
+                self._skippable_cids.update(cids)
+
+        for elem in elements:
+            self._id_to_elem[f"#/{elem.page_no}/{elem.cluster.id}"] = elem
+        self._cid_to_rels.update((rel.cid, rel) for rel in sorted_elements)
+        self._pending.extend(sorted_elements)
+
+    def _predict_merges(self, final: bool) -> int:
+        """Predict the merges of the pending elements, return the open chain start.
+
+        A merge chain is open when its last paragraph would be continued by a
+        paragraph on a later page. All pending elements before its head are final.
+        """
+        elements = self._pending[self._merge_pos :]
+        if not elements:
+            return len(self._pending)
+
+        open_head: Optional[int] = None
+        if final:
+            merges = self.model.ro_model.predict_merges(sorted_elements=elements)
+        else:
+            last = elements[-1]
+            probe = ReadingOrderPageElement(
+                cid=-1,
+                text="continued",
+                page_no=last.page_no + 1,
+                page_size=last.page_size,
+                label=DocItemLabel.TEXT,
+                l=0,
+                r=0,
+                b=0,
+                t=0,
+                coord_origin=CoordOrigin.BOTTOMLEFT,
+            )
+            merges = self.model.ro_model.predict_merges(
+                sorted_elements=[*elements, probe]
+            )
+            open_head = next(
+                (head for head, cids in merges.items() if probe.cid in cids), None
+            )
+
+        for head, cids in merges.items():
+            if head != open_head:
+                self._merges[head] = cids
+                self._skippable_cids.update(cids)
+
+        if open_head is None:
+            self._merge_pos = len(self._pending)
+        else:
+            self._merge_pos += next(
+                ix for ix, rel in enumerate(elements) if rel.cid == open_head
+            )
+        return self._merge_pos
@@ -1,6 +1,7 @@
 import copy
 import warnings
 from collections.abc import Iterable, Sequence
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -22,6 +23,7 @@ from docling.datamodel.pipeline_options import (
 from docling.datamodel.settings import settings
 from docling.models.base_table_model import BaseTableStructureModel
 from docling.models.utils.hf_model_download import download_hf_model
+from docling.models.utils.model_registry import load_shared_model
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.profiling import TimeRecorder
 
@@ -83,8 +85,17 @@ class TableStructureModel(BaseTableStructureModel):
             self.tm_config["model"]["save_dir"] = artifacts_path
             self.tm_model_type = self.tm_config["model"]["type"]
 
-            self.tf_predictor = TFPredictor(
-                self.tm_config, device, accelerator_options.num_threads
+            self.tf_predictor = load_shared_model(
+                self,
+                key=(
+                    "docling_tableformer",
+                    str(artifacts_path),
+                    device,
+                    accelerator_options.num_threads,
+                ),
+                loader=partial(
+                    TFPredictor, self.tm_config, device, accelerator_options.num_threads
+                ),
             )
             self.scale = 2.0  # Scale up table input images to 144 dpi
 
@@ -6,6 +6,7 @@ using vision-language models through a pluggable runtime system.
 
 import logging
 from collections.abc import Iterable
+from typing import Optional
 
 from PIL import Image as PILImage
 
@@ -18,6 +19,7 @@ from docling.models.inference_engines.vlm import (
     VlmEngineInput,
     create_vlm_engine,
 )
+from docling.utils.cancellation import CancellationToken
 from docling.utils.profiling import TimeRecorder
 
 _log = logging.getLogger(__name__)
@@ -93,89 +95,110 @@ class VlmConvertModel(BasePageModel):
             return
 
         with TimeRecorder(conv_res, "vlm_convert"):
-            # Prepare images and prompts
+            # Prepare images
             images = []
-            prompts = []
             valid_pages = []
 
             for page in page_list:
-                if page.image is None:
+                image = self.prepare_image(page)
+                if image is None:
                     _log.warning(
                         f"Page {page.page_no} has no image, skipping VLM conversion"
                     )
                     continue
-
-                # Scale image if needed
-                image = page.image
-                if self.options.scale != 1.0:
-                    new_size = (
-                        int(image.width * self.options.scale),
-                        int(image.height * self.options.scale),
-                    )
-                    image = image.resize(new_size, PILImage.Resampling.LANCZOS)
-
-                # Apply max_size constraint if specified
-                if self.options.max_size is not None:
-                    max_dim = max(image.width, image.height)
-                    if max_dim > self.options.max_size:
-                        scale_factor = self.options.max_size / max_dim
-                        new_size = (
-                            int(image.width * scale_factor),
-                            int(image.height * scale_factor),
-                        )
-                        image = image.resize(new_size, PILImage.Resampling.LANCZOS)
-
                 images.append(image)
-                prompts.append(self.options.model_spec.prompt)
                 valid_pages.append(page)
 
             if not images:
                 _log.warning("No valid images to process")
                 return
 
-            # Process through runtime using batch prediction
-            _log.debug(f"Processing {len(images)} pages through VLM engine (batched)")
+            self.predict_pages(valid_pages, images, conv_res.cancellation)
 
-            try:
-                # Create batch of runtime inputs
-                engine_inputs = [
-                    VlmEngineInput(
-                        image=img,
-                        prompt=prompt,
-                        temperature=0.0,  # Use from options if needed
-                        max_new_tokens=4096,  # Use from options if needed
-                    )
-                    for img, prompt in zip(images, prompts)
-                ]
+        # Yield all pages (including those that were skipped)
+        yield from page_list
 
-                # Run batch inference
-                outputs = self.engine.predict_batch(engine_inputs)
+    def prepare_image(self, page: Page) -> Optional[PILImage.Image]:
+        """Return the page image scaled for the VLM, or None if the page has no image."""
+        image = page.image
+        if image is None:
+            return None
+
+        # Scale image if needed
+        if self.options.scale != 1.0:
+            new_size = (
+                int(image.width * self.options.scale),
+                int(image.height * self.options.scale),
+            )
+            image = image.resize(new_size, PILImage.Resampling.LANCZOS)
+
+        # Apply max_size constraint if specified
+        if self.options.max_size is not None:
+            max_dim = max(image.width, image.height)
+            if max_dim > self.options.max_size:
+                scale_factor = self.options.max_size / max_dim
+                new_size = (
+                    int(image.width * scale_factor),
+                    int(image.height * scale_factor),
+                )
+                image = image.resize(new_size, PILImage.Resampling.LANCZOS)
 
-                # Attach predictions to pages
-                for page, output in zip(valid_pages, outputs):
-                    # Convert string stop_reason to VlmStopReason enum
-                    stop_reason = VlmStopReason.UNSPECIFIED
-                    if output.stop_reason:
-                        try:
-                            stop_reason = VlmStopReason(output.stop_reason)
-                        except ValueError:
-                            stop_reason = VlmStopReason.UNSPECIFIED
-
-                    page.predictions.vlm_response = VlmPrediction(
-                        text=output.text,
-                        stop_reason=stop_reason,
-                    )
-                    _log.debug(
-                        f"Page {page.page_no}: Generated {len(output.text)} chars, "
-                        f"stop_reason={output.stop_reason}"
-                    )
+        return image
 
-            except Exception as e:
-                _log.error(f"Error processing pages through VLM engine: {e}")
-                raise
+    def predict_pages(
+        self,
+        pages: list[Page],
+        images: list[PILImage.Image],
+        cancellation: Optional[CancellationToken] = None,
+    ) -> None:
+        """Run the VLM engine on *images* and attach the predictions to *pages*.
 
-        # Yield all pages (including those that were skipped)
-        yield from page_list
+        Args:
+            pages: Pages to attach the predictions to
+            images: Images prepared with `prepare_image`, one per page
+            cancellation: Token of the conversion, aborting the generation
+        """
+        # Process through runtime using batch prediction
+        _log.debug(f"Processing {len(images)} pages through VLM engine (batched)")
+
+        try:
+            # Create batch of runtime inputs
+            engine_inputs = [
+                VlmEngineInput(
+                    image=img,
+                    prompt=self.options.model_spec.prompt,
+                    temperature=0.0,  # Use from options if needed
+                    max_new_tokens=4096,  # Use from options if needed
+                    cancellation=cancellation,
+                )
+                for img in images
+            ]
+
+            # Run batch inference
+            outputs = self.engine.predict_batch(engine_inputs)
+
+            # Attach predictions to pages
+            for page, output in zip(pages, outputs):
+                # Convert string stop_reason to VlmStopReason enum
+                stop_reason = VlmStopReason.UNSPECIFIED
+                if output.stop_reason:
+                    try:
+                        stop_reason = VlmStopReason(output.stop_reason)
+                    except ValueError:
+                        stop_reason = VlmStopReason.UNSPECIFIED
+
+                page.predictions.vlm_response = VlmPrediction(
+                    text=output.text,
+                    stop_reason=stop_reason,
+                )
+                _log.debug(
+                    f"Page {page.page_no}: Generated {len(output.text)} chars, "
+                    f"stop_reason={output.stop_reason}"
+                )
+
+        except Exception as e:
+            _log.error(f"Error processing pages through VLM engine: {e}")
+            raise
 
     def process_images(
         self,
@@ -7,6 +7,8 @@ from typing import List
 
 from transformers import StoppingCriteria
 
+from docling.utils.cancellation import CancellationToken
+
 _log = logging.getLogger(__name__)
 
 
@@ -117,6 +119,32 @@ class DocTagsRepetitionStopper(GenerationStopper):
         return run_repetitive(run)
 
 
+class CancellationStopper(GenerationStopper):
+    """Stops the generation once the conversion is cancelled."""
+
+    def __init__(self, cancellation: CancellationToken):
+        self.cancellation = cancellation
+
+    def should_stop(self, s: str) -> bool:
+        return self.cancellation.cancelled
+
+    def lookback_tokens(self) -> int:
+        return 1
+
+
+class CancellationCriteria(StoppingCriteria):
+    """Stops the HuggingFace generation of all sequences once the conversion is cancelled.
+
+    Unlike wrapping a `CancellationStopper`, this does not decode any token.
+    """
+
+    def __init__(self, cancellation: CancellationToken):
+        self.cancellation = cancellation
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.cancellation.cancelled
+
+
 class HFStoppingCriteriaWrapper(StoppingCriteria):
     """
     Adapts any GenerationStopper to HuggingFace Transformers.
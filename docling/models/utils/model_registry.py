@@ -0,0 +1,281 @@
+"""Process-wide registry of loaded model weights.
+
+Pipelines are cached per (class, options) by the `DocumentConverter`, hence two
+pipelines which only differ in e.g. `do_ocr` or `images_scale` would each load
+their own layout, table and OCR models. Models acquired through the registry are
+instead keyed by their artifact and device, reference-counted and shared across
+pipeline instances and converters.
+"""
+
+import itertools
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from docling.datamodel.settings import settings
+
+_log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+ModelKey = tuple[Hashable, ...]
+
+
+@dataclass
+class _RegistryEntry:
+    model: Any
+    size_bytes: int
+    ref_count: int = 0
+    last_used: float = 0.0
+
+
+@dataclass
+class ModelRegistryStats:
+    """Counters of a `ModelRegistry`."""
+
+    loads: int = 0
+    hits: int = 0
+    evictions: int = 0
+    loaded_models: int = 0
+    idle_models: int = 0
+    loaded_bytes: int = 0
+    idle_bytes: int = 0
+
+
+def estimate_model_bytes(model: Any, max_depth: int = 1) -> int:
+    """Estimate the memory held by the torch parameters and buffers of *model*.
+
+    The object and its attributes up to *max_depth* levels deep are inspected,
+    descending into lists, tuples and dicts. The default covers the predictor
+    wrappers of docling-ibm-models. Returns 0 if torch is not available.
+    """
+    try:
+        import torch
+    except ImportError:
+        return 0
+
+    seen_objects: set[int] = set()
+    seen_tensors: set[int] = set()
+    total = 0
+
+    def _visit(obj: Any, depth: int) -> None:
+        nonlocal total
+        if id(obj) in seen_objects:
+            return
+        seen_objects.add(id(obj))
+
+        if isinstance(obj, torch.nn.Module):
+            for tensor in itertools.chain(obj.parameters(), obj.buffers()):
+                if id(tensor) in seen_tensors:
+                    continue
+                seen_tensors.add(id(tensor))
+                total += tensor.numel() * tensor.element_size()
+            return
+
+        if depth <= 0:
+            return
+        if isinstance(obj, list | tuple):
+            children: Iterable[Any] = obj
+        elif isinstance(obj, dict):
+            children = obj.values()
+        elif hasattr(obj, "__dict__"):
+            children = vars(obj).values()
+        else:
+            return
+        for child in children:
+            _visit(child, depth - 1)
+
+    _visit(model, max_depth)
+    return total
+
+
+class ModelRegistry:
+    """Reference-counted registry of loaded models, keyed by artifact and device.
+
+    Models which are no longer referenced stay loaded as long as they fit in
+    ``max_idle_bytes`` and there are at most ``max_idle_models`` of them, so that
+    pipelines created later can reuse them. Beyond that budget, idle models are
+    evicted least-recently-used first. The count also bounds the models whose size
+    cannot be measured (e.g. onnxruntime OCR engines). When no budget is given,
+    ``settings.perf.model_registry_max_idle_bytes`` and
+    ``settings.perf.model_registry_max_idle_models`` are used.
+    """
+
+    def __init__(
+        self,
+        max_idle_bytes: Optional[int] = None,
+        max_idle_models: Optional[int] = None,
+    ) -> None:
+        self._max_idle_bytes = max_idle_bytes
+        self._max_idle_models = max_idle_models
+        self._entries: OrderedDict[ModelKey, _RegistryEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[ModelKey, threading.Lock] = {}
+        self._stats = ModelRegistryStats()
+
+    @property
+    def max_idle_bytes(self) -> int:
+        if self._max_idle_bytes is not None:
+            return self._max_idle_bytes
+        return settings.perf.model_registry_max_idle_bytes
+
+    @property
+    def max_idle_models(self) -> int:
+        if self._max_idle_models is not None:
+            return self._max_idle_models
+        return settings.perf.model_registry_max_idle_models
+
+    def acquire(self, key: ModelKey, loader: Callable[[], _T]) -> _T:
+        """Return the model registered under *key*, loading it on first use.
+
+        Every call must be balanced by a `release` of the same key.
+        """
+        while True:
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+            # Load outside of the registry lock, models of other keys can be acquired
+            # while this one is loading.
+            with key_lock:
+                with self._lock:
+                    if self._key_locks.get(key) is not key_lock:
+                        continue  # evicted while waiting, take the new lock
+                    entry = self._entries.get(key)
+                    if entry is not None:
+                        self._stats.hits += 1
+                        entry.ref_count += 1
+                        entry.last_used = time.monotonic()
+                        self._entries.move_to_end(key)
+                        return entry.model
+
+                _log.debug("Loading shared model %s", key)
+                model = loader()
+                size_bytes = estimate_model_bytes(model)
+
+                with self._lock:
+                    self._stats.loads += 1
+                    self._entries[key] = _RegistryEntry(
+                        model=model,
+                        size_bytes=size_bytes,
+                        ref_count=1,
+                        last_used=time.monotonic(),
+                    )
+                return model
+
+    def release(self, key: ModelKey) -> None:
+        """Drop one reference to *key* and evict idle models beyond the budget."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.ref_count == 0:
+                return
+            entry.ref_count -= 1
+            entry.last_used = time.monotonic()
+            evicted = self._evict_idle_locked(self.max_idle_bytes, self.max_idle_models)
+        self._free(evicted)
+
+    def attach(self, owner: object, key: ModelKey, loader: Callable[[], _T]) -> _T:
+        """Acquire *key* and release it automatically once *owner* is collected."""
+        model = self.acquire(key, loader)
+        weakref.finalize(owner, self.release, key)
+        return model
+
+    def evict_idle(
+        self,
+        max_idle_bytes: Optional[int] = None,
+        max_idle_models: Optional[int] = None,
+    ) -> int:
+        """Evict idle models until they fit in *max_idle_bytes* and *max_idle_models*.
+
+        Defaults to the registry budget. Returns the number of evicted models.
+        """
+        budget = self.max_idle_bytes if max_idle_bytes is None else max_idle_bytes
+        max_models = (
+            self.max_idle_models if max_idle_models is None else max_idle_models
+        )
+        with self._lock:
+            evicted = self._evict_idle_locked(budget, max_models)
+        num_evicted = len(evicted)
+        self._free(evicted)
+        return num_evicted
+
+    def _evict_idle_locked(
+        self, max_idle_bytes: int, max_idle_models: int
+    ) -> list[Any]:
+        idle = [e for e in self._entries.values() if e.ref_count == 0]
+        idle_bytes = sum(e.size_bytes for e in idle)
+        idle_models = len(idle)
+        evicted: list[Any] = []
+        for key in list(self._entries.keys()):  # least recently used first
+            # A zero budget also drops idle models without measurable size
+            if (
+                idle_bytes <= max_idle_bytes
+                and max_idle_bytes > 0
+                and idle_models <= max_idle_models
+            ):
+                break
+            entry = self._entries[key]
+            if entry.ref_count > 0:
+                continue
+            _log.debug("Evicting idle shared model %s", key)
+            del self._entries[key]
+            del self._key_locks[key]
+            idle_bytes -= entry.size_bytes
+            idle_models -= 1
+            self._stats.evictions += 1
+            evicted.append(entry.model)
+        return evicted
+
+    @staticmethod
+    def _free(evicted: list[Any]) -> None:
+        if not evicted:
+            return
+        evicted.clear()
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def stats(self) -> ModelRegistryStats:
+        """Return a snapshot of the registry counters."""
+        with self._lock:
+            idle = [e for e in self._entries.values() if e.ref_count == 0]
+            return ModelRegistryStats(
+                loads=self._stats.loads,
+                hits=self._stats.hits,
+                evictions=self._stats.evictions,
+                loaded_models=len(self._entries),
+                idle_models=len(idle),
+                loaded_bytes=sum(e.size_bytes for e in self._entries.values()),
+                idle_bytes=sum(e.size_bytes for e in idle),
+            )
+
+    def clear(self) -> None:
+        """Forget all models, referenced or not."""
+        with self._lock:
+            evicted = [e.model for e in self._entries.values()]
+            self._entries.clear()
+            self._key_locks.clear()
+        self._free(evicted)
+
+
+model_registry = ModelRegistry()
+
+
+def load_shared_model(owner: object, key: ModelKey, loader: Callable[[], _T]) -> _T:
+    """Load a model through the process-wide registry when sharing is enabled.
+
+    With ``settings.perf.share_models`` disabled, the model is loaded privately by
+    calling *loader*. Otherwise it is shared with every other owner using the same
+    *key*, and released when *owner* is garbage collected.
+    """
+    if not settings.perf.share_models:
+        return loader()
+    return model_registry.attach(owner, key, loader)
@@ -1,10 +1,20 @@
 import logging
+import queue
+import subprocess
 import sys
-import tempfile
+import threading
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+)
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
+import numpy as np
 from docling_core.types.doc import (
     ContentLayer,
     DocItemLabel,
@@ -30,6 +40,7 @@ from docling.datamodel.pipeline_options_asr_model import (
     InlineAsrMlxWhisperOptions,
     InlineAsrNativeWhisperOptions,
 )
+from docling.exceptions import ConversionCancelledError
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.profiling import ProfilingScope, TimeRecorder
@@ -86,6 +97,122 @@ class _ConversationItem(BaseModel):
         return result
 
 
+_SAMPLE_RATE = 16000  # Whisper models expect 16 kHz mono audio
+_VAD_FRAME_SECONDS = 0.03
+
+
+def _decode_audio(source: Union[Path, BytesIO]) -> np.ndarray:
+    """Decode audio to 16 kHz mono float32 samples with ffmpeg.
+
+    Streams are piped to ffmpeg, no temporary file is written.
+    """
+    if isinstance(source, BytesIO):
+        input_arg, input_data = "pipe:0", source.getvalue()
+    else:
+        input_arg, input_data = str(source), None
+    cmd = [
+        "ffmpeg",
+        *(["-nostdin"] if input_data is None else []),
+        "-threads",
+        "0",
+        "-i",
+        input_arg,
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(_SAMPLE_RATE),
+        "-",
+    ]
+    try:
+        output = subprocess.run(
+            cmd, input=input_data, capture_output=True, check=True
+        ).stdout
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(
+            f"Failed to decode audio: {exc.stderr.decode(errors='ignore')}"
+        ) from exc
+    return np.frombuffer(output, np.int16).astype(np.float32) / 32768.0
+
+
+def _loudness_db(audio: np.ndarray) -> float:
+    """Root mean square level of *audio* in dBFS."""
+    if audio.size == 0:
+        return -np.inf
+    rms = float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+    return 20 * np.log10(max(rms, 1e-10))
+
+
+def _split_on_silence(
+    audio: np.ndarray,
+    chunk_duration: float,
+    search_window: float,
+    sample_rate: int = _SAMPLE_RATE,
+) -> list[tuple[int, int]]:
+    """Split *audio* into chunks of about *chunk_duration* seconds.
+
+    Each cut is placed at the quietest frame among the *search_window* seconds
+    before the target boundary (at most half a chunk), so that words are not
+    split across chunks. Among equally quiet frames the latest one is used.
+    Returns (start, end) sample offsets covering the whole audio.
+    """
+    frame = max(1, int(_VAD_FRAME_SECONDS * sample_rate))
+    num_frames = len(audio) // frame
+    energy = np.sqrt(
+        np.mean(np.square(audio[: num_frames * frame].reshape(-1, frame)), axis=1)
+    )
+
+    target = max(frame, int(chunk_duration * sample_rate))
+    window = int(search_window * sample_rate)
+
+    chunks: list[tuple[int, int]] = []
+    start = 0
+    while len(audio) - start > target:
+        end = start + target
+        first_frame = max(start + target // 2, end - window) // frame
+        last_frame = min(end // frame, num_frames)
+        if last_frame > first_frame:
+            candidates = energy[first_frame:last_frame]
+            # Frames within ~1 dB of the quietest one
+            quiet = np.flatnonzero(candidates <= candidates.min() * 1.12)
+            end = (first_frame + int(quiet[-1])) * frame
+        chunks.append((start, end))
+        start = end
+    chunks.append((start, len(audio)))
+    return chunks
+
+
+def _add_conversation(
+    conv_res: ConversionResult, conversation: list[_ConversationItem]
+) -> None:
+    """Build the DoclingDocument of *conv_res* from the transcribed conversation."""
+    # Ensure we have a proper DoclingDocument
+    origin = DocumentOrigin(
+        filename=conv_res.input.file.name or "audio.wav",
+        mimetype="audio/x-wav",
+        binary_hash=conv_res.input.document_hash,
+    )
+    conv_res.document = DoclingDocument(
+        name=conv_res.input.file.stem or "audio.wav", origin=origin
+    )
+
+    for citem in conversation:
+        track: TrackSource = TrackSource(
+            start_time=citem.start_time,
+            end_time=citem.end_time,
+            voice=citem.speaker,
+        )
+        conv_res.document.add_text(
+            label=DocItemLabel.TEXT,
+            text=citem.text,
+            content_layer=ContentLayer.BODY,
+            source=track,
+        )
+
+
 class _NativeWhisperModel:
     def __init__(
         self,
@@ -129,15 +256,21 @@ class _NativeWhisperModel:
             _log.info(f"loading _NativeWhisperModel({self.model_name})")
             if artifacts_path is not None:
                 _log.info(f"loading {self.model_name} from {artifacts_path}")
-                self.model = whisper.load_model(
+                self._load_model = partial(
+                    whisper.load_model,
                     name=self.model_name,
                     device=self.device,
                     download_root=str(artifacts_path),
                 )
             else:
-                self.model = whisper.load_model(
-                    name=self.model_name, device=self.device
+                self._load_model = partial(
+                    whisper.load_model, name=self.model_name, device=self.device
                 )
+            self.model = self._load_model()
+
+            # Model replicas used by the chunked transcription, loaded on first use
+            self._workers: Optional[queue.Queue[Any]] = None
+            self._workers_lock = threading.Lock()
 
             self.verbose = asr_options.verbose
             self.timestamps = asr_options.timestamps
@@ -147,49 +280,32 @@ class _NativeWhisperModel:
         # Access the file path from the backend, similar to how other pipelines handle it
         path_or_stream = conv_res.input._backend.path_or_stream
 
-        # Handle both Path and BytesIO inputs
-        temp_file_path: Optional[Path] = None
-
-        if isinstance(path_or_stream, BytesIO):
-            # For BytesIO, write to a temporary file since whisper requires a file path
-            suffix = Path(conv_res.input.file.name).suffix or ".wav"
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_file.write(path_or_stream.getvalue())
-                temp_file_path = Path(tmp_file.name)
-            audio_path = temp_file_path
-        elif isinstance(path_or_stream, Path):
-            audio_path = path_or_stream
-        else:
+        if self.asr_options.chunk_duration is not None:
+            # Audio is decoded in memory, streams need no temporary file
+            try:
+                conversation = self.transcribe_chunked(
+                    path_or_stream, conv_res=conv_res
+                )
+                _add_conversation(conv_res, conversation)
+            except Exception as exc:
+                _log.error(f"Audio tranciption has an error: {exc}")
+                conv_res.status = ConversionStatus.FAILURE
+            return conv_res
+
+        if not isinstance(path_or_stream, (BytesIO, Path)):
             raise RuntimeError(
                 f"ASR pipeline requires a file path or BytesIO stream, but got {type(path_or_stream)}"
             )
 
         try:
-            conversation = self.transcribe(audio_path)
-
-            # Ensure we have a proper DoclingDocument
-            origin = DocumentOrigin(
-                filename=conv_res.input.file.name or "audio.wav",
-                mimetype="audio/x-wav",
-                binary_hash=conv_res.input.document_hash,
+            # Streams are decoded in memory, no temporary file is written
+            audio: Union[Path, np.ndarray] = (
+                _decode_audio(path_or_stream)
+                if isinstance(path_or_stream, BytesIO)
+                else path_or_stream
             )
-            conv_res.document = DoclingDocument(
-                name=conv_res.input.file.stem or "audio.wav", origin=origin
-            )
-
-            for citem in conversation:
-                track: TrackSource = TrackSource(
-                    start_time=citem.start_time,
-                    end_time=citem.end_time,
-                    voice=citem.speaker,
-                )
-                conv_res.document.add_text(
-                    label=DocItemLabel.TEXT,
-                    text=citem.text,
-                    content_layer=ContentLayer.BODY,
-                    source=track,
-                )
-
+            conversation = self.transcribe(audio)
+            _add_conversation(conv_res, conversation)
             return conv_res
 
         except Exception as exc:
@@ -197,33 +313,120 @@ class _NativeWhisperModel:
             conv_res.status = ConversionStatus.FAILURE
             return conv_res
 
-        finally:
-            # Clean up temporary file if created
-            if temp_file_path is not None and temp_file_path.exists():
-                try:
-                    temp_file_path.unlink()
-                except Exception as e:
-                    _log.warning(
-                        f"Failed to delete temporary file {temp_file_path}: {e}"
-                    )
+    def transcribe(self, audio: Union[Path, np.ndarray]) -> list[_ConversationItem]:
+        if isinstance(audio, np.ndarray):
+            return self._transcribe_audio(self.model, audio)
+        return self._transcribe_audio(self.model, str(audio))
 
-    def transcribe(self, fpath: Path) -> list[_ConversationItem]:
-        result = self.model.transcribe(
-            str(fpath), verbose=self.verbose, word_timestamps=self.word_timestamps
+    def transcribe_chunked(
+        self,
+        source: Union[Path, BytesIO],
+        conv_res: ConversionResult,
+    ) -> list[_ConversationItem]:
+        """Transcribe the audio in chunks cut at silences, possibly in parallel.
+
+        Timestamps are shifted back to the position of each chunk in the recording.
+        When the cancellation token of *conv_res* fires (e.g. at the document
+        timeout), the chunks transcribed so far are returned and the conversion is
+        marked as partial success, or as failure if no chunk was done. The queued
+        chunks are then dropped without taking a model replica. A chunk already
+        being transcribed cannot be interrupted and keeps its replica until it is
+        done, for at most one chunk of *chunk_duration* seconds of audio.
+        """
+        assert self.asr_options.chunk_duration is not None
+
+        audio = _decode_audio(source)
+        chunks = [
+            (start, end)
+            for start, end in _split_on_silence(
+                audio,
+                chunk_duration=self.asr_options.chunk_duration,
+                search_window=self.asr_options.chunk_search_window,
+            )
+            if _loudness_db(audio[start:end]) > self.asr_options.silence_threshold_db
+        ]
+        _log.info(
+            f"Transcribing {len(chunks)} audio chunks of {conv_res.input.file.name}"
+        )
+
+        workers = self._get_workers()
+        cancellation = conv_res.cancellation
+
+        def _run_chunk(start: int, end: int) -> list[_ConversationItem]:
+            cancellation.raise_if_cancelled()
+            model = workers.get()
+            try:
+                # The replica may have been freed after the cancellation
+                cancellation.raise_if_cancelled()
+                return self._transcribe_audio(
+                    model, audio[start:end], offset=start / _SAMPLE_RATE
+                )
+            finally:
+                workers.put(model)
+
+        results: dict[int, list[_ConversationItem]] = {}
+        executor = ThreadPoolExecutor(max_workers=self.asr_options.num_workers)
+        try:
+            futures: dict[Future, int] = {
+                executor.submit(_run_chunk, start, end): ix
+                for ix, (start, end) in enumerate(chunks)
+            }
+            try:
+                for future in as_completed(futures, timeout=cancellation.remaining()):
+                    results[futures[future]] = future.result()
+                    _log.debug(f"Transcribed audio chunk {len(results)}/{len(chunks)}")
+            except (FuturesTimeoutError, ConversionCancelledError):
+                # Stop the chunks waiting for a replica
+                cancellation.cancel("document timeout exceeded")
+                _log.warning(
+                    f"Audio transcription cancelled ({cancellation.reason}), "
+                    f"keeping {len(results)}/{len(chunks)} transcribed chunks"
+                )
+                # Nothing to keep when no chunk finished before the interruption
+                conv_res.status = (
+                    ConversionStatus.PARTIAL_SUCCESS
+                    if results
+                    else ConversionStatus.FAILURE
+                )
+        finally:
+            # Do not wait for chunks still running after a timeout or an error
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return [item for ix in sorted(results) for item in results[ix]]
+
+    def _get_workers(self) -> "queue.Queue[Any]":
+        with self._workers_lock:
+            if self._workers is None:
+                # Whisper decoding installs hooks on the model, replicas are needed
+                # to transcribe chunks concurrently.
+                self._workers = queue.Queue()
+                self._workers.put(self.model)
+                for _ in range(1, self.asr_options.num_workers):
+                    self._workers.put(self._load_model())
+            return self._workers
+
+    def _transcribe_audio(
+        self, model: Any, audio: Union[str, np.ndarray], offset: float = 0.0
+    ) -> list[_ConversationItem]:
+        result = model.transcribe(
+            audio, verbose=self.verbose, word_timestamps=self.word_timestamps
         )
 
         convo: list[_ConversationItem] = []
         for _ in result["segments"]:
             item = _ConversationItem(
-                start_time=_["start"], end_time=_["end"], text=_["text"], words=[]
+                start_time=_["start"] + offset,
+                end_time=_["end"] + offset,
+                text=_["text"],
+                words=[],
             )
             if "words" in _ and self.word_timestamps:
                 item.words = []
                 for __ in _["words"]:
                     item.words.append(
                         _ConversationWord(
-                            start_time=__["start"],
-                            end_time=__["end"],
+                            start_time=__["start"] + offset,
+                            end_time=__["end"] + offset,
                             text=__["word"],
                         )
                     )
@@ -411,6 +614,9 @@ class AsrPipeline(BasePipeline):
         """Determines the final status of ASR Conversion based on its result."""
         if conv_res.status == ConversionStatus.FAILURE or conv_res.errors:
             return ConversionStatus.FAILURE
+        if conv_res.status == ConversionStatus.PARTIAL_SUCCESS:
+            # e.g. chunked transcription interrupted by the document timeout
+            return ConversionStatus.PARTIAL_SUCCESS
         if not self._has_text(conv_res.document):
             _log.warning(
                 "ASR conversion resulted in an empty document."
@@ -425,6 +631,7 @@ class AsrPipeline(BasePipeline):
 
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         _log.info(f"start _build_document in AsrPipeline: {conv_res.input.file}")
+        conv_res.cancellation.set_timeout(self.pipeline_options.document_timeout)
         with TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT):
             self._model.run(conv_res=conv_res)
 
@@ -26,6 +26,7 @@ from docling.datamodel.pipeline_options import (
     PipelineOptions,
 )
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelledError
 from docling.models.base_model import GenericEnrichmentModel
 from docling.models.factories import get_picture_description_factory
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
@@ -211,10 +212,19 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
         for model in self.build_pipe:
-            page_batch = model(conv_res, page_batch)
+            page_batch = model(conv_res, self._check_cancelled(conv_res, page_batch))
 
         yield from page_batch
 
+    @staticmethod
+    def _check_cancelled(
+        conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        """Pass the pages on to the next model until the conversion is cancelled."""
+        for page in page_batch:
+            conv_res.cancellation.raise_if_cancelled()
+            yield page
+
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         if not isinstance(conv_res.input._backend, PaginatedDocumentBackend):
             raise RuntimeError(
@@ -225,7 +235,7 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
             # conv_res.status = ConversionStatus.FAILURE
             # return conv_res
 
-        total_elapsed_time = 0.0
+        conv_res.cancellation.set_timeout(self.pipeline_options.document_timeout)
         with TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT):
             for i in range(conv_res.input.page_count):
                 start_page, end_page = conv_res.input.limits.page_range
@@ -238,8 +248,6 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                 for page_batch in chunkify(
                     conv_res.pages, settings.perf.page_batch_size
                 ):
-                    start_batch_time = time.monotonic()
-
                     # 1. Initialise the page resources
                     init_pages = map(
                         functools.partial(self.initialize_page, conv_res), page_batch
@@ -248,7 +256,25 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                     # 2. Run pipeline stages
                     pipeline_pages = self._apply_on_pages(conv_res, init_pages)
 
-                    for p in pipeline_pages:  # Must exhaust!
+                    try:
+                        finished_pages = list(pipeline_pages)  # Must exhaust!
+                    except ConversionCancelledError as e:
+                        # Drop the pages the models were interrupted on
+                        _log.warning(
+                            f"Conversion of document {conv_res.input.file.name} "
+                            f"cancelled: {e}"
+                        )
+                        for p in page_batch:
+                            if p._backend is not None:
+                                p._backend.unload()
+                        interrupted = {p.page_no for p in page_batch}
+                        conv_res.pages = [
+                            p for p in conv_res.pages if p.page_no not in interrupted
+                        ]
+                        conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+                        break
+
+                    for p in finished_pages:
                         # Cleanup cached images
                         if not self.keep_images:
                             p._image_cache = {}
@@ -264,13 +290,10 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                             p.parsed_page = None
 
                     end_batch_time = time.monotonic()
-                    total_elapsed_time += end_batch_time - start_batch_time
-                    if (
-                        self.pipeline_options.document_timeout is not None
-                        and total_elapsed_time > self.pipeline_options.document_timeout
-                    ):
+                    if conv_res.cancellation.cancelled:
                         _log.warning(
-                            f"Document processing time ({total_elapsed_time:.3f} seconds) exceeded the specified timeout of {self.pipeline_options.document_timeout:.3f} seconds"
+                            f"Conversion of document {conv_res.input.file.name} "
+                            f"cancelled: {conv_res.cancellation.reason}"
                         )
                         conv_res.status = ConversionStatus.PARTIAL_SUCCESS
                         break
@@ -1,7 +1,11 @@
 import inspect
 import json
 import logging
-from typing import Optional
+import queue
+import threading
+from collections.abc import Generator, Iterator
+from functools import lru_cache
+from typing import Any, Optional
 
 from PIL.Image import Image
 from pydantic import BaseModel
@@ -25,6 +29,7 @@ from docling.models.extraction.nuextract_transformers_model import (
 )
 from docling.pipeline.base_extraction_pipeline import BaseExtractionPipeline
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
 
@@ -52,9 +57,35 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
     ) -> ExtractionResult:
         """Extract data using the VLM model."""
         try:
-            # Get images from input document using the backend
-            images = self._get_images_from_input(ext_res.input)
-            if not images:
+            # Use provided template or default prompt, serialized once for all pages
+            if template is not None:
+                prompt = self._serialize_template(template)
+            else:
+                prompt = "Extract all text and structured information from this document. Return as JSON."
+
+            page_images: Iterator[tuple[int, Image]]
+            if self.pipeline_options.streaming:
+                page_images = _prefetch(
+                    self._iter_page_images(ext_res.input),
+                    self.pipeline_options.page_prefetch_size,
+                )
+            else:
+                page_images = iter(list(self._iter_page_images(ext_res.input)))
+
+            # Process pages with the VLM model, in batches and in page order
+            num_pages = 0
+            try:
+                for batch in chunkify(
+                    page_images, self.pipeline_options.page_batch_size
+                ):
+                    num_pages += len(batch)
+                    self._extract_batch(ext_res, batch, prompt)
+            finally:
+                if isinstance(page_images, Generator):
+                    # Stops the background rendering thread in streaming mode
+                    page_images.close()
+
+            if num_pages == 0:
                 ext_res.status = ConversionStatus.FAILURE
                 ext_res.errors.append(
                     ErrorItem(
@@ -65,60 +96,6 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
                 )
                 return ext_res
 
-            # Use provided template or default prompt
-            if template is not None:
-                prompt = self._serialize_template(template)
-            else:
-                prompt = "Extract all text and structured information from this document. Return as JSON."
-
-            # Process all images with VLM model
-            start_page, end_page = ext_res.input.limits.page_range
-            for i, image in enumerate(images):
-                # Calculate the actual page number based on the filtered range
-                page_number = start_page + i
-                try:
-                    predictions = list(self.vlm_model.process_images([image], prompt))
-
-                    if predictions:
-                        # Parse the extracted text as JSON if possible, otherwise use as-is
-                        extracted_text = predictions[0].text
-                        extracted_data = None
-                        vlm_stop_reason: VlmStopReason = predictions[0].stop_reason
-                        if (
-                            vlm_stop_reason == VlmStopReason.LENGTH
-                            or vlm_stop_reason == VlmStopReason.STOP_SEQUENCE
-                        ):
-                            ext_res.status = ConversionStatus.PARTIAL_SUCCESS
-
-                        try:
-                            extracted_data = json.loads(extracted_text)
-                        except (json.JSONDecodeError, ValueError):
-                            # If not valid JSON, keep extracted_data as None
-                            pass
-
-                        # Create page data with proper structure
-                        page_data = ExtractedPageData(
-                            page_no=page_number,
-                            extracted_data=extracted_data,
-                            raw_text=extracted_text,  # Always populate raw_text
-                        )
-                        ext_res.pages.append(page_data)
-                    else:
-                        # Add error page data
-                        page_data = ExtractedPageData(
-                            page_no=page_number,
-                            extracted_data=None,
-                            errors=["No extraction result from VLM model"],
-                        )
-                        ext_res.pages.append(page_data)
-
-                except Exception as e:
-                    _log.error(f"Error processing page {page_number}: {e}")
-                    page_data = ExtractedPageData(
-                        page_no=page_number, extracted_data=None, errors=[str(e)]
-                    )
-                    ext_res.pages.append(page_data)
-
         except Exception as e:
             _log.error(f"Error during extraction: {e}")
             ext_res.errors.append(
@@ -131,6 +108,64 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
 
         return ext_res
 
+    def _extract_batch(
+        self,
+        ext_res: ExtractionResult,
+        batch: list[tuple[int, Image]],
+        prompt: str,
+    ) -> None:
+        """Run the VLM on a batch of page images and append one result per page."""
+        try:
+            predictions = list(
+                self.vlm_model.process_images([image for _, image in batch], prompt)
+            )
+        except Exception as e:
+            _log.error(f"Error processing pages {batch[0][0]}-{batch[-1][0]}: {e}")
+            for page_number, _ in batch:
+                ext_res.pages.append(
+                    ExtractedPageData(
+                        page_no=page_number, extracted_data=None, errors=[str(e)]
+                    )
+                )
+            return
+
+        for i, (page_number, _) in enumerate(batch):
+            if i >= len(predictions):
+                # Add error page data
+                ext_res.pages.append(
+                    ExtractedPageData(
+                        page_no=page_number,
+                        extracted_data=None,
+                        errors=["No extraction result from VLM model"],
+                    )
+                )
+                continue
+
+            # Parse the extracted text as JSON if possible, otherwise use as-is
+            extracted_text = predictions[i].text
+            extracted_data = None
+            vlm_stop_reason: VlmStopReason = predictions[i].stop_reason
+            if (
+                vlm_stop_reason == VlmStopReason.LENGTH
+                or vlm_stop_reason == VlmStopReason.STOP_SEQUENCE
+            ):
+                ext_res.status = ConversionStatus.PARTIAL_SUCCESS
+
+            try:
+                extracted_data = json.loads(extracted_text)
+            except (json.JSONDecodeError, ValueError):
+                # If not valid JSON, keep extracted_data as None
+                pass
+
+            # Create page data with proper structure
+            ext_res.pages.append(
+                ExtractedPageData(
+                    page_no=page_number,
+                    extracted_data=extracted_data,
+                    raw_text=extracted_text,  # Always populate raw_text
+                )
+            )
+
     def _determine_status(self, ext_res: ExtractionResult) -> ConversionStatus:
         """Determine the status based on extraction results."""
         if ext_res.pages and not any(page.errors for page in ext_res.pages):
@@ -142,10 +177,10 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
         else:
             return ConversionStatus.FAILURE
 
-    def _get_images_from_input(self, input_doc: InputDocument) -> list[Image]:
-        """Extract images from input document using the backend."""
-        images = []
-
+    def _iter_page_images(
+        self, input_doc: InputDocument
+    ) -> Iterator[tuple[int, Image]]:
+        """Lazily render the pages of the input document, with their page number."""
         try:
             backend = input_doc._backend
 
@@ -169,17 +204,17 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
                             page_image = page_backend.get_page_image(
                                 scale=self.pipeline_options.vlm_options.scale
                             )
-                            images.append(page_image)
                         else:
                             _log.warning(f"Page {page_num + 1} backend is not valid")
+                            continue
                     except Exception as e:
                         _log.error(f"Error loading page {page_num + 1}: {e}")
+                        continue
+                    yield page_num + 1, page_image
 
         except Exception as e:
             _log.error(f"Error getting images from input document: {e}")
 
-        return images
-
     def _serialize_template(self, template: ExtractionTemplateType) -> str:
         """Serialize template to string based on its type."""
         if isinstance(template, str):
@@ -189,19 +224,65 @@ class ExtractionVlmPipeline(BaseExtractionPipeline):
         elif isinstance(template, BaseModel):
             return template.model_dump_json(indent=2)
         elif inspect.isclass(template) and issubclass(template, BaseModel):
-            from polyfactory.factories.pydantic_factory import ModelFactory
-
-            class ExtractionTemplateFactory(ModelFactory[template]):  # type: ignore
-                __use_examples__ = True  # prefer Field(examples=...) when present
-                __use_defaults__ = True  # use field defaults instead of random values
-                __check_model__ = (
-                    True  # setting the value to avoid deprecation warnings
-                )
-
-            return ExtractionTemplateFactory.build().model_dump_json(indent=2)  # type: ignore
+            return _build_template_example(template)
         else:
             raise ValueError(f"Unsupported template type: {type(template)}")
 
     @classmethod
     def get_default_options(cls) -> PipelineOptions:
         return VlmExtractionPipelineOptions()
+
+
+@lru_cache(maxsize=64)
+def _build_template_example(template: type[BaseModel]) -> str:
+    """Build an example instance of a template class, once per class."""
+    from polyfactory.factories.pydantic_factory import ModelFactory
+
+    class ExtractionTemplateFactory(ModelFactory[template]):  # type: ignore
+        __use_examples__ = True  # prefer Field(examples=...) when present
+        __use_defaults__ = True  # use field defaults instead of random values
+        __check_model__ = True  # setting the value to avoid deprecation warnings
+
+    return ExtractionTemplateFactory.build().model_dump_json(indent=2)  # type: ignore
+
+
+_END_OF_PAGES = object()
+
+
+def _prefetch(
+    items: Iterator[tuple[int, Image]], max_size: int
+) -> Generator[tuple[int, Image], None, None]:
+    """Produce *items* on a background thread, keeping at most *max_size* ahead.
+
+    Closing the returned generator stops the background thread.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max_size)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in items:
+                if not _put(item):
+                    return
+        finally:
+            _put(_END_OF_PAGES)
+
+    thread = threading.Thread(
+        target=_produce, name="extraction-page-render", daemon=True
+    )
+    thread.start()
+    try:
+        while (item := buffer.get()) is not _END_OF_PAGES:
+            yield item
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,214 @@
+"""Hybrid PDF pipeline: standard conversion with a VLM fallback per page.
+
+Every page goes through the layout, table structure and OCR models of
+`StandardPdfPipeline`. The pages whose confidence scores fall below
+`vlm_fallback_thresholds` are converted again with the VLM of `vlm_options`, and
+their VLM content replaces the standard one in the document. Documents get VLM
+quality on the pages that need it, at nearly the throughput of the standard pipeline.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Mapping, Sequence
+
+from docling_core.types.doc import ContentLayer, DocItem, DoclingDocument
+
+from docling.backend.pdf_backend import PdfDocumentBackend
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    DoclingComponentType,
+    ErrorItem,
+    Page,
+    PageConfidenceScores,
+)
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import (
+    HybridPdfPipelineOptions,
+    VlmFallbackThresholds,
+    VlmPipelineOptions,
+)
+from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelledError
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.pipeline.vlm_pipeline import VlmPipeline, concatenate_page_documents
+from docling.utils.profiling import ProfilingScope, TimeRecorder
+from docling.utils.utils import chunkify
+
+_log = logging.getLogger(__name__)
+
+
+def is_low_confidence(
+    scores: PageConfidenceScores, thresholds: VlmFallbackThresholds
+) -> bool:
+    """Whether any applicable score of a page is below its threshold."""
+    for name in ("parse_score", "layout_score", "table_score", "ocr_score"):
+        threshold = getattr(thresholds, name)
+        score = getattr(scores, name)
+        if threshold is not None and not math.isnan(score) and score < threshold:
+            return True
+    return False
+
+
+def merge_page_documents(
+    doc: DoclingDocument,
+    page_docs: Mapping[int, DoclingDocument],
+    page_nos: Sequence[int],
+) -> DoclingDocument:
+    """Replace the content of pages of *doc* by one-page documents.
+
+    Args:
+        doc: Document of all the pages in *page_nos*
+        page_docs: One-page documents replacing pages of *doc*, by page number
+        page_nos: Page numbers of the merged document, in ascending order
+
+    Returns:
+        Document with the content of *page_docs* in place of the pages of *doc*.
+        The runs of consecutive pages kept from *doc* keep their structure.
+    """
+    parts: list[DoclingDocument] = []
+    run: list[int] = []
+    for page_no in page_nos:
+        if page_no in page_docs or (run and page_no != run[-1] + 1):
+            if run:
+                parts.append(doc.filter(page_nrs=set(run)))
+                run = []
+        if page_no in page_docs:
+            parts.append(page_docs[page_no])
+        elif page_no in doc.pages:
+            run.append(page_no)
+    if run:
+        parts.append(doc.filter(page_nrs=set(run)))
+
+    kept_page_nos = [
+        page_no for page_no in page_nos if page_no in page_docs or page_no in doc.pages
+    ]
+    merged = concatenate_page_documents(parts, kept_page_nos)
+    merged.name = doc.name
+    merged.origin = doc.origin
+    return merged
+
+
+class HybridPdfPipeline(StandardPdfPipeline):
+    """Standard PDF pipeline converting its low-confidence pages again with a VLM."""
+
+    def __init__(self, pipeline_options: HybridPdfPipelineOptions) -> None:
+        super().__init__(pipeline_options)
+        self.pipeline_options: HybridPdfPipelineOptions = pipeline_options
+
+        # The VLM pipeline provides the VLM model and the conversion of its responses
+        self.vlm_pipeline = VlmPipeline(
+            VlmPipelineOptions(
+                vlm_options=pipeline_options.vlm_options,
+                images_scale=pipeline_options.images_scale,
+                generate_picture_images=pipeline_options.generate_picture_images,
+                artifacts_path=pipeline_options.artifacts_path,
+                accelerator_options=pipeline_options.accelerator_options,
+                enable_remote_services=pipeline_options.enable_remote_services,
+                allow_external_plugins=pipeline_options.allow_external_plugins,
+            )
+        )
+
+    def _assemble_document(self, conv_res: ConversionResult) -> ConversionResult:
+        conv_res = super()._assemble_document(conv_res)
+
+        thresholds = self.pipeline_options.vlm_fallback_thresholds
+        vlm_pages = [
+            page
+            for page in conv_res.pages
+            if page.page_no in conv_res.confidence.pages
+            and is_low_confidence(conv_res.confidence.pages[page.page_no], thresholds)
+        ]
+        if not vlm_pages:
+            return conv_res
+
+        _log.info(
+            f"Converting {len(vlm_pages)} of {len(conv_res.pages)} pages of "
+            f"{conv_res.input.file.name} with the VLM"
+        )
+        with TimeRecorder(conv_res, "vlm_fallback", scope=ProfilingScope.DOCUMENT):
+            page_docs = self._convert_vlm_pages(conv_res, vlm_pages)
+            if page_docs:
+                conv_res.document = merge_page_documents(
+                    conv_res.document,
+                    page_docs,
+                    [page.page_no for page in conv_res.pages],
+                )
+        return conv_res
+
+    def _convert_vlm_pages(
+        self, conv_res: ConversionResult, pages: list[Page]
+    ) -> dict[int, DoclingDocument]:
+        """Convert *pages* with the VLM into one-page documents, by page number.
+
+        The pages of a failed VLM batch are missing and keep their standard content.
+        """
+        backend = conv_res.input._backend
+        assert isinstance(backend, PdfDocumentBackend)
+        vlm_model = self.vlm_pipeline.build_pipe[0]
+        page_docs: dict[int, DoclingDocument] = {}
+        for page_batch in chunkify(pages, settings.perf.page_batch_size):
+            for page in page_batch:
+                # The standard stages released the page backends
+                page._backend = backend.load_page(page.page_no - 1)
+                page._default_image_scale = self.pipeline_options.images_scale
+            try:
+                for page in vlm_model(conv_res, page_batch):
+                    if page.predictions.vlm_response is None or page.size is None:
+                        continue
+                    page_doc = self.vlm_pipeline._convert_page(conv_res, page)
+                    self._scale_to_page(page_doc, page)
+                    page_docs[page.page_no] = page_doc
+            except ConversionCancelledError:
+                _log.warning(
+                    f"Document {conv_res.input.file} cancelled during the VLM "
+                    "conversion, keeping the standard content of the remaining pages"
+                )
+                conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+                break
+            except Exception as exc:
+                page_nos = [page.page_no for page in page_batch]
+                _log.warning(
+                    f"VLM conversion of pages {page_nos} of {conv_res.input.file} "
+                    f"failed, keeping their standard content: {exc}"
+                )
+                conv_res.errors.append(
+                    ErrorItem(
+                        component_type=DoclingComponentType.MODEL,
+                        module_name=type(vlm_model).__name__,
+                        error_message=f"VLM fallback of pages {page_nos} failed: {exc}",
+                    )
+                )
+            finally:
+                for page in page_batch:
+                    if not self.keep_images:
+                        page._image_cache = {}
+                    if not self.keep_backend and page._backend is not None:
+                        page._backend.unload()
+                        page._backend = None
+        return page_docs
+
+    @staticmethod
+    def _scale_to_page(page_doc: DoclingDocument, page: Page) -> None:
+        """Express the coordinates of a one-page VLM document in page points.
+
+        The VLM documents are sized like the page image, the standard ones like the
+        PDF page.
+        """
+        assert page.size is not None
+        doc_page = page_doc.pages.get(1)
+        if doc_page is None or doc_page.size.width <= 0:
+            return
+        scale = page.size.width / doc_page.size.width
+        for item, _ in page_doc.iterate_items(
+            traverse_pictures=True, included_content_layers=set(ContentLayer)
+        ):
+            if isinstance(item, DocItem):
+                for prov in item.prov:
+                    prov.bbox = prov.bbox.scaled(scale)
+        doc_page.size = page.size
+
+    @classmethod
+    def get_default_options(cls) -> HybridPdfPipelineOptions:
+        return HybridPdfPipelineOptions()
@@ -8,6 +8,10 @@ A self-contained, thread-safe PDF conversion pipeline exploiting parallelism bet
   relying on :pyfunc:`id`, which may clash after garbage collection.
 * **Explicit back-pressure & shutdown** - producers block on full queues; queue *close()*
   propagates downstream so stages terminate deterministically without sentinels.
+* **Shared stage graph** - with *shared_stage_graph*, long-lived stage threads convert the
+  pages of all the concurrent runs, each run feeding a fair share of the queue capacity.
+* **Adaptive batching** - with *adaptive_batch_size*, the OCR, layout and table stages tune
+  their batch size from the measured latency per page, queue depth and free memory.
 * **Minimal shared state** - heavyweight models are initialised once per pipeline instance
   and only read by worker threads; no runtime mutability is exposed.
 * **Strict typing & clean API usage** - code is fully annotated and respects *coding_rules.md*.
@@ -17,19 +21,25 @@ from __future__ import annotations
 
 import itertools
 import logging
+import multiprocessing
 import threading
 import time
 import warnings
+import weakref
 from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, cast
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
-from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
+from docling_core.types.doc import FloatingItem, PictureItem, TableItem
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
-from docling.backend.pdf_backend import PdfDocumentBackend
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.backend.docling_parse_v4_workers import DoclingParseV4WorkerPool
+from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageContent
 from docling.datamodel.base_models import (
     AssembledUnit,
     ConversionStatus,
@@ -37,7 +47,7 @@ from docling.datamodel.base_models import (
     ErrorItem,
     Page,
 )
-from docling.datamodel.document import ConversionResult
+from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
 from docling.datamodel.settings import settings
 from docling.models.factories import (
@@ -48,6 +58,7 @@ from docling.models.factories import (
 from docling.models.stages.code_formula.code_formula_vlm_model import (
     CodeFormulaVlmModel,
 )
+from docling.models.stages.layout.layout_model import LayoutModel
 from docling.models.stages.page_assemble.page_assemble_model import (
     PageAssembleModel,
     PageAssembleOptions,
@@ -57,11 +68,21 @@ from docling.models.stages.page_preprocessing.page_preprocessing_model import (
     PagePreprocessingOptions,
 )
 from docling.models.stages.reading_order.readingorder_model import (
+    IncrementalReadingOrder,
     ReadingOrderModel,
     ReadingOrderOptions,
 )
 from docling.pipeline.base_pipeline import ConvertPipeline
-from docling.utils.profiling import ProfilingScope, TimeRecorder
+from docling.utils.batching import AdaptiveBatchSizer
+from docling.utils.element_images import generate_images
+from docling.utils.page_image_store import PageImageStore
+from docling.utils.profiling import (
+    ProfilingItem,
+    ProfilingScope,
+    TimeRecorder,
+    merge_timings,
+    record_batch,
+)
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -176,6 +197,25 @@ class ThreadedQueue:
     def closed(self) -> bool:
         return self._closed
 
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
+class _ScratchTimings:
+    """View of a `ConversionResult` recording the timings into its own dict.
+
+    Used for model calls processing the pages of several documents, while the
+    other stages keep recording on the documents.
+    """
+
+    def __init__(self, conv_res: ConversionResult) -> None:
+        self._conv_res = conv_res
+        self.timings: dict[str, ProfilingItem] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conv_res, name)
+
 
 class ThreadedPipelineStage:
     """A single pipeline stage backed by one worker thread."""
@@ -190,10 +230,17 @@ class ThreadedPipelineStage:
         queue_max_size: int,
         postprocess: Optional[Callable[[ThreadedItem], None]] = None,
         timed_out_run_ids: Optional[set[int]] = None,
+        batch_sizer: Optional[AdaptiveBatchSizer] = None,
+        cross_document: bool = False,
+        daemon: bool = False,
     ) -> None:
         self.name = name
         self.model = model
         self.batch_size = batch_size
+        self.batch_sizer = batch_sizer
+        # The model may receive pages of several documents in one call
+        self.cross_document = cross_document
+        self.daemon = daemon
         self.batch_timeout = batch_timeout
         self.input_queue = ThreadedQueue(queue_max_size)
         self._outputs: list[ThreadedQueue] = []
@@ -214,7 +261,7 @@ class ThreadedPipelineStage:
             return
         self._running = True
         self._thread = threading.Thread(
-            target=self._run, name=f"Stage-{self.name}", daemon=False
+            target=self._run, name=f"Stage-{self.name}", daemon=self.daemon
         )
         self._thread.start()
 
@@ -237,10 +284,28 @@ class ThreadedPipelineStage:
     def _run(self) -> None:
         try:
             while self._running:
-                batch = self.input_queue.get_batch(self.batch_size, self.batch_timeout)
+                batch_size = (
+                    self.batch_sizer.size
+                    if self.batch_sizer is not None
+                    else self.batch_size
+                )
+                batch = self.input_queue.get_batch(batch_size, self.batch_timeout)
                 if not batch and self.input_queue.closed:
                     break
+                start = time.monotonic()
                 processed = self._process_batch(batch)
+                elapsed = time.monotonic() - start
+                if batch:
+                    for conv_res in {
+                        id(it.conv_res): it.conv_res for it in batch
+                    }.values():
+                        record_batch(
+                            conv_res, f"{self.name}_batch", batch_size, elapsed
+                        )
+                    if self.batch_sizer is not None:
+                        self.batch_sizer.update(
+                            len(batch), elapsed, queue_depth=len(self.input_queue)
+                        )
                 self._emit(processed)
         except Exception:  # pragma: no cover - top-level guard
             _log.exception("Fatal error in stage %s", self.name)
@@ -250,16 +315,24 @@ class ThreadedPipelineStage:
 
     # ----------------------------------------------------- _process_batch()
     def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
-        """Run *model* on *batch* grouped by run_id to maximise batching."""
+        """Run *model* on *batch* grouped by run_id to maximise batching.
+
+        With *cross_document*, the pages of all the runs go through one model call.
+        """
         groups: dict[int, list[ThreadedItem]] = defaultdict(list)
         for itm in batch:
             groups[itm.run_id].append(itm)
 
         result: list[ThreadedItem] = []
+        # (all items, items to process) of the model calls
+        calls: list[tuple[list[ThreadedItem], list[ThreadedItem]]] = []
         for rid, items in groups.items():
             # If run_id is timed out, skip processing but pass through items as-is
             # This allows already-completed work to flow through while aborting new work
-            if rid in self._timed_out_run_ids:
+            if (
+                rid in self._timed_out_run_ids
+                or items[0].conv_res.cancellation.cancelled
+            ):
                 for it in items:
                     it.is_failed = True
                     if it.error is None:
@@ -271,37 +344,40 @@ class ThreadedPipelineStage:
             if not good:
                 result.extend(items)
                 continue
+            if any(i.payload is None for i in good):
+                # Some items have None payloads, mark all as failed
+                for it in items:
+                    it.is_failed = True
+                    it.error = RuntimeError("Page payload is None")
+                result.extend(items)
+                continue
+            calls.append((items, good))
+
+        if self.cross_document and len(calls) > 1:
             try:
-                # Filter out None payloads and ensure type safety
-                pages_with_payloads = [
-                    (i, i.payload) for i in good if i.payload is not None
-                ]
-                if len(pages_with_payloads) != len(good):
-                    # Some items have None payloads, mark all as failed
-                    for it in items:
-                        it.is_failed = True
-                        it.error = RuntimeError("Page payload is None")
-                    result.extend(items)
-                    continue
-
-                pages: List[Page] = [payload for _, payload in pages_with_payloads]
-                processed_pages = list(self.model(good[0].conv_res, pages))  # type: ignore[arg-type]
-                if len(processed_pages) != len(pages):  # strict mismatch guard
-                    raise RuntimeError(
-                        f"Model {self.name} returned wrong number of pages"
-                    )
-                for idx, page in enumerate(processed_pages):
-                    result.append(
-                        ThreadedItem(
-                            payload=page,
-                            run_id=rid,
-                            page_no=good[idx].page_no,
-                            conv_res=good[idx].conv_res,
-                        )
-                    )
+                result.extend(
+                    self._call_model([it for _, good in calls for it in good])
+                )
+                return result
+            except Exception as exc:
+                # Retry per run, so that a failing page only fails its own document
+                _log.warning(
+                    "Stage %s failed for runs %s, retrying per run: %s",
+                    self.name,
+                    sorted({items[0].run_id for items, _ in calls}),
+                    exc,
+                )
+
+        for items, good in calls:
+            try:
+                result.extend(self._call_model(good))
             except Exception as exc:
                 _log.error(
-                    "Stage %s failed for run %d: %s", self.name, rid, exc, exc_info=True
+                    "Stage %s failed for run %s: %s",
+                    self.name,
+                    items[0].run_id,
+                    exc,
+                    exc_info=True,
                 )
                 for it in items:
                     it.is_failed = True
@@ -309,6 +385,32 @@ class ThreadedPipelineStage:
                 result.extend(items)
         return result
 
+    def _call_model(self, good: Sequence[ThreadedItem]) -> list[ThreadedItem]:
+        """Run *model* on the pages of *good*, which may belong to several runs.
+
+        For pages of several documents, the model records its timings apart, and
+        they are added to each of the documents.
+        """
+        conv_results = {id(it.conv_res): it.conv_res for it in good}
+        conv_res: Any = good[0].conv_res
+        if len(conv_results) > 1:
+            conv_res = _ScratchTimings(good[0].conv_res)
+        pages: List[Page] = [i.payload for i in good if i.payload is not None]
+        processed_pages = list(self.model(conv_res, pages))
+        if len(processed_pages) != len(pages):  # strict mismatch guard
+            raise RuntimeError(f"Model {self.name} returned wrong number of pages")
+        if isinstance(conv_res, _ScratchTimings):
+            merge_timings(conv_res.timings, conv_results.values())
+        return [
+            ThreadedItem(
+                payload=page,
+                run_id=good[idx].run_id,
+                page_no=good[idx].page_no,
+                conv_res=good[idx].conv_res,
+            )
+            for idx, page in enumerate(processed_pages)
+        ]
+
     # -------------------------------------------------------------- _emit()
     def _emit(self, items: Iterable[ThreadedItem]) -> None:
         for item in items:
@@ -320,7 +422,11 @@ class ThreadedPipelineStage:
 
 
 class PreprocessThreadedStage(ThreadedPipelineStage):
-    """Pipeline stage that lazily loads PDF backends just-in-time."""
+    """Pipeline stage that lazily loads PDF backends just-in-time.
+
+    With a parse worker pool, the pages of a batch are parsed and rendered at the
+    given image scales in parallel by the workers.
+    """
 
     def __init__(
         self,
@@ -329,15 +435,21 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         queue_max_size: int,
         model: Any,
         timed_out_run_ids: Optional[set[int]] = None,
+        parse_pool: Optional[DoclingParseV4WorkerPool] = None,
+        image_scales: Sequence[float] = (1.0,),
+        daemon: bool = False,
     ) -> None:
         super().__init__(
             name="preprocess",
             model=model,
-            batch_size=1,
+            batch_size=parse_pool.max_workers if parse_pool is not None else 1,
             batch_timeout=batch_timeout,
             queue_max_size=queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
         )
+        self._parse_pool = parse_pool
+        self._image_scales = image_scales
 
     def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
         groups: dict[int, list[ThreadedItem]] = defaultdict(list)
@@ -361,11 +473,23 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
                 result.extend(items)
                 continue
             try:
+                if any(it.payload is None for it in good):
+                    raise RuntimeError("Page payload is None")
+                backend = good[0].conv_res.input._backend
+                if self._parse_pool is not None and isinstance(
+                    backend, DoclingParseV4DocumentBackend
+                ):
+                    unloaded = [
+                        it.payload
+                        for it in good
+                        if it.payload is not None and it.payload._backend is None
+                    ]
+                    self._parse_pool.load_pages(backend, unloaded, self._image_scales)
+
                 pages_with_payloads: list[tuple[ThreadedItem, Page]] = []
                 for it in good:
                     page = it.payload
-                    if page is None:
-                        raise RuntimeError("Page payload is None")
+                    assert page is not None
                     if page._backend is None:
                         backend = it.conv_res.input._backend
                         assert isinstance(backend, PdfDocumentBackend), (
@@ -410,6 +534,57 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         return result
 
 
+class _LayoutInferenceStep:
+    """Stage model running only the layout predictor of a `LayoutModel`.
+
+    The raw clusters are stored in ``page.predictions.layout`` for the following
+    `_LayoutPostprocessStep`.
+    """
+
+    def __init__(self, layout_model: LayoutModel) -> None:
+        self.layout_model = layout_model
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        pages = list(page_batch)
+        predictions = self.layout_model.predict_raw_layout(conv_res, pages)
+        for page, prediction in zip(pages, predictions):
+            page.predictions.layout = prediction
+            yield page
+
+
+class _LayoutPostprocessStep:
+    """Stage model post-processing the raw layout, optionally in an executor."""
+
+    def __init__(
+        self, layout_model: LayoutModel, executor: Optional[Executor] = None
+    ) -> None:
+        self.layout_model = layout_model
+        self.executor = executor
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        pages = list(page_batch)
+        self.layout_model.postprocess_layout(conv_res, pages, executor=self.executor)
+        yield from pages
+
+
+def _has_builtin_layout_calls(layout_model: LayoutModel) -> bool:
+    """Whether *layout_model* predicts the layout with the code of `LayoutModel`.
+
+    Only then can the layout stage be split into `_LayoutInferenceStep` and
+    `_LayoutPostprocessStep`, a subclass overriding ``predict_layout`` or
+    ``__call__`` keeps one stage running its own code.
+    """
+    model_cls = type(layout_model)
+    return (
+        model_cls.predict_layout is LayoutModel.predict_layout
+        and model_cls.__call__ is LayoutModel.__call__
+    )
+
+
 @dataclass
 class RunContext:
     """Wiring for a single *execute* call."""
@@ -420,6 +595,176 @@ class RunContext:
     timed_out_run_ids: set[int] = field(default_factory=set)
 
 
+class _SharedStageGraph:
+    """Long-lived stages converting the pages of all the runs of a pipeline.
+
+    The pages of all the runs go through the same stage threads. A router thread
+    dispatches the pages leaving the last stage to the output queue of their run.
+    """
+
+    def __init__(self, ctx: RunContext, queue_max_size: int) -> None:
+        self.ctx = ctx
+        self.queue_max_size = queue_max_size
+        self._run_queues: dict[int, ThreadedQueue] = {}
+        self._lock = threading.Lock()
+        for st in ctx.stages:
+            st.start()
+        self._router = threading.Thread(
+            target=self._route, name="Stage-router", daemon=True
+        )
+        self._router.start()
+
+    def register(self, run_id: int, num_pages: int) -> ThreadedQueue:
+        """Output queue of a new run of *num_pages* pages."""
+        # The router never blocks: the queue holds all the pages of the run
+        q = ThreadedQueue(max(num_pages, 1))
+        with self._lock:
+            self._run_queues[run_id] = q
+        if self.ctx.output_queue.closed:
+            q.close()
+        return q
+
+    def unregister(self, run_id: int) -> None:
+        """Forget a finished run, its pages still in flight are dropped."""
+        with self._lock:
+            q = self._run_queues.pop(run_id, None)
+        if q is not None:
+            q.close()
+        # Later pages of a cancelled run are skipped by their cancellation token
+        self.ctx.timed_out_run_ids.discard(run_id)
+
+    def fair_share(self) -> int:
+        """Pages each run may have in flight, for the runs to progress evenly."""
+        with self._lock:
+            num_runs = max(len(self._run_queues), 1)
+        return max(1, self.queue_max_size // num_runs)
+
+    def shutdown(self) -> None:
+        for st in self.ctx.stages:
+            st.stop()
+        self.ctx.output_queue.close()
+        self._router.join(timeout=15.0)
+
+    def _route(self) -> None:
+        try:
+            while True:
+                batch = self.ctx.output_queue.get_batch(32, timeout=0.5)
+                if not batch and self.ctx.output_queue.closed:
+                    break
+                for itm in batch:
+                    with self._lock:
+                        q = self._run_queues.get(itm.run_id)
+                    if q is not None:
+                        q.put(itm)
+        finally:
+            with self._lock:
+                queues = list(self._run_queues.values())
+            for q in queues:
+                q.close()
+
+
+def run_pages(
+    ctx: RunContext,
+    pages: Sequence[Page],
+    run_id: int,
+    conv_res: ConversionResult,
+    output_queue: Optional[ThreadedQueue] = None,
+    fair_share: Optional[Callable[[], int]] = None,
+    on_result: Optional[Callable[[ThreadedItem], None]] = None,
+) -> Tuple[ProcessingResult, bool]:
+    """Feed *pages* to the started stages of *ctx* and collect them from the output.
+
+    The results are read from *output_queue* (by default the output queue of *ctx*)
+    and passed to *on_result* as they arrive. With *fair_share*, the stages are
+    shared with other runs: at most that many pages of the run are in flight and the
+    input queue of the first stage is never closed.
+
+    Stops at the cancellation of *conv_res*, the pages not done by then are marked
+    as failed. Returns the processing result and whether the run was cancelled.
+    """
+    total_pages = len(pages)
+    proc = ProcessingResult(total_expected=total_pages)
+    queue_out = output_queue if output_queue is not None else ctx.output_queue
+    fed_idx: int = 0  # number of pages successfully queued
+    batch_size: int = 32  # drain chunk
+    timeout_exceeded = False
+    input_queue_closed = False
+    while proc.success_count + proc.failure_count < total_pages:
+        # Check timeout and cancellation
+        if conv_res.cancellation.cancelled:
+            _log.warning(
+                f"Conversion of document {conv_res.input.file.name} "
+                f"cancelled: {conv_res.cancellation.reason}"
+            )
+            timeout_exceeded = True
+            ctx.timed_out_run_ids.add(run_id)
+            if not input_queue_closed and fair_share is None:
+                ctx.first_stage.input_queue.close()
+                input_queue_closed = True
+            # Break immediately - don't wait for in-flight work
+            break
+
+        # 1) feed - try to enqueue until the first queue is full
+        while not input_queue_closed and fed_idx < total_pages:
+            if (
+                fair_share is not None
+                and fed_idx - (proc.success_count + proc.failure_count) >= fair_share()
+            ):
+                break  # leave the stages to the other runs
+            ok = ctx.first_stage.input_queue.put(
+                ThreadedItem(
+                    payload=pages[fed_idx],
+                    run_id=run_id,
+                    page_no=pages[fed_idx].page_no,
+                    conv_res=conv_res,
+                ),
+                timeout=0.0,  # non-blocking try-put
+            )
+            if not ok:  # queue full - switch to draining
+                break
+            fed_idx += 1
+            if fed_idx == total_pages and fair_share is None:
+                ctx.first_stage.input_queue.close()
+                input_queue_closed = True
+
+        # 2) drain - pull whatever is ready from the output side
+        out_batch = queue_out.get_batch(batch_size, timeout=0.05)
+        for itm in out_batch:
+            if itm.run_id != run_id:
+                continue
+            if itm.is_failed or itm.error:
+                proc.failed_pages.append(
+                    (itm.page_no, itm.error or RuntimeError("unknown error"))
+                )
+            else:
+                assert itm.payload is not None
+                proc.pages.append(itm.payload)
+            if on_result is not None:
+                on_result(itm)
+
+        # 3) failure safety - downstream closed early
+        if not out_batch and queue_out.closed:
+            missing = total_pages - (proc.success_count + proc.failure_count)
+            if missing > 0:
+                proc.failed_pages.extend(
+                    [(-1, RuntimeError("pipeline terminated early"))] * missing
+                )
+            break
+
+    # Mark remaining pages as failed if timeout occurred, including the pages
+    # still in flight
+    if timeout_exceeded:
+        completed_page_nos = {p.page_no for p in proc.pages} | {
+            fp for fp, _ in proc.failed_pages
+        }
+        for page in pages:
+            if page.page_no not in completed_page_nos:
+                proc.failed_pages.append(
+                    (page.page_no, RuntimeError("document timeout exceeded"))
+                )
+    return proc, timeout_exceeded
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Main pipeline
 # ──────────────────────────────────────────────────────────────────────────────
@@ -432,6 +777,16 @@ class StandardPdfPipeline(ConvertPipeline):
         super().__init__(pipeline_options)
         self.pipeline_options: ThreadedPdfPipelineOptions = pipeline_options
         self._run_seq = itertools.count(1)  # deterministic, monotonic run ids
+        self._layout_postprocess_executor: Optional[Executor] = None
+        self._parse_worker_pool: Optional[DoclingParseV4WorkerPool] = None
+        # Shard inputs of documents in conversion, unloaded with the document
+        self._shard_inputs: dict[int, list[InputDocument]] = {}
+        # Reading order of documents in conversion, finished at assembly
+        self._reading_orders: dict[int, IncrementalReadingOrder] = {}
+        self._shared_graph: Optional[_SharedStageGraph] = None
+        self._executor_lock = threading.Lock()
+        # Separate lock: building the graph takes _executor_lock for the pools
+        self._shared_graph_lock = threading.Lock()
 
         # initialise heavy models once
         self._init_models()
@@ -512,12 +867,72 @@ class StandardPdfPipeline(ConvertPipeline):
             accelerator_options=self.pipeline_options.accelerator_options,
         )
 
+    def _required_page_content(self) -> Optional[set[PdfPageContent]]:
+        """Page content consumed by the enabled stages, None for everything."""
+        opts = self.pipeline_options
+        if not opts.parse_required_content_only or opts.generate_parsed_pages:
+            return None
+        content = {PdfPageContent.TEXTLINES}
+        if opts.do_ocr:
+            content.add(PdfPageContent.BITMAPS)  # OCR areas are derived from bitmaps
+        if opts.do_table_structure:
+            content.add(PdfPageContent.WORDS)  # table tokens are word cells
+        return content
+
+    def _get_layout_postprocess_executor(self) -> Optional[Executor]:
+        workers = self.pipeline_options.layout_postprocess_workers
+        if workers == 0:
+            return None
+        with self._executor_lock:
+            if self._layout_postprocess_executor is None:
+                # spawn: forking a process with running stage threads is unsafe
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                weakref.finalize(self, executor.shutdown, wait=False)
+                self._layout_postprocess_executor = executor
+            return self._layout_postprocess_executor
+
+    def _get_parse_worker_pool(self) -> Optional[DoclingParseV4WorkerPool]:
+        workers = self.pipeline_options.parse_workers
+        if workers == 0:
+            return None
+        with self._executor_lock:
+            if self._parse_worker_pool is None:
+                pool = DoclingParseV4WorkerPool(max_workers=workers)
+                weakref.finalize(self, pool.shutdown)
+                self._parse_worker_pool = pool
+            return self._parse_worker_pool
+
+    def _get_shared_graph(self) -> _SharedStageGraph:
+        with self._shared_graph_lock:
+            if self._shared_graph is None:
+                graph = _SharedStageGraph(
+                    self._create_run_ctx(shared=True),
+                    self.pipeline_options.queue_max_size,
+                )
+                weakref.finalize(self, graph.shutdown)
+                self._shared_graph = graph
+            return self._shared_graph
+
+    def _make_batch_sizer(self, batch_size: int) -> Optional[AdaptiveBatchSizer]:
+        opts = self.pipeline_options
+        if not opts.adaptive_batch_size:
+            return None
+        return AdaptiveBatchSizer(
+            initial_size=batch_size,
+            max_size=opts.max_adaptive_batch_size,
+            min_free_memory=opts.adaptive_batch_min_free_memory,
+        )
+
     def _release_page_resources(self, item: ThreadedItem) -> None:
         page = item.payload
         if page is None:
             return
         if not self.keep_images:
             page._image_cache = {}
+        elif page._image_store is not None:
+            page.spill_images()
         if not self.keep_backend and page._backend is not None:
             page._backend.unload()
             page._backend = None
@@ -528,14 +943,34 @@ class StandardPdfPipeline(ConvertPipeline):
     # Build - thread pipeline
     # ────────────────────────────────────────────────────────────────────────
 
-    def _create_run_ctx(self) -> RunContext:
+    def _create_run_ctx(self, shared: bool = False) -> RunContext:
+        """Wire the stages of a run.
+
+        With *shared*, the stages serve all the runs of the pipeline: their threads
+        are daemons and do not keep the pipeline alive, and the layout inference
+        batches take pages of several documents.
+        """
         opts = self.pipeline_options
         timed_out_run_ids: set[int] = set()
+        release_page_resources: Callable[[ThreadedItem], None] = (
+            self._release_page_resources
+        )
+        if shared:
+            release_ref = weakref.WeakMethod(self._release_page_resources)
+
+            def release_page_resources(item: ThreadedItem) -> None:
+                release = release_ref()
+                if release is not None:
+                    release(item)
+
         preprocess = PreprocessThreadedStage(
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             model=self.preprocessing_model,
             timed_out_run_ids=timed_out_run_ids,
+            parse_pool=self._get_parse_worker_pool(),
+            image_scales=sorted({1.0, opts.images_scale}),
+            daemon=shared,
         )
         ocr = ThreadedPipelineStage(
             name="ocr",
@@ -544,15 +979,50 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            batch_sizer=self._make_batch_sizer(opts.ocr_batch_size),
+            daemon=shared,
         )
-        layout = ThreadedPipelineStage(
-            name="layout",
-            model=self.layout_model,
-            batch_size=opts.layout_batch_size,
-            batch_timeout=opts.batch_polling_interval_seconds,
-            queue_max_size=opts.queue_max_size,
-            timed_out_run_ids=timed_out_run_ids,
-        )
+        # Split layout inference from its CPU-bound post-processing when supported
+        layout_postprocess: Optional[ThreadedPipelineStage] = None
+        if (
+            opts.layout_postprocess_stage
+            and isinstance(self.layout_model, LayoutModel)
+            and _has_builtin_layout_calls(self.layout_model)
+        ):
+            layout = ThreadedPipelineStage(
+                name="layout",
+                model=_LayoutInferenceStep(self.layout_model),
+                batch_size=opts.layout_batch_size,
+                batch_timeout=opts.batch_polling_interval_seconds,
+                queue_max_size=opts.queue_max_size,
+                timed_out_run_ids=timed_out_run_ids,
+                batch_sizer=self._make_batch_sizer(opts.layout_batch_size),
+                cross_document=shared,
+                daemon=shared,
+            )
+            layout_postprocess = ThreadedPipelineStage(
+                name="layout_postprocess",
+                model=_LayoutPostprocessStep(
+                    self.layout_model, self._get_layout_postprocess_executor()
+                ),
+                batch_size=opts.layout_batch_size,
+                batch_timeout=opts.batch_polling_interval_seconds,
+                queue_max_size=opts.queue_max_size,
+                timed_out_run_ids=timed_out_run_ids,
+                batch_sizer=self._make_batch_sizer(opts.layout_batch_size),
+                daemon=shared,
+            )
+        else:
+            layout = ThreadedPipelineStage(
+                name="layout",
+                model=self.layout_model,
+                batch_size=opts.layout_batch_size,
+                batch_timeout=opts.batch_polling_interval_seconds,
+                queue_max_size=opts.queue_max_size,
+                timed_out_run_ids=timed_out_run_ids,
+                batch_sizer=self._make_batch_sizer(opts.layout_batch_size),
+                daemon=shared,
+            )
         table = ThreadedPipelineStage(
             name="table",
             model=self.table_model,
@@ -560,6 +1030,8 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            batch_sizer=self._make_batch_sizer(opts.table_batch_size),
+            daemon=shared,
         )
         assemble = ThreadedPipelineStage(
             name="assemble",
@@ -567,19 +1039,26 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_size=1,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
-            postprocess=self._release_page_resources,
+            postprocess=release_page_resources,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=shared,
         )
 
         # wire stages
         output_q = ThreadedQueue(opts.queue_max_size)
         preprocess.add_output_queue(ocr.input_queue)
         ocr.add_output_queue(layout.input_queue)
-        layout.add_output_queue(table.input_queue)
+        if layout_postprocess is not None:
+            layout.add_output_queue(layout_postprocess.input_queue)
+            layout_postprocess.add_output_queue(table.input_queue)
+        else:
+            layout.add_output_queue(table.input_queue)
         table.add_output_queue(assemble.input_queue)
         assemble.add_output_queue(output_q)
 
         stages = [preprocess, ocr, layout, table, assemble]
+        if layout_postprocess is not None:
+            stages.insert(3, layout_postprocess)
         return RunContext(
             stages=stages,
             first_stage=preprocess,
@@ -589,22 +1068,133 @@ class StandardPdfPipeline(ConvertPipeline):
 
     # --------------------------------------------------------------------- build
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
+        # One deadline for the whole document, shared by its shards and by the
+        # work following the build (e.g. enrichment)
+        conv_res.cancellation.set_timeout(self.pipeline_options.document_timeout)
+        page_ranges = self._shard_page_ranges(conv_res.input)
+        if len(page_ranges) > 1:
+            return self._build_sharded(conv_res, page_ranges)
+        return self._build_page_range(
+            conv_res,
+            incremental_reading_order=self.pipeline_options.incremental_reading_order,
+        )
+
+    def _shard_page_ranges(self, in_doc: InputDocument) -> list[tuple[int, int]]:
+        """Split the page range of *in_doc* into contiguous shards of similar size."""
+        opts = self.pipeline_options
+        start_page, end_page = in_doc.limits.page_range
+        end_page = min(end_page, in_doc.page_count)
+        num_pages = end_page - start_page + 1
+        num_shards = min(opts.num_page_shards, num_pages // opts.page_shard_min_pages)
+        if num_shards <= 1:
+            return [(start_page, end_page)]
+
+        shard_size, remainder = divmod(num_pages, num_shards)
+        page_ranges = []
+        for ix in range(num_shards):
+            end = start_page + shard_size + (1 if ix < remainder else 0) - 1
+            page_ranges.append((start_page, end))
+            start_page = end + 1
+        return page_ranges
+
+    def _shard_input(
+        self, in_doc: InputDocument, page_range: tuple[int, int]
+    ) -> InputDocument:
+        """Copy of *in_doc* limited to *page_range*, with its own backend."""
+        backend = in_doc._backend
+        path_or_stream = backend.path_or_stream
+        if isinstance(path_or_stream, BytesIO):
+            path_or_stream = BytesIO(path_or_stream.getvalue())
+        shard = in_doc.model_copy(
+            update={
+                "limits": in_doc.limits.model_copy(update={"page_range": page_range})
+            }
+        )
+        shard._init_doc(type(backend), path_or_stream)
+        return shard
+
+    def _build_sharded(
+        self, conv_res: ConversionResult, page_ranges: list[tuple[int, int]]
+    ) -> ConversionResult:
+        """Build the page ranges concurrently and merge their pages into *conv_res*."""
+        _log.info(
+            f"Converting {conv_res.input.file.name} in {len(page_ranges)} shards: "
+            f"{page_ranges}"
+        )
+        shard_inputs = [
+            self._shard_input(conv_res.input, page_range) for page_range in page_ranges
+        ]
+        with self._executor_lock:
+            self._shard_inputs[id(conv_res)] = shard_inputs
+
+        shard_conv_results = []
+        for shard in shard_inputs:
+            shard_res = ConversionResult(input=shard)
+            # Cancelling the document, or any shard, stops all the shards
+            shard_res._cancellation = conv_res.cancellation
+            shard_conv_results.append(shard_res)
+
+        with ThreadPoolExecutor(
+            max_workers=len(shard_inputs), thread_name_prefix="pdf-shard"
+        ) as pool:
+            shard_results = list(pool.map(self._build_page_range, shard_conv_results))
+
+        for shard_res in shard_results:
+            conv_res.errors.extend(shard_res.errors)
+            conv_res.confidence.pages.update(shard_res.confidence.pages)
+            for key, item in shard_res.timings.items():
+                if key in conv_res.timings:
+                    conv_res.timings[key].count += item.count
+                    conv_res.timings[key].times.extend(item.times)
+                    conv_res.timings[key].start_timestamps.extend(item.start_timestamps)
+                    conv_res.timings[key].batch_sizes.extend(item.batch_sizes)
+                else:
+                    conv_res.timings[key] = item
+        conv_res.pages = [p for shard_res in shard_results for p in shard_res.pages]
+
+        statuses = {shard_res.status for shard_res in shard_results}
+        if statuses == {ConversionStatus.SUCCESS}:
+            conv_res.status = ConversionStatus.SUCCESS
+        elif statuses == {ConversionStatus.FAILURE}:
+            conv_res.status = ConversionStatus.FAILURE
+        else:
+            conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+        return conv_res
+
+    def _build_page_range(
+        self, conv_res: ConversionResult, incremental_reading_order: bool = False
+    ) -> ConversionResult:
         """Stream-build the document while interleaving producer and consumer work.
 
-        Note: If a worker thread gets stuck in a blocking call (model inference or PDF backend
-        load_page/get_size), that thread will be abandoned after a brief wait (15s) during cleanup.
-        The thread continues running until the blocking call completes, potentially holding
-        resources (e.g., pypdfium2_lock).
+        With *incremental_reading_order*, the finished pages are appended to
+        `conv_res.document` while the next pages are converted.
+
+        `_build_document` arms the cancellation token of *conv_res* with the
+        `document_timeout`: the models check it during their long operations (VLM
+        generation, OCR subprocesses, API requests) and abort, so the stage threads are
+        free when the run stops.
+
+        Note: If a worker thread gets stuck in a blocking call that does not check the
+        cancellation (e.g. PDF backend load_page/get_size), that thread will be abandoned
+        after a brief wait (15s) during cleanup. The thread continues running until the
+        blocking call completes, potentially holding resources (e.g., pypdfium2_lock).
         """
         run_id = next(self._run_seq)
         assert isinstance(conv_res.input._backend, PdfDocumentBackend)
+        conv_res.input._backend.set_required_page_content(self._required_page_content())
 
         # Collect page placeholders; backends are loaded lazily in preprocess stage
         start_page, end_page = conv_res.input.limits.page_range
+        image_store = (
+            PageImageStore()
+            if self.keep_images and self.pipeline_options.spill_page_images
+            else None
+        )
         pages: list[Page] = []
         for i in range(conv_res.input.page_count):
             if start_page - 1 <= i <= end_page - 1:
                 page = Page(page_no=i + 1)
+                page._image_store = image_store
                 conv_res.pages.append(page)
                 pages.append(page)
 
@@ -612,94 +1202,56 @@ class StandardPdfPipeline(ConvertPipeline):
             conv_res.status = ConversionStatus.FAILURE
             return conv_res
 
+        reading_order: Optional[IncrementalReadingOrder] = None
+        if incremental_reading_order:
+            reading_order = IncrementalReadingOrder(
+                self.reading_order_model, conv_res, [p.page_no for p in pages]
+            )
+            conv_res.document = reading_order.document
+            with self._executor_lock:
+                self._reading_orders[id(conv_res)] = reading_order
+
         total_pages: int = len(pages)
-        ctx: RunContext = self._create_run_ctx()
-        for st in ctx.stages:
-            st.start()
+        graph: Optional[_SharedStageGraph] = None
+        if self.pipeline_options.shared_stage_graph:
+            graph = self._get_shared_graph()
+            ctx = graph.ctx
+            output_queue = graph.register(run_id, total_pages)
+        else:
+            ctx = self._create_run_ctx()
+            output_queue = ctx.output_queue
+            for st in ctx.stages:
+                st.start()
 
-        proc = ProcessingResult(total_expected=total_pages)
-        fed_idx: int = 0  # number of pages successfully queued
-        batch_size: int = 32  # drain chunk
-        start_time = time.monotonic()
-        timeout_exceeded = False
-        input_queue_closed = False
-        try:
-            while proc.success_count + proc.failure_count < total_pages:
-                # Check timeout
-                if (
-                    self.pipeline_options.document_timeout is not None
-                    and not timeout_exceeded
-                ):
-                    elapsed_time = time.monotonic() - start_time
-                    if elapsed_time > self.pipeline_options.document_timeout:
-                        _log.warning(
-                            f"Document processing time ({elapsed_time:.3f}s) "
-                            f"exceeded timeout of {self.pipeline_options.document_timeout:.3f}s"
-                        )
-                        timeout_exceeded = True
-                        ctx.timed_out_run_ids.add(run_id)
-                        if not input_queue_closed:
-                            ctx.first_stage.input_queue.close()
-                            input_queue_closed = True
-                        # Break immediately - don't wait for in-flight work
-                        break
-
-                # 1) feed - try to enqueue until the first queue is full
-                if not input_queue_closed:
-                    while fed_idx < total_pages:
-                        ok = ctx.first_stage.input_queue.put(
-                            ThreadedItem(
-                                payload=pages[fed_idx],
-                                run_id=run_id,
-                                page_no=pages[fed_idx].page_no,
-                                conv_res=conv_res,
-                            ),
-                            timeout=0.0,  # non-blocking try-put
-                        )
-                        if ok:
-                            fed_idx += 1
-                            if fed_idx == total_pages:
-                                ctx.first_stage.input_queue.close()
-                                input_queue_closed = True
-                        else:  # queue full - switch to draining
-                            break
-
-                # 2) drain - pull whatever is ready from the output side
-                out_batch = ctx.output_queue.get_batch(batch_size, timeout=0.05)
-                for itm in out_batch:
-                    if itm.run_id != run_id:
-                        continue
-                    if itm.is_failed or itm.error:
-                        proc.failed_pages.append(
-                            (itm.page_no, itm.error or RuntimeError("unknown error"))
-                        )
-                    else:
-                        assert itm.payload is not None
-                        proc.pages.append(itm.payload)
-
-                # 3) failure safety - downstream closed early
-                if not out_batch and ctx.output_queue.closed:
-                    missing = total_pages - (proc.success_count + proc.failure_count)
-                    if missing > 0:
-                        proc.failed_pages.extend(
-                            [(-1, RuntimeError("pipeline terminated early"))] * missing
-                        )
-                    break
+        def _add_to_reading_order(itm: ThreadedItem) -> None:
+            assert reading_order is not None
+            if itm.is_failed or itm.error:
+                reading_order.skip_page(itm.page_no)
+            else:
+                assert itm.payload is not None
+                reading_order.add_page(itm.payload)
 
-            # Mark remaining pages as failed if timeout occurred
-            if timeout_exceeded:
-                completed_page_nos = {p.page_no for p in proc.pages} | {
-                    fp for fp, _ in proc.failed_pages
-                }
-                for page in pages[fed_idx:]:
-                    if page.page_no not in completed_page_nos:
-                        proc.failed_pages.append(
-                            (page.page_no, RuntimeError("document timeout exceeded"))
-                        )
+        try:
+            proc, timeout_exceeded = run_pages(
+                ctx,
+                pages,
+                run_id,
+                conv_res,
+                output_queue=output_queue,
+                fair_share=graph.fair_share if graph is not None else None,
+                on_result=_add_to_reading_order if reading_order is not None else None,
+            )
         finally:
-            for st in ctx.stages:
-                st.stop()
-            ctx.output_queue.close()
+            if graph is not None:
+                graph.unregister(run_id)
+            else:
+                for st in ctx.stages:
+                    st.stop()
+                ctx.output_queue.close()
+            if self._parse_worker_pool is not None and isinstance(
+                conv_res.input._backend, DoclingParseV4DocumentBackend
+            ):
+                self._parse_worker_pool.release_document(conv_res.input._backend)
 
         self._integrate_results(conv_res, proc, timeout_exceeded=timeout_exceeded)
         return conv_res
@@ -757,56 +1309,30 @@ class StandardPdfPipeline(ConvertPipeline):
             conv_res.assembled = AssembledUnit(
                 elements=elements, headers=headers, body=body
             )
-            conv_res.document = self.reading_order_model(conv_res)
-
-            # Generate page images in the output
-            if self.pipeline_options.generate_page_images:
-                for page in conv_res.pages:
-                    assert page.image is not None
-                    page_no = page.page_no
-                    conv_res.document.pages[page_no].image = ImageRef.from_pil(
-                        page.image, dpi=int(72 * self.pipeline_options.images_scale)
-                    )
-
-            # Generate images of the requested element types
+            with self._executor_lock:
+                reading_order = self._reading_orders.pop(id(conv_res), None)
+            if reading_order is not None:
+                conv_res.document = reading_order.finish()
+            else:
+                conv_res.document = self.reading_order_model(conv_res)
+
+            # Generate page images and images of the requested element types
             with warnings.catch_warnings():  # deprecated generate_table_images
                 warnings.filterwarnings("ignore", category=DeprecationWarning)
-                if (
-                    self.pipeline_options.generate_picture_images
-                    or self.pipeline_options.generate_table_images
-                ):
-                    scale = self.pipeline_options.images_scale
-                    for element, _level in conv_res.document.iterate_items():
-                        if not isinstance(element, DocItem) or len(element.prov) == 0:
-                            continue
-                        if (
-                            isinstance(element, PictureItem)
-                            and self.pipeline_options.generate_picture_images
-                        ) or (
-                            isinstance(element, TableItem)
-                            and self.pipeline_options.generate_table_images
-                        ):
-                            page_ix = element.prov[0].page_no
-                            page = next(
-                                (p for p in conv_res.pages if p.page_no == page_ix),
-                                cast("Page", None),
-                            )
-                            assert page is not None
-                            assert page.size is not None
-                            assert page.image is not None
-
-                            crop_bbox = (
-                                element.prov[0]
-                                .bbox.scaled(scale=scale)
-                                .to_top_left_origin(
-                                    page_height=page.size.height * scale
-                                )
-                            )
-
-                            cropped_im = page.image.crop(crop_bbox.as_tuple())
-                            element.image = ImageRef.from_pil(
-                                cropped_im, dpi=int(72 * scale)
-                            )
+                element_types: list[type[FloatingItem]] = []
+                if self.pipeline_options.generate_picture_images:
+                    element_types.append(PictureItem)
+                if self.pipeline_options.generate_table_images:
+                    element_types.append(TableItem)
+            if self.pipeline_options.generate_page_images or element_types:
+                generate_images(
+                    conv_res,
+                    scale=self.pipeline_options.images_scale,
+                    page_images=self.pipeline_options.generate_page_images,
+                    element_types=tuple(element_types),
+                    output_dir=self.pipeline_options.images_output_dir,
+                    max_workers=self.pipeline_options.image_encoding_workers,
+                )
 
             # Aggregate confidence values for document:
             if len(conv_res.pages) > 0:
@@ -856,5 +1382,10 @@ class StandardPdfPipeline(ConvertPipeline):
         for p in conv_res.pages:
             if p._backend is not None:
                 p._backend.unload()
+        with self._executor_lock:
+            shard_inputs = self._shard_inputs.pop(id(conv_res), [])
+            self._reading_orders.pop(id(conv_res), None)
+        for shard in shard_inputs:
+            shard._backend.unload()
         if conv_res.input._backend:
             conv_res.input._backend.unload()
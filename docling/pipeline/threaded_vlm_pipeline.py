@@ -0,0 +1,340 @@
+"""Threaded VLM pipeline
+======================
+Runs the models of the `VlmPipeline` on bounded-queue stage threads, so that the
+rendering of the next pages and the conversion of the responses of the previous
+pages overlap with the VLM inference:
+
+* **render** - loads the page backends and renders the page images, including the
+  images resized for the VLM.
+* **vlm** - runs the VLM on batches of the preferred size of the inference engine.
+  With `vlm_reorder_window`, the queued pages are grouped by expected response
+  length before batching.
+* **page_assemble** - converts the VLM response of each page (DocTags, Markdown,
+  HTML) into a one-page document. The page documents are concatenated at assembly.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+from docling_core.types.doc import DoclingDocument
+
+from docling.backend.pdf_backend import PdfDocumentBackend
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    DoclingComponentType,
+    ErrorItem,
+    Page,
+)
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import ThreadedVlmPipelineOptions
+from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions
+from docling.datamodel.settings import settings
+from docling.models.stages.vlm_convert.vlm_convert_model import VlmConvertModel
+from docling.pipeline.standard_pdf_pipeline import (
+    ProcessingResult,
+    RunContext,
+    ThreadedItem,
+    ThreadedPipelineStage,
+    ThreadedQueue,
+    run_pages,
+)
+from docling.pipeline.vlm_pipeline import VlmPipeline, concatenate_page_documents
+from docling.utils.batching import ink_density, length_sorted_batches
+from docling.utils.profiling import ProfilingScope, TimeRecorder
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+_log = logging.getLogger(__name__)
+
+
+class _RenderStep:
+    """Stage model loading the pages and rendering their images.
+
+    The images prepared for a `VlmConvertModel` are stored in *vlm_images* by page
+    number, for the following `_VlmStep`.
+    """
+
+    def __init__(
+        self, pipeline: ThreadedVlmPipeline, vlm_images: dict[int, Image]
+    ) -> None:
+        self.pipeline = pipeline
+        self.vlm_images = vlm_images
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        vlm_model = self.pipeline.vlm_model
+        vlm_options = self.pipeline.pipeline_options.vlm_options
+        for page in page_batch:
+            page = self.pipeline.initialize_page(conv_res, page)
+            if page.size is not None:
+                with TimeRecorder(conv_res, "page_render"):
+                    if isinstance(vlm_model, VlmConvertModel):
+                        image = vlm_model.prepare_image(page)
+                        if image is not None:
+                            self.vlm_images[page.page_no] = image
+                    else:
+                        # Fill the image cache of the page at the scales used by
+                        # the legacy models and by the page assembly
+                        page.get_image(
+                            scale=vlm_options.scale, max_size=vlm_options.max_size
+                        )
+                        page.get_image(scale=page._default_image_scale)
+            yield page
+
+
+class _VlmStep:
+    """Stage model running the VLM on one batch of rendered pages."""
+
+    def __init__(
+        self, vlm_model: Callable, vlm_images: dict[int, Image], batch_size: int
+    ) -> None:
+        self.vlm_model = vlm_model
+        self.vlm_images = vlm_images
+        self.batch_size = batch_size
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        pages = list(page_batch)
+        if not isinstance(self.vlm_model, VlmConvertModel):
+            list(self.vlm_model(conv_res, pages))
+            return pages
+
+        valid_pages: list[Page] = []
+        images: list[Image] = []
+        for page in pages:
+            image = self.vlm_images.pop(page.page_no, None)
+            if image is None:
+                _log.warning(
+                    f"Page {page.page_no} has no image, skipping VLM conversion"
+                )
+                continue
+            valid_pages.append(page)
+            images.append(image)
+        if valid_pages:
+            with TimeRecorder(conv_res, "vlm_convert"):
+                self.vlm_model.predict_pages(valid_pages, images, conv_res.cancellation)
+        return pages
+
+    def length_batches(self, items: Sequence[ThreadedItem]) -> list[list[ThreadedItem]]:
+        """Split *items* into batches of *batch_size* pages with similar ink density.
+
+        Short responses are then not decoded for as long as the longest response of
+        a mixed batch.
+        """
+        if len(items) <= self.batch_size:
+            return [list(items)] if items else []
+        densities = []
+        for itm in items:
+            image: Optional[Image] = None
+            if isinstance(self.vlm_model, VlmConvertModel):
+                image = self.vlm_images.get(itm.page_no)
+            elif itm.payload is not None:
+                image = itm.payload.image
+            densities.append(ink_density(image) if image is not None else 0.0)
+        return [
+            [items[ix] for ix in batch]
+            for batch in length_sorted_batches(densities, self.batch_size)
+        ]
+
+
+class _VlmStage(ThreadedPipelineStage):
+    """VLM stage calling its model once per engine batch.
+
+    With a reorder window, the stage receives more pages than one engine batch. A
+    failing engine call only fails the pages of its own batch.
+    """
+
+    model: _VlmStep
+
+    def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
+        result: list[ThreadedItem] = []
+        for engine_batch in self.model.length_batches(batch):
+            result.extend(super()._process_batch(engine_batch))
+        return result
+
+
+class _PageAssembleStep:
+    """Stage model converting the VLM response of each page into a document.
+
+    The one-page documents are stored in *page_docs* by page number.
+    """
+
+    def __init__(
+        self, pipeline: ThreadedVlmPipeline, page_docs: dict[int, DoclingDocument]
+    ) -> None:
+        self.pipeline = pipeline
+        self.page_docs = page_docs
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            if page.size is not None:
+                with TimeRecorder(conv_res, "page_assemble"):
+                    self.page_docs[page.page_no] = self.pipeline._convert_page(
+                        conv_res, page
+                    )
+            # Cleanup cached images
+            if not self.pipeline.keep_images:
+                page._image_cache = {}
+            yield page
+
+
+class ThreadedVlmPipeline(VlmPipeline):
+    """VLM pipeline overlapping page rendering, VLM inference and page assembly."""
+
+    def __init__(self, pipeline_options: ThreadedVlmPipelineOptions) -> None:
+        super().__init__(pipeline_options)
+        self.pipeline_options: ThreadedVlmPipelineOptions
+        self.vlm_model = self.build_pipe[0]
+        self._run_seq = itertools.count(1)  # deterministic, monotonic run ids
+        # One-page documents of the conversions in progress, by id(conv_res)
+        self._page_docs: dict[int, dict[int, DoclingDocument]] = {}
+
+    def _vlm_batch_size(self) -> int:
+        opts = self.pipeline_options
+        if opts.vlm_batch_size is not None:
+            return opts.vlm_batch_size
+        if isinstance(self.vlm_model, VlmConvertModel):
+            return self.vlm_model.engine.preferred_batch_size
+        if isinstance(opts.vlm_options, ApiVlmOptions):
+            return opts.vlm_options.concurrency
+        return settings.perf.page_batch_size
+
+    def _create_run_ctx(self, page_docs: dict[int, DoclingDocument]) -> RunContext:
+        opts = self.pipeline_options
+        timed_out_run_ids: set[int] = set()
+        vlm_batch_size = self._vlm_batch_size()
+        vlm_images: dict[int, Image] = {}
+        render = ThreadedPipelineStage(
+            name="render",
+            model=_RenderStep(self, vlm_images),
+            batch_size=1,
+            batch_timeout=opts.batch_polling_interval_seconds,
+            queue_max_size=opts.queue_max_size,
+            timed_out_run_ids=timed_out_run_ids,
+        )
+        vlm = _VlmStage(
+            name="vlm",
+            model=_VlmStep(self.vlm_model, vlm_images, vlm_batch_size),
+            batch_size=max(vlm_batch_size, opts.vlm_reorder_window or 0),
+            batch_timeout=opts.batch_polling_interval_seconds,
+            queue_max_size=opts.queue_max_size,
+            timed_out_run_ids=timed_out_run_ids,
+        )
+        page_assemble = ThreadedPipelineStage(
+            name="page_assemble",
+            model=_PageAssembleStep(self, page_docs),
+            batch_size=1,
+            batch_timeout=opts.batch_polling_interval_seconds,
+            queue_max_size=opts.queue_max_size,
+            timed_out_run_ids=timed_out_run_ids,
+        )
+
+        # wire stages
+        output_q = ThreadedQueue(opts.queue_max_size)
+        render.add_output_queue(vlm.input_queue)
+        vlm.add_output_queue(page_assemble.input_queue)
+        page_assemble.add_output_queue(output_q)
+
+        return RunContext(
+            stages=[render, vlm, page_assemble],
+            first_stage=render,
+            output_queue=output_q,
+            timed_out_run_ids=timed_out_run_ids,
+        )
+
+    def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
+        """Stream the pages through the stage threads while collecting the results."""
+        run_id = next(self._run_seq)
+        assert isinstance(conv_res.input._backend, PdfDocumentBackend)
+
+        with TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT):
+            # Collect page placeholders; backends are loaded in the render stage
+            start_page, end_page = conv_res.input.limits.page_range
+            pages: list[Page] = []
+            for i in range(conv_res.input.page_count):
+                if start_page - 1 <= i <= end_page - 1:
+                    page = Page(page_no=i + 1)
+                    conv_res.pages.append(page)
+                    pages.append(page)
+
+            if not pages:
+                conv_res.status = ConversionStatus.FAILURE
+                return conv_res
+
+            page_docs: dict[int, DoclingDocument] = {}
+            self._page_docs[id(conv_res)] = page_docs
+
+            ctx = self._create_run_ctx(page_docs)
+            for st in ctx.stages:
+                st.start()
+
+            conv_res.cancellation.set_timeout(self.pipeline_options.document_timeout)
+            try:
+                proc, timeout_exceeded = run_pages(ctx, pages, run_id, conv_res)
+            finally:
+                for st in ctx.stages:
+                    st.stop()
+                ctx.output_queue.close()
+
+            self._integrate_results(conv_res, proc, timeout_exceeded=timeout_exceeded)
+        return conv_res
+
+    def _integrate_results(
+        self,
+        conv_res: ConversionResult,
+        proc: ProcessingResult,
+        timeout_exceeded: bool = False,
+    ) -> None:
+        page_map = {p.page_no: p for p in proc.pages}
+        # Only keep pages that successfully completed processing, filtering out
+        # pages whose backend could not be loaded
+        conv_res.pages = [
+            page_map[p.page_no]
+            for p in conv_res.pages
+            if p.page_no in page_map and page_map[p.page_no].size is not None
+        ]
+        # Add error details from failed pages
+        for page_no, error in proc.failed_pages:
+            page_label = f"Page {page_no}" if page_no > 0 else "Unknown page"
+            error_msg = str(error) if error else ""
+            conv_res.errors.append(
+                ErrorItem(
+                    component_type=DoclingComponentType.PIPELINE,
+                    module_name=self.__class__.__name__,
+                    error_message=f"{page_label}: {error_msg}"
+                    if error_msg
+                    else page_label,
+                )
+            )
+        if proc.is_complete_failure:
+            conv_res.status = ConversionStatus.FAILURE
+        elif timeout_exceeded or proc.is_partial_success:
+            conv_res.status = ConversionStatus.PARTIAL_SUCCESS
+
+    def _assemble_document(self, conv_res: ConversionResult) -> ConversionResult:
+        page_docs = self._page_docs.pop(id(conv_res), {})
+        with TimeRecorder(conv_res, "doc_assemble", scope=ProfilingScope.DOCUMENT):
+            page_nos = [p.page_no for p in conv_res.pages if p.page_no in page_docs]
+            if page_nos:
+                # Failed pages are missing, the others keep their page number
+                conv_res.document = concatenate_page_documents(
+                    [page_docs[page_no] for page_no in page_nos], page_nos
+                )
+        return conv_res
+
+    @classmethod
+    def get_default_options(cls) -> ThreadedVlmPipelineOptions:
+        return ThreadedVlmPipelineOptions()
+
+    def _unload(self, conv_res: ConversionResult) -> ConversionResult:
+        self._page_docs.pop(id(conv_res), None)
+        return super()._unload(conv_res)
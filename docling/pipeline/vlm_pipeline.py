@@ -3,7 +3,7 @@ import re
 import warnings
 from io import BytesIO
 from pathlib import Path
-from typing import List, Union, cast
+from typing import List, Mapping, Sequence, Union, cast
 
 from docling_core.types.doc import (
     BoundingBox,
@@ -58,6 +58,32 @@ from docling.utils.profiling import ProfilingScope, TimeRecorder
 _log = logging.getLogger(__name__)
 
 
+def concatenate_page_documents(
+    docs: Sequence[DoclingDocument], page_nos: Sequence[int]
+) -> DoclingDocument:
+    """Concatenate documents and give their pages the numbers *page_nos*.
+
+    Concatenation numbers the pages from 1, in the order of *docs*. *page_nos*
+    holds the original number of each of these pages, e.g. when some pages of the
+    input failed.
+    """
+    merged = DoclingDocument.concatenate(docs=list(docs))
+    mapping = {ix + 1: page_no for ix, page_no in enumerate(page_nos)}
+    if any(ix != page_no for ix, page_no in mapping.items()):
+        for item, _ in merged.iterate_items(
+            traverse_pictures=True, included_content_layers=set(ContentLayer)
+        ):
+            if isinstance(item, DocItem):
+                for prov in item.prov:
+                    prov.page_no = mapping[prov.page_no]
+        pages = {}
+        for ix, page in merged.pages.items():
+            page.page_no = mapping[ix]
+            pages[page.page_no] = page
+        merged.pages = pages
+    return merged
+
+
 class VlmPipeline(PaginatedPipeline):
     def __init__(self, pipeline_options: VlmPipelineOptions):
         super().__init__(pipeline_options)
@@ -204,20 +230,17 @@ class VlmPipeline(PaginatedPipeline):
                     text = page._backend.get_text_in_rect(bbox)
         return text
 
+    def _get_response_format(self) -> ResponseFormat:
+        # Determine response format from options
+        if isinstance(self.pipeline_options.vlm_options, VlmConvertOptions):
+            # Response format is already ResponseFormat, no mapping needed
+            return self.pipeline_options.vlm_options.model_spec.response_format
+        # Legacy path
+        return self.pipeline_options.vlm_options.response_format
+
     def _assemble_document(self, conv_res: ConversionResult) -> ConversionResult:
         with TimeRecorder(conv_res, "doc_assemble", scope=ProfilingScope.DOCUMENT):
-            # Determine response format from options
-            if isinstance(self.pipeline_options.vlm_options, VlmConvertOptions):
-                response_format = (
-                    self.pipeline_options.vlm_options.model_spec.response_format
-                )
-                # Response format is already ResponseFormat, no mapping needed
-                response_format_legacy = response_format
-            else:
-                # Legacy path
-                response_format_legacy = (
-                    self.pipeline_options.vlm_options.response_format
-                )
+            response_format_legacy = self._get_response_format()
 
             if response_format_legacy == ResponseFormat.DOCTAGS:
                 conv_res.document = self._turn_dt_into_doc(conv_res)
@@ -242,36 +265,80 @@ class VlmPipeline(PaginatedPipeline):
 
             # Generate images of the requested element types
             if self.pipeline_options.generate_picture_images:
-                scale = self.pipeline_options.images_scale
-                for element, _level in conv_res.document.iterate_items():
-                    if not isinstance(element, DocItem) or len(element.prov) == 0:
-                        continue
-                    if (
-                        isinstance(element, PictureItem)
-                        and self.pipeline_options.generate_picture_images
-                    ):
-                        page_ix = element.prov[0].page_no - 1
-                        page = conv_res.pages[page_ix]
-                        assert page.size is not None
-                        assert page.image is not None
-
-                        crop_bbox = (
-                            element.prov[0]
-                            .bbox.scaled(scale=scale)
-                            .to_top_left_origin(page_height=page.size.height * scale)
-                        )
-
-                        cropped_im = page.image.crop(crop_bbox.as_tuple())
-                        element.image = ImageRef.from_pil(
-                            cropped_im, dpi=int(72 * scale)
-                        )
+                self._generate_picture_images(
+                    conv_res.document,
+                    {pg_idx + 1: page for pg_idx, page in enumerate(conv_res.pages)},
+                )
 
         return conv_res
 
+    def _generate_picture_images(
+        self, document: DoclingDocument, pages: Mapping[int, Page]
+    ) -> None:
+        """Crop the images of the pictures in *document* from the page images.
+
+        Args:
+            document: Document with the pictures
+            pages: Pages by their page number in *document*
+        """
+        scale = self.pipeline_options.images_scale
+        for element, _level in document.iterate_items():
+            if not isinstance(element, DocItem) or len(element.prov) == 0:
+                continue
+            if isinstance(element, PictureItem):
+                page = pages[element.prov[0].page_no]
+                assert page.size is not None
+                assert page.image is not None
+
+                crop_bbox = (
+                    element.prov[0]
+                    .bbox.scaled(scale=scale)
+                    .to_top_left_origin(page_height=page.size.height * scale)
+                )
+
+                cropped_im = page.image.crop(crop_bbox.as_tuple())
+                element.image = ImageRef.from_pil(cropped_im, dpi=int(72 * scale))
+
+    def _convert_page(self, conv_res: ConversionResult, page: Page) -> DoclingDocument:
+        """Convert the VLM response of a single page into a one-page document.
+
+        Used by `ThreadedVlmPipeline`, which concatenates the page documents.
+        """
+        response_format = self._get_response_format()
+        if response_format == ResponseFormat.DOCTAGS:
+            page_doc = self._turn_page_dt_into_doc(page)
+        elif response_format == ResponseFormat.DEEPSEEKOCR_MARKDOWN:
+            page_doc = self._parse_deepseekocr_page(conv_res, page, page_no=1)
+            self._add_page_metadata(page_doc, page, page_no=1)
+        elif response_format == ResponseFormat.MARKDOWN:
+            page_doc = self._convert_page_text_with_backend(
+                conv_res, page, 1, InputFormat.MD, MarkdownDocumentBackend
+            )
+            self._add_page_metadata(page_doc, page, page_no=1)
+        elif response_format == ResponseFormat.HTML:
+            page_doc = self._convert_page_text_with_backend(
+                conv_res, page, 1, InputFormat.HTML, HTMLDocumentBackend
+            )
+            self._add_page_metadata(page_doc, page, page_no=1)
+        else:
+            raise RuntimeError(f"Unsupported VLM response format {response_format}")
+
+        if self.pipeline_options.generate_picture_images:
+            self._generate_picture_images(page_doc, {1: page})
+        return page_doc
+
     def _turn_dt_into_doc(self, conv_res) -> DoclingDocument:
+        conv_res.document = self._load_doctags_pages(conv_res.pages)
+        return conv_res.document
+
+    def _turn_page_dt_into_doc(self, page: Page) -> DoclingDocument:
+        return self._load_doctags_pages([page])
+
+    def _load_doctags_pages(self, pages: Sequence[Page]) -> DoclingDocument:
+        """Load the DocTags responses of *pages* into a document paged from 1."""
         doctags_list = []
         image_list = []
-        for page in conv_res.pages:
+        for page in pages:
             predicted_doctags = ""
             img = PILImage.new("RGB", (1, 1), "rgb(255,255,255)")
             if page.predictions.vlm_response:
@@ -286,27 +353,27 @@ class VlmPipeline(PaginatedPipeline):
         doctags_doc = DocTagsDocument.from_doctags_and_image_pairs(
             doctags_list_c, image_list_c
         )
-        conv_res.document = DoclingDocument.load_from_doctags(
-            doctag_document=doctags_doc
-        )
+        document = DoclingDocument.load_from_doctags(doctag_document=doctags_doc)
 
         # If forced backend text, replace model predicted text with backend one
-        if page.size:
-            if self.force_backend_text:
-                scale = self.pipeline_options.images_scale
-                for element, _level in conv_res.document.iterate_items():
-                    if not isinstance(element, TextItem) or len(element.prov) == 0:
-                        continue
-                    crop_bbox = (
-                        element.prov[0]
-                        .bbox.scaled(scale=scale)
-                        .to_top_left_origin(page_height=page.size.height * scale)
-                    )
-                    txt = self.extract_text_from_backend(page, crop_bbox)
-                    element.text = txt
-                    element.orig = txt
+        if self.force_backend_text:
+            scale = self.pipeline_options.images_scale
+            for element, _level in document.iterate_items():
+                if not isinstance(element, TextItem) or len(element.prov) == 0:
+                    continue
+                page = pages[element.prov[0].page_no - 1]
+                if not page.size:
+                    continue
+                crop_bbox = (
+                    element.prov[0]
+                    .bbox.scaled(scale=scale)
+                    .to_top_left_origin(page_height=page.size.height * scale)
+                )
+                txt = self.extract_text_from_backend(page, crop_bbox)
+                element.text = txt
+                element.orig = txt
 
-        return conv_res.document
+        return document
 
     def _parse_deepseekocr_markdown(
         self, conv_res: ConversionResult
@@ -323,29 +390,33 @@ class VlmPipeline(PaginatedPipeline):
         - figure_caption: Titles or descriptions for figures/images
         - header / footer: Content at top or bottom margins of pages
         """
-        page_docs = []
-
-        for pg_idx, page in enumerate(conv_res.pages):
-            predicted_text = ""
-            if page.predictions.vlm_response:
-                predicted_text = page.predictions.vlm_response.text
-
-            assert page.size is not None
-
-            # Parse single page using the utility function
-            # Pass vlm_options.scale to convert bboxes from scaled image coords to original PDF coords
-            page_doc = parse_deepseekocr_markdown(
-                content=predicted_text,
-                original_page_size=page.size,
-                page_no=pg_idx + 1,
-                filename=conv_res.input.file.name or "file",
-                page_image=page.image,
-            )
-            page_docs.append(page_doc)
+        page_docs = [
+            self._parse_deepseekocr_page(conv_res, page, page_no=pg_idx + 1)
+            for pg_idx, page in enumerate(conv_res.pages)
+        ]
 
         # Add page metadata and concatenate
         return self._add_page_metadata_and_concatenate(page_docs, conv_res)
 
+    def _parse_deepseekocr_page(
+        self, conv_res: ConversionResult, page: Page, page_no: int
+    ) -> DoclingDocument:
+        predicted_text = ""
+        if page.predictions.vlm_response:
+            predicted_text = page.predictions.vlm_response.text
+
+        assert page.size is not None
+
+        # Parse single page using the utility function
+        # Pass vlm_options.scale to convert bboxes from scaled image coords to original PDF coords
+        return parse_deepseekocr_markdown(
+            content=predicted_text,
+            original_page_size=page.size,
+            page_no=page_no,
+            filename=conv_res.input.file.name or "file",
+            page_image=page.image,
+        )
+
     def _extract_code_block(self, text: str) -> str:
         """
         Extracts text from markdown code blocks (enclosed in triple backticks).
@@ -388,24 +459,27 @@ class VlmPipeline(PaginatedPipeline):
         """
         for pg_idx, (page_doc, page) in enumerate(zip(page_docs, conv_res.pages)):
             # Add page metadata to the page document before concatenation
-            if page.image is not None:
-                pg_width = page.image.width
-                pg_height = page.image.height
-            else:
-                pg_width = 1
-                pg_height = 1
-
-            page_doc.add_page(
-                page_no=pg_idx + 1,
-                size=Size(width=pg_width, height=pg_height),
-                image=ImageRef.from_pil(image=page.image, dpi=72)
-                if page.image
-                else None,
-            )
+            self._add_page_metadata(page_doc, page, page_no=pg_idx + 1)
 
         # Concatenate all page documents to preserve hierarchy
         return DoclingDocument.concatenate(docs=page_docs)
 
+    def _add_page_metadata(
+        self, page_doc: DoclingDocument, page: Page, page_no: int
+    ) -> None:
+        if page.image is not None:
+            pg_width = page.image.width
+            pg_height = page.image.height
+        else:
+            pg_width = 1
+            pg_height = 1
+
+        page_doc.add_page(
+            page_no=page_no,
+            size=Size(width=pg_width, height=pg_height),
+            image=ImageRef.from_pil(image=page.image, dpi=72) if page.image else None,
+        )
+
     def _convert_text_with_backend(
         self,
         conv_res: ConversionResult,
@@ -423,52 +497,64 @@ class VlmPipeline(PaginatedPipeline):
         Returns:
             DoclingDocument: The assembled document
         """
-        page_docs = []
-
-        for pg_idx, page in enumerate(conv_res.pages):
-            predicted_text = ""
-            if page.predictions.vlm_response:
-                predicted_text = page.predictions.vlm_response.text + "\n\n"
-
-            # Extract content from code blocks if present
-            predicted_text = self._extract_code_block(text=predicted_text)
-
-            # Convert text to document using specified backend
-            response_bytes = BytesIO(predicted_text.encode("utf8"))
-            out_doc = InputDocument(
-                path_or_stream=response_bytes,
-                filename=conv_res.input.file.name,
-                format=input_format,
-                backend=backend_class,
-            )
-            backend = backend_class(
-                in_doc=out_doc,
-                path_or_stream=response_bytes,
+        page_docs = [
+            self._convert_page_text_with_backend(
+                conv_res, page, pg_idx + 1, input_format, backend_class
             )
-            page_doc = backend.convert()
-
-            # Modify provenance in place for all items in the page document
-            for item, level in page_doc.iterate_items(
-                with_groups=True,
-                traverse_pictures=True,
-                included_content_layers=set(ContentLayer),
-            ):
-                if isinstance(item, DocItem):
-                    item.prov = [
-                        ProvenanceItem(
-                            page_no=pg_idx + 1,
-                            bbox=BoundingBox(
-                                t=0.0, b=0.0, l=0.0, r=0.0
-                            ),  # FIXME: would be nice not to have to "fake" it
-                            charspan=[0, 0],
-                        )
-                    ]
-
-            page_docs.append(page_doc)
+            for pg_idx, page in enumerate(conv_res.pages)
+        ]
 
         # Add page metadata and concatenate
         return self._add_page_metadata_and_concatenate(page_docs, conv_res)
 
+    def _convert_page_text_with_backend(
+        self,
+        conv_res: ConversionResult,
+        page: Page,
+        page_no: int,
+        input_format: InputFormat,
+        backend_class: type[DeclarativeDocumentBackend],
+    ) -> DoclingDocument:
+        predicted_text = ""
+        if page.predictions.vlm_response:
+            predicted_text = page.predictions.vlm_response.text + "\n\n"
+
+        # Extract content from code blocks if present
+        predicted_text = self._extract_code_block(text=predicted_text)
+
+        # Convert text to document using specified backend
+        response_bytes = BytesIO(predicted_text.encode("utf8"))
+        out_doc = InputDocument(
+            path_or_stream=response_bytes,
+            filename=conv_res.input.file.name,
+            format=input_format,
+            backend=backend_class,
+        )
+        backend = backend_class(
+            in_doc=out_doc,
+            path_or_stream=response_bytes,
+        )
+        page_doc = backend.convert()
+
+        # Modify provenance in place for all items in the page document
+        for item, level in page_doc.iterate_items(
+            with_groups=True,
+            traverse_pictures=True,
+            included_content_layers=set(ContentLayer),
+        ):
+            if isinstance(item, DocItem):
+                item.prov = [
+                    ProvenanceItem(
+                        page_no=page_no,
+                        bbox=BoundingBox(
+                            t=0.0, b=0.0, l=0.0, r=0.0
+                        ),  # FIXME: would be nice not to have to "fake" it
+                        charspan=[0, 0],
+                    )
+                ]
+
+        return page_doc
+
     @classmethod
     def get_default_options(cls) -> VlmPipelineOptions:
         return VlmPipelineOptions()
@@ -0,0 +1,174 @@
+"""Length-aware batch forming and adaptive batch sizing.
+
+Generative models decode a padded batch until its longest sequence is done, so a
+nearly blank page batched with a dense one costs as many decoding steps as two
+dense pages. Grouping pages of similar expected output length reduces this waste.
+The expected length is estimated cheaply from the ink density of the page image.
+
+The best batch size of a model depends on the device, the page size and the model
+itself. `AdaptiveBatchSizer` searches it at runtime from the measured latency per item.
+"""
+
+import logging
+import os
+import sys
+from collections.abc import Sequence
+from typing import Callable, Optional
+
+from PIL.Image import Image
+
+_log = logging.getLogger(__name__)
+
+# Thumbnail edge length used to measure the ink density
+_THUMBNAIL_SIZE = 128
+# Gray levels below this threshold count as ink
+_INK_THRESHOLD = 160
+
+
+def ink_density(image: Image) -> float:
+    """Return the fraction of dark pixels of *image*, a proxy of its amount of text."""
+    factor = max(1, max(image.size) // _THUMBNAIL_SIZE)
+    thumbnail = image.reduce(factor).convert("L")
+    histogram = thumbnail.histogram()
+    return sum(histogram[:_INK_THRESHOLD]) / (thumbnail.width * thumbnail.height)
+
+
+def length_sorted_batches(lengths: Sequence[float], batch_size: int) -> list[list[int]]:
+    """Split the indices of *lengths* into batches of items with similar lengths.
+
+    Args:
+        lengths: Expected output length (or any monotonic proxy) of each item
+        batch_size: Maximum number of items per batch
+
+    Returns:
+        Batches of indices into *lengths*, from the shortest items to the longest
+    """
+    order = sorted(range(len(lengths)), key=lambda ix: lengths[ix])
+    return [order[ix : ix + batch_size] for ix in range(0, len(order), batch_size)]
+
+
+def free_memory_fraction() -> Optional[float]:
+    """Return the free fraction of the CUDA memory if torch uses it, else of the host.
+
+    Returns None when the free memory cannot be measured on this platform.
+    """
+    torch = sys.modules.get("torch")  # only probe CUDA if a model already uses torch
+    if torch is not None and torch.cuda.is_available() and torch.cuda.is_initialized():
+        free, total = torch.cuda.mem_get_info()
+        return free / total
+    try:
+        with open("/proc/meminfo") as meminfo:
+            values = {
+                key: int(value.split()[0])
+                for key, value in (line.split(":", 1) for line in meminfo)
+            }
+        return values["MemAvailable"] / values["MemTotal"]
+    except (OSError, KeyError, ValueError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") / os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class AdaptiveBatchSizer:
+    """Batch size of a pipeline stage, adapted to the measured latency per item.
+
+    The size doubles after full batches while items are waiting in the input queue
+    and the latency per item does not get worse than at the previous size by more
+    than *tolerance*. It falls back to the previous size when it does, and halves
+    when the free memory drops below *min_free_memory*. The size where the latency
+    or the memory stopped the growth becomes the upper bound, until
+    *recovery_batches* batches in a row had enough free memory and no latency
+    regression. The configured *max_size* is then allowed again, so a transient
+    memory dip or a noisy latency sample does not cap a long-lived stage for good.
+
+    Not thread-safe, each stage thread owns its sizer.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        max_size: int,
+        min_size: int = 1,
+        min_free_memory: float = 0.1,
+        tolerance: float = 0.1,
+        memory_probe: Callable[[], Optional[float]] = free_memory_fraction,
+        recovery_batches: int = 50,
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.recovery_batches = recovery_batches
+        self._configured_max_size = self.max_size
+        self._healthy_batches = 0  # batches since the upper bound was lowered
+        self.min_free_memory = min_free_memory
+        self.tolerance = tolerance
+        self._memory_probe = memory_probe
+        self._size = min(max(initial_size, self.min_size), self.max_size)
+        self._smaller: dict[int, int] = {}  # size -> size it was grown from
+        self._latency: dict[int, float] = {}  # size -> EMA of the latency per item
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def update(self, num_items: int, elapsed: float, queue_depth: int) -> int:
+        """Record a batch of *num_items* processed in *elapsed* seconds.
+
+        Args:
+            num_items: Number of items of the batch
+            elapsed: Processing time of the batch in seconds
+            queue_depth: Number of items waiting in the input queue
+
+        Returns:
+            The batch size for the next batch
+        """
+        if num_items <= 0:
+            return self._size
+        size = self._size
+
+        free_memory = self._memory_probe()
+        if free_memory is not None and free_memory < self.min_free_memory:
+            self._set_size(max(size // 2, self.min_size), cap=True)
+            return self._size
+        if self.max_size < self._configured_max_size:
+            self._healthy_batches += 1
+            if self._healthy_batches >= self.recovery_batches:
+                self._relax_cap()
+
+        # Only full batches measure the latency of the current size
+        if num_items < size:
+            return size
+        latency = elapsed / num_items
+        previous = self._latency.get(size)
+        self._latency[size] = (
+            latency if previous is None else 0.5 * previous + 0.5 * latency
+        )
+
+        smaller = self._smaller.get(size)
+        if smaller is not None and self._latency[size] > self._latency[smaller] * (
+            1 + self.tolerance
+        ):
+            self._set_size(smaller, cap=True)
+        elif queue_depth >= size and size < self.max_size:
+            grown = min(size * 2, self.max_size)
+            self._smaller[grown] = size
+            self._set_size(grown)
+        return self._size
+
+    def _relax_cap(self) -> None:
+        _log.debug(
+            "Batch size bound %d -> %d", self.max_size, self._configured_max_size
+        )
+        self.max_size = self._configured_max_size
+        # The latency of the larger sizes is measured again
+        for size in [s for s in self._latency if s > self._size]:
+            del self._latency[size]
+
+    def _set_size(self, size: int, cap: bool = False) -> None:
+        if cap:
+            self.max_size = size
+            self._healthy_batches = 0
+        if size != self._size:
+            _log.debug("Batch size %d -> %d", self._size, size)
+        self._size = size
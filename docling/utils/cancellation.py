@@ -0,0 +1,76 @@
+"""Cooperative cancellation of document conversions.
+
+Each `ConversionResult` carries a `CancellationToken`, armed by the pipelines with the
+`document_timeout` deadline. The page models, OCR engines and VLM engines check it
+during their long operations and raise `ConversionCancelledError`, so that a timed-out
+conversion stops using CPU, GPU and locks instead of finishing in an abandoned thread.
+"""
+
+import threading
+import time
+from typing import Optional, overload
+
+from docling.exceptions import ConversionCancelledError
+
+
+class CancellationToken:
+    """Cancellation flag with an optional deadline, safe to share between threads."""
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self._event = threading.Event()
+        self._reason = "conversion cancelled"
+        self._deadline: Optional[float] = None
+        self.set_timeout(timeout)
+
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        """Cancel the token *timeout* seconds from now, None removes the deadline."""
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+
+    def cancel(self, reason: str = "conversion cancelled") -> None:
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if (
+            not self._event.is_set()
+            and self._deadline is not None
+            and time.monotonic() >= self._deadline
+        ):
+            self.cancel("document timeout exceeded")
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason if self.cancelled else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without deadline."""
+        if self._event.is_set():
+            return 0.0
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    @overload
+    def timeout(self, timeout: float) -> float: ...
+
+    @overload
+    def timeout(self, timeout: None = None) -> Optional[float]: ...
+
+    def timeout(self, timeout: Optional[float] = None) -> Optional[float]:
+        """Return *timeout* shortened to the remaining time, for blocking calls."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise ConversionCancelledError(self._reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to *timeout* seconds for the cancellation, return whether it happened."""
+        self._event.wait(self.timeout(timeout))
+        return self.cancelled
@@ -0,0 +1,131 @@
+"""Generation of page, picture and table images for the output document.
+
+Cropping is cheap, but encoding every crop as PNG is not: catalogs with thousands
+of figures spend most of their assembly time in `ImageRef.from_pil`. The encoding
+releases the GIL, so it runs in worker threads here, while the main thread walks
+the pages in order and loads each page image once.
+"""
+
+import logging
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+from docling_core.types.doc import FloatingItem, ImageRef, PageItem, Size
+from PIL import Image
+
+from docling.datamodel.document import ConversionResult
+
+_log = logging.getLogger(__name__)
+
+
+def _encode_image(
+    image: Image.Image,
+    dpi: int,
+    crop: Optional[tuple[float, float, float, float]] = None,
+    path: Optional[Path] = None,
+) -> ImageRef:
+    if crop is not None:
+        image = image.crop(crop)
+    if path is None:
+        return ImageRef.from_pil(image, dpi=dpi)
+
+    image.save(path, format="PNG")
+    return ImageRef(
+        mimetype="image/png",
+        dpi=dpi,
+        size=Size(width=image.width, height=image.height),
+        uri=path,
+    )
+
+
+def generate_images(
+    conv_res: ConversionResult,
+    *,
+    scale: float,
+    page_images: bool,
+    element_types: tuple[type[FloatingItem], ...],
+    output_dir: Optional[Path] = None,
+    max_workers: int = 4,
+) -> None:
+    """Set the images of the pages and of the items of *element_types*.
+
+    Items are cropped from the page images at *scale*. With *output_dir*, the images
+    are written as PNG files to a subdirectory named after the document hash and
+    referenced by path instead of embedded.
+    """
+    doc = conv_res.document
+    pages = {p.page_no: p for p in conv_res.pages}
+
+    elements_by_page: dict[int, list[FloatingItem]] = defaultdict(list)
+    if element_types:
+        for element, _level in doc.iterate_items():
+            if isinstance(element, element_types) and len(element.prov) > 0:
+                elements_by_page[element.prov[0].page_no].append(element)
+
+    page_nos = sorted(set(pages) if page_images else set(elements_by_page))
+    if output_dir is not None:
+        # One directory per document: inputs sharing a file name must not clash
+        output_dir = output_dir / conv_res.input.document_hash
+        output_dir.mkdir(parents=True, exist_ok=True)
+    stem = conv_res.input.file.stem
+    dpi = int(72 * scale)
+
+    def _path(name: str) -> Optional[Path]:
+        return output_dir / f"{stem}_{name}.png" if output_dir is not None else None
+
+    # Bound the page images and crops waiting for a worker
+    max_pending = 4 * max_workers
+    pending: deque[tuple[Union[FloatingItem, PageItem], Future[ImageRef]]] = deque()
+
+    def _resolve(num_pending: int) -> None:
+        while len(pending) > num_pending:
+            target, future = pending.popleft()
+            target.image = future.result()
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="image-encode"
+    ) as pool:
+        for page_no in page_nos:
+            page = pages.get(page_no)
+            if page is None:
+                continue
+            assert page.size is not None
+            page_image = page.image
+            assert page_image is not None
+
+            if page_images:
+                pending.append(
+                    (
+                        doc.pages[page_no],
+                        pool.submit(
+                            _encode_image,
+                            page_image,
+                            dpi,
+                            path=_path(f"page_{page_no}"),
+                        ),
+                    )
+                )
+            for element in elements_by_page.get(page_no, []):
+                crop_bbox = (
+                    element.prov[0]
+                    .bbox.scaled(scale=scale)
+                    .to_top_left_origin(page_height=page.size.height * scale)
+                )
+                # e.g. "#/pictures/3" -> "pictures_3"
+                name = "_".join(element.self_ref.split("/")[1:])
+                pending.append(
+                    (
+                        element,
+                        pool.submit(
+                            _encode_image,
+                            page_image,
+                            dpi,
+                            crop=crop_bbox.as_tuple(),
+                            path=_path(name),
+                        ),
+                    )
+                )
+            _resolve(max_pending)
+        _resolve(0)
@@ -3,7 +3,8 @@ import logging
 import sys
 from collections import defaultdict
 
-from docling_core.types.doc import DocItemLabel, Size
+import numpy as np
+from docling_core.types.doc import CoordOrigin, DocItemLabel, Size
 from docling_core.types.doc.page import TextCell
 from rtree import index
 
@@ -13,6 +14,64 @@ from docling.datamodel.pipeline_options import LayoutOptions
 _log = logging.getLogger(__name__)
 
 
+def _cell_boxes(cells: list[TextCell]) -> np.ndarray:
+    """Bounding boxes of the cells as a (N, 4) array of l, t, r, b.
+
+    Same values as ``cell.rect.to_bounding_box()``, without creating a pydantic
+    model per cell.
+    """
+    if not cells:
+        return np.zeros((0, 4))
+    corners = np.array(
+        [
+            (r.r_x0, r.r_x1, r.r_x2, r.r_x3, r.r_y0, r.r_y1, r.r_y2, r.r_y3)
+            for r in (cell.rect for cell in cells)
+        ],
+        dtype=np.float64,
+    )
+    xs, ys = corners[:, :4], corners[:, 4:]
+    bottom_left = np.array(
+        [cell.rect.coord_origin == CoordOrigin.BOTTOMLEFT for cell in cells]
+    )
+    return np.stack(
+        [
+            xs.min(axis=1),
+            np.where(bottom_left, ys.max(axis=1), ys.min(axis=1)),
+            xs.max(axis=1),
+            np.where(bottom_left, ys.min(axis=1), ys.max(axis=1)),
+        ],
+        axis=1,
+    )
+
+
+def _intersection_over_self(
+    boxes: np.ndarray, others: np.ndarray, coord_origin: CoordOrigin
+) -> np.ndarray:
+    """(N, M) matrix of `BoundingBox.intersection_over_self` for l, t, r, b rows.
+
+    Boxes with an empty area get -inf, so they never pass an overlap threshold.
+    """
+    left = np.maximum(boxes[:, None, 0], others[None, :, 0])
+    right = np.minimum(boxes[:, None, 2], others[None, :, 2])
+    if coord_origin == CoordOrigin.TOPLEFT:
+        bottom = np.maximum(boxes[:, None, 1], others[None, :, 1])
+        top = np.minimum(boxes[:, None, 3], others[None, :, 3])
+    else:
+        top = np.minimum(boxes[:, None, 1], others[None, :, 1])
+        bottom = np.maximum(boxes[:, None, 3], others[None, :, 3])
+    width = right - left
+    height = top - bottom
+    intersection = np.where((width > 0) & (height > 0), width * height, 0.0)
+
+    area = np.abs(boxes[:, 2] - boxes[:, 0]) * np.abs(boxes[:, 3] - boxes[:, 1])
+    return np.divide(
+        intersection,
+        area[:, None],
+        out=np.full(intersection.shape, -np.inf),
+        where=area[:, None] > 0,
+    )
+
+
 class UnionFind:
     """Efficient Union-Find data structure for grouping elements."""
 
@@ -588,26 +647,28 @@ class LayoutPostprocessor:
         for cluster in clusters:
             cluster.cells = []
 
-        for cell in self.cells:
-            if not cell.text.strip():
-                continue
-
-            best_overlap = min_overlap
-            best_cluster = None
-
-            for cluster in clusters:
-                if cell.rect.to_bounding_box().area() <= 0:
-                    continue
+        cells = [cell for cell in self.cells if cell.text.strip()]
+        if cells and clusters:
+            coord_origins = {c.bbox.coord_origin for c in clusters}
+            coord_origins.update(cell.rect.coord_origin for cell in cells)
+            if len(coord_origins) > 1:
+                raise ValueError("BoundingBoxes have different CoordOrigin")
 
-                overlap_ratio = cell.rect.to_bounding_box().intersection_over_self(
-                    cluster.bbox
-                )
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_cluster = cluster
-
-            if best_cluster is not None:
-                best_cluster.cells.append(cell)
+            cluster_boxes = np.array(
+                [(c.bbox.l, c.bbox.t, c.bbox.r, c.bbox.b) for c in clusters],
+                dtype=np.float64,
+            )
+            overlaps = _intersection_over_self(
+                _cell_boxes(cells), cluster_boxes, coord_origins.pop()
+            )
+            # argmax picks the first of equal overlaps, like a strict ">" scan
+            best = overlaps.argmax(axis=1)
+            best_overlaps = overlaps[np.arange(len(cells)), best]
+            for cell, cluster_ix, overlap in zip(
+                cells, best.tolist(), best_overlaps.tolist()
+            ):
+                if overlap > min_overlap:
+                    clusters[cluster_ix].cells.append(cell)
 
         # Deduplicate cells in each cluster after assignment
         for cluster in clusters:
@@ -630,12 +691,10 @@ class LayoutPostprocessor:
             if not cluster.cells:
                 continue
 
-            cells_bbox = BoundingBox(
-                l=min(cell.rect.to_bounding_box().l for cell in cluster.cells),
-                t=min(cell.rect.to_bounding_box().t for cell in cluster.cells),
-                r=max(cell.rect.to_bounding_box().r for cell in cluster.cells),
-                b=max(cell.rect.to_bounding_box().b for cell in cluster.cells),
-            )
+            boxes = _cell_boxes(cluster.cells)
+            left, top = boxes[:, :2].min(axis=0).tolist()
+            right, bottom = boxes[:, 2:].max(axis=0).tolist()
+            cells_bbox = BoundingBox(l=left, t=top, r=right, b=bottom)
 
             if cluster.label == DocItemLabel.TABLE:
                 # For tables, take union of current bbox and cells bbox
@@ -1,3 +1,5 @@
+import threading
+from collections import Counter, OrderedDict
 from typing import Optional, Tuple
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -67,3 +69,55 @@ def tesseract_box_to_bounding_rectangle(
             rect.r_y2 += original_offset.t
             rect.r_y3 += original_offset.t
     return rect
+
+
+class DocumentOsdCache:
+    """Per-document cache of the Tesseract orientation and script detection (OSD).
+
+    The OSD results of the first ``sample_pages`` pages of a document are collected,
+    then the most frequent orientation and script are reused for all remaining OCR
+    rectangles of the same document. Only the most recent ``max_documents`` documents
+    are tracked.
+    """
+
+    def __init__(self, sample_pages: int, max_documents: int = 64):
+        self.sample_pages = sample_pages
+        self.max_documents = max_documents
+        self._samples: OrderedDict[str, dict[int, Tuple[int, Optional[str]]]] = (
+            OrderedDict()
+        )
+        self._decisions: OrderedDict[str, Tuple[int, Optional[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, doc_key: str) -> Optional[Tuple[int, Optional[str]]]:
+        """Return the cached ``(orientation, script)`` or None while still sampling."""
+        with self._lock:
+            decision = self._decisions.get(doc_key)
+            if decision is not None:
+                self._decisions.move_to_end(doc_key)
+            return decision
+
+    def add_sample(
+        self, doc_key: str, page_no: int, orientation: int, script: Optional[str]
+    ) -> None:
+        """Record the OSD result of a page; only the first result per page counts."""
+        with self._lock:
+            if doc_key in self._decisions:
+                return
+            samples = self._samples.setdefault(doc_key, {})
+            self._samples.move_to_end(doc_key)
+            samples.setdefault(page_no, (orientation, script))
+
+            if len(samples) >= self.sample_pages:
+                orientations = Counter(o for o, _ in samples.values())
+                scripts = Counter(s for _, s in samples.values() if s is not None)
+                self._decisions[doc_key] = (
+                    orientations.most_common(1)[0][0],
+                    scripts.most_common(1)[0][0] if scripts else None,
+                )
+                del self._samples[doc_key]
+
+            while len(self._samples) > self.max_documents:
+                self._samples.popitem(last=False)
+            while len(self._decisions) > self.max_documents:
+                self._decisions.popitem(last=False)
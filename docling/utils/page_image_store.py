@@ -0,0 +1,63 @@
+"""On-disk store for the images of finished pages.
+
+When page images are kept for the output (`generate_page_images`,
+`generate_picture_images`), every page holds its rendered images until the document
+is assembled, so the memory of a conversion grows with the document length.
+`PageImageStore` moves the images of finished pages to a temporary directory;
+`Page.get_image` loads them back on demand, without caching them again.
+"""
+
+import logging
+import shutil
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+_log = logging.getLogger(__name__)
+
+
+class PageImageStore:
+    """Temporary directory of page images, keyed by page number and scale.
+
+    The directory is removed when the store is garbage collected, i.e. once no page
+    refers to it anymore, or at interpreter exit.
+    """
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self.directory = Path(tempfile.mkdtemp(prefix="docling-pages-", dir=directory))
+        self._paths: dict[tuple[int, float], Path] = {}
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+
+    def put(self, page_no: int, scale: float, image: Image.Image) -> None:
+        path = self.directory / f"page_{page_no:05}_{scale:g}.png"
+        # Favour speed over size, the files only live for the conversion
+        image.save(path, format="png", compress_level=1)
+        with self._lock:
+            self._paths[(page_no, scale)] = path
+
+    def get(self, page_no: int, scale: float) -> Optional[Image.Image]:
+        with self._lock:
+            path = self._paths.get((page_no, scale))
+        if path is None:
+            return None
+        with Image.open(path) as image:
+            image.load()
+            return image
+
+    def spill(self, page_no: int, images: dict[float, Image.Image]) -> None:
+        """Store all cached images of a page."""
+        for scale, image in images.items():
+            self.put(page_no, scale, image)
+
+    def close(self) -> None:
+        """Remove the stored images right away."""
+        with self._lock:
+            self._paths.clear()
+        self._finalizer()
@@ -0,0 +1,220 @@
+"""Bounded cache of initialized pipelines.
+
+Converters keep one initialized pipeline per (pipeline class, options hash). In a
+long-running service accepting per-request options this cache grows with every new
+combination, together with the models each pipeline holds. `PipelineCache` bounds
+it by count, idle time and estimated model memory, evicting least-recently-used
+pipelines first.
+"""
+
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, MutableMapping
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from docling.datamodel.settings import settings
+from docling.models.utils.model_registry import estimate_model_bytes
+
+_log = logging.getLogger(__name__)
+
+_K = TypeVar("_K", bound=Hashable)
+_P = TypeVar("_P")
+
+# Pipeline -> build_pipe list -> model -> predictor -> torch module
+_PIPELINE_SIZE_DEPTH = 5
+
+
+@dataclass
+class PipelineCacheStats:
+    """Counters of a `PipelineCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    size_bytes: int = 0
+
+
+@dataclass
+class _CacheEntry(Generic[_P]):
+    pipeline: _P
+    size_bytes: int
+    last_used: float
+
+
+class PipelineCache(MutableMapping[_K, _P]):
+    """LRU cache of initialized pipelines bounded by count, TTL and memory.
+
+    Limits which are not given fall back to ``settings.perf.pipeline_cache_max_size``,
+    ``settings.perf.pipeline_cache_ttl`` and ``settings.perf.pipeline_cache_max_bytes``;
+    ``None`` means unbounded. The pipeline requested last is never evicted, even if it
+    alone exceeds the memory budget.
+
+    Evicted pipelines are dropped and garbage collected right away, so that their
+    models (or their references to shared models) are released deterministically.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[_K, _CacheEntry[_P]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = PipelineCacheStats()
+
+    @property
+    def max_size(self) -> Optional[int]:
+        if self._max_size is not None:
+            return self._max_size
+        return settings.perf.pipeline_cache_max_size
+
+    @property
+    def ttl(self) -> Optional[float]:
+        if self._ttl is not None:
+            return self._ttl
+        return settings.perf.pipeline_cache_ttl
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return settings.perf.pipeline_cache_max_bytes
+
+    def get_or_create(self, key: _K, factory: Callable[[], _P]) -> _P:
+        """Return the pipeline cached under *key*, creating it on a miss."""
+        with self._lock:
+            evicted = self._evict_expired_locked()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._stats.hits += 1
+                self._touch(key, entry)
+                pipeline = entry.pipeline
+            else:
+                self._stats.misses += 1
+                pipeline = factory()
+                self._insert(key, pipeline)
+                evicted.extend(self._evict_over_limits_locked(keep=key))
+        self._release(evicted)
+        return pipeline
+
+    def evict_expired(self) -> int:
+        """Evict pipelines unused for longer than the TTL.
+
+        Returns the number of evicted pipelines.
+        """
+        with self._lock:
+            evicted = self._evict_expired_locked()
+        num_evicted = len(evicted)
+        self._release(evicted)
+        return num_evicted
+
+    def stats(self) -> PipelineCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return PipelineCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries),
+                size_bytes=sum(e.size_bytes for e in self._entries.values()),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            evicted = [e.pipeline for e in self._entries.values()]
+            self._entries.clear()
+        self._release(evicted)
+
+    def __getitem__(self, key: _K) -> _P:
+        with self._lock:
+            entry = self._entries[key]
+            self._touch(key, entry)
+            return entry.pipeline
+
+    def __setitem__(self, key: _K, pipeline: _P) -> None:
+        with self._lock:
+            self._insert(key, pipeline)
+            evicted = self._evict_over_limits_locked(keep=key)
+        self._release(evicted)
+
+    def __delitem__(self, key: _K) -> None:
+        with self._lock:
+            entry = self._entries.pop(key)
+        self._release([entry.pipeline])
+
+    def __iter__(self) -> Iterator[_K]:
+        with self._lock:
+            return iter(list(self._entries.keys()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _touch(self, key: _K, entry: _CacheEntry[_P]) -> None:
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(key)
+
+    def _insert(self, key: _K, pipeline: _P) -> None:
+        self._entries[key] = _CacheEntry(
+            pipeline=pipeline,
+            size_bytes=estimate_model_bytes(pipeline, max_depth=_PIPELINE_SIZE_DEPTH),
+            last_used=time.monotonic(),
+        )
+        self._entries.move_to_end(key)
+
+    def _pop_locked(self, key: _K, reason: str) -> Any:
+        _log.info(f"Evicting cached pipeline {key} ({reason})")
+        self._stats.evictions += 1
+        return self._entries.pop(key).pipeline
+
+    def _evict_expired_locked(self) -> list[Any]:
+        ttl = self.ttl
+        if ttl is None:
+            return []
+        now = time.monotonic()
+        return [
+            self._pop_locked(key, "expired")
+            for key, entry in list(self._entries.items())
+            if now - entry.last_used > ttl
+        ]
+
+    def _evict_over_limits_locked(self, keep: _K) -> list[Any]:
+        evicted: list[Any] = []
+        max_size = self.max_size
+        max_bytes = self.max_bytes
+        size_bytes = sum(e.size_bytes for e in self._entries.values())
+        for key in list(self._entries.keys()):  # least recently used first
+            over_size = max_size is not None and len(self._entries) > max_size
+            over_bytes = max_bytes is not None and size_bytes > max_bytes
+            if not (over_size or over_bytes):
+                break
+            if key == keep:
+                continue
+            size_bytes -= self._entries[key].size_bytes
+            evicted.append(
+                self._pop_locked(key, "max size" if over_size else "memory budget")
+            )
+        return evicted
+
+    @staticmethod
+    def _release(evicted: list[Any]) -> None:
+        if not evicted:
+            return
+        evicted.clear()
+        # Collect now, so models (and registry references) go away with the pipeline
+        gc.collect()
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
@@ -1,7 +1,8 @@
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, Iterable, List
 
 import numpy as np
 from pydantic import BaseModel
@@ -22,6 +23,8 @@ class ProfilingItem(BaseModel):
     count: int = 0
     times: List[float] = []
     start_timestamps: List[datetime] = []
+    # Batch size of each recorded batch, for the batches of the pipeline stages
+    batch_sizes: List[int] = []
 
     def total(self) -> float:
         return np.sum(self.times)  # type: ignore
@@ -63,3 +66,41 @@ class TimeRecorder:
             elapsed = time.monotonic() - self.start
             self.conv_res.timings[self.key].times.append(elapsed)
             self.conv_res.timings[self.key].count += 1
+
+
+def record_batch(
+    conv_res: "ConversionResult", key: str, batch_size: int, elapsed: float
+) -> None:
+    """Record the processing time and the batch size of a pipeline stage batch."""
+    if settings.debug.profile_pipeline_timings:
+        if key not in conv_res.timings.keys():
+            conv_res.timings[key] = ProfilingItem(scope=ProfilingScope.PAGE)
+        item = conv_res.timings[key]
+        item.start_timestamps.append(datetime.utcnow() - timedelta(seconds=elapsed))
+        item.times.append(elapsed)
+        item.batch_sizes.append(batch_size)
+        item.count += 1
+
+
+_merge_lock = threading.Lock()
+
+
+def merge_timings(
+    timings: Dict[str, ProfilingItem], targets: Iterable["ConversionResult"]
+) -> None:
+    """Add *timings*, recorded once for several documents, to each of *targets*.
+
+    Only the keys of *timings* are touched: the timings of the documents may be
+    recorded concurrently by other threads.
+    """
+    if not settings.debug.profile_pipeline_timings:
+        return
+    with _merge_lock:
+        for target in targets:
+            for key, item in timings.items():
+                target_item = target.timings.setdefault(
+                    key, ProfilingItem(scope=item.scope)
+                )
+                target_item.times.extend(item.times)
+                target_item.start_timestamps.extend(item.start_timestamps)
+                target_item.count += item.count
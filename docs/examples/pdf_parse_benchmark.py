@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Parsing benchmark for the docling-parse v4 PDF backend.
+
+This script compares the time needed to parse all pages of PDF files when:
+1. All page content is built (text lines, words and bitmap resources)
+2. Only the content a pipeline without OCR and table structure consumes is built
+
+The pipelines declare the content they need via
+`PdfDocumentBackend.set_required_page_content()`.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add the repository root to the path so we can import docling
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.backend.pdf_backend import PdfPageContent
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+
+
+def parse_pdf(path: Path, required: Optional[set[PdfPageContent]]) -> float:
+    """Parse all pages of a PDF and return the elapsed time in seconds."""
+    in_doc = InputDocument(
+        path_or_stream=path,
+        format=InputFormat.PDF,
+        backend=DoclingParseV4DocumentBackend,
+    )
+    doc_backend = in_doc._backend
+    assert isinstance(doc_backend, DoclingParseV4DocumentBackend)
+    doc_backend.set_required_page_content(required)
+
+    start = time.perf_counter()
+    for page_no in range(doc_backend.page_count()):
+        page_backend = doc_backend.load_page(page_no)
+        page_backend.get_segmented_page()
+        page_backend.unload()
+    elapsed = time.perf_counter() - start
+
+    doc_backend.unload()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare full and selective parsing with docling-parse v4"
+    )
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=Path("tests/data/pdf"),
+        help="PDF file or directory of PDF files",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per mode (best is kept)"
+    )
+    args = parser.parse_args()
+
+    paths = sorted(args.input.glob("*.pdf")) if args.input.is_dir() else [args.input]
+    modes: dict[str, Optional[set[PdfPageContent]]] = {
+        "full": None,
+        "textlines": {PdfPageContent.TEXTLINES},
+    }
+
+    print(f"{'file':<40} {'full [s]':>10} {'textlines [s]':>14} {'speedup':>8}")
+    totals = dict.fromkeys(modes, 0.0)
+    for path in paths:
+        timings = {
+            mode: min(parse_pdf(path, required) for _ in range(args.repeat))
+            for mode, required in modes.items()
+        }
+        for mode, elapsed in timings.items():
+            totals[mode] += elapsed
+        print(
+            f"{path.name:<40} {timings['full']:>10.3f} {timings['textlines']:>14.3f}"
+            f" {timings['full'] / timings['textlines']:>7.2f}x"
+        )
+
+    print(
+        f"{'total':<40} {totals['full']:>10.3f} {totals['textlines']:>14.3f}"
+        f" {totals['full'] / totals['textlines']:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
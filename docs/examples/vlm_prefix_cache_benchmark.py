@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Prompt prefix caching benchmark for the Transformers VLM engine.
+
+Every page sent to the VLM starts with the same chat template and system prompt,
+followed by the image tokens and the instruction. This script measures the prefill
+time of the continuous batching scheduler:
+1. Without prefix caching: every prompt is prefilled from its first token
+2. With prefix caching: the KV cache of the tokens before the image is computed once
+   and reused (enabled with `TransformersVlmEngineOptions(continuous_batching=True,
+   prompt_prefix_caching=True)`)
+
+Requests generate a single token, so the time is the prefill time. It runs on CPU
+with a tiny randomly initialized Llama decoder, the language model of SmolDocling and
+Granite-Docling, so no model download is needed. The image tokens stand in for the
+image embeddings. The savings grow with the share of the prompt before the image.
+Prefixes shorter than `MIN_PREFIX_TOKENS` are prefilled with the prompt: attending
+to a cache is slower than a causal prefill, so they would not pay off. The default
+DocTags prompts put the image right after the chat role, long system prompts
+benefit the most.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import torch
+from transformers import LlamaConfig, LlamaForCausalLM
+
+# Add the repository root to the path so we can import docling
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from docling.models.inference_engines.vlm._continuous_batching import (
+    ContinuousBatchScheduler,
+    GenerationRequest,
+)
+
+IMAGE_TOKEN_ID = 2
+
+
+def make_prompts(
+    num_requests: int, prefix_tokens: int, image_tokens: int, suffix_tokens: int
+) -> list[torch.Tensor]:
+    generator = torch.Generator().manual_seed(0)
+    prefix = torch.randint(3, 1000, (1, prefix_tokens), generator=generator)
+    suffix = torch.randint(3, 1000, (1, suffix_tokens), generator=generator)
+    image = torch.full((1, image_tokens), IMAGE_TOKEN_ID)
+    return [torch.cat([prefix, image, suffix], dim=1) for _ in range(num_requests)]
+
+
+def run(model, prompts: list[torch.Tensor], prefix_caching: bool):
+    scheduler = ContinuousBatchScheduler(
+        model,
+        eos_token_ids=None,
+        max_batch_size=1,
+        image_token_id=IMAGE_TOKEN_ID if prefix_caching else None,
+        # Cache prefixes of any length, to measure where caching pays off
+        min_prefix_tokens=1,
+    )
+    start = time.perf_counter()
+    for prompt in prompts:
+        scheduler.submit(
+            GenerationRequest(
+                inputs={"input_ids": prompt, "attention_mask": torch.ones_like(prompt)},
+                max_new_tokens=1,
+            )
+        ).result()
+    elapsed = time.perf_counter() - start
+    stats = scheduler.prefix_stats()
+    scheduler.shutdown()
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the prefill savings of prompt prefix caching"
+    )
+    parser.add_argument("--requests", type=int, default=32, help="Number of pages")
+    parser.add_argument(
+        "--prefix-tokens",
+        type=int,
+        default=256,
+        help="Tokens before the image (chat template and system prompt)",
+    )
+    parser.add_argument(
+        "--image-tokens", type=int, default=320, help="Tokens of the image"
+    )
+    parser.add_argument(
+        "--suffix-tokens", type=int, default=16, help="Tokens after the image"
+    )
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=1024,
+        hidden_size=256,
+        intermediate_size=1024,
+        num_hidden_layers=4,
+        num_attention_heads=8,
+        num_key_value_heads=4,
+    )
+    model = LlamaForCausalLM(config).eval()
+    prompts = make_prompts(
+        args.requests, args.prefix_tokens, args.image_tokens, args.suffix_tokens
+    )
+
+    # Warm up both code paths
+    run(model, prompts[:2], prefix_caching=False)
+    run(model, prompts[:2], prefix_caching=True)
+
+    prompt_len = prompts[0].shape[1]
+    print(
+        f"{args.requests} prompts of {prompt_len} tokens, "
+        f"{args.prefix_tokens} before the image"
+    )
+    print(f"{'mode':<16} {'time [s]':>10} {'prefill [ms]':>14} {'reused tokens':>14}")
+    for mode, prefix_caching in (("full prefill", False), ("prefix cache", True)):
+        elapsed, stats = run(model, prompts, prefix_caching)
+        print(
+            f"{mode:<16} {elapsed:>10.2f} {1000 * elapsed / len(prompts):>14.1f} "
+            f"{stats.reused_tokens:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
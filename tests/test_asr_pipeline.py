@@ -240,10 +240,12 @@ def test_native_init_with_artifacts_path_and_device_logging(tmp_path):
     assert model.enabled is True
 
 
-def test_native_run_success_with_bytesio_builds_document(tmp_path):
+def test_native_run_success_with_bytesio_builds_document(monkeypatch, tmp_path):
     """Cover _NativeWhisperModel.run with BytesIO input and success path."""
     from io import BytesIO
 
+    import numpy as np
+
     from docling.backend.noop_backend import NoOpBackend
     from docling.datamodel.accelerator_options import (
         AcceleratorDevice,
@@ -254,8 +256,18 @@ def test_native_run_success_with_bytesio_builds_document(tmp_path):
         InferenceAsrFramework,
         InlineAsrNativeWhisperOptions,
     )
+    from docling.pipeline import asr_pipeline
     from docling.pipeline.asr_pipeline import _NativeWhisperModel
 
+    # The stream is decoded in memory instead of going through a temporary file
+    audio = np.zeros(16000, dtype=np.float32)
+    decoded = []
+    monkeypatch.setattr(
+        asr_pipeline,
+        "_decode_audio",
+        lambda source: decoded.append(source.getvalue()) or audio,
+    )
+
     # Prepare InputDocument with BytesIO
     audio_bytes = BytesIO(b"RIFF....WAVE")
     input_doc = InputDocument(
@@ -299,6 +311,8 @@ def test_native_run_success_with_bytesio_builds_document(tmp_path):
     # Status is determined later by pipeline; here we validate document content
     assert out.document is not None
     assert len(out.document.texts) >= 1
+    assert decoded == [b"RIFF....WAVE"]
+    assert model.model.transcribe.call_args.args[0] is audio
 
 
 def test_native_run_failure_sets_status(tmp_path):
@@ -402,3 +416,175 @@ def test_mlx_run_success_and_failure(tmp_path):
         model2.mlx_whisper.transcribe.side_effect = RuntimeError("fail")
         out2 = model2.run(conv_res2)
         assert out2.status.name == "FAILURE"
+
+
+def _tone_with_gaps(seconds: list[tuple[float, bool]], sample_rate: int = 16000):
+    """Concatenate sine tone (True) and silence (False) sections."""
+    import numpy as np
+
+    parts = []
+    for duration, loud in seconds:
+        t = np.arange(int(duration * sample_rate)) / sample_rate
+        parts.append(
+            (0.5 * np.sin(2 * np.pi * 440 * t) if loud else 0 * t).astype(np.float32)
+        )
+    return np.concatenate(parts)
+
+
+def test_split_on_silence_cuts_in_gaps():
+    from docling.pipeline.asr_pipeline import _split_on_silence
+
+    audio = _tone_with_gaps([(8.0, True), (1.0, False), (8.0, True)])
+    chunks = _split_on_silence(audio, chunk_duration=10.0, search_window=5.0)
+
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(audio)
+    assert len(chunks) == 2
+    # The cut falls in the silent second between 8s and 9s
+    assert 8 * 16000 <= chunks[0][1] <= 9 * 16000
+
+
+def test_native_transcribe_chunked_offsets_and_skips_silence(monkeypatch):
+    import threading
+
+    from docling.backend.noop_backend import NoOpBackend
+    from docling.datamodel.accelerator_options import AcceleratorOptions
+    from docling.datamodel.pipeline_options_asr_model import (
+        InlineAsrNativeWhisperOptions,
+    )
+    from docling.pipeline import asr_pipeline
+
+    audio = _tone_with_gaps([(4.0, True), (6.0, False), (4.0, True)])
+    monkeypatch.setattr(asr_pipeline, "_decode_audio", lambda source: audio)
+
+    opts = InlineAsrNativeWhisperOptions(
+        repo_id="tiny", word_timestamps=False, chunk_duration=5.0
+    )
+    model = asr_pipeline._NativeWhisperModel(False, None, AcceleratorOptions(), opts)
+    model.asr_options = opts
+    model.verbose = False
+    model.word_timestamps = False
+    model.model = Mock()
+    model.model.transcribe.side_effect = lambda chunk, **kwargs: {
+        "segments": [{"start": 0.0, "end": len(chunk) / 16000, "text": "la"}]
+    }
+    model._workers = None
+    model._workers_lock = threading.Lock()
+
+    input_doc = InputDocument(
+        path_or_stream=Path("./tests/data/audio/sample_10s.mp3"),
+        format=InputFormat.AUDIO,
+        backend=NoOpBackend,
+    )
+    conv_res = ConversionResult(input=input_doc)
+    convo = model.transcribe_chunked(Path("unused.wav"), conv_res=conv_res)
+
+    # The silent middle chunk is never sent to the model
+    assert len(convo) == 2
+    assert model.model.transcribe.call_count == 2
+    assert convo[0].start_time == 0.0
+    assert convo[1].start_time == pytest.approx(10.0, abs=0.15)
+    assert convo[1].end_time == pytest.approx(14.0, abs=0.05)
+
+
+def test_native_transcribe_chunked_cancelled_keeps_replicas(monkeypatch):
+    import threading
+
+    from docling.backend.noop_backend import NoOpBackend
+    from docling.datamodel.accelerator_options import AcceleratorOptions
+    from docling.datamodel.base_models import ConversionStatus
+    from docling.datamodel.pipeline_options_asr_model import (
+        InlineAsrNativeWhisperOptions,
+    )
+    from docling.pipeline import asr_pipeline
+
+    audio = _tone_with_gaps([(4.0, True), (6.0, False), (4.0, True)])
+    monkeypatch.setattr(asr_pipeline, "_decode_audio", lambda source: audio)
+
+    opts = InlineAsrNativeWhisperOptions(
+        repo_id="tiny", word_timestamps=False, chunk_duration=5.0, num_workers=2
+    )
+    model = asr_pipeline._NativeWhisperModel(False, None, AcceleratorOptions(), opts)
+    model.asr_options = opts
+    model.verbose = False
+    model.word_timestamps = False
+    model.model = Mock()
+    model._load_model = Mock
+    model._workers = None
+    model._workers_lock = threading.Lock()
+
+    input_doc = InputDocument(
+        path_or_stream=Path("./tests/data/audio/sample_10s.mp3"),
+        format=InputFormat.AUDIO,
+        backend=NoOpBackend,
+    )
+    conv_res = ConversionResult(input=input_doc)
+    conv_res.cancellation.cancel()
+    convo = model.transcribe_chunked(Path("unused.wav"), conv_res=conv_res)
+
+    # No chunk takes a replica once the document is cancelled
+    assert convo == []
+    assert conv_res.status == ConversionStatus.FAILURE
+    assert model.model.transcribe.call_count == 0
+    assert model._workers is not None and model._workers.qsize() == 2
+
+
+@pytest.mark.parametrize("chunks_done", [0, 1])
+def test_native_transcribe_chunked_timeout_status(monkeypatch, chunks_done):
+    import threading
+
+    from docling.backend.noop_backend import NoOpBackend
+    from docling.datamodel.accelerator_options import AcceleratorOptions
+    from docling.datamodel.base_models import ConversionStatus
+    from docling.datamodel.pipeline_options_asr_model import (
+        InlineAsrNativeWhisperOptions,
+    )
+    from docling.pipeline import asr_pipeline
+
+    audio = _tone_with_gaps([(4.0, True), (6.0, False), (4.0, True)])
+    monkeypatch.setattr(asr_pipeline, "_decode_audio", lambda source: audio)
+
+    opts = InlineAsrNativeWhisperOptions(
+        repo_id="tiny", word_timestamps=False, chunk_duration=5.0, num_workers=2
+    )
+    model = asr_pipeline._NativeWhisperModel(False, None, AcceleratorOptions(), opts)
+    model.asr_options = opts
+    model.verbose = False
+    model.word_timestamps = False
+    model._workers = None
+    model._workers_lock = threading.Lock()
+
+    # The first *chunks_done* calls return, the others hang past the timeout
+    release = threading.Event()
+    calls: list[int] = []
+    calls_lock = threading.Lock()
+
+    def _transcribe(chunk, **kwargs):
+        with calls_lock:
+            calls.append(len(calls))
+            call = calls[-1]
+        if call >= chunks_done:
+            release.wait(5.0)
+        return {"segments": [{"start": 0.0, "end": 1.0, "text": "la"}]}
+
+    model.model = Mock()
+    model.model.transcribe.side_effect = _transcribe
+    model._load_model = lambda: model.model
+
+    input_doc = InputDocument(
+        path_or_stream=Path("./tests/data/audio/sample_10s.mp3"),
+        format=InputFormat.AUDIO,
+        backend=NoOpBackend,
+    )
+    conv_res = ConversionResult(input=input_doc)
+    conv_res.cancellation.set_timeout(0.5)
+    try:
+        convo = model.transcribe_chunked(Path("unused.wav"), conv_res=conv_res)
+    finally:
+        release.set()
+
+    # Only a run that kept some transcribed audio is a partial success
+    assert len(convo) == chunks_done
+    if chunks_done:
+        assert conv_res.status == ConversionStatus.PARTIAL_SUCCESS
+    else:
+        assert conv_res.status == ConversionStatus.FAILURE
@@ -1,3 +1,4 @@
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -6,7 +7,9 @@ from docling.backend.docling_parse_v4_backend import (
     DoclingParseV4DocumentBackend,
     DoclingParseV4PageBackend,
 )
-from docling.datamodel.base_models import BoundingBox, InputFormat
+from docling.backend.docling_parse_v4_workers import DoclingParseV4WorkerPool
+from docling.backend.pdf_backend import PdfPageContent
+from docling.datamodel.base_models import BoundingBox, DocumentStream, InputFormat, Page
 from docling.datamodel.document import InputDocument
 
 
@@ -91,3 +94,66 @@ def test_num_pages(test_doc_path):
 
     # Explicitly clean up resources to prevent race conditions in CI
     doc_backend.unload()
+
+
+def test_required_page_content():
+    doc_backend = _get_backend(Path("./tests/data/pdf/redp5110_sampled.pdf"))
+
+    page_backend = doc_backend.load_page(0)
+    full_page = page_backend.get_segmented_page()
+    assert full_page is not None
+    full_lines = [c.rect for c in full_page.textline_cells]
+    assert len(full_page.word_cells) > 0
+    page_backend.unload()
+
+    doc_backend.set_required_page_content([PdfPageContent.TEXTLINES])
+    page_backend = doc_backend.load_page(0)
+    page = page_backend.get_segmented_page()
+    assert page is not None
+    assert [c.rect for c in page.textline_cells] == full_lines
+    assert len(page.word_cells) == 0
+    assert len(page.char_cells) == 0
+    assert len(page.bitmap_resources) == 0
+    page_backend.unload()
+
+    doc_backend.unload()
+
+
+def test_parse_worker_pool_matches_in_process():
+    pdf_doc = Path("./tests/data/pdf/redp5110_sampled.pdf")
+    stream = DocumentStream(name=pdf_doc.name, stream=BytesIO(pdf_doc.read_bytes()))
+
+    pool = DoclingParseV4WorkerPool(max_workers=2)
+    try:
+        for path_or_stream in (pdf_doc, stream.stream):
+            in_doc = InputDocument(
+                path_or_stream=path_or_stream,
+                format=InputFormat.PDF,
+                backend=DoclingParseV4DocumentBackend,
+                filename=pdf_doc.name,
+            )
+            doc_backend = in_doc._backend
+            assert isinstance(doc_backend, DoclingParseV4DocumentBackend)
+
+            pages = [Page(page_no=1), Page(page_no=2)]
+            pool.load_pages(doc_backend, pages, scales=[1.0, 2.0])
+            pool.release_document(doc_backend)
+
+            for page in pages:
+                assert page._backend is not None
+                expected_backend = doc_backend.load_page(page.page_no - 1)
+                expected = expected_backend.get_segmented_page()
+                parsed = page._backend.get_segmented_page()
+                assert parsed is not None and expected is not None
+                assert parsed.textline_cells == expected.textline_cells
+                assert page.size == expected_backend.get_size()
+                assert (
+                    page._image_cache[2.0].tobytes()
+                    == expected_backend.get_page_image(scale=2.0).tobytes()
+                )
+                expected_backend.unload()
+                page._backend.unload()
+
+            doc_backend.unload()
+    finally:
+        pool.shutdown()
@@ -0,0 +1,107 @@
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.pipeline_options import (
+    ThreadedVlmPipelineOptions,
+    VlmConvertOptions,
+    VlmPipelineOptions,
+)
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.exceptions import ConversionCancelledError
+from docling.models.inference_engines.vlm.base import (
+    BaseVlmEngine,
+    BaseVlmEngineOptions,
+    VlmEngineInput,
+    VlmEngineOutput,
+)
+from docling.models.stages.vlm_convert import vlm_convert_model
+from docling.pipeline.threaded_vlm_pipeline import ThreadedVlmPipeline
+from docling.pipeline.vlm_pipeline import VlmPipeline
+from docling.utils.cancellation import CancellationToken
+
+PDF_PATH = Path("./tests/data/pdf/redp5110_sampled.pdf")
+
+
+class _SlowEngine(BaseVlmEngine):
+    """Engine generating for 5s from the second batch, aborting at cancellation."""
+
+    def __init__(self) -> None:
+        super().__init__(BaseVlmEngineOptions.model_construct())
+        self.num_batches = 0
+
+    def initialize(self) -> None:
+        self._initialized = True
+
+    def predict_batch(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        self.num_batches += 1
+        cancellation = input_batch[0].cancellation
+        assert cancellation is not None
+        if self.num_batches > 1:
+            cancellation.wait(5.0)
+            cancellation.raise_if_cancelled()
+        return [
+            VlmEngineOutput(
+                text="<doctag><text><loc_10><loc_40><loc_400><loc_60>Text</text></doctag>"
+            )
+            for _ in input_batch
+        ]
+
+
+def test_cancellation_token():
+    token = CancellationToken()
+    assert not token.cancelled
+    assert token.remaining() is None
+    assert token.timeout(5.0) == 5.0
+    token.raise_if_cancelled()
+
+    token.cancel("stopped by user")
+    assert token.cancelled
+    assert token.reason == "stopped by user"
+    with pytest.raises(ConversionCancelledError, match="stopped by user"):
+        token.raise_if_cancelled()
+
+    token = CancellationToken(timeout=0.05)
+    assert token.timeout(5.0) <= 0.05
+    assert token.wait(5.0)
+    assert token.reason == "document timeout exceeded"
+
+
+@pytest.mark.parametrize(
+    ("pipeline_cls", "options_cls"),
+    [
+        (VlmPipeline, VlmPipelineOptions),
+        (ThreadedVlmPipeline, ThreadedVlmPipelineOptions),
+    ],
+)
+def test_document_timeout_aborts_generation(monkeypatch, pipeline_cls, options_cls):
+    engine = _SlowEngine()
+    monkeypatch.setattr(
+        vlm_convert_model, "create_vlm_engine", lambda *args, **kwargs: engine
+    )
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=pipeline_cls,
+                pipeline_options=options_cls(
+                    vlm_options=VlmConvertOptions.from_preset("smoldocling"),
+                    document_timeout=1.0,
+                ),
+            )
+        }
+    )
+    converter.initialize_pipeline(InputFormat.PDF)
+
+    start_time = time.monotonic()
+    result = converter.convert(PDF_PATH, raises_on_error=False)
+    elapsed = time.monotonic() - start_time
+
+    assert result.status == ConversionStatus.PARTIAL_SUCCESS
+    assert engine.num_batches == 2
+    assert 0 < len(result.pages) < 18
+    assert result.document.num_pages() == len(result.pages)
+    # The generation was aborted at the deadline, not after its 5s
+    assert elapsed < 3.0
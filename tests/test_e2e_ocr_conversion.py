@@ -68,7 +68,10 @@ def test_e2e_conversions():
         (TesseractOcrOptions(force_full_page_ocr=True, lang=["auto"]), True),
         (TesseractCliOcrOptions(force_full_page_ocr=True), True),
         (TesseractCliOcrOptions(force_full_page_ocr=True, lang=["auto"]), True),
+        (TesseractOcrOptions(lang=["auto"], osd_sample_pages=1), True),
+        (TesseractCliOcrOptions(lang=["auto"], osd_sample_pages=1), True),
         (EasyOcrOptions(force_full_page_ocr=True), False),
+        (EasyOcrOptions(force_full_page_ocr=True, batch_size=4), False),
     ]
 
     for rapidocr_backend in ["onnxruntime", "torch"]:
@@ -80,6 +83,14 @@ def test_e2e_conversions():
         engines.append(
             (RapidOcrOptions(backend=rapidocr_backend, force_full_page_ocr=True), False)
         )
+        engines.append(
+            (
+                RapidOcrOptions(
+                    backend=rapidocr_backend, force_full_page_ocr=True, batch_size=8
+                ),
+                False,
+            )
+        )
         engines.append(
             (
                 RapidOcrOptions(
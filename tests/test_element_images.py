@@ -0,0 +1,121 @@
+import shutil
+from pathlib import Path
+
+from docling_core.types.doc import (
+    BoundingBox,
+    CoordOrigin,
+    DocItemLabel,
+    DoclingDocument,
+    PictureItem,
+    ProvenanceItem,
+    Size,
+    TableData,
+    TableItem,
+)
+from PIL import Image, ImageDraw
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.utils.element_images import generate_images
+
+
+def _conv_res(
+    source: Path = Path("tests/data/pdf/redp5110_sampled.pdf"),
+) -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=source,
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    doc = DoclingDocument(name="sample")
+    for page_no in (1, 2):
+        doc.add_page(page_no=page_no, size=Size(width=100, height=200))
+        image = Image.new("RGB", (200, 400), "white")
+        # Mark the picture area, in top-left coordinates at scale 2
+        ImageDraw.Draw(image).rectangle((20, 40, 59, 99), fill="red")
+        page = Page(page_no=page_no, size=Size(width=100, height=200))
+        page._image_cache = {2.0: image}
+        page._default_image_scale = 2.0
+        conv_res.pages.append(page)
+
+        bbox = BoundingBox(
+            l=10, t=180, r=30, b=150, coord_origin=CoordOrigin.BOTTOMLEFT
+        )
+        prov = ProvenanceItem(page_no=page_no, bbox=bbox, charspan=(0, 0))
+        doc.add_picture(prov=prov)
+        doc.add_table(data=TableData(), prov=prov, label=DocItemLabel.TABLE)
+    conv_res.document = doc
+    return conv_res
+
+
+def test_generate_embedded_images():
+    conv_res = _conv_res()
+    generate_images(
+        conv_res,
+        scale=2.0,
+        page_images=True,
+        element_types=(PictureItem,),
+        max_workers=2,
+    )
+
+    doc = conv_res.document
+    assert all(p.image is not None for p in doc.pages.values())
+    for picture in doc.pictures:
+        assert picture.image is not None
+        assert str(picture.image.uri).startswith("data:image/png;base64,")
+        pil_image = picture.image.pil_image
+        assert pil_image is not None
+        assert pil_image.size == (40, 60)
+        assert pil_image.getpixel((20, 30)) == (255, 0, 0)
+    assert all(t.image is None for t in doc.tables)
+
+
+def test_generate_referenced_images(tmp_path):
+    conv_res = _conv_res()
+    generate_images(
+        conv_res,
+        scale=2.0,
+        page_images=False,
+        element_types=(PictureItem, TableItem),
+        output_dir=tmp_path,
+    )
+
+    image_dir = tmp_path / conv_res.input.document_hash
+    assert sorted(p.name for p in image_dir.iterdir()) == [
+        "redp5110_sampled_pictures_0.png",
+        "redp5110_sampled_pictures_1.png",
+        "redp5110_sampled_tables_0.png",
+        "redp5110_sampled_tables_1.png",
+    ]
+    table = conv_res.document.tables[1]
+    assert table.image is not None
+    assert table.image.uri == image_dir / "redp5110_sampled_tables_1.png"
+    assert table.image.size == Size(width=40, height=60)
+    assert all(p.image is None for p in conv_res.document.pages.values())
+
+
+def test_referenced_images_of_same_named_documents(tmp_path):
+    # Another document stored under the same file name
+    other = tmp_path / "other" / "redp5110_sampled.pdf"
+    other.parent.mkdir()
+    shutil.copy("tests/data/pdf/multi_page.pdf", other)
+    conv_results = [_conv_res(), _conv_res(other)]
+    for conv_res in conv_results:
+        generate_images(
+            conv_res,
+            scale=2.0,
+            page_images=True,
+            element_types=(PictureItem,),
+            output_dir=tmp_path / "images",
+        )
+
+    uris = [
+        page.image.uri
+        for conv_res in conv_results
+        for page in conv_res.document.pages.values()
+        if page.image is not None
+    ]
+    assert len(uris) == 4
+    assert len(set(uris)) == 4
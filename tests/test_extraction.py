@@ -8,9 +8,14 @@ from pathlib import Path
 import pytest
 from pydantic import BaseModel, Field
 
-from docling.datamodel.base_models import InputFormat
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, InputFormat, VlmPrediction
+from docling.datamodel.document import InputDocument
+from docling.datamodel.pipeline_options import VlmExtractionPipelineOptions
 from docling.document_converter import DocumentConverter
 from docling.document_extractor import DocumentExtractor
+from docling.pipeline.base_extraction_pipeline import BaseExtractionPipeline
+from docling.pipeline.extraction_vlm_pipeline import ExtractionVlmPipeline
 
 IS_CI = bool(os.getenv("CI"))
 
@@ -106,3 +111,41 @@ def test_extraction_with_pydantic_class_template(
     assert len(result.pages) == 1
     assert result.pages[0].extracted_data["bill_no"] == "3139"
     assert result.pages[0].extracted_data["total"] == 3949.75
+
+
+class _BatchRecordingVlmModel:
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def process_images(self, image_batch, prompt):
+        images = list(image_batch)
+        self.batch_sizes.append(len(images))
+        for _ in images:
+            yield VlmPrediction(text='{"ok": true}')
+
+
+class _FakeExtractionVlmPipeline(ExtractionVlmPipeline):
+    def __init__(self, pipeline_options: VlmExtractionPipelineOptions):
+        BaseExtractionPipeline.__init__(self, pipeline_options)
+        self.vlm_model = _BatchRecordingVlmModel()  # type: ignore[assignment]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_extraction_pipeline_batches_pages(streaming: bool) -> None:
+    pipeline = _FakeExtractionVlmPipeline(
+        VlmExtractionPipelineOptions(
+            page_batch_size=2, streaming=streaming, page_prefetch_size=1
+        )
+    )
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/multi_page.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+
+    result = pipeline.execute(in_doc, raises_on_error=True, template=ExampleTemplate)
+
+    assert result.status == ConversionStatus.SUCCESS
+    assert [page.page_no for page in result.pages] == [1, 2, 3, 4, 5]
+    assert all(page.extracted_data == {"ok": True} for page in result.pages)
+    assert pipeline.vlm_model.batch_sizes == [2, 2, 1]  # type: ignore[attr-defined]
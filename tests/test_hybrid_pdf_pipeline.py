@@ -0,0 +1,194 @@
+import math
+from pathlib import Path
+from typing import List
+
+import pytest
+from docling_core.types.doc import DocItemLabel, DoclingDocument
+from docling_core.types.doc.document import DocTagsDocument
+from PIL import Image
+
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    InputFormat,
+    PageConfidenceScores,
+)
+from docling.datamodel.pipeline_options import (
+    HybridPdfPipelineOptions,
+    VlmConvertOptions,
+    VlmFallbackThresholds,
+)
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.inference_engines.vlm.base import (
+    BaseVlmEngine,
+    BaseVlmEngineOptions,
+    VlmEngineInput,
+    VlmEngineOutput,
+)
+from docling.models.stages.vlm_convert import vlm_convert_model
+from docling.pipeline.hybrid_pdf_pipeline import (
+    HybridPdfPipeline,
+    is_low_confidence,
+    merge_page_documents,
+)
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+
+PDF_PATH = Path("./tests/data/pdf/redp5110_sampled.pdf")
+
+
+class _FakeDocTagsEngine(BaseVlmEngine):
+    """Engine answering with one text element spanning 80% of the image width."""
+
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__(BaseVlmEngineOptions.model_construct())
+        self.batch_sizes: List[int] = []
+        self.fail = fail
+
+    def initialize(self) -> None:
+        self._initialized = True
+
+    def predict_batch(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        self.batch_sizes.append(len(input_batch))
+        if self.fail:
+            raise RuntimeError("inference failed")
+        return [
+            VlmEngineOutput(
+                text=(
+                    "<doctag><text><loc_0><loc_50><loc_400><loc_100>"
+                    "VLM text</text></doctag>"
+                ),
+                stop_reason="end_of_sequence",
+            )
+            for _ in input_batch
+        ]
+
+
+def _doc(*page_texts: str) -> DoclingDocument:
+    doctags = [
+        f"<doctag><text><loc_10><loc_10><loc_400><loc_40>{text}</text></doctag>"
+        for text in page_texts
+    ]
+    images = [Image.new("RGB", (500, 500)) for _ in page_texts]
+    return DoclingDocument.load_from_doctags(
+        DocTagsDocument.from_doctags_and_image_pairs(doctags, images)
+    )
+
+
+def test_is_low_confidence():
+    thresholds = VlmFallbackThresholds(parse_score=0.5, table_score=None)
+    scores = PageConfidenceScores(parse_score=0.9, layout_score=0.8)
+    assert math.isnan(scores.table_score)
+    assert not is_low_confidence(scores, thresholds)
+    assert is_low_confidence(
+        PageConfidenceScores(parse_score=0.2, layout_score=0.8), thresholds
+    )
+    # Disabled thresholds do not trigger
+    assert not is_low_confidence(
+        PageConfidenceScores(parse_score=0.9, table_score=0.1), thresholds
+    )
+
+
+def test_merge_page_documents():
+    doc = _doc("std 1", "std 2", "std 3", "std 4")
+    vlm_doc = _doc("vlm 2")
+
+    merged = merge_page_documents(doc, {2: vlm_doc}, [1, 2, 3, 4])
+
+    assert [(item.text, item.prov[0].page_no) for item in merged.texts] == [
+        ("std 1", 1),
+        ("vlm 2", 2),
+        ("std 3", 3),
+        ("std 4", 4),
+    ]
+    assert sorted(merged.pages) == [1, 2, 3, 4]
+    assert all(item.label == DocItemLabel.TEXT for item in merged.texts)
+
+
+def test_merge_page_documents_keeps_page_numbers():
+    # Conversion of the page range 3-5
+    doc = _doc("std 1", "std 2", "std 3", "std 4", "std 5").filter(page_nrs={3, 4, 5})
+    assert sorted(doc.pages) == [3, 4, 5]
+
+    merged = merge_page_documents(doc, {4: _doc("vlm 4")}, [3, 4, 5])
+
+    assert [(item.text, item.prov[0].page_no) for item in merged.texts] == [
+        ("std 3", 3),
+        ("vlm 4", 4),
+        ("std 5", 5),
+    ]
+    assert sorted(merged.pages) == [3, 4, 5]
+
+
+def _texts(doc: DoclingDocument, page_nos: set[int]):
+    return [
+        (item.text, item.prov[0].page_no)
+        for item in doc.texts
+        if item.prov and item.prov[0].page_no in page_nos
+    ]
+
+
+@pytest.mark.parametrize("vlm_fails", [False, True])
+def test_hybrid_pdf_pipeline_replaces_low_confidence_page(monkeypatch, vlm_fails):
+    engine = _FakeDocTagsEngine(fail=vlm_fails)
+    monkeypatch.setattr(
+        vlm_convert_model, "create_vlm_engine", lambda *args, **kwargs: engine
+    )
+
+    # Page 5 gets a low parse score, the other pages stay above the threshold
+    assemble_document = StandardPdfPipeline._assemble_document
+
+    def _assemble_with_low_page_5(self, conv_res):
+        conv_res.confidence.pages[5].parse_score = 0.0
+        return assemble_document(self, conv_res)
+
+    monkeypatch.setattr(
+        StandardPdfPipeline, "_assemble_document", _assemble_with_low_page_5
+    )
+
+    options = HybridPdfPipelineOptions(
+        do_ocr=False,
+        do_table_structure=False,
+        vlm_options=VlmConvertOptions.from_preset("smoldocling"),
+        vlm_fallback_thresholds=VlmFallbackThresholds(
+            parse_score=0.1, layout_score=None, table_score=None, ocr_score=None
+        ),
+    )
+    results = {}
+    for pipeline_cls in (StandardPdfPipeline, HybridPdfPipeline):
+        converter = DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_cls=pipeline_cls, pipeline_options=options
+                )
+            }
+        )
+        results[pipeline_cls] = converter.convert(
+            PDF_PATH, page_range=(4, 6), raises_on_error=False
+        )
+    std_res = results[StandardPdfPipeline]
+    hybrid_res = results[HybridPdfPipeline]
+
+    # Only the low-confidence page is sent to the VLM
+    assert engine.batch_sizes == [1]
+    assert hybrid_res.status == ConversionStatus.SUCCESS
+    assert sorted(hybrid_res.document.pages) == [4, 5, 6]
+
+    # The other pages keep the content of the standard conversion
+    assert _texts(std_res.document, {4, 6})
+    assert _texts(hybrid_res.document, {4, 6}) == _texts(std_res.document, {4, 6})
+
+    if vlm_fails:
+        # The low-confidence page keeps its standard content
+        assert len(hybrid_res.errors) == 1
+        assert _texts(hybrid_res.document, {5}) == _texts(std_res.document, {5})
+        return
+
+    assert _texts(hybrid_res.document, {5}) == [("VLM text", 5)]
+    # The VLM coordinates are rescaled from the page image to the page
+    page_size = std_res.document.pages[5].size
+    assert hybrid_res.document.pages[5].size == page_size
+    item = next(t for t in hybrid_res.document.texts if t.text == "VLM text")
+    bbox = item.prov[0].bbox.to_top_left_origin(page_size.height)
+    assert bbox.l == pytest.approx(0.0, abs=1.0)
+    assert bbox.r == pytest.approx(0.8 * page_size.width, rel=0.02)
+    assert bbox.t == pytest.approx(0.1 * page_size.height, rel=0.02)
+    assert bbox.b == pytest.approx(0.2 * page_size.height, rel=0.02)
@@ -0,0 +1,153 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, Size
+from docling_core.types.doc.page import (
+    BoundingRectangle,
+    PdfPageBoundaryType,
+    PdfPageGeometry,
+    SegmentedPdfPage,
+    TextCell,
+)
+
+from docling.datamodel.base_models import (
+    Cluster,
+    ConfidenceReport,
+    LayoutPrediction,
+    Page,
+)
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import LayoutOptions
+from docling.models.stages.layout.layout_model import LayoutModel
+from docling.utils.layout_postprocessor import LayoutPostprocessor
+
+PAGE_SIZE = Size(width=600, height=800)
+
+
+class _ValidBackend:
+    def is_valid(self) -> bool:
+        return True
+
+
+def _tl_box(left, top, right, bottom) -> BoundingBox:
+    return BoundingBox(
+        l=left, t=top, r=right, b=bottom, coord_origin=CoordOrigin.TOPLEFT
+    )
+
+
+def _make_page() -> Page:
+    cells = [
+        TextCell(
+            index=ix,
+            text=f"line {ix}",
+            orig=f"line {ix}",
+            from_ocr=False,
+            rect=BoundingRectangle.from_bounding_box(
+                _tl_box(100, 100 + 20 * ix, 400, 115 + 20 * ix)
+            ),
+        )
+        for ix in range(5)
+    ]
+    bbox = BoundingBox(l=0, t=0, r=PAGE_SIZE.width, b=PAGE_SIZE.height)
+    dimension = PdfPageGeometry(
+        angle=0.0,
+        rect=BoundingRectangle.from_bounding_box(bbox),
+        boundary_type=PdfPageBoundaryType.CROP_BOX,
+        art_bbox=bbox,
+        bleed_bbox=bbox,
+        crop_bbox=bbox,
+        media_bbox=bbox,
+        trim_bbox=bbox,
+    )
+    page = Page(
+        page_no=1,
+        size=PAGE_SIZE,
+        parsed_page=SegmentedPdfPage(
+            dimension=dimension, textline_cells=cells, char_cells=[], word_cells=[]
+        ),
+    )
+    page._backend = _ValidBackend()  # type: ignore[assignment]
+    page.predictions.layout = LayoutPrediction(
+        clusters=[
+            Cluster(
+                id=0,
+                label=DocItemLabel.TEXT,
+                confidence=0.9,
+                bbox=_tl_box(90, 90, 410, 200),
+            ),
+            Cluster(
+                id=1,
+                label=DocItemLabel.PICTURE,
+                confidence=0.8,
+                bbox=_tl_box(50, 400, 500, 700),
+            ),
+        ]
+    )
+    return page
+
+
+def _postprocess(executor=None):
+    model = LayoutModel.__new__(LayoutModel)
+    model.options = LayoutOptions()
+    page = _make_page()
+    conv_res = ConversionResult.model_construct(confidence=ConfidenceReport())
+
+    predictions = model.postprocess_layout(conv_res, [page], executor=executor)
+    return page, predictions[0], conv_res
+
+
+def test_postprocess_layout_in_process_pool_matches_in_thread():
+    page, prediction, conv_res = _postprocess()
+    assert page.predictions.layout is prediction
+    assert [len(c.cells) for c in prediction.clusters] == [5, 0]
+    assert conv_res.confidence.pages[1].layout_score > 0
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        pool_page, pool_prediction, pool_conv_res = _postprocess(executor)
+
+    assert pool_prediction == prediction
+    assert [c.text for c in pool_page.cells] == [c.text for c in page.cells]
+    assert (
+        pool_conv_res.confidence.pages[1].layout_score
+        == conv_res.confidence.pages[1].layout_score
+    )
+
+
+def test_cell_assignment_matches_bounding_box_overlaps():
+    page = _make_page()
+    assert page.parsed_page is not None
+    # A zero-area cell and a cell straddling both clusters
+    page.parsed_page.textline_cells += [
+        TextCell(
+            index=5,
+            text="empty",
+            orig="empty",
+            from_ocr=False,
+            rect=BoundingRectangle.from_bounding_box(_tl_box(120, 300, 120, 300)),
+        ),
+        TextCell(
+            index=6,
+            text="straddle",
+            orig="straddle",
+            from_ocr=False,
+            rect=BoundingRectangle.from_bounding_box(_tl_box(80, 190, 420, 420)),
+        ),
+    ]
+    assert page.predictions.layout is not None
+    clusters = page.predictions.layout.clusters
+
+    postprocessor = LayoutPostprocessor(page, clusters, LayoutOptions())
+    assigned = postprocessor._assign_cells_to_clusters(clusters)
+
+    for cell in page.cells:
+        bbox = cell.rect.to_bounding_box()
+        overlaps = [
+            bbox.intersection_over_self(c.bbox) if bbox.area() > 0 else 0.0
+            for c in clusters
+        ]
+        best = max(range(len(clusters)), key=overlaps.__getitem__)
+        expected = [best] if overlaps[best] > 0.2 else []
+        actual = [ix for ix, c in enumerate(assigned) if cell in c.cells]
+        assert actual == expected, cell.text
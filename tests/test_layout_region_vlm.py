@@ -0,0 +1,206 @@
+from typing import Iterable, Union
+
+import numpy as np
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    Size,
+    TableItem,
+)
+from docling_core.types.doc.document import DocTagsDocument
+from PIL import Image
+
+from docling.datamodel.base_models import (
+    Cluster,
+    LayoutPrediction,
+    Page,
+    VlmPrediction,
+)
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options_vlm_model import InlineVlmOptions
+from docling.datamodel.vlm_model_specs import GRANITEDOCLING_TRANSFORMERS
+from docling.experimental.models.layout_region_vlm_model import (
+    LayoutRegionVlmModel,
+    is_clean_text,
+    region_body,
+)
+from docling.models.base_model import BaseVlmPageModel
+
+PAGE_SIZE = Size(width=600, height=800)
+
+NATIVE_TEXT = {
+    (50, 50, 550, 80): "Introduction",
+    (50, 100, 550, 200): "Clean  native\ntext of the page.",
+    (50, 500, 550, 550): "GLYPH<c=1,font=/F1>GLYPH<c=2,font=/F1>",
+}
+
+
+class _Backend:
+    def is_valid(self) -> bool:
+        return True
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        return NATIVE_TEXT.get((bbox.l, bbox.t, bbox.r, bbox.b), "")
+
+    def get_page_image(self, scale=1.0, cropbox=None):
+        image = Image.new(
+            "RGB",
+            (round(PAGE_SIZE.width * scale), round(PAGE_SIZE.height * scale)),
+            "white",
+        )
+        if cropbox is not None:
+            image = image.crop(cropbox.scaled(scale=scale).as_tuple())
+        return image
+
+
+class _FakeVlm(BaseVlmPageModel):
+    def __init__(self) -> None:
+        self.vlm_options: InlineVlmOptions = GRANITEDOCLING_TRANSFORMERS
+        self.calls: list[tuple[list[tuple[int, int]], list[str]]] = []
+
+    def __call__(self, conv_res, page_batch):
+        raise AssertionError("full pages must not be sent in region mode")
+
+    def process_images(
+        self,
+        image_batch: Iterable[Union[Image.Image, np.ndarray]],
+        prompt: Union[str, list[str]],
+    ) -> Iterable[VlmPrediction]:
+        sizes = [im.size for im in image_batch if isinstance(im, Image.Image)]
+        assert isinstance(prompt, list)
+        self.calls.append((sizes, prompt))
+        responses = {
+            "Convert table to OTSL.": (
+                "<otsl><loc_0><loc_0><loc_500><loc_500>"
+                "<ched>A<ched>B<nl><fcel>1<fcel>2<nl></otsl>"
+            ),
+            "Convert formula to LaTeX.": (
+                "<formula><loc_3><loc_5><loc_490><loc_480>E=mc^2</formula>"
+            ),
+        }
+        for p in prompt:
+            yield VlmPrediction(
+                text=responses.get(
+                    p, "<doctag><text><loc_1><loc_1><loc_9><loc_9>OCR text</text>"
+                )
+            )
+
+
+def _cluster(cid: int, label: DocItemLabel, left, top, right, bottom) -> Cluster:
+    return Cluster(
+        id=cid,
+        label=label,
+        bbox=BoundingBox(l=left, t=top, r=right, b=bottom),
+        confidence=0.9,
+    )
+
+
+def _make_page(page_no: int) -> Page:
+    page = Page(page_no=page_no, size=PAGE_SIZE)
+    page._backend = _Backend()  # type: ignore[assignment]
+    page.predictions.layout = LayoutPrediction(
+        clusters=[
+            _cluster(0, DocItemLabel.SECTION_HEADER, 50, 50, 550, 80),
+            _cluster(1, DocItemLabel.TEXT, 50, 100, 550, 200),
+            _cluster(2, DocItemLabel.TABLE, 50, 250, 550, 400),
+            _cluster(3, DocItemLabel.FORMULA, 50, 420, 550, 460),
+            _cluster(4, DocItemLabel.TEXT, 50, 500, 550, 550),
+        ]
+    )
+    return page
+
+
+def test_region_helpers():
+    assert is_clean_text("Some text")
+    assert not is_clean_text("  ")
+    assert not is_clean_text("GLYPH<c=3,font=/F1>")
+    assert not is_clean_text("\ufffd\ufffd text")
+    assert (
+        region_body("<otsl><loc_1><loc_2><fcel>x<nl></otsl>", "otsl") == "<fcel>x<nl>"
+    )
+    assert region_body("<text><loc_1>a</text><text>b</text>", "text") == "a b"
+
+
+def test_layout_region_vlm_model():
+    vlm = _FakeVlm()
+    model = LayoutRegionVlmModel(
+        vlm_model=vlm,
+        region_labels={DocItemLabel.TABLE, DocItemLabel.FORMULA},
+        region_prompts={
+            DocItemLabel.TABLE: "Convert table to OTSL.",
+            DocItemLabel.FORMULA: "Convert formula to LaTeX.",
+        },
+        scale=2.0,
+        batch_size=8,
+    )
+    conv_res = ConversionResult.model_construct()
+    pages = list(model(conv_res, [_make_page(1), _make_page(2)]))
+
+    # One VLM call with the crops of both pages, the clean text is not sent
+    assert len(vlm.calls) == 1
+    sizes, prompts = vlm.calls[0]
+    assert (
+        prompts
+        == [
+            "Convert table to OTSL.",
+            "Convert formula to LaTeX.",
+            GRANITEDOCLING_TRANSFORMERS.prompt,
+        ]
+        * 2
+    )
+    assert sizes[:3] == [(1000, 300), (1000, 80), (1000, 100)]
+
+    assert pages[0].predictions.vlm_response is not None
+    doctags = pages[0].predictions.vlm_response.text
+    doc = DoclingDocument.load_from_doctags(
+        DocTagsDocument.from_doctags_and_image_pairs(
+            [doctags], [Image.new("RGB", (600, 800))]
+        )
+    )
+    items = [item for item, _ in doc.iterate_items()]
+    assert [item.label for item in items] == [
+        DocItemLabel.SECTION_HEADER,
+        DocItemLabel.TEXT,
+        DocItemLabel.TABLE,
+        DocItemLabel.FORMULA,
+        DocItemLabel.TEXT,
+    ]
+    assert [getattr(item, "text", None) for item in items] == [
+        "Introduction",
+        "Clean native text of the page.",
+        None,
+        "E=mc^2",
+        "OCR text",
+    ]
+    table = items[2]
+    assert isinstance(table, TableItem)
+    assert (table.data.num_rows, table.data.num_cols) == (2, 2)
+    # The stitched elements have the locations of the layout clusters
+    assert abs(table.prov[0].bbox.t - 250) < 1
+
+
+def test_layout_region_vlm_model_batches():
+    vlm = _FakeVlm()
+    model = LayoutRegionVlmModel(
+        vlm_model=vlm,
+        region_labels={DocItemLabel.TABLE, DocItemLabel.FORMULA},
+        region_prompts={},
+        scale=1.0,
+        batch_size=4,
+    )
+    page = _make_page(1)
+    assert page.predictions.layout is not None
+    # A region without area has no crop
+    page.predictions.layout.clusters.append(
+        _cluster(5, DocItemLabel.TABLE, 50, 600, 550, 600)
+    )
+    pages = list(
+        model(ConversionResult.model_construct(), [page, _make_page(2), _make_page(3)])
+    )
+
+    # 9 crops sent in VLM batches of at most 4
+    assert [len(sizes) for sizes, _ in vlm.calls] == [4, 4, 1]
+    # The region without crop is kept as an empty table
+    assert pages[0].predictions.vlm_response is not None
+    assert pages[0].predictions.vlm_response.text.count("<otsl>") == 2
@@ -0,0 +1,87 @@
+import gc
+
+from docling.models.utils.model_registry import ModelRegistry
+
+
+class _Owner:
+    pass
+
+
+def test_acquire_shares_and_counts_references():
+    registry = ModelRegistry(max_idle_bytes=1024)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return object()
+
+    first = registry.acquire(("layout", "cpu"), loader)
+    second = registry.acquire(("layout", "cpu"), loader)
+    other = registry.acquire(("layout", "cuda"), loader)
+
+    assert first is second
+    assert first is not other
+    assert len(loads) == 2
+
+    stats = registry.stats()
+    assert stats.loads == 2
+    assert stats.hits == 1
+    assert stats.loaded_models == 2
+    assert stats.idle_models == 0
+
+    registry.release(("layout", "cpu"))
+    assert registry.stats().idle_models == 0
+    registry.release(("layout", "cpu"))
+    assert registry.stats().idle_models == 1
+
+    # Idle models within the budget are reused
+    assert registry.acquire(("layout", "cpu"), loader) is first
+    assert len(loads) == 2
+
+
+def test_zero_budget_evicts_idle_models():
+    registry = ModelRegistry(max_idle_bytes=0)
+    key = ("table", "cpu")
+
+    model = registry.acquire(key, object)
+    registry.release(key)
+
+    stats = registry.stats()
+    assert stats.evictions == 1
+    assert stats.loaded_models == 0
+    assert registry.acquire(key, object) is not model
+
+
+def test_attach_releases_on_owner_collection():
+    registry = ModelRegistry(max_idle_bytes=1024)
+    key = ("ocr", "cpu")
+
+    owner_a, owner_b = _Owner(), _Owner()
+    model = registry.attach(owner_a, key, object)
+    assert registry.attach(owner_b, key, object) is model
+
+    del owner_a
+    gc.collect()
+    assert registry.stats().idle_models == 0
+
+    del owner_b
+    gc.collect()
+    assert registry.stats().idle_models == 1
+
+    assert registry.evict_idle(0) == 1
+    assert registry.stats().loaded_models == 0
+
+
+def test_idle_models_bounded_by_count():
+    registry = ModelRegistry(max_idle_bytes=1024, max_idle_models=2)
+
+    # Models without measurable size, e.g. one OCR engine per option combination
+    for ix in range(4):
+        registry.acquire(("ocr", ix), object)
+        registry.release(("ocr", ix))
+
+    stats = registry.stats()
+    assert stats.idle_models == 2
+    assert stats.evictions == 2
+    # The locks of the evicted keys are dropped with them
+    assert sorted(registry._key_locks) == [("ocr", 2), ("ocr", 3)]
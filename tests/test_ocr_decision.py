@@ -0,0 +1,171 @@
+from collections.abc import Iterable
+from typing import Type
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
+from docling_core.types.doc.page import (
+    BoundingRectangle,
+    PdfPageBoundaryType,
+    PdfPageGeometry,
+    SegmentedPdfPage,
+    TextCell,
+)
+
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.base_models import ConfidenceReport, OcrDecisionReason, Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import (
+    OcrDecisionPolicy,
+    OcrOptions,
+    RapidOcrOptions,
+)
+from docling.models.base_ocr_model import BaseOcrModel
+
+PAGE_SIZE = Size(width=600, height=800)
+
+
+class _BitmapBackend:
+    def __init__(self, bitmap_rects: list[BoundingBox]):
+        self.bitmap_rects = bitmap_rects
+
+    def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        return self.bitmap_rects
+
+    def is_valid(self) -> bool:
+        return True
+
+
+class _NoopOcrModel(BaseOcrModel):
+    def __call__(self, conv_res, page_batch):
+        yield from page_batch
+
+    @classmethod
+    def get_options_type(cls) -> Type[OcrOptions]:
+        return RapidOcrOptions
+
+
+def _make_model(**kwargs) -> _NoopOcrModel:
+    return _NoopOcrModel(
+        enabled=True,
+        artifacts_path=None,
+        options=RapidOcrOptions(**kwargs),
+        accelerator_options=AcceleratorOptions(),
+    )
+
+
+def _make_page(bitmap_rects: list[BoundingBox], cell_bboxes: list[BoundingBox]):
+    cells = [
+        TextCell(
+            index=ix,
+            text="text",
+            orig="text",
+            from_ocr=False,
+            rect=BoundingRectangle.from_bounding_box(bbox),
+        )
+        for ix, bbox in enumerate(cell_bboxes)
+    ]
+    bbox = BoundingBox(l=0, t=0, r=PAGE_SIZE.width, b=PAGE_SIZE.height)
+    dimension = PdfPageGeometry(
+        angle=0.0,
+        rect=BoundingRectangle.from_bounding_box(bbox),
+        boundary_type=PdfPageBoundaryType.CROP_BOX,
+        art_bbox=bbox,
+        bleed_bbox=bbox,
+        crop_bbox=bbox,
+        media_bbox=bbox,
+        trim_bbox=bbox,
+    )
+    page = Page(
+        page_no=1,
+        size=PAGE_SIZE,
+        parsed_page=SegmentedPdfPage(
+            dimension=dimension, textline_cells=cells, char_cells=[], word_cells=[]
+        ),
+    )
+    page._backend = _BitmapBackend(bitmap_rects)  # type: ignore[assignment]
+    return page
+
+
+def _tl_box(left, top, right, bottom) -> BoundingBox:
+    return BoundingBox(
+        l=left, t=top, r=right, b=bottom, coord_origin=CoordOrigin.TOPLEFT
+    )
+
+
+def _conv_res_with_parse_score(page: Page, score: float) -> ConversionResult:
+    conv_res = ConversionResult.model_construct(confidence=ConfidenceReport())
+    conv_res.confidence.pages[page.page_no].parse_score = score
+    return conv_res
+
+
+def test_bitmap_coverage_policy_records_decision():
+    page = _make_page([_tl_box(0, 0, 600, 700)], [])
+    rects = _make_model().get_ocr_rects(page)
+
+    assert len(rects) == 1
+    decision = page.predictions.ocr_decision
+    assert decision is not None
+    assert decision.do_ocr
+    assert decision.reason == OcrDecisionReason.BITMAP_DOMINANT
+
+
+def test_adaptive_skips_regions_covered_by_text_layer():
+    image = _tl_box(100, 100, 400, 300)
+    lines = [_tl_box(100, 100 + 20 * i, 400, 115 + 20 * i) for i in range(10)]
+    page = _make_page([image], lines)
+
+    assert len(_make_model().get_ocr_rects(page)) == 1
+
+    model = _make_model(decision_policy=OcrDecisionPolicy.ADAPTIVE)
+    rects = model.get_ocr_rects(page)
+
+    assert rects == []
+    decision = page.predictions.ocr_decision
+    assert decision is not None
+    assert not decision.do_ocr
+    assert decision.reason == OcrDecisionReason.TEXT_LAYER_PRESENT
+    assert decision.num_skipped_rects == 1
+
+
+def test_text_density_only_computed_by_adaptive_policy():
+    lines = [_tl_box(0, 0, 600, 100), _tl_box(0, 700, 300, 800)]
+    page = _make_page([], lines)
+    # A bottom-left origin cell covering the same area as the second line
+    page.parsed_page.textline_cells[1].rect = BoundingRectangle.from_bounding_box(
+        _tl_box(0, 700, 300, 800).to_bottom_left_origin(PAGE_SIZE.height)
+    )
+
+    _make_model().get_ocr_rects(page)
+    decision = page.predictions.ocr_decision
+    assert decision is not None
+    assert decision.text_density is None
+
+    _make_model(decision_policy=OcrDecisionPolicy.ADAPTIVE).get_ocr_rects(page)
+    decision = page.predictions.ocr_decision
+    assert decision is not None
+    assert decision.text_density == (600 * 100 + 300 * 100) / (600 * 800)
+
+
+def test_adaptive_ocrs_garbled_text_layer():
+    page = _make_page([], [_tl_box(50, 50, 500, 70)])
+    conv_res = _conv_res_with_parse_score(page, 0.0)
+
+    assert _make_model().get_ocr_rects(page, conv_res) == []
+
+    model = _make_model(decision_policy=OcrDecisionPolicy.ADAPTIVE)
+    rects = model.get_ocr_rects(page, conv_res)
+
+    assert len(rects) == 1
+    decision = page.predictions.ocr_decision
+    assert decision is not None
+    assert decision.reason == OcrDecisionReason.LOW_PARSE_QUALITY
+    assert decision.parse_score == 0.0
+
+    ocr_cell = TextCell(
+        index=0,
+        text="clean",
+        orig="clean",
+        from_ocr=True,
+        rect=BoundingRectangle.from_bounding_box(_tl_box(50, 50, 500, 70)),
+    )
+    model.post_process_cells([ocr_cell], page)
+    assert [c.text for c in page.cells] == ["clean"]
@@ -4,6 +4,7 @@ import pytest
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import BoundingRectangle
 
+from docling.utils.ocr_utils import DocumentOsdCache
 from docling.utils.orientation import rotate_bounding_box
 
 IM_SIZE = (4, 5)
@@ -78,3 +79,21 @@ def test_rotate_bounding_box(
     assert rotated == expected_rectangle
     expected_angle_360 = angle % 360
     assert rotated.angle_360 == expected_angle_360
+
+
+def test_document_osd_cache():
+    cache = DocumentOsdCache(sample_pages=3, max_documents=1)
+
+    cache.add_sample("doc", 1, 0, "Latin")
+    cache.add_sample("doc", 1, 90, "Cyrillic")  # only the first result per page
+    cache.add_sample("doc", 2, 180, "Latin")
+    assert cache.get("doc") is None
+
+    cache.add_sample("doc", 3, 0, None)
+    assert cache.get("doc") == (0, "Latin")
+
+    cache.add_sample("other", 1, 90, "Greek")
+    cache.add_sample("other", 2, 90, "Greek")
+    cache.add_sample("other", 3, 90, "Greek")
+    assert cache.get("other") == (90, "Greek")
+    assert cache.get("doc") is None  # evicted
@@ -0,0 +1,32 @@
+import gc
+
+from PIL import Image
+
+from docling.datamodel.base_models import Page
+from docling.utils.page_image_store import PageImageStore
+
+
+def test_spilled_images_are_loaded_on_demand():
+    store = PageImageStore()
+    directory = store.directory
+
+    page = Page(page_no=3)
+    page._image_store = store
+    image = Image.new("RGB", (40, 30), "rgb(10,20,30)")
+    page._image_cache = {1.0: image, 2.0: image.resize((80, 60))}
+
+    page.spill_images()
+    assert page._image_cache == {}
+    assert len(list(directory.iterdir())) == 2
+
+    restored = page.get_image(scale=1.0)
+    assert restored is not None
+    assert restored.tobytes() == image.tobytes()
+    assert page.get_image(scale=2.0).size == (80, 60)  # type: ignore[union-attr]
+    assert page.get_image(scale=0.5) is None
+    # Loaded images are not cached in memory again
+    assert page._image_cache == {}
+
+    del page, store
+    gc.collect()
+    assert not directory.exists()
@@ -0,0 +1,59 @@
+import time
+import weakref
+from pathlib import Path
+
+from docling.datamodel.base_models import InputFormat
+from docling.document_converter import DocumentConverter
+from docling.utils.pipeline_cache import PipelineCache
+
+
+class _Pipeline:
+    pass
+
+
+def test_lru_eviction_and_stats():
+    cache: PipelineCache[str, _Pipeline] = PipelineCache(max_size=2)
+
+    a = cache.get_or_create("a", _Pipeline)
+    ref_b = weakref.ref(cache.get_or_create("b", _Pipeline))
+    assert cache.get_or_create("a", _Pipeline) is a
+
+    cache.get_or_create("c", _Pipeline)
+
+    # "b" was the least recently used and is released right away
+    assert set(cache) == {"a", "c"}
+    assert ref_b() is None
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+
+def test_ttl_eviction():
+    cache: PipelineCache[str, _Pipeline] = PipelineCache(ttl=0.01)
+    cache.get_or_create("a", _Pipeline)
+    time.sleep(0.02)
+
+    assert cache.evict_expired() == 1
+    assert len(cache) == 0
+
+
+def test_memory_budget_keeps_latest_pipeline():
+    cache: PipelineCache[str, _Pipeline] = PipelineCache(max_bytes=0)
+    cache.get_or_create("a", _Pipeline)
+    assert len(cache) == 1
+
+
+def test_converter_reports_cache_stats():
+    converter = DocumentConverter(allowed_formats=[InputFormat.MD])
+    source = Path("./tests/data/md/wiki.md")
+
+    converter.convert(source)
+    converter.convert(source)
+
+    stats = converter.pipeline_cache_stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.size == 1
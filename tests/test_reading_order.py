@@ -0,0 +1,131 @@
+import random
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, Size
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cluster,
+    FigureElement,
+    InputFormat,
+    Page,
+    TextElement,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.models.stages.reading_order.readingorder_model import (
+    IncrementalReadingOrder,
+    ReadingOrderModel,
+    ReadingOrderOptions,
+)
+
+PAGE_SIZE = Size(width=600, height=800)
+
+# Elements per page, top to bottom: (label, text)
+PAGES = {
+    1: [
+        (DocItemLabel.SECTION_HEADER, "Introduction"),
+        (DocItemLabel.TEXT, "The first paragraph is continued on the"),
+        (DocItemLabel.PAGE_FOOTER, "1"),
+    ],
+    2: [
+        (DocItemLabel.TEXT, "next page and ends there."),
+        (DocItemLabel.LIST_ITEM, "- first item"),
+        (DocItemLabel.LIST_ITEM, "- second item"),
+        (DocItemLabel.TEXT, "This paragraph is continued after a figure,"),
+    ],
+    3: [
+        (DocItemLabel.PICTURE, ""),
+        (DocItemLabel.CAPTION, "Figure 1: A figure."),
+    ],
+    4: [
+        (DocItemLabel.TEXT, "which spans a whole page."),
+        (DocItemLabel.TEXT, "The last paragraph ends with a comma,"),
+    ],
+}
+
+
+def _page(page_no: int) -> Page:
+    elements = []
+    for ix, (label, text) in enumerate(PAGES[page_no]):
+        cluster = Cluster(
+            id=ix,
+            label=label,
+            bbox=BoundingBox(
+                l=50,
+                t=50 + 150 * ix,
+                r=550,
+                b=150 + 150 * ix,
+                coord_origin=CoordOrigin.TOPLEFT,
+            ),
+        )
+        element_cls = FigureElement if label == DocItemLabel.PICTURE else TextElement
+        elements.append(
+            element_cls(label=label, id=ix, page_no=page_no, cluster=cluster, text=text)
+        )
+    page = Page(page_no=page_no, size=PAGE_SIZE)
+    page.assembled = AssembledUnit(elements=elements)
+    return page
+
+
+def _conv_res() -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/redp5110_sampled.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    return ConversionResult(input=in_doc)
+
+
+def test_incremental_reading_order_matches_full_document():
+    model = ReadingOrderModel(options=ReadingOrderOptions())
+
+    conv_res = _conv_res()
+    conv_res.pages = [_page(page_no) for page_no in PAGES]
+    conv_res.assembled = AssembledUnit(
+        elements=[e for p in conv_res.pages for e in p.assembled.elements]
+    )
+    expected = model(conv_res).export_to_dict()
+    texts = [item.text for item in model(conv_res).texts]
+    assert "The first paragraph is continued on the next page and ends there." in texts
+    assert (
+        "This paragraph is continued after a figure, which spans a whole page." in texts
+    )
+
+    page_nos = list(PAGES)
+    random.Random(42).shuffle(page_nos)
+    incremental = IncrementalReadingOrder(model, _conv_res(), list(PAGES))
+    for page_no in page_nos:
+        incremental.add_page(_page(page_no))
+    assert incremental.finish().export_to_dict() == expected
+
+
+def test_incremental_reading_order_holds_back_continued_paragraph():
+    model = ReadingOrderModel(options=ReadingOrderOptions())
+    incremental = IncrementalReadingOrder(model, _conv_res(), [1, 2, 3, 4, 5])
+    doc = incremental.document
+
+    incremental.add_page(_page(1))
+    # The paragraph and the page footer after it wait for page 2
+    assert [item.text for item in doc.texts] == ["Introduction"]
+
+    incremental.add_page(_page(3))
+    assert len(doc.texts) == 1
+
+    incremental.add_page(_page(2))
+    # The last paragraph of page 2 may continue after the figure of page 3
+    assert [item.text for item in doc.texts] == [
+        "Introduction",
+        "The first paragraph is continued on the next page and ends there.",
+        "1",
+        "first item",
+        "second item",
+    ]
+    assert list(doc.pages) == [1, 2, 3]
+
+    incremental.skip_page(4)
+    incremental.finish()
+    assert doc.texts[-2].text == "This paragraph is continued after a figure,"
+    assert doc.texts[-1].text == "Figure 1: A figure."
+    assert len(doc.pictures) == 1
+    assert list(doc.pages) == [1, 2, 3]
@@ -1,20 +1,30 @@
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
 import pytest
 
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, InputFormat
-from docling.datamodel.document import ConversionResult
+from docling.datamodel.base_models import ConversionStatus, InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     ThreadedPdfPipelineOptions,
 )
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.pipeline.standard_pdf_pipeline import (
+    StandardPdfPipeline,
+    ThreadedItem,
+    ThreadedPipelineStage,
+    ThreadedQueue,
+)
 from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
+from docling.utils.batching import AdaptiveBatchSizer
+from docling.utils.profiling import TimeRecorder, record_batch
 
 
 def test_threaded_pipeline_multiple_documents():
@@ -193,6 +203,331 @@ def test_pypdfium_threaded_pipeline():
     print("All done!")
 
 
+def test_sharded_build_merges_page_ranges(monkeypatch):
+    monkeypatch.setattr(settings.debug, "profile_pipeline_timings", True)
+    pipeline = StandardPdfPipeline.__new__(StandardPdfPipeline)
+    pipeline.pipeline_options = ThreadedPdfPipelineOptions(
+        num_page_shards=3, page_shard_min_pages=2, document_timeout=600
+    )
+    pipeline._executor_lock = threading.Lock()
+    pipeline._shard_inputs = {}
+    pipeline._reading_orders = {}
+
+    built_ranges = []
+    shard_tokens = []
+
+    def build_page_range(conv_res: ConversionResult) -> ConversionResult:
+        start_page, end_page = conv_res.input.limits.page_range
+        built_ranges.append((start_page, end_page))
+        shard_tokens.append(conv_res.cancellation)
+        record_batch(conv_res, "layout_batch", end_page - start_page + 1, 0.1)
+        conv_res.pages = [Page(page_no=i) for i in range(start_page, end_page + 1)]
+        conv_res.status = (
+            ConversionStatus.FAILURE if start_page == 1 else ConversionStatus.SUCCESS
+        )
+        return conv_res
+
+    pipeline._build_page_range = build_page_range  # type: ignore[method-assign]
+
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/redp5110_sampled.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    assert pipeline._shard_page_ranges(in_doc) == [(1, 6), (7, 12), (13, 18)]
+
+    conv_res = pipeline._build_document(ConversionResult(input=in_doc))
+    assert sorted(built_ranges) == [(1, 6), (7, 12), (13, 18)]
+    assert [p.page_no for p in conv_res.pages] == list(range(1, 19))
+    assert conv_res.status == ConversionStatus.PARTIAL_SUCCESS
+    # The shards share the deadline of the document
+    assert conv_res.cancellation.remaining() is not None
+    assert all(token is conv_res.cancellation for token in shard_tokens)
+    layout_batch = conv_res.timings["layout_batch"]
+    assert layout_batch.count == 3
+    assert layout_batch.batch_sizes == [6, 6, 6]
+    assert len(layout_batch.times) == 3
+
+    shard_inputs = pipeline._shard_inputs[id(conv_res)]
+    assert all(s._backend is not in_doc._backend for s in shard_inputs)
+    pipeline._unload(conv_res)
+    assert pipeline._shard_inputs == {}
+
+
+def test_adaptive_batch_sizer():
+    free_memory = [0.5]
+    sizer = AdaptiveBatchSizer(
+        initial_size=2,
+        max_size=16,
+        memory_probe=lambda: free_memory[0],
+        recovery_batches=3,
+    )
+    # Grows while pages are waiting and the latency per page improves
+    assert sizer.update(2, elapsed=2.0, queue_depth=10) == 4
+    assert sizer.update(4, elapsed=2.0, queue_depth=10) == 8
+    # Partial batches and empty queues keep the size
+    assert sizer.update(3, elapsed=0.1, queue_depth=10) == 8
+    # Worse latency per page than at the previous size: back to it and capped
+    assert sizer.update(8, elapsed=8.0, queue_depth=10) == 4
+    assert sizer.update(4, elapsed=1.0, queue_depth=10) == 4
+    # Low memory halves the size
+    free_memory[0] = 0.05
+    assert sizer.update(4, elapsed=1.0, queue_depth=10) == 2
+    assert sizer.max_size == 2
+    # The bound is lifted after healthy batches, and the size grows again
+    free_memory[0] = 0.5
+    assert sizer.update(2, elapsed=0.5, queue_depth=10) == 2
+    assert sizer.update(2, elapsed=0.5, queue_depth=10) == 2
+    assert sizer.max_size == 2
+    assert sizer.update(2, elapsed=0.5, queue_depth=10) == 4
+    assert sizer.max_size == 16
+
+
+def test_stage_records_batch_sizes(monkeypatch):
+    monkeypatch.setattr(settings.debug, "profile_pipeline_timings", True)
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=Path("tests/data/pdf/redp5110_sampled.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+    )
+
+    def model(conv_res, pages):
+        time.sleep(0.05)  # fixed cost per batch, larger batches are faster per page
+        return list(pages)
+
+    stage = ThreadedPipelineStage(
+        name="fake",
+        model=model,
+        batch_size=2,
+        batch_timeout=0.05,
+        queue_max_size=20,
+        batch_sizer=AdaptiveBatchSizer(
+            initial_size=2, max_size=8, memory_probe=lambda: None
+        ),
+    )
+    output = ThreadedQueue(20)
+    stage.add_output_queue(output)
+    for page_no in range(1, 15):
+        stage.input_queue.put(
+            ThreadedItem(
+                payload=Page(page_no=page_no),
+                run_id=1,
+                page_no=page_no,
+                conv_res=conv_res,
+            )
+        )
+    stage.input_queue.close()
+    stage.start()
+    items: List[ThreadedItem] = []
+    while not output.closed or len(output):
+        items.extend(output.get_batch(20, timeout=1.0))
+    stage.stop()
+
+    assert len(items) == 14
+    batch_sizes = conv_res.timings["fake_batch"].batch_sizes
+    assert batch_sizes == [2, 4, 8]
+
+
+def _run_cross_document_stage(model, conv_results) -> List[ThreadedItem]:
+    stage = ThreadedPipelineStage(
+        name="fake",
+        model=model,
+        batch_size=8,
+        batch_timeout=0.05,
+        queue_max_size=20,
+        cross_document=True,
+    )
+    output = ThreadedQueue(20)
+    stage.add_output_queue(output)
+    for page_no in range(1, 5):
+        for run_id, conv_res in enumerate(conv_results, start=1):
+            stage.input_queue.put(
+                ThreadedItem(
+                    payload=Page(page_no=page_no),
+                    run_id=run_id,
+                    page_no=page_no,
+                    conv_res=conv_res,
+                )
+            )
+    stage.input_queue.close()
+    stage.start()
+    items: List[ThreadedItem] = []
+    while not output.closed or len(output):
+        items.extend(output.get_batch(20, timeout=1.0))
+    stage.stop()
+    return items
+
+
+def _conv_results(num: int) -> List[ConversionResult]:
+    return [
+        ConversionResult(
+            input=InputDocument(
+                path_or_stream=Path("tests/data/pdf/redp5110_sampled.pdf"),
+                format=InputFormat.PDF,
+                backend=PyPdfiumDocumentBackend,
+            )
+        )
+        for _ in range(num)
+    ]
+
+
+def test_stage_batches_pages_across_documents(monkeypatch):
+    monkeypatch.setattr(settings.debug, "profile_pipeline_timings", True)
+    conv_results = _conv_results(2)
+    calls: List[int] = []
+
+    def model(conv_res, pages):
+        pages = list(pages)
+        calls.append(len(pages))
+        # Another stage recording on a document meanwhile
+        with TimeRecorder(conv_results[0], "other_stage"):
+            pass
+        with TimeRecorder(conv_res, "fake_model"):
+            return pages
+
+    items = _run_cross_document_stage(model, conv_results)
+
+    assert calls == [8]
+    # The pages keep their run and document
+    for itm in items:
+        assert itm.conv_res is conv_results[itm.run_id - 1]
+    assert sorted((itm.run_id, itm.page_no) for itm in items) == [
+        (run_id, page_no) for run_id in (1, 2) for page_no in range(1, 5)
+    ]
+    # The timing of the model call is recorded on both documents
+    assert [conv_res.timings["fake_model"].count for conv_res in conv_results] == [
+        1,
+        1,
+    ]
+    assert "other_stage" not in conv_results[1].timings
+
+
+def test_stage_cross_document_failure_stays_in_its_run():
+    conv_results = _conv_results(2)
+    calls: List[int] = []
+
+    def model(conv_res, pages):
+        pages = list(pages)
+        calls.append(len(pages))
+        if conv_res.input is conv_results[1].input:
+            raise RuntimeError("bad page")
+        return pages
+
+    # The failing document comes first in the batch
+    items = _run_cross_document_stage(model, conv_results[::-1])
+
+    # The merged call failed and was retried per run
+    assert calls == [8, 4, 4]
+    failed = {itm.conv_res is conv_results[1] for itm in items if itm.is_failed}
+    assert failed == {True}
+    assert sum(not itm.is_failed for itm in items) == 4
+
+
+@pytest.mark.parametrize("parse_workers", [0, 1])
+def test_shared_stage_graph(monkeypatch, parse_workers):
+    from docling.datamodel.base_models import LayoutPrediction
+    from docling.pipeline import standard_pdf_pipeline
+
+    class _FakeLayoutModel:
+        def __call__(self, conv_res, page_batch):
+            for page in page_batch:
+                page.predictions.layout = LayoutPrediction()
+                yield page
+
+    class _FakeLayoutFactory:
+        def create_instance(self, **kwargs):
+            return _FakeLayoutModel()
+
+    monkeypatch.setattr(
+        standard_pdf_pipeline,
+        "get_layout_factory",
+        lambda allow_external_plugins: _FakeLayoutFactory(),
+    )
+    pipeline = StandardPdfPipeline(
+        ThreadedPdfPipelineOptions(
+            do_ocr=False,
+            do_table_structure=False,
+            shared_stage_graph=True,
+            queue_max_size=4,
+            parse_workers=parse_workers,
+        )
+    )
+
+    def convert(_) -> ConversionResult:
+        in_doc = InputDocument(
+            path_or_stream=Path("tests/data/pdf/redp5110_sampled.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+        return pipeline.execute(in_doc, raises_on_error=True)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(convert, range(3)))
+    assert [res.status for res in results] == [ConversionStatus.SUCCESS] * 3
+    assert all(len(res.pages) == 18 for res in results)
+
+    # One set of stage threads serves all the documents and outlives them
+    graph = pipeline._shared_graph
+    assert graph is not None
+    stage_threads = [st._thread for st in graph.ctx.stages]
+    assert all(t is not None and t.is_alive() for t in stage_threads)
+    assert convert(None).status == ConversionStatus.SUCCESS
+    assert pipeline._shared_graph is graph
+    assert [st._thread for st in graph.ctx.stages] == stage_threads
+    assert graph.fair_share() == 4
+
+    graph.shutdown()
+    assert not any(t is not None and t.is_alive() for t in stage_threads)
+
+
+def test_layout_subclass_keeps_single_layout_stage(monkeypatch):
+    from docling.datamodel.base_models import LayoutPrediction
+    from docling.models.stages.layout.layout_model import LayoutModel
+    from docling.pipeline import standard_pdf_pipeline
+
+    class _CustomLayoutModel(LayoutModel):
+        def __init__(self) -> None:
+            self.predicted_pages: List[int] = []
+
+        def predict_layout(self, conv_res, pages):
+            self.predicted_pages.extend(page.page_no for page in pages)
+            return [LayoutPrediction() for _ in pages]
+
+    layout_model = _CustomLayoutModel()
+
+    class _FakeLayoutFactory:
+        def create_instance(self, **kwargs):
+            return layout_model
+
+    monkeypatch.setattr(
+        standard_pdf_pipeline,
+        "get_layout_factory",
+        lambda allow_external_plugins: _FakeLayoutFactory(),
+    )
+    options = ThreadedPdfPipelineOptions(do_ocr=False, do_table_structure=False)
+    assert options.layout_postprocess_stage
+    pipeline = StandardPdfPipeline(options)
+
+    # The overridden predict_layout runs in the single layout stage
+    stage_names = [st.name for st in pipeline._create_run_ctx().stages]
+    assert "layout_postprocess" not in stage_names
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/redp5110_sampled.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    conv_res = pipeline.execute(in_doc, raises_on_error=True)
+    assert conv_res.status == ConversionStatus.SUCCESS
+    assert sorted(layout_model.predicted_pages) == list(range(1, 19))
+
+    # The built-in layout model is split
+    pipeline.layout_model = LayoutModel.__new__(LayoutModel)
+    stage_names = [st.name for st in pipeline._create_run_ctx().stages]
+    assert stage_names.index("layout_postprocess") == stage_names.index("layout") + 1
+
+
 if __name__ == "__main__":
     # Run basic performance test
     test_pipeline_comparison()
@@ -0,0 +1,203 @@
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+from PIL import Image
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.pipeline_options import (
+    ThreadedVlmPipelineOptions,
+    VlmConvertOptions,
+    VlmPipelineOptions,
+)
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.inference_engines.vlm.base import (
+    BaseVlmEngine,
+    BaseVlmEngineOptions,
+    VlmEngineInput,
+    VlmEngineOutput,
+)
+from docling.models.stages.vlm_convert import vlm_convert_model
+from docling.pipeline.threaded_vlm_pipeline import ThreadedVlmPipeline
+from docling.pipeline.vlm_pipeline import VlmPipeline
+from docling.utils.batching import ink_density, length_sorted_batches
+
+PDF_PATH = Path("./tests/data/pdf/redp5110_sampled.pdf")
+
+
+class _FakeDocTagsEngine(BaseVlmEngine):
+    """Engine answering with DocTags derived from the image size."""
+
+    def __init__(self, fail_on_call: int = -1, first_call_delay: float = 0.0) -> None:
+        super().__init__(BaseVlmEngineOptions.model_construct())
+        self.batch_sizes: List[int] = []
+        self.fail_on_call = fail_on_call
+        self.first_call_delay = first_call_delay
+
+    def initialize(self) -> None:
+        self._initialized = True
+
+    @property
+    def preferred_batch_size(self) -> int:
+        return 3
+
+    def predict_batch(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        self.batch_sizes.append(len(input_batch))
+        if len(self.batch_sizes) == 1:
+            time.sleep(self.first_call_delay)
+        if len(self.batch_sizes) - 1 == self.fail_on_call:
+            raise RuntimeError("inference failed")
+        return [
+            VlmEngineOutput(
+                text=(
+                    "<doctag><section_header_level_1><loc_10><loc_10><loc_200><loc_30>"
+                    f"Page {inp.image.width}x{inp.image.height}"
+                    "</section_header_level_1>"
+                    "<text><loc_10><loc_40><loc_400><loc_60>Some text</text>"
+                    "<picture><loc_10><loc_100><loc_200><loc_200></picture>"
+                    "</doctag>"
+                ),
+                stop_reason="end_of_sequence",
+            )
+            for inp in input_batch
+        ]
+
+
+def _convert(monkeypatch, pipeline_cls, pipeline_options, engine):
+    monkeypatch.setattr(
+        vlm_convert_model, "create_vlm_engine", lambda *args, **kwargs: engine
+    )
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=pipeline_cls, pipeline_options=pipeline_options
+            )
+        }
+    )
+    return converter.convert(PDF_PATH, raises_on_error=False)
+
+
+def _options(cls, **kwargs):
+    return cls(
+        vlm_options=VlmConvertOptions.from_preset("smoldocling"),
+        generate_picture_images=True,
+        **kwargs,
+    )
+
+
+def test_threaded_vlm_pipeline_matches_vlm_pipeline(monkeypatch):
+    expected = _convert(
+        monkeypatch, VlmPipeline, _options(VlmPipelineOptions), _FakeDocTagsEngine()
+    )
+
+    engine = _FakeDocTagsEngine()
+    result = _convert(
+        monkeypatch,
+        ThreadedVlmPipeline,
+        _options(ThreadedVlmPipelineOptions, batch_polling_interval_seconds=0.05),
+        engine,
+    )
+
+    assert result.status == ConversionStatus.SUCCESS
+    assert [p.page_no for p in result.pages] == [p.page_no for p in expected.pages]
+    assert max(engine.batch_sizes) <= engine.preferred_batch_size
+    assert sum(engine.batch_sizes) == len(result.pages)
+    assert result.document.export_to_dict() == expected.document.export_to_dict()
+
+
+def test_threaded_vlm_pipeline_failed_batch(monkeypatch):
+    engine = _FakeDocTagsEngine(fail_on_call=0)
+    result = _convert(
+        monkeypatch,
+        ThreadedVlmPipeline,
+        _options(ThreadedVlmPipelineOptions, vlm_batch_size=1),
+        engine,
+    )
+
+    assert result.status == ConversionStatus.PARTIAL_SUCCESS
+    assert set(engine.batch_sizes) == {1}
+    assert len(result.pages) == len(engine.batch_sizes) - 1
+    assert result.document.num_pages() == len(result.pages)
+    assert any("inference failed" in error.error_message for error in result.errors)
+
+
+def test_threaded_vlm_pipeline_failed_page_keeps_page_numbers(monkeypatch):
+    engine = _FakeDocTagsEngine(fail_on_call=3)
+    result = _convert(
+        monkeypatch,
+        ThreadedVlmPipeline,
+        _options(ThreadedVlmPipelineOptions, vlm_batch_size=1),
+        engine,
+    )
+
+    assert result.status == ConversionStatus.PARTIAL_SUCCESS
+    page_nos = [p.page_no for p in result.pages]
+    assert page_nos == [p for p in range(1, 19) if p != 4]
+    # The pages after the failed one are not renumbered
+    assert sorted(result.document.pages) == page_nos
+    prov_page_nos = {
+        prov.page_no
+        for item, _ in result.document.iterate_items()
+        for prov in item.prov
+    }
+    assert prov_page_nos == set(page_nos)
+    assert any("Page 4" in error.error_message for error in result.errors)
+
+
+def test_threaded_vlm_pipeline_failed_batch_in_window(monkeypatch):
+    # The pages rendered during the first call fill the window of the next one
+    engine = _FakeDocTagsEngine(fail_on_call=1, first_call_delay=1.0)
+    result = _convert(
+        monkeypatch,
+        ThreadedVlmPipeline,
+        _options(
+            ThreadedVlmPipelineOptions,
+            vlm_batch_size=2,
+            vlm_reorder_window=8,
+            batch_polling_interval_seconds=0.05,
+        ),
+        engine,
+    )
+
+    # Only the pages of the failed engine batch are lost, not the whole window
+    assert result.status == ConversionStatus.PARTIAL_SUCCESS
+    assert max(engine.batch_sizes) <= 2
+    assert sum(engine.batch_sizes) == 18
+    assert engine.batch_sizes[1:3] == [2, 2]
+    assert len(result.pages) == 18 - engine.batch_sizes[1]
+    assert result.document.num_pages() == len(result.pages)
+
+
+def test_threaded_vlm_pipeline_length_batches(monkeypatch):
+    expected = _convert(
+        monkeypatch, VlmPipeline, _options(VlmPipelineOptions), _FakeDocTagsEngine()
+    )
+
+    engine = _FakeDocTagsEngine()
+    result = _convert(
+        monkeypatch,
+        ThreadedVlmPipeline,
+        _options(
+            ThreadedVlmPipelineOptions,
+            vlm_reorder_window=8,
+            batch_polling_interval_seconds=0.05,
+        ),
+        engine,
+    )
+
+    assert result.status == ConversionStatus.SUCCESS
+    assert max(engine.batch_sizes) <= engine.preferred_batch_size
+    assert sum(engine.batch_sizes) == len(result.pages)
+    assert result.document.export_to_dict() == expected.document.export_to_dict()
+
+
+def test_length_sorted_batches():
+    assert length_sorted_batches([0.5, 0.1, 0.9, 0.2, 0.6], 2) == [[1, 3], [0, 4], [2]]
+    assert length_sorted_batches([], 2) == []
+
+    blank = Image.new("RGB", (600, 800), "white")
+    half = blank.copy()
+    half.paste((0, 0, 0), (0, 0, 600, 400))
+    assert ink_density(blank) == 0.0
+    assert ink_density(half) == pytest.approx(0.5, abs=0.02)
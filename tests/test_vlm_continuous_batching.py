@@ -0,0 +1,226 @@
+import pytest
+import torch
+from transformers import (
+    LlamaConfig,
+    LlamaForCausalLM,
+    MistralConfig,
+    MistralForCausalLM,
+    StoppingCriteria,
+    StoppingCriteriaList,
+)
+
+from docling.datamodel.base_models import VlmStopReason
+from docling.models.inference_engines.vlm._continuous_batching import (
+    ContinuousBatchScheduler,
+    GenerationRequest,
+    UnsupportedModelError,
+)
+
+
+class _StopAfterToken(StoppingCriteria):
+    def __init__(self, token_id: int):
+        self.token_id = token_id
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return input_ids[:, -1] == self.token_id
+
+
+@pytest.fixture(scope="module")
+def model():
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=128,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+    )
+    return LlamaForCausalLM(config).eval()
+
+
+def _prompts(num: int) -> list[torch.Tensor]:
+    generator = torch.Generator().manual_seed(1)
+    lengths = torch.randint(4, 40, (num,), generator=generator)
+    return [torch.randint(3, 128, (1, int(n)), generator=generator) for n in lengths]
+
+
+def _request(prompt: torch.Tensor, max_new_tokens: int, **kwargs):
+    return GenerationRequest(
+        inputs={"input_ids": prompt, "attention_mask": torch.ones_like(prompt)},
+        max_new_tokens=max_new_tokens,
+        **kwargs,
+    )
+
+
+def test_continuous_batching_matches_generate(model):
+    prompts = _prompts(10)
+    budgets = [3 + 4 * ix for ix in range(len(prompts))]
+    expected = [
+        model.generate(
+            input_ids=prompt,
+            attention_mask=torch.ones_like(prompt),
+            max_new_tokens=budget,
+            do_sample=False,
+            eos_token_id=None,
+            pad_token_id=0,
+        )[0, prompt.shape[1] :].tolist()
+        for prompt, budget in zip(prompts, budgets)
+    ]
+
+    # Fewer slots than requests: queued requests join while others decode
+    scheduler = ContinuousBatchScheduler(model, eos_token_ids=None, max_batch_size=3)
+    try:
+        futures = [
+            scheduler.submit(_request(prompt, budget))
+            for prompt, budget in zip(prompts, budgets)
+        ]
+        results = [future.result(timeout=60) for future in futures]
+    finally:
+        scheduler.shutdown()
+
+    assert [result.token_ids for result in results] == expected
+    assert all(result.stop_reason == VlmStopReason.LENGTH for result in results)
+
+
+def test_sequences_stop_on_their_own_criteria(model):
+    prompts = _prompts(3)
+    scheduler = ContinuousBatchScheduler(model, eos_token_ids=None, max_batch_size=3)
+    try:
+        reference = scheduler.submit(_request(prompts[0], 20)).result(timeout=60)
+        stop_token = reference.token_ids[4]
+        stop_at = reference.token_ids.index(stop_token) + 1
+
+        futures = [
+            scheduler.submit(
+                _request(
+                    prompts[0],
+                    20,
+                    stopping_criteria=StoppingCriteriaList(
+                        [_StopAfterToken(stop_token)]
+                    ),
+                )
+            ),
+            scheduler.submit(_request(prompts[1], 7)),
+            scheduler.submit(_request(prompts[2], 20)),
+        ]
+        stopped, short, full = [future.result(timeout=60) for future in futures]
+    finally:
+        scheduler.shutdown()
+
+    assert stopped.token_ids == reference.token_ids[:stop_at]
+    assert stopped.stop_reason == VlmStopReason.STOP_SEQUENCE
+    assert len(short.token_ids) == 7
+    assert len(full.token_ids) == 20
+
+    eos_scheduler = ContinuousBatchScheduler(
+        model, eos_token_ids=stop_token, max_batch_size=2
+    )
+    try:
+        result = eos_scheduler.submit(_request(prompts[0], 20)).result(timeout=60)
+    finally:
+        eos_scheduler.shutdown()
+    assert result.token_ids == reference.token_ids[:stop_at]
+    assert result.stop_reason == VlmStopReason.END_OF_SEQUENCE
+
+
+def test_sliding_window_cache_is_unsupported():
+    config = MistralConfig(
+        vocab_size=128,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=1,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        sliding_window=16,
+    )
+    model = MistralForCausalLM(config).eval()
+    scheduler = ContinuousBatchScheduler(model, eos_token_ids=None)
+    try:
+        future = scheduler.submit(_request(_prompts(1)[0], 4))
+        with pytest.raises(UnsupportedModelError):
+            future.result(timeout=60)
+    finally:
+        scheduler.shutdown()
+
+
+def test_engine_falls_back_and_shuts_down_scheduler():
+    from PIL import Image
+
+    from docling.datamodel.vlm_engine_options import TransformersVlmEngineOptions
+    from docling.models.inference_engines.vlm.base import VlmEngineInput
+    from docling.models.inference_engines.vlm.transformers_engine import (
+        TransformersVlmEngine,
+    )
+
+    config = MistralConfig(
+        vocab_size=128,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=1,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        sliding_window=16,
+    )
+    scheduler = ContinuousBatchScheduler(
+        MistralForCausalLM(config).eval(), eos_token_ids=None
+    )
+    engine = TransformersVlmEngine(
+        TransformersVlmEngineOptions(continuous_batching=True)
+    )
+    engine._scheduler = scheduler
+    prompt = _prompts(1)[0]
+    engine._format_prompt = lambda input_data, prompt_style: None
+    engine._process_inputs = lambda images, prompts, input_data, prompt_style: {
+        "input_ids": prompt,
+        "attention_mask": torch.ones_like(prompt),
+    }
+
+    inputs = [
+        VlmEngineInput(image=Image.new("RGB", (8, 8)), prompt="", max_new_tokens=4)
+    ]
+    assert engine._predict_continuous(inputs) is None
+    assert engine._continuous_batching_unsupported
+    assert engine._scheduler is None
+    assert not scheduler._thread.is_alive()
+
+
+def test_prompt_prefix_cache(model):
+    image_token_id = 2
+    generator = torch.Generator().manual_seed(2)
+    prefix = torch.randint(3, 128, (1, 12), generator=generator)
+    prompts = [
+        torch.cat(
+            [
+                prefix,
+                torch.full((1, 4), image_token_id),
+                torch.randint(3, 128, (1, 6 + ix), generator=generator),
+            ],
+            dim=1,
+        )
+        for ix in range(4)
+    ]
+    # The prompt changed: its prefix is prefilled again
+    prompts.append(torch.cat([prompts[0][:, 1:], prompts[0][:, :1]], dim=1))
+
+    def run(image_token_id):
+        scheduler = ContinuousBatchScheduler(
+            model,
+            eos_token_ids=None,
+            max_batch_size=2,
+            image_token_id=image_token_id,
+            min_prefix_tokens=8,
+        )
+        try:
+            futures = [scheduler.submit(_request(prompt, 8)) for prompt in prompts]
+            results = [future.result(timeout=60).token_ids for future in futures]
+            return results, scheduler.prefix_stats()
+        finally:
+            scheduler.shutdown()
+
+    expected, _ = run(None)
+    tokens, stats = run(image_token_id)
+
+    assert tokens == expected
+    assert (stats.hits, stats.misses) == (3, 2)
+    assert stats.reused_tokens == 3 * prefix.shape[1]
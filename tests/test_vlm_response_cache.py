@@ -0,0 +1,137 @@
+from typing import List
+
+from PIL import Image
+
+from docling.datamodel.vlm_engine_options import ApiVlmEngineOptions
+from docling.models.inference_engines.vlm import (
+    BaseVlmEngine,
+    BaseVlmEngineOptions,
+    VlmEngineInput,
+    VlmEngineOutput,
+    VlmEngineType,
+    create_vlm_engine,
+)
+from docling.models.inference_engines.vlm.base import VlmResponseCacheOptions
+from docling.models.inference_engines.vlm.response_cache import (
+    CachedVlmEngine,
+    VlmResponseCache,
+)
+
+
+class _CountingEngine(BaseVlmEngine):
+    """Engine answering with the color of the image and counting the predictions."""
+
+    def __init__(self, repo_id: str = "fake/model") -> None:
+        super().__init__(BaseVlmEngineOptions(engine_type=VlmEngineType.TRANSFORMERS))
+        self.repo_id = repo_id
+        self.num_predicted = 0
+
+    def initialize(self) -> None:
+        self._initialized = True
+
+    def get_cache_identity(self):
+        return {"repo_id": self.repo_id}
+
+    def predict_batch(self, input_batch: List[VlmEngineInput]) -> List[VlmEngineOutput]:
+        self.num_predicted += len(input_batch)
+        return [
+            VlmEngineOutput(
+                text=f"{inp.prompt} {inp.image.getpixel((0, 0))}",
+                stop_reason="end_of_sequence",
+            )
+            for inp in input_batch
+        ]
+
+
+def _input(color: str, prompt: str = "Convert", **kwargs) -> VlmEngineInput:
+    return VlmEngineInput(
+        image=Image.new("RGB", (32, 32), color), prompt=prompt, **kwargs
+    )
+
+
+def test_cached_engine_reuses_responses(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    engine = _CountingEngine()
+    cached = CachedVlmEngine(engine, VlmResponseCache(path))
+
+    first = cached.predict_batch([_input("red"), _input("blue"), _input("red")])
+    assert engine.num_predicted == 2
+    assert first[0].text == first[2].text == "Convert (255, 0, 0)"
+
+    second = cached.predict_batch(
+        [_input("blue"), _input("red"), _input("red", prompt="Describe")]
+    )
+    assert engine.num_predicted == 3
+    assert [o.text for o in second] == [
+        "Convert (0, 0, 255)",
+        "Convert (255, 0, 0)",
+        "Describe (255, 0, 0)",
+    ]
+
+    stats = cached.cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 3, 3)
+    cached.cleanup()
+
+    # The responses persist, but only for the same model
+    reopened = CachedVlmEngine(_CountingEngine(), VlmResponseCache(path))
+    reopened.predict_batch([_input("red")])
+    assert reopened.engine.num_predicted == 0  # type: ignore[attr-defined]
+    other_model = CachedVlmEngine(
+        _CountingEngine(repo_id="other/model"), VlmResponseCache(path)
+    )
+    other_model.predict_batch([_input("red")])
+    assert other_model.engine.num_predicted == 1  # type: ignore[attr-defined]
+
+
+def test_cached_engine_skips_sampled_generations(tmp_path):
+    engine = _CountingEngine()
+    cached = CachedVlmEngine(engine, VlmResponseCache(tmp_path / "cache.sqlite"))
+    for _ in range(2):
+        cached.predict_batch([_input("red", temperature=0.7)])
+    assert engine.num_predicted == 2
+    assert cached.cache.stats().size == 0
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = VlmResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+    output = VlmEngineOutput(text="x")
+    cache.put("a", output)
+    cache.put("b", output)
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("c", output)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert (stats.evictions, stats.size) == (1, 2)
+    assert stats.hit_rate == 0.75
+
+
+def test_factory_wraps_engine_with_cache(tmp_path):
+    options = ApiVlmEngineOptions(
+        response_cache=VlmResponseCacheOptions(path=tmp_path / "cache.sqlite")
+    )
+    engine = create_vlm_engine(options)
+    assert isinstance(engine, CachedVlmEngine)
+    assert engine.get_cache_identity()["url"] == str(options.url)
+    engine.cleanup()
+
+    assert not isinstance(create_vlm_engine(ApiVlmEngineOptions()), CachedVlmEngine)
+
+
+def test_transformers_cache_identity_covers_precision():
+    from docling.datamodel.vlm_engine_options import TransformersVlmEngineOptions
+    from docling.models.inference_engines.vlm.transformers_engine import (
+        TransformersVlmEngine,
+    )
+
+    def identity(**kwargs):
+        return TransformersVlmEngine(
+            TransformersVlmEngineOptions(**kwargs)
+        ).get_cache_identity()
+
+    assert identity(torch_dtype="bfloat16") != identity(quantized=True)
+    assert identity(torch_dtype="bfloat16") != identity(torch_dtype="float16")
+    assert identity(quantized=True) != identity(quantized=True, load_in_8bit=False)
+    assert identity() == identity(load_in_8bit=False)